@@ -0,0 +1,28 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import sys
+
+import pytest
+from loguru import logger
+from pytest_benchmark.utils import get_tag
+
+
+def pytest_configure(config):
+    # Store the results of every run (in `.benchmarks`) so they can be compared
+    # later with `--benchmark-compare`.
+    if not config.getoption("benchmark_disable", False) and not config.option.benchmark_autosave:
+        config.option.benchmark_autosave = get_tag()
+
+
+@pytest.fixture(autouse=True)
+def info_logging():
+    """Benchmarks run with logging at INFO level, as in production."""
+    logger.remove()
+    handler_id = logger.add(sys.stderr, level="INFO")
+    yield
+    logger.remove(handler_id)
+    logger.add(sys.stderr)
@@ -0,0 +1,683 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+import numpy as np
+import pytest
+import soundfile as sf
+import soxr
+
+from benchmarks.utils import generate_audio, run_async
+from pipecat.audio.codecs.g711 import G711Decoder, G711Encoder
+from pipecat.audio.filters.frame_aligned_filter import FrameAlignedAudioFilter
+from pipecat.audio.filters.spectral_gating_filter import SpectralGatingFilter
+from pipecat.audio.loudness import LoudnessMeter
+from pipecat.audio.mixers.multitrack_mixer import MixerTrack, MultiTrackMixer
+from pipecat.audio.mixers.sound_bank import clear_sounds
+from pipecat.audio.mixers.soundfile_mixer import SoundfileMixer
+from pipecat.audio.playout import AudioPlayout
+from pipecat.audio.recorder import AudioRecorder
+from pipecat.audio.resamplers.soxr_resampler import SOXRAudioResampler
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+from pipecat.audio.utils import calculate_audio_volume, interleave_stereo_audio, mix_audio
+from pipecat.audio.vad.silero import (
+    SileroVADAnalyzer,
+    SileroVADBatchService,
+    clear_onnx_sessions,
+)
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+from pipecat.frames.frames import InputAudioRawFrame, OutputAudioRawFrame, TTSAudioRawFrame
+from pipecat.processors.audio.audio_buffer_processor import AudioBufferProcessor
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import TransportParams
+from pipecat.utils.memory import current_rss
+
+try:
+    import audioop
+except ModuleNotFoundError:
+    # Removed in Python 3.13.
+    audioop = None
+
+
+@pytest.mark.benchmark(group="vad")
+@pytest.mark.parametrize("sample_rate", [8000, 16000])
+def test_silero_vad_throughput(benchmark, sample_rate):
+    """Analyzes 1 second of audio in 20ms chunks."""
+    vad = SileroVADAnalyzer(sample_rate=sample_rate)
+    vad.set_sample_rate(sample_rate)
+    audio = generate_audio(1.0, sample_rate)
+    chunk_size = int(sample_rate * 0.02) * 2
+    chunks = [audio[i : i + chunk_size] for i in range(0, len(audio), chunk_size)]
+
+    def analyze():
+        for chunk in chunks:
+            vad.analyze_audio(chunk)
+
+    benchmark(analyze)
+    benchmark.extra_info["audio_seconds"] = 1.0
+
+
+class ConstantVADAnalyzer(VADAnalyzer):
+    """A VAD analyzer without a model, to measure the analyzer overhead."""
+
+    def num_frames_required(self) -> int:
+        return 512
+
+    def voice_confidence(self, buffer) -> float:
+        return 1.0
+
+
+@pytest.mark.benchmark(group="vad-overhead")
+@pytest.mark.parametrize("chunk_secs", [0.01, 0.02, 0.03, 0.1])
+def test_vad_analyzer_overhead(benchmark, chunk_secs):
+    """Per-chunk cost of `VADAnalyzer.analyze_audio()` (audio accumulation,
+    volume and state machine) without any model, for 1 second of 16kHz audio
+    sent in chunks that don't line up with the 512 samples window.
+
+    """
+    sample_rate = 16000
+    audio = generate_audio(1.0, sample_rate)
+    chunk_size = int(sample_rate * chunk_secs) * 2
+    chunks = [audio[i : i + chunk_size] for i in range(0, len(audio), chunk_size)]
+
+    def analyze():
+        vad = ConstantVADAnalyzer(sample_rate=sample_rate, params=VADParams())
+        vad.set_sample_rate(sample_rate)
+        for chunk in chunks:
+            vad.analyze_audio(chunk)
+
+    benchmark(analyze)
+    benchmark.extra_info["chunks"] = len(chunks)
+
+
+@pytest.mark.benchmark(group="audio-volume")
+@pytest.mark.parametrize("streaming", [False, True], ids=["calculate_audio_volume", "meter"])
+def test_audio_volume(benchmark, streaming):
+    """Volume of 1 second of 16kHz audio measured in 512 samples windows (what
+    `VADAnalyzer` does with Silero) with `calculate_audio_volume()` and with a
+    streaming `LoudnessMeter`.
+
+    """
+    sample_rate = 16000
+    audio = generate_audio(1.0, sample_rate)
+    windows = [audio[i : i + 1024] for i in range(0, len(audio) - 1023, 1024)]
+    meter = LoudnessMeter(sample_rate)
+
+    def measure():
+        if streaming:
+            return [meter.volume(window) for window in windows]
+        else:
+            return [calculate_audio_volume(window, sample_rate) for window in windows]
+
+    benchmark(measure)
+
+
+@pytest.mark.benchmark(group="vad-creation")
+@pytest.mark.parametrize("shared", [False, True], ids=["new-session", "shared-session"])
+def test_silero_vad_creation(benchmark, shared):
+    """Time to create a `SileroVADAnalyzer`, loading a new ONNX session or
+    reusing the process-wide one. The memory (RSS) retained by every analyzer
+    is stored in `extra_info`.
+
+    """
+    # Make sure the shared session exists so we only measure analyzers.
+    SileroVADAnalyzer()
+
+    def create():
+        if not shared:
+            clear_onnx_sessions()
+        return SileroVADAnalyzer()
+
+    benchmark(create)
+
+    num_analyzers = 20
+    rss = current_rss()
+    analyzers = [create() for _ in range(num_analyzers)]
+    benchmark.extra_info["rss_per_analyzer"] = (current_rss() - rss) / len(analyzers)
+    clear_onnx_sessions()
+
+
+@pytest.mark.benchmark(group="vad-sessions")
+@pytest.mark.parametrize("batched", [False, True], ids=["per-session", "batched"])
+def test_silero_vad_sessions(benchmark, batched):
+    """64 sessions analyzing 1 second of audio each, every session in its own
+    thread (like `BaseInputTransport` does). Compares per-session analyzers
+    with a shared `SileroVADBatchService`.
+
+    """
+    num_sessions = 64
+    sample_rate = 16000
+    service = SileroVADBatchService() if batched else None
+    vads = []
+    for _ in range(num_sessions):
+        vad = SileroVADAnalyzer(sample_rate=sample_rate, batch_service=service)
+        vad.set_sample_rate(sample_rate)
+        vads.append(vad)
+    audio = generate_audio(1.0, sample_rate)
+    window = vads[0].num_frames_required() * 2
+    windows = [audio[i : i + window] for i in range(0, len(audio) - window + 1, window)]
+
+    def analyze(vad: SileroVADAnalyzer):
+        for w in windows:
+            vad.voice_confidence(w)
+
+    with ThreadPoolExecutor(max_workers=num_sessions) as executor:
+        benchmark(lambda: list(executor.map(analyze, vads)))
+
+    if service:
+        benchmark.extra_info["windows_per_batch"] = service.num_windows / service.num_batches
+        service.close()
+    benchmark.extra_info["sessions"] = num_sessions
+    benchmark.extra_info["audio_seconds"] = 1.0
+
+
+@pytest.mark.benchmark(group="resampler")
+@pytest.mark.parametrize("in_rate,out_rate", [(24000, 16000), (16000, 48000), (8000, 16000)])
+@pytest.mark.parametrize("chunk_secs", [0.02, 1.0])
+@pytest.mark.parametrize("streaming", [False, True], ids=["oneshot", "stream"])
+def test_soxr_resampler_throughput(benchmark, in_rate, out_rate, chunk_secs, streaming):
+    """Resamples 1 second of audio in chunks of the given duration, with
+    `SOXRAudioResampler` (every chunk on its own) and with
+    `SOXRStreamAudioResampler`. The distortion introduced at chunk boundaries
+    (signal to error ratio, in dB, compared to resampling the whole audio at
+    once) is stored in `extra_info`.
+
+    """
+    resampler = SOXRStreamAudioResampler() if streaming else SOXRAudioResampler()
+    audio = generate_audio(1.0, in_rate)
+    chunk_size = int(in_rate * chunk_secs) * 2
+    chunks = [audio[i : i + chunk_size] for i in range(0, len(audio), chunk_size)]
+
+    async def resample():
+        result = bytearray()
+        for chunk in chunks:
+            result.extend(await resampler.resample(chunk, in_rate, out_rate))
+        result.extend(await resampler.flush())
+        return result
+
+    result = benchmark(lambda: run_async(resample()))
+
+    expected = soxr.resample(np.frombuffer(audio, dtype=np.int16), in_rate, out_rate, "VHQ")
+    result = np.frombuffer(result, dtype=np.int16)[: len(expected)].astype(np.float64)
+    error = np.sum((result - expected) ** 2)
+    snr = 10 * np.log10(np.sum(expected.astype(np.float64) ** 2) / error) if error else np.inf
+    benchmark.extra_info["boundary_snr_db"] = float(snr)
+    benchmark.extra_info["audio_seconds"] = 1.0
+
+
+@pytest.mark.benchmark(group="output-transport")
+@pytest.mark.parametrize("frame_secs", [0.02, 1.0])
+def test_output_transport_chunking(benchmark, frame_secs):
+    """Splits 1 second of TTS audio (received in frames of the given duration)
+    into the 20ms chunks the output transport writes.
+
+    """
+    sample_rate = 24000
+    audio = generate_audio(1.0, sample_rate)
+    frame_size = int(sample_rate * frame_secs) * 2
+    frames = [
+        TTSAudioRawFrame(audio=audio[i : i + frame_size], sample_rate=sample_rate, num_channels=1)
+        for i in range(0, len(audio), frame_size)
+    ]
+
+    transport = BaseOutputTransport(
+        TransportParams(audio_out_enabled=True, audio_out_sample_rate=sample_rate)
+    )
+    # This is what `start()` would do, without creating the sink tasks. The
+    # chunks are written to the sink queue, which we drain on every round.
+    transport._sample_rate = sample_rate
+    transport._playout = AudioPlayout(sample_rate=sample_rate)
+    transport._audio_chunk_size = transport._playout.chunk_size
+
+    async def chunk():
+        transport._sink_queue = asyncio.Queue()
+        for frame in frames:
+            await transport._handle_audio(frame)
+
+    benchmark(lambda: run_async(chunk()))
+    benchmark.extra_info["audio_seconds"] = 1.0
+
+
+def temporary_bytes(fn: Callable[[bytes], Any], chunks: List[bytes]) -> int:
+    """Sum of the memory peaks (with `tracemalloc`) of calling `fn` on every
+    chunk. Since these functions don't keep anything, this is the memory they
+    allocate for their intermediate arrays and results.
+
+    """
+    fn(chunks[0])
+    tracemalloc.start()
+    total = 0
+    for chunk in chunks:
+        tracemalloc.reset_peak()
+        (current, _) = tracemalloc.get_traced_memory()
+        fn(chunk)
+        (_, peak) = tracemalloc.get_traced_memory()
+        total += peak - current
+    tracemalloc.stop()
+    return total
+
+
+@pytest.mark.benchmark(group="audio-utils")
+@pytest.mark.parametrize("function", ["mix_audio", "interleave_stereo_audio"])
+def test_audio_utils(benchmark, function):
+    """Mixes or interleaves 1 second of 16kHz audio in 20ms chunks (what
+    `AudioBufferProcessor` does). The memory allocated per second of audio is
+    stored in `extra_info`.
+
+    """
+    sample_rate = 16000
+    audio = generate_audio(1.0, sample_rate)
+    chunks = [audio[i : i + 640] for i in range(0, len(audio), 640)]
+    fn = {
+        "mix_audio": lambda chunk: mix_audio(chunk, chunk[:600]),
+        "interleave_stereo_audio": lambda chunk: interleave_stereo_audio(chunk, chunk),
+    }[function]
+
+    def run():
+        for chunk in chunks:
+            fn(chunk)
+
+    benchmark(run)
+    benchmark.extra_info["allocated_bytes_per_second"] = temporary_bytes(fn, chunks)
+
+
+@pytest.mark.benchmark(group="g711")
+@pytest.mark.skipif(audioop is None, reason="audioop is not available")
+@pytest.mark.parametrize("direction", ["encode", "decode"])
+@pytest.mark.parametrize("rate", [16000, 24000])
+@pytest.mark.parametrize("implementation", ["audioop", "g711"])
+def test_g711(benchmark, direction, rate, implementation):
+    """Encodes 1 second of audio at the given rate to 8kHz μ-law, or decodes
+    it back to the given rate, in 20ms packets (what telephony serializers
+    do). `audioop` is the previous implementation: a separate resampling step
+    followed by `audioop`.
+
+    """
+    audio = generate_audio(1.0, rate)
+    chunk_size = int(rate * 0.02) * 2
+    chunks = [audio[i : i + chunk_size] for i in range(0, len(audio), chunk_size)]
+    if direction == "decode":
+        data = audioop.lin2ulaw(soxr.resample(np.frombuffer(audio, dtype=np.int16), rate, 8000), 2)
+        chunks = [data[i : i + 160] for i in range(0, len(data), 160)]
+
+    resampler = SOXRAudioResampler()
+    encoder = G711Encoder("ulaw")
+    decoder = G711Decoder("ulaw")
+
+    async def audioop_encode(chunk: bytes):
+        return audioop.lin2ulaw(await resampler.resample(chunk, rate, 8000), 2)
+
+    async def audioop_decode(chunk: bytes):
+        return await resampler.resample(audioop.ulaw2lin(chunk, 2), 8000, rate)
+
+    async def g711_encode(chunk: bytes):
+        return encoder.encode(chunk, rate)
+
+    async def g711_decode(chunk: bytes):
+        return decoder.decode(chunk, rate)
+
+    fn = {
+        ("audioop", "encode"): audioop_encode,
+        ("audioop", "decode"): audioop_decode,
+        ("g711", "encode"): g711_encode,
+        ("g711", "decode"): g711_decode,
+    }[(implementation, direction)]
+
+    async def run():
+        for chunk in chunks:
+            await fn(chunk)
+
+    # Reuse the event loop, creating one is more expensive than what we
+    # measure.
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark(lambda: loop.run_until_complete(run()))
+    finally:
+        loop.close()
+    benchmark.extra_info["audio_seconds"] = 1.0
+
+
+@pytest.mark.benchmark(group="mixer-start")
+@pytest.mark.parametrize("sounds", ["per-session", "shared", "mapped"])
+def test_soundfile_mixer_start(benchmark, tmp_path, sounds):
+    """Starts a `SoundfileMixer` (at 24kHz) with 30 seconds of 44.1kHz stereo
+    background sound. With `per-session` every mixer decodes and resamples its
+    own copy (what mixers used to do), with `shared` the sound has already been
+    loaded in the process and with `mapped` it's mapped from the cache file
+    (e.g. the first session of a new process). The RSS increase per session is
+    stored in `extra_info`.
+
+    """
+    sample_rate = 44100
+    sound = np.frombuffer(generate_audio(30.0, sample_rate), dtype=np.int16)
+    sound_file = str(tmp_path / "ambience.wav")
+    sf.write(sound_file, np.stack([sound, sound], axis=1), sample_rate)
+    cache_dir = str(tmp_path / "cache") if sounds == "mapped" else None
+
+    def start() -> SoundfileMixer:
+        if sounds != "shared":
+            clear_sounds()
+        mixer = SoundfileMixer({"ambience": sound_file}, "ambience", cache_dir=cache_dir)
+        run_async(mixer.start(24000))
+        return mixer
+
+    # Load the sound (and create the cache file) once.
+    start()
+    benchmark(start)
+
+    num_sessions = 20
+    rss = current_rss()
+    mixers = [start() for _ in range(num_sessions)]
+    benchmark.extra_info["rss_per_session"] = (current_rss() - rss) / len(mixers)
+    clear_sounds()
+
+
+@pytest.mark.benchmark(group="mixer")
+@pytest.mark.parametrize("num_tracks", [1, 8])
+@pytest.mark.parametrize("mixer", ["soundfile", "multitrack"])
+def test_mixer_tracks(benchmark, tmp_path, num_tracks, mixer):
+    """Mixes 1 second of 24kHz bot voice, in 20ms chunks, with `num_tracks`
+    looping sounds. `soundfile` chains one `SoundfileMixer` per track (the
+    only way to layer sounds before `MultiTrackMixer`).
+
+    """
+    sample_rate = 24000
+    sound_files = []
+    for i in range(num_tracks):
+        sound_file = str(tmp_path / f"track{i}.wav")
+        sf.write(
+            sound_file, np.frombuffer(generate_audio(3.0, sample_rate), dtype=np.int16), sample_rate
+        )
+        sound_files.append(sound_file)
+
+    if mixer == "soundfile":
+        mixers = [SoundfileMixer({"track": f}, "track", cache_dir=None) for f in sound_files]
+    else:
+        tracks = {f"track{i}": MixerTrack(sound=f, playing=True) for i, f in enumerate(sound_files)}
+        mixers = [MultiTrackMixer(tracks, cache_dir=None)]
+    for m in mixers:
+        run_async(m.start(sample_rate))
+
+    audio = generate_audio(1.0, sample_rate)
+    chunk_size = int(sample_rate * 0.02) * 2
+    chunks = [audio[i : i + chunk_size] for i in range(0, len(audio), chunk_size)]
+
+    async def run():
+        for chunk in chunks:
+            for m in mixers:
+                chunk = await m.mix(chunk)
+
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark(lambda: loop.run_until_complete(run()))
+    finally:
+        loop.close()
+    benchmark.extra_info["audio_seconds"] = 1.0
+    clear_sounds()
+
+
+class FakeKoala:
+    """Same interface as a Koala instance. `process_secs` emulates the engine
+    time (sleeping releases the GIL, like the native engine would)."""
+
+    frame_length = 512
+
+    def __init__(self, process_secs: float = 0.0):
+        self._process_secs = process_secs
+
+    def process(self, pcm):
+        if self._process_secs:
+            time.sleep(self._process_secs)
+        return pcm
+
+
+class LegacyKoalaFilter:
+    """How `KoalaFilter` used to frame audio."""
+
+    def __init__(self, koala: FakeKoala):
+        self._koala = koala
+        self._audio_buffer = bytearray()
+
+    async def filter(self, audio: bytes) -> bytes:
+        self._audio_buffer.extend(audio)
+        filtered_data = []
+        frame_length = self._koala.frame_length
+        num_koala_frames = len(self._audio_buffer) // (frame_length * 2)
+        for i in range(num_koala_frames):
+            data = np.frombuffer(
+                self._audio_buffer, dtype=np.int16, count=frame_length, offset=i * frame_length * 2
+            ).tolist()
+            filtered_data += self._koala.process(data)
+        del self._audio_buffer[: num_koala_frames * frame_length * 2]
+        return np.array(filtered_data, dtype=np.int16).tobytes()
+
+
+class FakeKoalaFilter(FrameAlignedAudioFilter):
+    def __init__(self, koala: FakeKoala, **kwargs):
+        super().__init__(**kwargs)
+        self._koala = koala
+
+    def frame_length(self) -> int:
+        return self._koala.frame_length
+
+    def filter_frames(self, frames: np.ndarray) -> np.ndarray:
+        filtered = np.empty(frames.shape, dtype=np.int16)
+        for i, frame in enumerate(frames):
+            filtered[i] = self._koala.process(frame.tolist())
+        return filtered
+
+
+def create_koala_filter(implementation: str, koala: FakeKoala):
+    if implementation == "legacy":
+        return LegacyKoalaFilter(koala)
+    return FakeKoalaFilter(koala, offload=implementation == "offload")
+
+
+@pytest.mark.benchmark(group="audio-filter")
+@pytest.mark.parametrize("implementation", ["legacy", "inline", "offload"])
+def test_frame_aligned_filter(benchmark, implementation):
+    """Filters 1 second of 16kHz audio, in 20ms chunks, with a Koala-like
+    engine (512-sample frames) that takes no time, so only the framing (and
+    thread hand-off) overhead is measured. `legacy` is how `KoalaFilter` used
+    to frame audio.
+
+    """
+    audio = generate_audio(1.0, 16000)
+    chunks = [audio[i : i + 640] for i in range(0, len(audio), 640)]
+    filter = create_koala_filter(implementation, FakeKoala())
+
+    async def run():
+        for chunk in chunks:
+            await filter.filter(chunk)
+
+    loop = asyncio.new_event_loop()
+    try:
+        if implementation != "legacy":
+            loop.run_until_complete(filter.start(16000))
+        benchmark(lambda: loop.run_until_complete(run()))
+        if implementation != "legacy":
+            loop.run_until_complete(filter.stop())
+    finally:
+        loop.close()
+    benchmark.extra_info["audio_seconds"] = 1.0
+
+
+@pytest.mark.benchmark(group="audio-filter-latency")
+@pytest.mark.parametrize("implementation", ["legacy", "offload"])
+def test_frame_aligned_filter_loop_lag(benchmark, implementation):
+    """Filters 1 second of 16kHz audio, in 20ms chunks, with a Koala-like
+    engine that takes 2ms per frame, while another task measures how late the
+    event loop wakes it up every millisecond. The mean and maximum lag (how
+    long other tasks, e.g. the output transport, could be delayed) are stored
+    in `extra_info`.
+
+    """
+    audio = generate_audio(1.0, 16000)
+    chunks = [audio[i : i + 640] for i in range(0, len(audio), 640)]
+    filter = create_koala_filter(implementation, FakeKoala(process_secs=0.002))
+    lags = []
+
+    async def measure_lag():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    async def run():
+        task = asyncio.create_task(measure_lag())
+        await asyncio.sleep(0)
+        for chunk in chunks:
+            await filter.filter(chunk)
+            # Let other tasks run, like the input transport does between
+            # chunks.
+            await asyncio.sleep(0)
+        task.cancel()
+
+    loop = asyncio.new_event_loop()
+    try:
+        if implementation != "legacy":
+            loop.run_until_complete(filter.start(16000))
+        benchmark.pedantic(lambda: loop.run_until_complete(run()), rounds=3)
+        if implementation != "legacy":
+            loop.run_until_complete(filter.stop())
+    finally:
+        loop.close()
+    benchmark.extra_info["mean_loop_lag"] = sum(lags) / len(lags)
+    benchmark.extra_info["max_loop_lag"] = max(lags)
+
+
+def generate_noisy_speech(seconds: float, sample_rate: int):
+    """Returns a clean speech-like signal (a harmonic sound with a moving pitch,
+    4 syllables per second and pauses), the same signal with white noise at
+    5dB SNR (int16) and a mask of the samples in pauses.
+
+    """
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pitch = 150 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 20))
+    envelope = (np.sin(2 * np.pi * 4 * t) > 0) & ((t % 2) < 1.3)
+    clean = 4000 * voiced * envelope
+    noise = rng.standard_normal(len(t))
+    noise *= np.sqrt(np.mean(clean**2) / 10 ** (5 / 10))
+    noisy = np.clip(clean + noise, -32768, 32767).astype(np.int16)
+    pauses = np.convolve(envelope, np.ones(sample_rate // 20), "same") == 0
+    return clean, noisy, pauses
+
+
+def noise_filter_quality(clean: np.ndarray, noisy: np.ndarray, pauses: np.ndarray, output: bytes):
+    """Returns how much noise is removed in pauses and the SNR while speaking
+    (both in dB), compensating the filter delay.
+
+    """
+    output = np.frombuffer(output, dtype=np.int16).astype(np.float64)
+    delay = max(range(1024), key=lambda d: np.dot(output[d : d + 16000], clean[:16000]))
+    output = output[delay:]
+    n = len(output)
+    clean, noisy, pauses = clean[:n], noisy[:n].astype(np.float64), pauses[:n]
+    noise_reduction = 10 * np.log10(np.mean(noisy[pauses] ** 2) / np.mean(output[pauses] ** 2))
+    speech = ~pauses
+    error = output[speech] - clean[speech]
+    speech_snr = 10 * np.log10(np.mean(clean[speech] ** 2) / np.mean(error**2))
+    return noise_reduction, speech_snr
+
+
+@pytest.mark.benchmark(group="noise-filter")
+@pytest.mark.parametrize("implementation", ["noisereduce", "spectral-gating"])
+def test_noise_filter(benchmark, implementation):
+    """Filters 4 seconds of noisy speech-like audio at 16kHz in 20ms chunks.
+    The noise removed in pauses and the SNR while speaking (8.2dB before
+    filtering) are stored in `extra_info`.
+
+    """
+    if implementation == "noisereduce":
+        pytest.importorskip("noisereduce")
+        from pipecat.audio.filters.noisereduce_filter import NoisereduceFilter
+
+        create_filter = NoisereduceFilter
+    else:
+        create_filter = SpectralGatingFilter
+
+    sample_rate = 16000
+    clean, noisy, pauses = generate_noisy_speech(4.0, sample_rate)
+    chunk_size = int(sample_rate * 0.02)
+    chunks = [noisy[i : i + chunk_size].tobytes() for i in range(0, len(noisy), chunk_size)]
+
+    async def run() -> bytes:
+        filter = create_filter()
+        await filter.start(sample_rate)
+        output = b"".join([await filter.filter(chunk) for chunk in chunks])
+        await filter.stop()
+        return output
+
+    loop = asyncio.new_event_loop()
+    try:
+        output = benchmark(lambda: loop.run_until_complete(run()))
+    finally:
+        loop.close()
+    noise_reduction, speech_snr = noise_filter_quality(clean, noisy, pauses, output)
+    benchmark.extra_info["audio_seconds"] = 4.0
+    benchmark.extra_info["noise_reduction_db"] = noise_reduction
+    benchmark.extra_info["speech_snr_db"] = speech_snr
+
+
+@pytest.mark.benchmark(group="recorder")
+@pytest.mark.parametrize("implementation", ["audio-buffer", "streaming"])
+def test_recorder_memory(benchmark, implementation, tmp_path):
+    """Records a 2 hour call at 8kHz to a WAV file: 20ms user frames and the
+    bot talks half of the time. The peak memory while recording and writing
+    the file is measured (with `tracemalloc`) in a separate run, since tracing
+    slows down recording, and stored in `extra_info`.
+
+    """
+    sample_rate = 8000
+    num_frames = 2 * 3600 * 50
+    frame_ns = 20_000_000
+    audio = generate_audio(0.02, sample_rate)
+    user_frame = InputAudioRawFrame(audio=audio, sample_rate=sample_rate, num_channels=1)
+    bot_frame = OutputAudioRawFrame(audio=audio, sample_rate=sample_rate, num_channels=1)
+    file_name = str(tmp_path / "call.wav")
+
+    async def record_audio_buffer():
+        processor = AudioBufferProcessor(sample_rate=sample_rate)
+        processor._sample_rate = sample_rate
+        processor._recording = True
+        for i in range(num_frames):
+            await processor._handle_continuous_stream(user_frame)
+            if (i // 500) % 2:
+                await processor._handle_continuous_stream(bot_frame)
+        audio = np.frombuffer(processor.merge_audio_buffers(), dtype=np.int16)
+        sf.write(file_name, audio, sample_rate)
+
+    async def record_streaming():
+        recorder = AudioRecorder(file_name, sample_rate=sample_rate)
+        recorder.start(0)
+        for i in range(num_frames):
+            timestamp = (i + 1) * frame_ns
+            await recorder.write_user_audio(user_frame.audio, timestamp)
+            if (i // 500) % 2:
+                await recorder.write_bot_audio(bot_frame.audio, timestamp)
+        await recorder.stop()
+
+    record = record_audio_buffer if implementation == "audio-buffer" else record_streaming
+
+    tracemalloc.start()
+    try:
+        run_async(record())
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    benchmark.pedantic(lambda: run_async(record()), rounds=1)
+    benchmark.extra_info["audio_seconds"] = num_frames * 0.02
+    benchmark.extra_info["peak_memory"] = peak
+    benchmark.extra_info["file_size"] = sf.info(file_name).frames * 2
@@ -0,0 +1,46 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import pytest
+
+from pipecat.frames.frames import (
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    TextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    UserStartedSpeakingFrame,
+)
+
+AUDIO_20MS = b"\x00" * 640
+
+
+@pytest.mark.benchmark(group="frames")
+@pytest.mark.parametrize(
+    "factory",
+    [
+        pytest.param(lambda: TextFrame(text="Hello!"), id="TextFrame"),
+        pytest.param(
+            lambda: TranscriptionFrame(text="Hello!", user_id="user", timestamp=""),
+            id="TranscriptionFrame",
+        ),
+        pytest.param(
+            lambda: InputAudioRawFrame(audio=AUDIO_20MS, sample_rate=16000, num_channels=1),
+            id="InputAudioRawFrame",
+        ),
+        pytest.param(
+            lambda: OutputAudioRawFrame(audio=AUDIO_20MS, sample_rate=16000, num_channels=1),
+            id="OutputAudioRawFrame",
+        ),
+        pytest.param(
+            lambda: TTSAudioRawFrame(audio=AUDIO_20MS, sample_rate=16000, num_channels=1),
+            id="TTSAudioRawFrame",
+        ),
+        pytest.param(lambda: UserStartedSpeakingFrame(), id="UserStartedSpeakingFrame"),
+    ],
+)
+def test_frame_creation(benchmark, factory):
+    benchmark(factory)
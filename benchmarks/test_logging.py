@@ -0,0 +1,148 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the cost of trace logging in the frame push path.
+
+Frames are pushed through a pipeline of identity filters with logging at INFO
+level using three versions of `FrameProcessor.__internal_push_frame`:
+
+- lazy: the current implementation, using `pipecat.utils.log`.
+- eager: logging with `logger.trace(f"...")`, formatting on every frame.
+- stripped: the same implementation without any trace calls.
+
+Run with:
+
+    pytest benchmarks/test_logging.py --benchmark-group-by=group
+
+"""
+
+import asyncio
+import time
+
+import pytest
+from loguru import logger
+
+from pipecat.frames.frames import EndFrame, ErrorFrame, Frame, TextFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+NUM_STAGES = 10
+NUM_FRAMES = 2000
+
+
+async def _push_frame_eager(self, frame: Frame, direction: FrameDirection):
+    try:
+        timestamp = self._clock.get_time() if self._clock else 0
+        if direction == FrameDirection.DOWNSTREAM and self._next:
+            logger.trace(f"Pushing {frame} from {self} to {self._next}")
+            if self._observer:
+                await self._observer.on_push_frame(self, self._next, frame, direction, timestamp)
+            await self._next.queue_frame(frame, direction)
+        elif direction == FrameDirection.UPSTREAM and self._prev:
+            logger.trace(f"Pushing {frame} upstream from {self} to {self._prev}")
+            if self._observer:
+                await self._observer.on_push_frame(self, self._prev, frame, direction, timestamp)
+            await self._prev.queue_frame(frame, direction)
+    except Exception as e:
+        logger.exception(f"Uncaught exception in {self}: {e}")
+        await self.push_error(ErrorFrame(str(e)))
+        raise
+
+
+async def _push_frame_stripped(self, frame: Frame, direction: FrameDirection):
+    try:
+        timestamp = self._clock.get_time() if self._clock else 0
+        if direction == FrameDirection.DOWNSTREAM and self._next:
+            if self._observer:
+                await self._observer.on_push_frame(self, self._next, frame, direction, timestamp)
+            await self._next.queue_frame(frame, direction)
+        elif direction == FrameDirection.UPSTREAM and self._prev:
+            if self._observer:
+                await self._observer.on_push_frame(self, self._prev, frame, direction, timestamp)
+            await self._prev.queue_frame(frame, direction)
+    except Exception as e:
+        logger.exception(f"Uncaught exception in {self}: {e}")
+        await self.push_error(ErrorFrame(str(e)))
+        raise
+
+
+PUSH_FRAME_VARIANTS = {
+    "lazy": FrameProcessor._FrameProcessor__internal_push_frame,
+    "eager": _push_frame_eager,
+    "stripped": _push_frame_stripped,
+}
+
+
+def run_frames(variant: str) -> float:
+    """Pushes frames through the pipeline and returns the number of frames per
+    second (counting every hop).
+
+    """
+    original = FrameProcessor._FrameProcessor__internal_push_frame
+    FrameProcessor._FrameProcessor__internal_push_frame = PUSH_FRAME_VARIANTS[variant]
+    try:
+        pipeline = Pipeline([IdentityFilter() for _ in range(NUM_STAGES)])
+        task = PipelineTask(pipeline)
+        frames = [TextFrame(text="Hello!") for _ in range(NUM_FRAMES)]
+
+        async def run():
+            await task.queue_frames(frames + [EndFrame()])
+            await PipelineRunner(handle_sigint=False).run(task)
+
+        start = time.perf_counter()
+        asyncio.run(run())
+        elapsed = time.perf_counter() - start
+    finally:
+        FrameProcessor._FrameProcessor__internal_push_frame = original
+    return NUM_FRAMES * NUM_STAGES / elapsed
+
+
+class NullProcessor(FrameProcessor):
+    async def queue_frame(self, frame: Frame, direction: FrameDirection, callback=None):
+        pass
+
+
+def push_frames(variant: str, num_frames: int = 50_000) -> float:
+    """Calls the push path directly (the next processor discards the frames)
+    and returns the number of frames per second. This isolates the cost of
+    logging from the rest of the pipeline machinery.
+
+    """
+    push_frame = PUSH_FRAME_VARIANTS[variant]
+    processor = IdentityFilter()
+    processor.link(NullProcessor())
+    frame = TextFrame(text="Hello!")
+
+    async def run():
+        for _ in range(num_frames):
+            await push_frame(processor, frame, FrameDirection.DOWNSTREAM)
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    return num_frames / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark(group="logging")
+@pytest.mark.parametrize("variant", list(PUSH_FRAME_VARIANTS.keys()))
+def test_push_frame_logging(benchmark, variant):
+    fps = benchmark.pedantic(run_frames, args=(variant,), rounds=5, warmup_rounds=1)
+    benchmark.extra_info["frames_per_second"] = fps
+
+
+def test_lazy_logging_matches_stripped():
+    # Interleave runs (alternating the order) so all variants see the same
+    # machine conditions and keep the best run of each.
+    best = {variant: 0.0 for variant in ("lazy", "eager", "stripped")}
+    variants = list(best.keys())
+    for _ in range(15):
+        for variant in variants:
+            best[variant] = max(best[variant], push_frames(variant))
+        variants.reverse()
+    assert best["lazy"] >= best["stripped"] * 0.9, best
+    assert best["lazy"] > best["eager"], best
@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.utils import generate_audio
+from pipecat.audio.vad.vad_analyzer import VADParams
+from pipecat.frames.frames import EndFrame, Frame, InputAudioRawFrame, OutputAudioRawFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.mock import audio_rms
+from pipecat.tests.loadgen.bot import EnergyVADAnalyzer, create_bot_task
+from pipecat.tests.loadgen.scenario import LoadScenario
+from pipecat.tests.virtual_time import run_with_virtual_time
+from pipecat.transports.local.loopback import (
+    LoopbackNetworkParams,
+    LoopbackParams,
+    create_loopback_transports,
+)
+
+SAMPLE_RATE = 16000
+NETWORK = LoopbackNetworkParams(latency=0.05, jitter=0.02, packet_loss=0.01, seed=0)
+
+
+class ResponseDetector(FrameProcessor):
+    """Records when the client first hears the bot."""
+
+    def __init__(self):
+        super().__init__()
+        self.first_audio_time = None
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if (
+            isinstance(frame, InputAudioRawFrame)
+            and not self.first_audio_time
+            and audio_rms(frame.audio) > 0.01
+        ):
+            self.first_audio_time = time.monotonic()
+        await self.push_frame(frame, direction)
+
+
+async def run_conversation() -> float:
+    scenario = LoadScenario(sample_rate=SAMPLE_RATE)
+    (bot, client) = create_loopback_transports(
+        LoopbackParams(
+            audio_in_enabled=True,
+            audio_out_enabled=True,
+            vad_enabled=True,
+            vad_analyzer=EnergyVADAnalyzer(params=VADParams(stop_secs=scenario.bot.vad_stop_secs)),
+            vad_audio_passthrough=True,
+            network=NETWORK,
+        ),
+        LoopbackParams(audio_in_enabled=True, audio_out_enabled=True, network=NETWORK),
+    )
+
+    bot_task = create_bot_task(bot, scenario)
+    detector = ResponseDetector()
+    client_task = PipelineTask(
+        Pipeline([client.input(), detector, client.output()]),
+        params=PipelineParams(audio_in_sample_rate=SAMPLE_RATE, audio_out_sample_rate=SAMPLE_RATE),
+    )
+
+    async def caller():
+        # One second of speech followed by silence while the bot responds.
+        audio = generate_audio(1.0, SAMPLE_RATE) + bytes(SAMPLE_RATE * 2 * 7)
+        await asyncio.sleep(0.01)
+        await client_task.queue_frame(
+            OutputAudioRawFrame(audio=audio, sample_rate=SAMPLE_RATE, num_channels=1)
+        )
+        speech_end_time = time.monotonic() + 1.0
+        await asyncio.sleep(8.0)
+        await client_task.queue_frame(EndFrame())
+        await bot_task.queue_frame(EndFrame())
+        return speech_end_time
+
+    runner = PipelineRunner(handle_sigint=False)
+    (_, _, speech_end_time) = await asyncio.gather(
+        runner.run(bot_task), runner.run(client_task), caller()
+    )
+    return detector.first_audio_time - speech_end_time
+
+
+@pytest.mark.benchmark(group="loopback")
+def test_loopback_conversation(benchmark):
+    """CPU time of a full voice bot turn (VAD, mock STT, LLM and TTS and both
+    transports) through the loopback transport. The conversation, 8 seconds of
+    real-time audio, runs with virtual time so only the processing is
+    measured. The user-perceived response latency (in virtual time) is stored
+    in `extra_info`.
+
+    """
+    latency = benchmark(lambda: run_with_virtual_time(run_conversation()))
+    benchmark.extra_info["response_latency"] = latency
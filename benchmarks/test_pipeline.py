@@ -0,0 +1,56 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import pytest
+
+from benchmarks.utils import RunningPipeline
+from pipecat.frames.frames import StartInterruptionFrame, TextFrame
+from pipecat.pipeline.task import PipelineParams
+from pipecat.processors.filters.identity_filter import IdentityFilter
+
+
+@pytest.mark.benchmark(group="pipeline-latency")
+@pytest.mark.parametrize("num_stages", [1, 10, 50])
+def test_frame_latency(benchmark, num_stages):
+    """Time for a single frame to go through a pipeline of `num_stages`
+    processors. The per-hop latency is roughly the difference between stages
+    divided by the number of extra stages.
+
+    """
+    with RunningPipeline([IdentityFilter() for _ in range(num_stages)]) as pipeline:
+        benchmark(lambda: pipeline.run(pipeline.push_and_wait([TextFrame("Hello!")], TextFrame)))
+    benchmark.extra_info["num_stages"] = num_stages
+
+
+@pytest.mark.benchmark(group="pipeline-throughput")
+@pytest.mark.parametrize("num_stages", [1, 10])
+def test_frame_throughput(benchmark, num_stages):
+    """Time to push a burst of 100 frames through the pipeline."""
+    with RunningPipeline([IdentityFilter() for _ in range(num_stages)]) as pipeline:
+
+        async def burst():
+            for _ in range(100):
+                await pipeline.task.queue_frame(TextFrame("Hello!"))
+            for _ in range(100):
+                await pipeline.wait_for(TextFrame)
+
+        benchmark(lambda: pipeline.run(burst()))
+    benchmark.extra_info["num_stages"] = num_stages
+
+
+@pytest.mark.benchmark(group="pipeline-interruption")
+@pytest.mark.parametrize("num_stages", [1, 10])
+def test_interruption_latency(benchmark, num_stages):
+    """Time for an interruption to reach the end of the pipeline while every
+    processor has frames queued. Interruptions cancel and recreate the
+    processors' internal tasks.
+
+    """
+    params = PipelineParams(allow_interruptions=True)
+    with RunningPipeline([IdentityFilter() for _ in range(num_stages)], params) as pipeline:
+        frames = [TextFrame("Hello!") for _ in range(50)] + [StartInterruptionFrame()]
+        benchmark(lambda: pipeline.run(pipeline.push_and_wait(frames, StartInterruptionFrame)))
+    benchmark.extra_info["num_stages"] = num_stages
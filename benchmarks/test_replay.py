@@ -0,0 +1,128 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+
+import pytest
+
+from benchmarks.utils import generate_audio, run_async
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    EndTaskFrame,
+    InputAudioRawFrame,
+    StartFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.session_recorder import SessionRecorder, SessionRecording
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.llm_response import (
+    LLMAssistantContextAggregator,
+    LLMUserContextAggregator,
+)
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.services.mock import MockLLMService, MockSTTService, MockTTSService
+from pipecat.tests.replay import ReplayService, replay_session
+from pipecat.transports.base_input import BaseInputTransport
+from pipecat.transports.base_transport import TransportParams
+
+SAMPLE_RATE = 16000
+NUM_TURNS = 5
+
+
+class ScriptedInputTransport(BaseInputTransport):
+    """Pushes `NUM_TURNS` user turns (1 second of speech followed by silence)
+    and then ends the pipeline.
+
+    """
+
+    def __init__(self):
+        super().__init__(TransportParams())
+        self._user_task = None
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        self._user_task = self.create_task(self._user_task_handler())
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        await self.cancel_task(self._user_task)
+
+    async def cancel(self, frame: CancelFrame):
+        await super().cancel(frame)
+        await self.cancel_task(self._user_task)
+
+    async def _user_task_handler(self):
+        chunk = int(SAMPLE_RATE * 0.02) * 2
+        audio = generate_audio(1.0, SAMPLE_RATE) + bytes(int(SAMPLE_RATE * 0.4) * 2)
+        for _ in range(NUM_TURNS):
+            await self.push_frame(UserStartedSpeakingFrame())
+            for i in range(0, len(audio), chunk):
+                await self.push_frame(
+                    InputAudioRawFrame(
+                        audio=audio[i : i + chunk], sample_rate=SAMPLE_RATE, num_channels=1
+                    )
+                )
+            # Give the STT service time to transcribe.
+            await asyncio.sleep(0.05)
+            await self.push_frame(UserStoppedSpeakingFrame())
+            await asyncio.sleep(0.2)
+        await self.push_frame(EndTaskFrame(), FrameDirection.UPSTREAM)
+
+
+def create_processors(stt, llm, tts):
+    context = OpenAILLMContext()
+    return [
+        stt,
+        LLMUserContextAggregator(context),
+        llm,
+        tts,
+        LLMAssistantContextAggregator(context),
+    ]
+
+
+@pytest.fixture(scope="module")
+def recording() -> SessionRecording:
+    async def record():
+        recorder = SessionRecorder()
+        processors = create_processors(
+            MockSTTService(latency=0, endpointing_secs=0.2),
+            MockLLMService(latency=0, token_interval=0),
+            MockTTSService(latency=0),
+        )
+        task = PipelineTask(
+            Pipeline([ScriptedInputTransport(), *processors]),
+            params=PipelineParams(observers=[recorder]),
+        )
+        await PipelineRunner(handle_sigint=False).run(task)
+        return recorder.recording
+
+    return run_async(record())
+
+
+@pytest.mark.benchmark(group="replay")
+def test_replay_session(benchmark, recording):
+    """Time to replay a recorded voice bot session (STT, user context
+    aggregator, LLM, TTS and assistant context aggregator) as fast as
+    possible. This is the CPU cost of the pipeline itself for a few user
+    turns, without any external service.
+
+    """
+
+    async def replay():
+        processors = create_processors(
+            ReplayService(recording, "stt", speed=0),
+            ReplayService(recording, "llm", speed=0),
+            ReplayService(recording, "tts", speed=0),
+        )
+        await replay_session(recording, processors, speed=0)
+
+    benchmark(lambda: run_async(replay()))
+    benchmark.extra_info["num_turns"] = NUM_TURNS
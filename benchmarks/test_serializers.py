@@ -0,0 +1,49 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import pytest
+
+from benchmarks.utils import generate_audio, run_async
+from pipecat.frames.frames import OutputAudioRawFrame, TextFrame, TranscriptionFrame
+from pipecat.serializers.protobuf import ProtobufFrameSerializer
+
+# All serializer benchmarks process this number of frames per round, so the
+# event loop overhead is not measured.
+NUM_FRAMES = 1000
+
+FRAMES = {
+    "text": TextFrame(text="Hello! How are you doing today?"),
+    "transcription": TranscriptionFrame(text="Hello!", user_id="user", timestamp="0"),
+    "audio-20ms": OutputAudioRawFrame(
+        audio=generate_audio(0.02, 16000), sample_rate=16000, num_channels=1
+    ),
+}
+
+
+@pytest.mark.benchmark(group="serializer-protobuf")
+@pytest.mark.parametrize("frame_type", FRAMES.keys())
+def test_protobuf_serialize(benchmark, frame_type):
+    serializer = ProtobufFrameSerializer()
+    frame = FRAMES[frame_type]
+
+    async def serialize():
+        for _ in range(NUM_FRAMES):
+            await serializer.serialize(frame)
+
+    benchmark(lambda: run_async(serialize()))
+
+
+@pytest.mark.benchmark(group="serializer-protobuf")
+@pytest.mark.parametrize("frame_type", FRAMES.keys())
+def test_protobuf_deserialize(benchmark, frame_type):
+    serializer = ProtobufFrameSerializer()
+    data = run_async(serializer.serialize(FRAMES[frame_type]))
+
+    async def deserialize():
+        for _ in range(NUM_FRAMES):
+            await serializer.deserialize(data)
+
+    benchmark(lambda: run_async(deserialize()))
@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+from typing import Coroutine, List, Optional, Sequence, Type
+
+import numpy as np
+
+from pipecat.frames.frames import EndFrame, Frame, StartFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+def generate_audio(seconds: float, sample_rate: int, *, seed: int = 0) -> bytes:
+    """Generates 16-bit mono audio (a tone with some noise) of the given
+    duration.
+
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = 0.3 * np.sin(2 * np.pi * 440 * t) + 0.05 * rng.standard_normal(t.shape)
+    return (samples * 32767).astype(np.int16).tobytes()
+
+
+def run_async(coroutine: Coroutine):
+    """Runs the given coroutine in a new event loop. Useful when benchmarking
+    async functions that don't need a running pipeline.
+
+    """
+    return asyncio.run(coroutine)
+
+
+class SinkProcessor(FrameProcessor):
+    """Puts all the frames (except `StartFrame`) that reach the end of the
+    pipeline in a queue.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.started = asyncio.Event()
+        self.queue = asyncio.Queue()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, StartFrame):
+            self.started.set()
+        elif direction == FrameDirection.DOWNSTREAM:
+            await self.queue.put(frame)
+
+        await self.push_frame(frame, direction)
+
+
+class RunningPipeline:
+    """Runs a pipeline task in its own event loop for the duration of a `with`
+    block, so benchmarks can repeatedly push frames into an already running
+    pipeline and wait for them to reach the end.
+
+    """
+
+    def __init__(
+        self, processors: Sequence[FrameProcessor], params: PipelineParams = PipelineParams()
+    ):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._sink = SinkProcessor()
+        self._task = PipelineTask(Pipeline(list(processors) + [self._sink]), params=params)
+        self._runner_task: Optional[asyncio.Task] = None
+
+    @property
+    def task(self) -> PipelineTask:
+        return self._task
+
+    def run(self, coroutine: Coroutine):
+        return self._loop.run_until_complete(coroutine)
+
+    async def wait_for(self, frame_type: Type[Frame]) -> Frame:
+        """Waits until a frame of the given type reaches the end of the
+        pipeline, discarding any other frames.
+
+        """
+        while True:
+            frame = await self._sink.queue.get()
+            if isinstance(frame, frame_type):
+                return frame
+
+    async def push_and_wait(self, frames: List[Frame], frame_type: Type[Frame]) -> Frame:
+        for frame in frames:
+            await self._task.queue_frame(frame)
+        return await self.wait_for(frame_type)
+
+    def __enter__(self):
+        runner = PipelineRunner(handle_sigint=False, loop=self._loop)
+        self._runner_task = self._loop.create_task(runner.run(self._task))
+        self.run(self._sink.started.wait())
+        return self
+
+    def __exit__(self, *args):
+        self.run(self._task.queue_frame(EndFrame()))
+        self.run(self._runner_task)
+        self._loop.close()
+        asyncio.set_event_loop(None)
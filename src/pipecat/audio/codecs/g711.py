@@ -0,0 +1,239 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""G.711 (μ-law and A-law) codec using numpy lookup tables. Encoding and
+decoding give the same result as the (deprecated) `audioop` functions.
+
+`G711Encoder` and `G711Decoder` also resample to and from the G.711 sample
+rate (usually 8000Hz) in the same pass. When one rate is a multiple of the
+other (e.g. 16000Hz or 24000Hz) they use a streaming polyphase FIR filter, so
+each packet is resampled without delay bursts and without distortion at the
+packet boundaries.
+
+"""
+
+import functools
+from typing import Literal, Optional
+
+import numpy as np
+import scipy.signal
+import soxr
+
+G711Law = Literal["ulaw", "alaw"]
+
+# Last value of each segment for 14-bit (μ-law) and 13-bit (A-law) magnitudes.
+_ULAW_SEGMENT_END = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF])
+_ALAW_SEGMENT_END = np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF])
+_ULAW_BIAS = 0x84
+_ULAW_CLIP = 8159
+
+
+def _ulaw_encode_table() -> np.ndarray:
+    # One entry per 16-bit sample, indexed by the sample as unsigned.
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(pcm), _ULAW_CLIP) + (_ULAW_BIAS >> 2)
+    segment = np.searchsorted(_ULAW_SEGMENT_END, magnitude)
+    value = (segment << 4) | ((magnitude >> (segment + 1)) & 0xF)
+    value = np.where(segment >= 8, 0x7F, value)
+    return (value ^ mask).astype(np.uint8)
+
+
+def _alaw_encode_table() -> np.ndarray:
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 3
+    mask = np.where(pcm >= 0, 0xD5, 0x55)
+    magnitude = np.where(pcm >= 0, pcm, -pcm - 1)
+    segment = np.searchsorted(_ALAW_SEGMENT_END, magnitude)
+    quantized = np.where(segment < 2, magnitude >> 1, magnitude >> segment) & 0xF
+    value = np.where(segment >= 8, 0x7F, (segment << 4) | quantized)
+    return (value ^ mask).astype(np.uint8)
+
+
+def _ulaw_decode_table() -> np.ndarray:
+    value = ~np.arange(256, dtype=np.int32) & 0xFF
+    t = (((value & 0xF) << 3) + _ULAW_BIAS) << ((value & 0x70) >> 4)
+    return np.where(value & 0x80, _ULAW_BIAS - t, t - _ULAW_BIAS).astype(np.int16)
+
+
+def _alaw_decode_table() -> np.ndarray:
+    value = np.arange(256, dtype=np.int32) ^ 0x55
+    t = (value & 0xF) << 4
+    segment = (value & 0x70) >> 4
+    t = np.where(segment == 0, t + 8, (t + 0x108) << np.maximum(segment - 1, 0))
+    return np.where(value & 0x80, t, -t).astype(np.int16)
+
+
+@functools.cache
+def _encode_table(law: G711Law) -> np.ndarray:
+    if law == "ulaw":
+        return _ulaw_encode_table()
+    elif law == "alaw":
+        return _alaw_encode_table()
+    raise ValueError(f"Unsupported G.711 law: {law}")
+
+
+@functools.cache
+def _decode_table(law: G711Law) -> np.ndarray:
+    if law == "ulaw":
+        return _ulaw_decode_table()
+    elif law == "alaw":
+        return _alaw_decode_table()
+    raise ValueError(f"Unsupported G.711 law: {law}")
+
+
+@functools.cache
+def _decode_table_float(law: G711Law) -> np.ndarray:
+    return _decode_table(law).astype(np.float32)
+
+
+def encode(samples: np.ndarray, law: G711Law = "ulaw") -> bytes:
+    """Encodes 16-bit samples (int16) to G.711."""
+    return _encode_table(law)[samples.view(np.uint16)].tobytes()
+
+
+def decode(data: bytes, law: G711Law = "ulaw") -> np.ndarray:
+    """Decodes G.711 data to 16-bit samples (int16)."""
+    return _decode_table(law)[np.frombuffer(data, dtype=np.uint8)]
+
+
+def _to_int16(samples: np.ndarray) -> np.ndarray:
+    np.rint(samples, out=samples)
+    np.clip(samples, -32768, 32767, out=samples)
+    return samples.astype(np.int16)
+
+
+@functools.cache
+def _lowpass_filter(factor: int) -> np.ndarray:
+    # Low-pass filter at the higher sample rate with the cutoff just below the
+    # Nyquist frequency of the lower one (3600Hz for 8000Hz). 48 taps per
+    # phase delays audio by 3ms.
+    taps = scipy.signal.firwin(48 * factor + 1, 0.9 / factor, window=("kaiser", 7.0))
+    return taps.astype(np.float32)
+
+
+class _Upsampler:
+    """Streaming polyphase interpolation by an integer factor: each phase of
+    the filter computes one of every `factor` output samples.
+
+    """
+
+    def __init__(self, factor: int):
+        self._factor = factor
+        taps = _lowpass_filter(factor) * factor
+        num_taps = -(-len(taps) // factor)
+        taps = np.pad(taps, (0, num_taps * factor - len(taps)))
+        self._phases = [taps[p::factor] for p in range(factor)]
+        self.reset()
+
+    def reset(self):
+        self._history = np.zeros(len(self._phases[0]) - 1, dtype=np.float32)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        output = np.empty((len(samples), self._factor), dtype=np.float32)
+        samples = np.concatenate((self._history, samples))
+        self._history = samples[len(samples) - len(self._history) :]
+        for p, phase in enumerate(self._phases):
+            output[:, p] = np.convolve(samples, phase, "valid")
+        return output.reshape(-1)
+
+
+class _Downsampler:
+    """Streaming decimation by an integer factor. Chunks don't need to be a
+    multiple of the factor.
+
+    """
+
+    def __init__(self, factor: int):
+        self._factor = factor
+        self._taps = _lowpass_filter(factor)
+        self.reset()
+
+    def reset(self):
+        self._history = np.zeros(len(self._taps) - 1, dtype=np.float32)
+        # Index, in the next chunk, of the next sample to keep.
+        self._offset = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        num_samples = len(samples)
+        samples = np.concatenate((self._history, samples))
+        self._history = samples[len(samples) - len(self._history) :]
+        output = np.convolve(samples, self._taps, "valid")[self._offset :: self._factor]
+        self._offset = (self._offset - num_samples) % self._factor
+        return output
+
+
+class G711Encoder:
+    """Resamples 16-bit mono audio to `sample_rate` and encodes it to G.711.
+    Filter state is kept between calls to `encode()`, so it should be called
+    with consecutive audio. Call `reset()` if there's a discontinuity (e.g.
+    on interruptions).
+
+    """
+
+    def __init__(self, law: G711Law = "ulaw", *, sample_rate: int = 8000):
+        self._table = _encode_table(law)
+        self._sample_rate = sample_rate
+        self._in_rate = 0
+        self._downsampler: Optional[_Downsampler] = None
+
+    def encode(self, audio: bytes, in_rate: int) -> bytes:
+        samples = np.frombuffer(audio, dtype=np.int16)
+        if in_rate != self._sample_rate:
+            samples = self._resample(samples, in_rate)
+        return self._table[samples.view(np.uint16)].tobytes()
+
+    def reset(self):
+        if self._downsampler:
+            self._downsampler.reset()
+
+    def _resample(self, samples: np.ndarray, in_rate: int) -> np.ndarray:
+        if in_rate != self._in_rate:
+            self._in_rate = in_rate
+            factor = in_rate // self._sample_rate
+            integer_ratio = in_rate % self._sample_rate == 0
+            self._downsampler = _Downsampler(factor) if integer_ratio else None
+
+        if self._downsampler:
+            return _to_int16(self._downsampler.process(samples.astype(np.float32)))
+
+        resampled = soxr.resample(samples, in_rate, self._sample_rate, quality="VHQ")
+        return resampled.astype(np.int16, copy=False)
+
+
+class G711Decoder:
+    """Decodes G.711 audio at `sample_rate` and resamples it to 16-bit mono
+    audio at the requested rate. Filter state is kept between calls to
+    `decode()`, so it should be called with consecutive packets.
+
+    """
+
+    def __init__(self, law: G711Law = "ulaw", *, sample_rate: int = 8000):
+        self._table = _decode_table(law)
+        self._float_table = _decode_table_float(law)
+        self._sample_rate = sample_rate
+        self._out_rate = 0
+        self._upsampler: Optional[_Upsampler] = None
+
+    def decode(self, data: bytes, out_rate: int) -> bytes:
+        codes = np.frombuffer(data, dtype=np.uint8)
+        if out_rate == self._sample_rate:
+            return self._table[codes].tobytes()
+
+        if out_rate != self._out_rate:
+            self._out_rate = out_rate
+            factor = out_rate // self._sample_rate
+            integer_ratio = out_rate % self._sample_rate == 0
+            self._upsampler = _Upsampler(factor) if integer_ratio else None
+
+        if self._upsampler:
+            return _to_int16(self._upsampler.process(self._float_table[codes])).tobytes()
+
+        resampled = soxr.resample(self._table[codes], self._sample_rate, out_rate, quality="VHQ")
+        return resampled.astype(np.int16, copy=False).tobytes()
+
+    def reset(self):
+        if self._upsampler:
+            self._upsampler.reset()
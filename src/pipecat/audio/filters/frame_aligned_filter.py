@@ -0,0 +1,111 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from pipecat.audio.filters.base_audio_filter import BaseAudioFilter
+from pipecat.audio.ring_buffer import AudioRingBuffer
+from pipecat.frames.frames import FilterControlFrame, FilterEnableFrame
+
+
+class FrameAlignedAudioFilter(BaseAudioFilter):
+    """Base class for filters whose engine processes audio in frames of a fixed
+    number of samples (e.g. Koala or Krisp).
+
+    Incoming audio is accumulated in a ring buffer and all the complete frames
+    are given to `filter_frames()` at once, as a `(num_frames, frame_length)`
+    view of the buffer (no copies). The remaining samples wait for the next
+    chunk, so the filter returns audio in multiples of the frame length, and no
+    audio at all (`b""`) for chunks that don't complete a frame. The input
+    transport drops those chunks.
+
+    If `offload` is enabled, `filter_frames()` runs in a dedicated worker thread
+    (always the same one, so engines don't need to be thread-safe) and the
+    event loop is free while the engine is working. Each `filter()` call waits
+    for its frames, so there's at most one chunk queued in the worker.
+
+    """
+
+    def __init__(self, *, offload: bool = False):
+        self._offload = offload
+        self._filtering = True
+        self._sample_rate = 0
+        self._frame_length = 0
+        self._buffer = AudioRingBuffer()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @abstractmethod
+    def frame_length(self) -> int:
+        """Number of samples of the frames processed by the engine. Called
+        after `start()`.
+
+        """
+        pass
+
+    @abstractmethod
+    def filter_frames(self, frames: np.ndarray) -> np.ndarray:
+        """Filters complete frames. `frames` is a read-only `(num_frames,
+        frame_length)` int16 array only valid during the call. Returns the
+        filtered 16-bit samples (same number of samples, any shape).
+
+        """
+        pass
+
+    async def start(self, sample_rate: int):
+        self._sample_rate = sample_rate
+        self._frame_length = self.frame_length()
+        self._buffer.clear()
+        if self._offload and not self._executor:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=self.__class__.__name__
+            )
+
+    async def stop(self):
+        self._buffer.clear()
+        if self._executor:
+            # Wait for the frames being filtered, if any.
+            await asyncio.to_thread(self._executor.shutdown, wait=True)
+            self._executor = None
+
+    async def process_frame(self, frame: FilterControlFrame):
+        if isinstance(frame, FilterEnableFrame):
+            self._filtering = frame.enable
+            self._buffer.clear()
+
+    def is_ready(self) -> bool:
+        """Whether the filter can process audio. If not, audio is returned
+        unchanged.
+
+        """
+        return True
+
+    async def filter(self, audio: bytes) -> bytes:
+        if not self._filtering or not self.is_ready():
+            return audio
+
+        frame_size = self._frame_length * 2
+        self._buffer.write(audio)
+        num_frames = len(self._buffer) // frame_size
+        if num_frames == 0:
+            return b""
+
+        view = self._buffer.read(num_frames * frame_size)
+        frames = np.frombuffer(view, dtype=np.int16).reshape(num_frames, self._frame_length)
+        if self._executor:
+            loop = asyncio.get_running_loop()
+            filtered = await loop.run_in_executor(self._executor, self.filter_frames, frames)
+        else:
+            filtered = self.filter_frames(frames)
+        return filtered.astype(np.int16, copy=False).tobytes()
@@ -5,12 +5,12 @@
 #
 
 import os
+import threading
 
 import numpy as np
 from loguru import logger
 
-from pipecat.audio.filters.base_audio_filter import BaseAudioFilter
-from pipecat.frames.frames import FilterControlFrame, FilterEnableFrame
+from pipecat.audio.filters.frame_aligned_filter import FrameAlignedAudioFilter
 
 try:
     from pipecat_ai_krisp.audio.krisp_processor import KrispAudioProcessor
@@ -26,6 +26,9 @@ class KrispProcessorManager:
     """
 
     _krisp_instance = None
+    # The processor is shared by all the filters, which might run in different
+    # threads.
+    lock = threading.Lock()
 
     @classmethod
     def get_processor(cls, sample_rate: int, sample_type: str, channels: int, model_path: str):
@@ -36,17 +39,23 @@ class KrispProcessorManager:
         return cls._krisp_instance
 
 
-class KrispFilter(BaseAudioFilter):
+class KrispFilter(FrameAlignedAudioFilter):
     def __init__(
-        self, sample_type: str = "PCM_16", channels: int = 1, model_path: str = None
+        self,
+        sample_type: str = "PCM_16",
+        channels: int = 1,
+        model_path: str = None,
+        *,
+        offload: bool = False,
     ) -> None:
         """Initializes the KrispAudioProcessor with customizable audio processing settings.
 
         :param sample_type: The type of audio sample, default is 'PCM_16'.
         :param channels: Number of audio channels, default is 1.
         :param model_path: Path to the Krisp model; defaults to environment variable KRISP_MODEL_PATH if not provided.
+        :param offload: Whether to run Krisp in a worker thread instead of the event loop.
         """
-        super().__init__()
+        super().__init__(offload=offload)
 
         # Set model path, checking environment if not specified
         self._model_path = model_path or os.getenv("KRISP_MODEL_PATH")
@@ -58,37 +67,32 @@ class KrispFilter(BaseAudioFilter):
 
         self._sample_type = sample_type
         self._channels = channels
-        self._sample_rate = 0
-        self._filtering = True
         self._krisp_processor = None
 
     async def start(self, sample_rate: int):
-        self._sample_rate = sample_rate
+        await super().start(sample_rate)
         self._krisp_processor = KrispProcessorManager.get_processor(
-            self._sample_rate, self._sample_type, self._channels, self._model_path
+            self.sample_rate, self._sample_type, self._channels, self._model_path
         )
 
     async def stop(self):
+        await super().stop()
         self._krisp_processor = None
 
-    async def process_frame(self, frame: FilterControlFrame):
-        if isinstance(frame, FilterEnableFrame):
-            self._filtering = frame.enable
+    def frame_length(self) -> int:
+        # Krisp processes 10ms frames.
+        return self.sample_rate // 100
 
-    async def filter(self, audio: bytes) -> bytes:
-        if not self._filtering:
-            return audio
+    def filter_frames(self, frames: np.ndarray) -> np.ndarray:
+        data = frames.reshape(-1).astype(np.float32)
 
-        data = np.frombuffer(audio, dtype=np.int16)
-
-        # Add a small epsilon to avoid division by zero.
+        # Add a small epsilon to avoid division by zero. `data` is our own copy
+        # so we can do it in place.
         epsilon = 1e-10
-        data = data.astype(np.float32) + epsilon
+        data += epsilon
 
         # Process the audio chunk to reduce noise
-        reduced_noise = self._krisp_processor.process(data)
-
-        # Clip and set processed audio back to frame
-        audio = np.clip(reduced_noise, -32768, 32767).astype(np.int16).tobytes()
+        with KrispProcessorManager.lock:
+            reduced_noise = self._krisp_processor.process(data)
 
-        return audio
+        return np.clip(reduced_noise, -32768, 32767).astype(np.int16)
@@ -39,14 +39,16 @@ class NoisereduceFilter(BaseAudioFilter):
         if not self._filtering:
             return audio
 
-        data = np.frombuffer(audio, dtype=np.int16)
+        data = np.frombuffer(audio, dtype=np.int16).astype(np.float32)
 
-        # Add a small epsilon to avoid division by zero.
+        # Add a small epsilon to avoid division by zero. `data` is our own copy
+        # so we can do it in place.
         epsilon = 1e-10
-        data = data.astype(np.float32) + epsilon
+        data += epsilon
 
         # Noise reduction
         reduced_noise = nr.reduce_noise(y=data, sr=self._sample_rate)
-        audio = np.clip(reduced_noise, -32768, 32767).astype(np.int16).tobytes()
+        np.clip(reduced_noise, -32768, 32767, out=reduced_noise)
+        audio = reduced_noise.astype(np.int16).tobytes()
 
         return audio
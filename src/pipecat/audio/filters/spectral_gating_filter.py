@@ -0,0 +1,186 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import math
+from typing import Optional
+
+import numpy as np
+import scipy.fft
+
+from pipecat.audio.filters.frame_aligned_filter import FrameAlignedAudioFilter
+
+# Frames used to learn the initial noise profile.
+_WARMUP_FRAMES = 10
+
+
+class _STFTBuffers:
+    """Buffers to process a given number of hops at once, allocated once."""
+
+    def __init__(self, num_hops: int, fft_size: int, hop_size: int):
+        overlap = fft_size - hop_size
+        num_bins = fft_size // 2 + 1
+        self.signal = np.zeros(overlap + num_hops * hop_size, dtype=np.float32)
+        self.frames = np.empty((num_hops, fft_size), dtype=np.float32)
+        self.magnitude = np.empty((num_hops, num_bins), dtype=np.float32)
+        self.gains = np.empty((num_hops, num_bins), dtype=np.float32)
+        self.output = np.empty(overlap + num_hops * hop_size, dtype=np.float32)
+
+
+class SpectralGatingFilter(FrameAlignedAudioFilter):
+    """Streaming noise reduction based on spectral gating. Unlike
+    `NoisereduceFilter`, which analyzes every chunk on its own, it keeps its
+    state between chunks and it doesn't need extra dependencies.
+
+    Audio is analyzed with a short-time Fourier transform (frames of
+    `frame_secs` with 75% overlap) and resynthesized with overlap-add, keeping
+    the overlap between chunks so there are no artifacts at chunk boundaries.
+    The mean and standard deviation of the noise are tracked for every
+    frequency over `noise_adapt_secs`, mostly from the frames that look like
+    noise, so the profile adapts to changing noise but not to speech.
+    Frequencies that are less than `n_std_thresh` standard deviations above the
+    mean noise are attenuated by up to `max_reduction_db`, and the gate closes
+    over `release_secs` to avoid musical noise.
+
+    The output is delayed by 3/4 of a frame (24ms at 16kHz).
+
+    """
+
+    def __init__(
+        self,
+        *,
+        frame_secs: float = 0.032,
+        n_std_thresh: float = 1.5,
+        max_reduction_db: float = 20.0,
+        noise_adapt_secs: float = 1.0,
+        release_secs: float = 0.05,
+        offload: bool = False,
+    ) -> None:
+        super().__init__(offload=offload)
+        self._frame_secs = frame_secs
+        self._n_std_thresh = n_std_thresh
+        self._floor = 10 ** (-max_reduction_db / 20)
+        self._noise_adapt_secs = noise_adapt_secs
+        self._release_secs = release_secs
+
+        self._fft_size = 0
+        self._hop_size = 0
+        self._buffers: Optional[_STFTBuffers] = None
+
+    async def start(self, sample_rate: int):
+        # Power of two FFT size, so the FFT is fast.
+        self._fft_size = 2 ** round(math.log2(self._frame_secs * sample_rate))
+        self._hop_size = self._fft_size // 4
+        await super().start(sample_rate)
+
+        num_bins = self._fft_size // 2 + 1
+        overlap = self._fft_size - self._hop_size
+        window = np.hanning(self._fft_size + 1)[:-1].astype(np.float32)
+        self._window = window
+        # Hann windows with 75% overlap add up to 1.5 (analysis and synthesis).
+        self._synthesis_window = window / 1.5
+
+        hop_secs = self._hop_size / sample_rate
+        self._noise_rate = min(1.0, hop_secs / self._noise_adapt_secs)
+        self._release = math.exp(-hop_secs / self._release_secs) if self._release_secs else 0.0
+
+        self._history = np.zeros(overlap, dtype=np.float32)
+        self._overlap = np.zeros(overlap, dtype=np.float32)
+        self._noise_mean = np.zeros(num_bins, dtype=np.float32)
+        self._noise_var = np.zeros(num_bins, dtype=np.float32)
+        self._noise_std = np.zeros(num_bins, dtype=np.float32)
+        self._magnitude = np.zeros(num_bins, dtype=np.float32)
+        self._gain = np.ones(num_bins, dtype=np.float32)
+        self._num_frames = 0
+        self._buffers = None
+
+    def frame_length(self) -> int:
+        return self._hop_size
+
+    def filter_frames(self, frames: np.ndarray) -> np.ndarray:
+        num_hops = len(frames)
+        fft_size = self._fft_size
+        hop_size = self._hop_size
+        overlap = fft_size - hop_size
+        buffers = self._get_buffers(num_hops)
+
+        # The new samples after the end of the previous frames.
+        signal = buffers.signal
+        signal[:overlap] = self._history
+        signal[overlap:] = frames.reshape(-1)
+        self._history[:] = signal[num_hops * hop_size :]
+
+        # One frame per hop (views of the signal).
+        windows = np.lib.stride_tricks.as_strided(
+            signal, shape=(num_hops, fft_size), strides=(hop_size * 4, 4), writeable=False
+        )
+        np.multiply(windows, self._window, out=buffers.frames)
+        spectrum = scipy.fft.rfft(buffers.frames, axis=1, overwrite_x=True)
+        np.abs(spectrum, out=buffers.magnitude)
+
+        for i in range(num_hops):
+            self._update_gain(buffers.magnitude[i], buffers.gains[i])
+        spectrum *= buffers.gains
+        filtered = scipy.fft.irfft(spectrum, n=fft_size, axis=1, overwrite_x=True)
+        filtered *= self._synthesis_window
+
+        # Overlap-add. Only the first samples are complete, the rest will be
+        # completed by the next frames.
+        output = buffers.output
+        output[:overlap] = self._overlap
+        output[overlap:] = 0
+        for i in range(num_hops):
+            output[i * hop_size : i * hop_size + fft_size] += filtered[i]
+        self._overlap[:] = output[num_hops * hop_size :]
+
+        result = output[: num_hops * hop_size]
+        np.clip(result, -32768, 32767, out=result)
+        return result.astype(np.int16)
+
+    def _get_buffers(self, num_hops: int) -> _STFTBuffers:
+        if not self._buffers or len(self._buffers.frames) != num_hops:
+            self._buffers = _STFTBuffers(num_hops, self._fft_size, self._hop_size)
+        return self._buffers
+
+    def _update_gain(self, magnitude: np.ndarray, gain: np.ndarray):
+        """Updates the noise profile with the magnitude of the next frame and
+        computes its gain.
+
+        """
+        mean = self._noise_mean
+        var = self._noise_var
+        std = self._noise_std
+
+        # Average the first frames so the noise profile is usable quickly.
+        # After that, frequencies that don't look like noise only move the
+        # mean, and much more slowly (in case noise gets louder).
+        self._num_frames += 1
+        rate = max(self._noise_rate, 1.0 / self._num_frames)
+        delta = magnitude - mean
+        if self._num_frames > _WARMUP_FRAMES:
+            noise_like = magnitude < mean + self._n_std_thresh * std
+            mean += delta * np.where(noise_like, rate, rate * 0.05)
+            var += (delta * delta - var) * (noise_like * rate)
+        else:
+            mean += delta * rate
+            var += (delta * delta - var) * rate
+        np.sqrt(var, out=std)
+
+        # Soft gate on the (time-smoothed) magnitude: closed below the
+        # threshold and fully open two standard deviations above it.
+        smoothed = self._magnitude
+        smoothed += (magnitude - smoothed) * 0.5
+        np.subtract(smoothed, mean, out=gain)
+        gain -= self._n_std_thresh * std
+        gain /= 2 * std + 1e-6
+        np.clip(gain, 0.0, 1.0, out=gain)
+
+        # Smooth across frequencies and close the gate slowly.
+        gain[1:-1] = 0.5 * gain[1:-1] + 0.25 * (gain[:-2] + gain[2:])
+        np.maximum(gain, self._gain * self._release, out=gain)
+        self._gain[:] = gain
+
+        gain *= 1.0 - self._floor
+        gain += self._floor
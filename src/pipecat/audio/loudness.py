@@ -0,0 +1,95 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import functools
+import math
+from typing import List, Tuple
+
+import numpy as np
+import scipy.signal
+from pyloudnorm.iirfilter import IIRfilter
+
+from pipecat.audio.utils import normalize_value
+
+# Blocks below this loudness (LUFS) are gated out, as in ITU-R BS.1770.
+ABSOLUTE_GATE = -70.0
+
+
+@functools.cache
+def _k_weighting_filters(sample_rate: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    # Same K-weighting filters (high shelf followed by high pass) as
+    # `pyloudnorm.Meter`, as float32 biquads.
+    filters = [
+        IIRfilter(4.0, 1 / np.sqrt(2), 1500.0, sample_rate, "high_shelf"),
+        IIRfilter(0.0, 0.5, 38.0, sample_rate, "high_pass"),
+    ]
+    return [((f.passband_gain * f.b).astype(np.float32), f.a.astype(np.float32)) for f in filters]
+
+
+class LoudnessMeter:
+    """Streaming loudness meter for mono 16-bit audio. It measures the same
+    K-weighted loudness as `calculate_audio_volume()` but the filter
+    coefficients are computed once per sample rate, the filter state is kept
+    across chunks (so there's no filter transient at the beginning of every
+    chunk) and the filtering is done in float32.
+
+    Each call to `loudness()` or `volume()` measures the given chunk only, so
+    the meter must be fed consecutive audio of a single stream. Call `reset()`
+    if there's a discontinuity.
+
+    """
+
+    def __init__(self, sample_rate: int = 0):
+        self._sample_rate = 0
+        self._filters = []
+        self._state = []
+        if sample_rate:
+            self.set_sample_rate(sample_rate)
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    def set_sample_rate(self, sample_rate: int):
+        if sample_rate == self._sample_rate:
+            return
+        self._sample_rate = sample_rate
+        self._filters = _k_weighting_filters(sample_rate)
+        self.reset()
+
+    def reset(self):
+        self._state = [np.zeros(2, dtype=np.float32) for _ in self._filters]
+
+    def loudness(self, audio: bytes) -> float:
+        """Returns the loudness (LUFS) of the given audio chunk, or `-inf` if
+        it's below the absolute gate. As with `calculate_audio_volume()`,
+        samples are not normalized so full scale audio is around 90 LUFS.
+
+        """
+        samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32)
+        if samples.size == 0:
+            return -math.inf
+
+        for i, (b, a) in enumerate(self._filters):
+            (samples, self._state[i]) = scipy.signal.lfilter(b, a, samples, zi=self._state[i])
+
+        mean_square = float(np.dot(samples, samples)) / samples.size
+        if mean_square <= 0:
+            return -math.inf
+        loudness = -0.691 + 10.0 * math.log10(mean_square)
+        return loudness if loudness >= ABSOLUTE_GATE else -math.inf
+
+    def volume(self, audio: bytes) -> float:
+        """Returns the loudness of the given audio chunk normalized between 0
+        and 1, like `calculate_audio_volume()`.
+
+        """
+        loudness = self.loudness(audio)
+        if loudness == -math.inf:
+            return 0.0
+        # Loudness goes from -20 to 80 (more or less), where -20 is quiet and
+        # 80 is loud.
+        return normalize_value(loudness, -20, 80)
@@ -0,0 +1,297 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+from typing import List, Mapping, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+from pydantic import BaseModel
+
+from pipecat.audio.mixers.base_audio_mixer import BaseAudioMixer
+from pipecat.audio.mixers.sound_bank import load_sound
+from pipecat.frames.frames import MixerControlFrame, MixerEnableFrame, MixerUpdateSettingsFrame
+
+# Samples above this level (-50 dBFS) in the mixed audio mean the bot is
+# speaking.
+VOICE_THRESHOLD = 100
+
+
+class MixerTrack(BaseModel):
+    """A sound played by a `MultiTrackMixer`.
+
+    Attributes:
+        sound: Sound file name. Files are loaded with `load_sound()`, so they
+            are shared with other mixers.
+        volume: Gain applied to the sound.
+        loop: Whether the sound starts again when it ends (e.g. background or
+            hold music) or stops (e.g. earcons).
+        duck: Whether the track is lowered to the mixer `duck_volume` while
+            the bot speaks.
+        playing: Whether the track starts playing when the mixer starts.
+    """
+
+    sound: str
+    volume: float = 1.0
+    loop: bool = True
+    duck: bool = False
+    playing: bool = False
+
+
+class _MixBuffers:
+    """Buffers to mix chunks of a given size, allocated once."""
+
+    def __init__(self, num_tracks: int, num_samples: int, ramp_samples: float):
+        self.samples = np.zeros((num_tracks, num_samples), dtype=np.float32)
+        self.gains = np.empty((num_tracks, num_samples), dtype=np.float32)
+        self.duck = np.empty(num_samples, dtype=np.float32)
+        self.mix = np.empty(num_samples, dtype=np.float32)
+        self.output = np.empty(num_samples, dtype=np.int16)
+        # Maximum gain change after each sample of the chunk, used to build
+        # the gain ramps.
+        self.steps = np.arange(1, num_samples + 1, dtype=np.float32) / ramp_samples
+        self.negative_steps = -self.steps
+
+
+class MultiTrackMixer(BaseAudioMixer):
+    """Audio mixer that layers any number of tracks (e.g. background sound,
+    hold music and earcons) on top of the bot voice.
+
+    Gain changes (volume updates, tracks starting and stopping and ducking) are
+    applied as linear ramps of `ramp_secs` to avoid clicks. While the bot
+    speaks, tracks with `duck` enabled are lowered to `duck_volume` and they go
+    back up after `duck_hold_secs` of silence.
+
+    The gains and samples of all the tracks are kept in preallocated matrices
+    and mixed with a few vectorized operations per chunk, so the only per-track
+    work is copying the samples of the playing tracks.
+
+    The `MixerUpdateSettingsFrame` has the following settings available: `play`
+    and `stop` (a track name or a list of names), `volumes` (a mapping of track
+    names to volumes) and `duck_volume` (float).
+
+    """
+
+    def __init__(
+        self,
+        tracks: Mapping[str, MixerTrack],
+        *,
+        duck_volume: float = 0.3,
+        duck_hold_secs: float = 0.3,
+        ramp_secs: float = 0.05,
+        cache_dir: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._tracks = dict(tracks)
+        self._names: List[str] = list(tracks.keys())
+        self._duck_volume = duck_volume
+        self._duck_hold_secs = duck_hold_secs
+        self._ramp_secs = ramp_secs
+        self._cache_dir = cache_dir
+        self._sample_rate = 0
+        self._duck_hold_samples = 0
+        self._ramp_samples = 1.0
+        self._mixing = True
+
+        num_tracks = len(self._names)
+        self._sounds: List[np.ndarray] = []
+        self._positions = [0] * num_tracks
+        self._playing = np.array([t.playing for t in tracks.values()], dtype=bool)
+        self._loop = np.array([t.loop for t in tracks.values()], dtype=bool)
+        self._duck = np.array([t.duck for t in tracks.values()], dtype=bool)
+        self._has_ducked_tracks = bool(self._duck.any())
+        self._volumes = np.array([t.volume for t in tracks.values()], dtype=np.float32)
+        # Current gain of each track (it ramps towards volume, or 0 if the
+        # track is not playing).
+        self._gains = np.zeros(num_tracks, dtype=np.float32)
+        self._duck_gain = 1.0
+        self._silence_samples = 0
+
+        self._buffers: Optional[_MixBuffers] = None
+
+    async def start(self, sample_rate: int):
+        self._sample_rate = sample_rate
+        self._duck_hold_samples = int(self._duck_hold_secs * sample_rate)
+        self._ramp_samples = max(1.0, self._ramp_secs * sample_rate)
+        # Start without ducking.
+        self._silence_samples = self._duck_hold_samples
+        self._buffers = None
+        self._sounds = []
+        for name in self._names:
+            sound = await asyncio.to_thread(self._load_sound, name)
+            self._sounds.append(sound)
+
+    async def stop(self):
+        pass
+
+    async def process_frame(self, frame: MixerControlFrame):
+        if isinstance(frame, MixerUpdateSettingsFrame):
+            await self._update_settings(frame)
+        elif isinstance(frame, MixerEnableFrame):
+            self._mixing = frame.enable
+
+    async def mix(self, audio: bytes) -> bytes:
+        if not self._mixing or not self._sounds:
+            return audio
+        return self._mix(audio)
+
+    def play(self, name: str):
+        """Plays the given track from the beginning."""
+        index = self._track_index(name)
+        if index is not None:
+            self._positions[index] = 0
+            self._playing[index] = True
+
+    def stop_track(self, name: str):
+        """Stops the given track (its volume ramps down to zero)."""
+        index = self._track_index(name)
+        if index is not None:
+            self._playing[index] = False
+
+    def set_volume(self, name: str, volume: float):
+        index = self._track_index(name)
+        if index is not None:
+            self._volumes[index] = volume
+
+    async def _update_settings(self, frame: MixerUpdateSettingsFrame):
+        for setting, value in frame.settings.items():
+            match setting:
+                case "play":
+                    for name in self._names_from_setting(value):
+                        self.play(name)
+                case "stop":
+                    for name in self._names_from_setting(value):
+                        self.stop_track(name)
+                case "volumes":
+                    for name, volume in value.items():
+                        self.set_volume(name, volume)
+                case "duck_volume":
+                    self._duck_volume = value
+
+    def _names_from_setting(self, value: str | Sequence[str]) -> Sequence[str]:
+        return [value] if isinstance(value, str) else value
+
+    def _track_index(self, name: str) -> Optional[int]:
+        if name not in self._tracks:
+            logger.error(f"Track {name} is not available")
+            return None
+        return self._names.index(name)
+
+    def _load_sound(self, name: str) -> np.ndarray:
+        file_name = self._tracks[name].sound
+        try:
+            logger.debug(f"Loading mixer track {name} from {file_name}")
+            return load_sound(file_name, self._sample_rate, cache_dir=self._cache_dir)
+        except Exception as e:
+            logger.error(f"Unable to open file {file_name}: {e}")
+            return np.zeros(0, dtype=np.int16)
+
+    def _get_buffers(self, num_samples: int) -> _MixBuffers:
+        if not self._buffers or len(self._buffers.mix) != num_samples:
+            self._buffers = _MixBuffers(len(self._names), num_samples, self._ramp_samples)
+        return self._buffers
+
+    def _read_samples(self, buffers: _MixBuffers, num_samples: int) -> List[int]:
+        """Copies the next chunk of every track that is playing (or still
+        ramping down) to the samples matrix. Returns the tracks that reached
+        their end.
+
+        """
+        finished = []
+        samples = buffers.samples
+        active = np.flatnonzero(self._playing | (self._gains > 0))
+        for i in active.tolist():
+            sound = self._sounds[i]
+            pos = self._positions[i]
+            row = samples[i]
+            size = min(num_samples, len(sound) - pos)
+            row[:size] = sound[pos : pos + size]
+            if size == num_samples:
+                self._positions[i] = pos + size
+            elif self._loop[i] and len(sound) > 0:
+                # Wrap around (sounds might be shorter than a chunk).
+                filled = size
+                while filled < num_samples:
+                    n = min(num_samples - filled, len(sound))
+                    row[filled : filled + n] = sound[:n]
+                    filled += n
+                self._positions[i] = n
+            else:
+                row[size:] = 0
+                self._positions[i] = len(sound)
+                finished.append(i)
+        return finished
+
+    def _mix(self, audio: bytes) -> bytes:
+        voice = np.frombuffer(audio, dtype=np.int16)
+        num_samples = len(voice)
+        buffers = self._get_buffers(num_samples)
+
+        finished = self._read_samples(buffers, num_samples)
+
+        targets = np.where(self._playing, self._volumes, 0).astype(np.float32)
+        duck_target = self._duck_volume if self._is_ducking(voice) else 1.0
+        if self._has_ducked_tracks and self._duck_gain != duck_target:
+            self._mix_ramps(buffers, targets, duck_target)
+        elif not np.array_equal(targets, self._gains):
+            self._mix_ramps(buffers, targets, self._duck_gain)
+        else:
+            # Nothing is changing (the usual case), so every track has a
+            # constant gain.
+            gains = targets
+            if self._has_ducked_tracks and self._duck_gain != 1.0:
+                gains = np.where(self._duck, gains * self._duck_gain, gains)
+            np.dot(gains, buffers.samples, out=buffers.mix)
+
+        # The rest of the chunk is already silent, no need to ramp down.
+        self._playing[finished] = False
+
+        # Add the voice.
+        mix = buffers.mix
+        mix += voice
+        np.minimum(mix, 32767, out=mix)
+        np.maximum(mix, -32768, out=mix)
+        np.copyto(buffers.output, mix, casting="unsafe")
+        return buffers.output.tobytes()
+
+    def _mix_ramps(self, buffers: _MixBuffers, targets: np.ndarray, duck_target: float):
+        """Mixes the tracks with a gain ramp per track, from their current
+        gain to their target, and the ducking ramp.
+
+        """
+        steps = buffers.steps
+        negative_steps = buffers.negative_steps
+
+        gains = buffers.gains
+        np.subtract(targets[:, None], self._gains[:, None], out=gains)
+        np.minimum(gains, steps, out=gains)
+        np.maximum(gains, negative_steps, out=gains)
+        gains += self._gains[:, None]
+        self._gains[:] = gains[:, -1]
+        # Finished ramps might be off by a rounding error.
+        np.copyto(self._gains, targets, where=np.abs(self._gains - targets) < 1e-6)
+
+        if self._has_ducked_tracks:
+            duck = buffers.duck
+            np.minimum(steps, duck_target - self._duck_gain, out=duck)
+            np.maximum(duck, negative_steps, out=duck)
+            duck += self._duck_gain
+            self._duck_gain = float(duck[-1])
+            if abs(self._duck_gain - duck_target) < 1e-6:
+                self._duck_gain = duck_target
+            gains[self._duck] *= duck
+
+        np.einsum("ij,ij->j", gains, buffers.samples, out=buffers.mix)
+
+    def _is_ducking(self, voice: np.ndarray) -> bool:
+        if len(voice) > 0 and max(int(voice.max()), -int(voice.min())) > VOICE_THRESHOLD:
+            self._silence_samples = 0
+            return True
+        ducking = self._silence_samples < self._duck_hold_samples
+        if ducking:
+            self._silence_samples += len(voice)
+        return ducking
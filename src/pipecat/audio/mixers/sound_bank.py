@@ -0,0 +1,156 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import hashlib
+import os
+import stat
+import struct
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import soxr
+from loguru import logger
+
+try:
+    import soundfile as sf
+except ModuleNotFoundError as e:
+    logger.error(f"Exception: {e}")
+    logger.error("In order to use the sound bank, you need to `pip install pipecat-ai[soundfile]`.")
+    raise Exception(f"Missing module: {e}")
+
+# Cache files start with a header: magic, digest of the sound key and number
+# of samples. Files that don't match the sound being loaded are rewritten.
+_CACHE_MAGIC = b"PCSOUND1"
+_CACHE_HEADER = struct.Struct("<8s20sQ4x")
+
+# (path, modification time, size, sample rate)
+_SoundKey = Tuple[str, int, int, int]
+
+_sounds: Dict[_SoundKey, np.ndarray] = {}
+_sounds_lock = threading.Lock()
+
+
+def _decode_sound(path: str, sample_rate: int) -> np.ndarray:
+    sound, file_sample_rate = sf.read(path, dtype="int16", always_2d=True)
+    if sound.shape[1] > 1:
+        sound = sound.mean(axis=1).astype(np.int16)
+    else:
+        sound = sound[:, 0]
+    if file_sample_rate != sample_rate:
+        logger.debug(f"Resampling sound {path} from {file_sample_rate} to {sample_rate}")
+        sound = soxr.resample(sound, file_sample_rate, sample_rate, quality="VHQ")
+    sound = np.ascontiguousarray(sound, dtype=np.int16)
+    sound.flags.writeable = False
+    return sound
+
+
+def _is_private_dir(cache_dir: str) -> bool:
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return True
+    # Anyone else able to write to the directory could plant cache files.
+    st = os.lstat(cache_dir)
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _read_cache_file(cache_file: str, digest: bytes) -> Optional[np.ndarray]:
+    try:
+        with open(cache_file, "rb") as f:
+            header = f.read(_CACHE_HEADER.size)
+            if len(header) != _CACHE_HEADER.size:
+                return None
+            (magic, file_digest, num_samples) = _CACHE_HEADER.unpack(header)
+            file_size = os.fstat(f.fileno()).st_size
+            if (
+                magic != _CACHE_MAGIC
+                or file_digest != digest
+                or file_size != _CACHE_HEADER.size + num_samples * 2
+            ):
+                return None
+            if num_samples == 0:
+                sound = np.zeros(0, dtype=np.int16)
+                sound.flags.writeable = False
+                return sound
+            # Map the file we checked, even if it's replaced in the meantime.
+            return np.memmap(
+                f, dtype=np.int16, mode="r", offset=_CACHE_HEADER.size, shape=(num_samples,)
+            )
+    except OSError:
+        return None
+
+
+def _map_sound(key: _SoundKey, cache_dir: str) -> np.ndarray:
+    (path, _, _, sample_rate) = key
+    if not _is_private_dir(cache_dir):
+        logger.warning(
+            f"Not caching sound {path}: {cache_dir} must be a directory only writable by the current user"
+        )
+        return _decode_sound(path, sample_rate)
+
+    # One file per sound and sample rate, so it's overwritten (instead of
+    # leaving the old one behind) when the sound file changes.
+    name = hashlib.sha1(repr((path, sample_rate)).encode()).hexdigest()
+    cache_file = os.path.join(cache_dir, f"{name}.pcm")
+    digest = hashlib.sha1(repr(key).encode()).digest()
+    sound = _read_cache_file(cache_file, digest)
+    if sound is not None:
+        return sound
+
+    decoded = _decode_sound(path, sample_rate)
+    # Other processes might be writing the same file, so write it to a
+    # temporary file and move it (atomically) when it's complete.
+    (fd, temp_file) = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_CACHE_HEADER.pack(_CACHE_MAGIC, digest, len(decoded)))
+            f.write(decoded.tobytes())
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Unable to cache sound {path} in {cache_dir}: {e}")
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        return decoded
+    sound = _read_cache_file(cache_file, digest)
+    return sound if sound is not None else decoded
+
+
+def load_sound(file_name: str, sample_rate: int, *, cache_dir: Optional[str] = None) -> np.ndarray:
+    """Returns the samples (read-only, 16-bit mono) of the given sound file at
+    the given sample rate. The file is decoded, mixed down to mono and
+    resampled only once per process and sample rate, and every caller gets the
+    same array.
+
+    If `cache_dir` is given, the decoded sound is stored there and the returned
+    array is memory-mapped, so the audio is also shared between processes (it
+    lives in the OS page cache) and it's not decoded again in future runs.
+    Cached sounds are invalidated when the sound file changes. The directory is
+    created if needed, and it must only be writable by the current user (e.g.
+    not a shared temporary directory), otherwise sounds are not cached.
+
+    """
+    path = os.path.realpath(file_name)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size, sample_rate)
+    with _sounds_lock:
+        sound = _sounds.get(key)
+        if sound is None:
+            if cache_dir:
+                sound = _map_sound(key, cache_dir)
+            else:
+                sound = _decode_sound(path, sample_rate)
+            _sounds[key] = sound
+        return sound
+
+
+def clear_sounds():
+    """Releases the loaded sounds. Mixers using them keep working, new ones
+    will load them again (from the cache directory, if there's one).
+
+    """
+    with _sounds_lock:
+        _sounds.clear()
@@ -5,29 +5,25 @@
 #
 
 import asyncio
-from typing import Any, Dict, Mapping
+from typing import Dict, Mapping, Optional
 
 import numpy as np
 from loguru import logger
 
 from pipecat.audio.mixers.base_audio_mixer import BaseAudioMixer
+from pipecat.audio.mixers.sound_bank import load_sound
 from pipecat.frames.frames import MixerControlFrame, MixerEnableFrame, MixerUpdateSettingsFrame
 
-try:
-    import soundfile as sf
-except ModuleNotFoundError as e:
-    logger.error(f"Exception: {e}")
-    logger.error(
-        "In order to use the soundfile mixer, you need to `pip install pipecat-ai[soundfile]`."
-    )
-    raise Exception(f"Missing module: {e}")
-
 
 class SoundfileMixer(BaseAudioMixer):
     """This is an audio mixer that mixes incoming audio with audio from a
     file. It uses the soundfile library to load files so it supports multiple
-    formats. The audio files need to only have one channel (mono) and it needs
-    to match the sample rate of the output transport.
+    formats. Sound files are mixed down to mono and resampled to the sample rate
+    of the output transport.
+
+    Sounds are loaded with `load_sound()`, so every mixer in the process (and,
+    with `cache_dir`, in other processes) shares the same read-only audio
+    instead of decoding its own copy.
 
     Multiple files can be loaded, each with a different name. The
     `MixerUpdateSettingsFrame` has the following settings available: `sound`
@@ -42,15 +38,17 @@ class SoundfileMixer(BaseAudioMixer):
         default_sound: str,
         volume: float = 0.4,
         loop: bool = True,
+        cache_dir: Optional[str] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self._sound_files = sound_files
         self._volume = volume
+        self._cache_dir = cache_dir
         self._sample_rate = 0
 
         self._sound_pos = 0
-        self._sounds: Dict[str, Any] = {}
+        self._sounds: Dict[str, np.ndarray] = {}
         self._current_sound = default_sound
         self._mixing = True
         self._loop = loop
@@ -102,16 +100,9 @@ class SoundfileMixer(BaseAudioMixer):
     def _load_sound_file(self, sound_name: str, file_name: str):
         try:
             logger.debug(f"Loading mixer sound from {file_name}")
-            sound, sample_rate = sf.read(file_name, dtype="int16")
-
-            if sample_rate == self._sample_rate:
-                audio = sound.tobytes()
-                # Convert from np to bytes again.
-                self._sounds[sound_name] = np.frombuffer(audio, dtype=np.int16)
-            else:
-                logger.warning(
-                    f"Sound file {file_name} has incorrect sample rate {sample_rate} (should be {self._sample_rate})"
-                )
+            self._sounds[sound_name] = load_sound(
+                file_name, self._sample_rate, cache_dir=self._cache_dir
+            )
         except Exception as e:
             logger.error(f"Unable to open file {file_name}: {e}")
 
@@ -0,0 +1,170 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List
+
+from pipecat.audio.ring_buffer import AudioRingBuffer
+
+
+@dataclass
+class AudioPlayoutStats:
+    """Counters of an `AudioPlayout`. Jitter is the difference between the
+    time a chunk was released and the time it was scheduled for.
+
+    """
+
+    chunks: int = 0
+    underruns: int = 0
+    overruns: int = 0
+    total_jitter: float = 0.0
+    max_jitter: float = 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        return self.total_jitter / self.chunks if self.chunks else 0.0
+
+
+class AudioPlayout:
+    """Splits output audio into chunks of exactly one tick (e.g. 10 or 20ms)
+    and, if `paced`, releases them at the audio rate following a monotonic
+    clock, like an audio device would.
+
+    Chunks are scheduled at absolute times (start time plus one tick per
+    chunk), so the time lost in a sleep is recovered in the next one instead of
+    accumulating. If a chunk is more than one tick late (i.e. the producer
+    couldn't keep up) the clock is restarted from the current time and, if
+    we were in the middle of a stream, an underrun is counted. If more than
+    `max_buffer_secs` of audio is waiting to be played an overrun is counted,
+    but no audio is dropped.
+
+    Call `end_of_stream()` when a stream of audio (e.g. a bot response) ends,
+    so the silence that follows is not counted as an underrun, and `clear()` to
+    discard everything (e.g. on interruptions).
+
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        num_channels: int = 1,
+        tick_secs: float = 0.02,
+        max_buffer_secs: float = 10.0,
+        paced: bool = True,
+    ):
+        bytes_per_sample = num_channels * 2
+        self._tick_secs = tick_secs
+        self._chunk_size = round(sample_rate * tick_secs) * bytes_per_sample
+        self._max_buffered = round(sample_rate * max_buffer_secs) * bytes_per_sample
+        self._paced = paced
+        self._silence = bytes(self._chunk_size)
+
+        # Only holds what's left after splitting the audio into chunks, so it
+        # never needs to be larger than a few chunks.
+        self._buffer = AudioRingBuffer(self._chunk_size * 4)
+
+        # Bytes in chunks returned by `write()` that haven't been played yet.
+        self._buffered = 0
+        self._overrun = False
+
+        self._start_time = 0.0
+        self._num_ticks = 0
+        self._playing = False
+
+        self._stats = AudioPlayoutStats()
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def tick_secs(self) -> float:
+        return self._tick_secs
+
+    @property
+    def buffered_secs(self) -> float:
+        return (self._buffered / self._chunk_size) * self._tick_secs
+
+    @property
+    def stats(self) -> AudioPlayoutStats:
+        return self._stats
+
+    def reset_stats(self):
+        self._stats = AudioPlayoutStats()
+
+    def write(self, audio: bytes) -> List[bytes]:
+        """Adds audio and returns the complete chunks that are ready to be
+        played. The remaining audio is kept until more audio arrives or the
+        stream is flushed.
+
+        """
+        self._buffer.write(audio)
+        chunk_size = self._chunk_size
+        num_bytes = len(self._buffer) - len(self._buffer) % chunk_size
+        if num_bytes == 0:
+            return []
+        view = self._buffer.read(num_bytes)
+        chunks = [bytes(view[i : i + chunk_size]) for i in range(0, num_bytes, chunk_size)]
+        self._add_buffered(num_bytes)
+        return chunks
+
+    def flush(self) -> List[bytes]:
+        """Returns the remaining audio as a last chunk, padded with silence."""
+        remaining = len(self._buffer)
+        if remaining == 0:
+            return []
+        chunk = bytes(self._buffer.read(remaining)) + self._silence[remaining:]
+        self._add_buffered(self._chunk_size)
+        return [chunk]
+
+    async def tick(self):
+        """Waits until the next chunk is due. Needs to be called once before
+        each chunk returned by `write()` or `flush()` is played.
+
+        """
+        self._buffered = max(0, self._buffered - self._chunk_size)
+        if self._buffered <= self._max_buffered:
+            self._overrun = False
+
+        if not self._paced:
+            return
+
+        now = time.monotonic()
+        deadline = self._start_time + self._num_ticks * self._tick_secs
+        if self._num_ticks == 0 or now - deadline > self._tick_secs:
+            if self._playing and self._num_ticks > 0:
+                self._stats.underruns += 1
+            self._start_time = now
+            self._num_ticks = 0
+            deadline = now
+        elif deadline > now:
+            await asyncio.sleep(deadline - now)
+
+        jitter = abs(time.monotonic() - deadline)
+        self._num_ticks += 1
+        self._playing = True
+        self._stats.chunks += 1
+        self._stats.total_jitter += jitter
+        self._stats.max_jitter = max(self._stats.max_jitter, jitter)
+
+    def end_of_stream(self):
+        self._playing = False
+
+    def clear(self):
+        self._buffer.clear()
+        self._buffered = 0
+        self._overrun = False
+        self._num_ticks = 0
+        self._playing = False
+
+    def _add_buffered(self, size: int):
+        self._buffered += size
+        if self._buffered > self._max_buffered and not self._overrun:
+            self._overrun = True
+            self._stats.overruns += 1
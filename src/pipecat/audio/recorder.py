@@ -0,0 +1,266 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import queue
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.ring_buffer import AudioRingBuffer
+
+try:
+    import soundfile as sf
+except ModuleNotFoundError as e:
+    logger.error(f"Exception: {e}")
+    logger.error(
+        "In order to use the audio recorder, you need to `pip install pipecat-ai[soundfile]`."
+    )
+    raise Exception(f"Missing module: {e}")
+
+# Audio that arrives later than this (e.g. user audio that is only sent while
+# the user speaks) is placed at its time instead of right after the previous
+# audio.
+_MAX_GAP_SECS = 0.1
+
+# Audio is handed to the writer thread in blocks of this duration.
+_BLOCK_SECS = 0.5
+
+
+class _Track:
+    """Audio of one side of the conversation that hasn't been written yet."""
+
+    def __init__(self, capacity: int):
+        self.buffer = AudioRingBuffer(capacity)
+        # Samples added since the recording started (written or not).
+        self.position = 0
+
+    def add(self, audio: bytes):
+        self.buffer.write(audio)
+        self.position += len(audio) // 2
+
+    def add_silence(self, num_samples: int, silence: memoryview):
+        self.position += num_samples
+        num_bytes = num_samples * 2
+        while num_bytes > 0:
+            size = min(num_bytes, len(silence))
+            self.buffer.write(silence[:size])
+            num_bytes -= size
+
+    def read(self, num_samples: int) -> np.ndarray:
+        view = self.buffer.read(num_samples * 2)
+        # The view is only valid until the next write, so the writer thread
+        # needs its own copy.
+        return np.frombuffer(view, dtype=np.int16).copy()
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.buffer) // 2
+
+
+class AudioRecorder:
+    """Writes the user and bot audio of a conversation to a sound file (any
+    format supported by `soundfile`, e.g. WAV, FLAC or Ogg, usually given by
+    the file extension) while the conversation happens.
+
+    User and bot audio are aligned with the time they were received
+    (nanosecond timestamps, e.g. from the pipeline clock), so silence is
+    inserted when one side doesn't send audio. With one channel both sides are
+    mixed, with two channels the user is on the left and the bot on the right.
+
+    Only the audio that hasn't been written yet is kept in memory: audio is
+    delayed by at most `max_delay_secs` (so late audio is still aligned) and
+    then handed to a writer thread in blocks, through a queue of at most
+    `max_queued_secs` of audio. Audio needs to be at `sample_rate`, 16-bit
+    mono.
+
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        *,
+        sample_rate: int,
+        num_channels: int = 1,
+        max_delay_secs: float = 1.0,
+        max_queued_secs: float = 10.0,
+        format: Optional[str] = None,
+        subtype: Optional[str] = None,
+    ):
+        if num_channels not in (1, 2):
+            raise ValueError(f"Unsupported number of channels: {num_channels}")
+        self._file_name = file_name
+        self._sample_rate = sample_rate
+        self._num_channels = num_channels
+        self._format = format
+        self._subtype = subtype
+        self._max_delay = int(max_delay_secs * sample_rate)
+        self._max_gap = int(_MAX_GAP_SECS * sample_rate)
+        self._block_size = int(_BLOCK_SECS * sample_rate)
+
+        capacity = (self._max_delay + self._block_size) * 4
+        self._user = _Track(capacity)
+        self._bot = _Track(capacity)
+        self._silence = memoryview(bytes(self._block_size * 2))
+
+        self._queue: queue.Queue[Optional[Tuple[np.ndarray, np.ndarray]]] = queue.Queue(
+            maxsize=max(1, int(max_queued_secs / _BLOCK_SECS))
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._start_time = 0
+        self._samples_written = 0
+        self._error: Optional[Exception] = None
+
+    @property
+    def file_name(self) -> str:
+        return self._file_name
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def num_channels(self) -> int:
+        return self._num_channels
+
+    @property
+    def duration_secs(self) -> float:
+        """Duration of the audio handed to the writer so far."""
+        return self._samples_written / self._sample_rate
+
+    @property
+    def recording(self) -> bool:
+        return self._thread is not None
+
+    def memory_usage(self) -> int:
+        """Bytes retained: the track buffers and the queued blocks."""
+        queued = self._queue.qsize() * self._block_size * 2 * 2
+        return self._user.buffer.capacity + self._bot.buffer.capacity + queued
+
+    def start(self, timestamp: int):
+        """Starts recording. `timestamp` (in nanoseconds) is the start of the
+        recording, timestamps of the audio are relative to the same clock.
+
+        """
+        if self._thread:
+            return
+        self._start_time = timestamp
+        self._thread = threading.Thread(
+            target=self._writer_thread_handler, name=self.__class__.__name__, daemon=True
+        )
+        self._thread.start()
+
+    async def write_user_audio(self, audio: bytes, timestamp: int):
+        """Adds user audio received at the given time (in nanoseconds)."""
+        await self._write_audio(self._user, audio, timestamp)
+
+    async def write_bot_audio(self, audio: bytes, timestamp: int):
+        """Adds bot audio received at the given time (in nanoseconds)."""
+        await self._write_audio(self._bot, audio, timestamp)
+
+    async def stop(self):
+        """Writes the remaining audio (the shortest side is padded with
+        silence) and closes the file.
+
+        """
+        if not self._thread:
+            return
+        end = max(self._user.position, self._bot.position)
+        await self._pad([(self._user, end), (self._bot, end)])
+        await self._flush(self._user.num_samples)
+        await self._put(None)
+        await asyncio.to_thread(self._thread.join)
+        self._thread = None
+        if self._error:
+            logger.error(f"Error writing audio to {self._file_name}: {self._error}")
+
+    async def _write_audio(self, track: _Track, audio: bytes, timestamp: int):
+        if not self._thread:
+            return
+        now = (timestamp - self._start_time) * self._sample_rate // 1_000_000_000
+
+        # Audio is received when it's complete, so it started a bit earlier.
+        # If there's a gap since the previous audio, fill it with silence.
+        start = now - len(audio) // 2
+        if start - track.position <= self._max_gap:
+            start = track.position
+
+        # Audio that we haven't received for the other side by now will be
+        # silence.
+        other = self._bot if track is self._user else self._user
+        other_start = now - self._max_delay
+        if start > track.position or other_start > other.position:
+            await self._pad([(track, start), (other, other_start)])
+
+        track.add(audio)
+        await self._flush_blocks()
+
+    async def _pad(self, targets: List[Tuple[_Track, int]]):
+        """Adds silence to the given tracks until they reach their target
+        position. Both tracks are padded at the same time and written in
+        blocks, so long gaps don't use more memory.
+
+        """
+        padding = True
+        while padding:
+            padding = False
+            for track, target in targets:
+                num_samples = min(target - track.position, self._block_size)
+                if num_samples > 0:
+                    track.add_silence(num_samples, self._silence)
+                    padding = True
+            await self._flush_blocks()
+
+    async def _flush_blocks(self):
+        num_samples = min(self._user.num_samples, self._bot.num_samples)
+        if num_samples >= self._block_size:
+            await self._flush(num_samples)
+
+    async def _flush(self, num_samples: int):
+        if num_samples <= 0:
+            return
+        block = (self._user.read(num_samples), self._bot.read(num_samples))
+        self._samples_written += num_samples
+        await self._put(block)
+
+    async def _put(self, block: Optional[Tuple[np.ndarray, np.ndarray]]):
+        try:
+            self._queue.put_nowait(block)
+        except queue.Full:
+            # The writer can't keep up (e.g. slow disk), wait without blocking
+            # the event loop.
+            await asyncio.to_thread(self._queue.put, block)
+
+    def _writer_thread_handler(self):
+        try:
+            with sf.SoundFile(
+                self._file_name,
+                "w",
+                samplerate=self._sample_rate,
+                channels=self._num_channels,
+                format=self._format,
+                subtype=self._subtype,
+            ) as file:
+                while True:
+                    block = self._queue.get()
+                    if block is None:
+                        break
+                    file.write(self._merge(*block))
+        except Exception as e:
+            self._error = e
+            # Keep consuming, so the recorder doesn't block.
+            while self._queue.get() is not None:
+                pass
+
+    def _merge(self, user: np.ndarray, bot: np.ndarray) -> np.ndarray:
+        if self._num_channels == 2:
+            return np.column_stack((user, bot))
+        mixed = user.astype(np.int32)
+        mixed += bot
+        np.clip(mixed, -32768, 32767, out=mixed)
+        return mixed.astype(np.int16)
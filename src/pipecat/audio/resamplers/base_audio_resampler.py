@@ -28,3 +28,20 @@ class BaseAudioResampler(ABC):
             bytes: The resampled audio data as a byte string.
         """
         pass
+
+    async def flush(self) -> bytes:
+        """
+        Returns the audio still buffered by a streaming resampler at the end of
+        a stream and gets ready for a new stream. Resamplers that don't keep any
+        state return no audio.
+
+        Returns:
+            bytes: The remaining resampled audio data.
+        """
+        return b""
+
+    def clear(self):
+        """Discards the audio buffered by a streaming resampler (e.g. on an
+        interruption). Resamplers that don't keep any state do nothing.
+        """
+        pass
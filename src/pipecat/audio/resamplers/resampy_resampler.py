@@ -21,5 +21,5 @@ class ResampyResampler(BaseAudioResampler):
             return audio
         audio_data = np.frombuffer(audio, dtype=np.int16)
         resampled_audio = resampy.resample(audio_data, in_rate, out_rate, filter="kaiser_fast")
-        result = resampled_audio.astype(np.int16).tobytes()
+        result = resampled_audio.astype(np.int16, copy=False).tobytes()
         return result
@@ -21,5 +21,5 @@ class SOXRAudioResampler(BaseAudioResampler):
             return audio
         audio_data = np.frombuffer(audio, dtype=np.int16)
         resampled_audio = soxr.resample(audio_data, in_rate, out_rate, quality="VHQ")
-        result = resampled_audio.astype(np.int16).tobytes()
+        result = resampled_audio.astype(np.int16, copy=False).tobytes()
         return result
@@ -0,0 +1,73 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from typing import Optional
+
+import numpy as np
+import soxr
+
+from pipecat.audio.resamplers.base_audio_resampler import BaseAudioResampler
+
+
+class SOXRStreamAudioResampler(BaseAudioResampler):
+    """Streaming audio resampler using the SoX resampler library. Unlike
+    `SOXRAudioResampler`, the resampler is only set up once per stream (i.e.
+    per input and output sample rate) and the filter history is kept between
+    chunks, so chunk boundaries don't introduce any distortion.
+
+    SoX resamples in blocks, so output audio is delayed and returned in bursts
+    (up to ~100ms at 8000Hz). This makes it a good fit for audio that is
+    generated faster than real-time, like TTS audio. `flush()` needs to be
+    called at the end of a stream to get the remaining audio and `clear()` to
+    discard it (e.g. on interruptions).
+
+    """
+
+    def __init__(self, *, num_channels: int = 1, quality: str = "VHQ", **kwargs):
+        self._num_channels = num_channels
+        self._quality = quality
+        self._in_rate = 0
+        self._out_rate = 0
+        self._stream: Optional[soxr.ResampleStream] = None
+
+    async def resample(self, audio: bytes, in_rate: int, out_rate: int) -> bytes:
+        tail = b""
+        if (in_rate, out_rate) != (self._in_rate, self._out_rate):
+            # Don't lose the end of the previous stream if the output sample
+            # rate is the same.
+            tail = self._flush() if out_rate == self._out_rate else b""
+            self._in_rate = in_rate
+            self._out_rate = out_rate
+            self._stream = None
+            if in_rate != out_rate:
+                self._stream = soxr.ResampleStream(
+                    in_rate, out_rate, self._num_channels, dtype="int16", quality=self._quality
+                )
+
+        if not self._stream:
+            return tail + audio if tail else audio
+
+        data = np.frombuffer(audio, dtype=np.int16)
+        if self._num_channels > 1:
+            data = data.reshape(-1, self._num_channels)
+        resampled_audio = self._stream.resample_chunk(data).tobytes()
+        return tail + resampled_audio if tail else resampled_audio
+
+    async def flush(self) -> bytes:
+        return self._flush()
+
+    def clear(self):
+        if self._stream:
+            self._stream.clear()
+
+    def _flush(self) -> bytes:
+        if not self._stream:
+            return b""
+        empty = np.zeros((0, self._num_channels) if self._num_channels > 1 else 0, dtype=np.int16)
+        tail = self._stream.resample_chunk(empty, last=True).tobytes()
+        # Ready for a new stream with the same sample rates.
+        self._stream.clear()
+        return tail
@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+
+class AudioRingBuffer:
+    """A preallocated FIFO of audio bytes that returns the data it holds as
+    views (no copies). Audio is written at the write index and consumed from
+    the read index. When there's no room left at the end of the buffer, the
+    unread bytes (usually less than a read) are moved back to the beginning
+    instead of wrapping around, so every read is a single contiguous view. If
+    the unread bytes don't fit the buffer grows.
+
+    Views returned by `peek()` and `read()` are only valid until the next
+    `write()`.
+
+    >>> buffer = AudioRingBuffer(8)
+    >>> buffer.write(b"123456")
+    >>> bytes(buffer.read(4))
+    b'1234'
+    >>> buffer.write(b"789")
+    >>> bytes(buffer.read(4))
+    b'5678'
+    >>> len(buffer)
+    1
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._capacity = capacity
+        self._read_index = 0
+        self._write_index = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._write_index - self._read_index
+
+    def write(self, data: bytes):
+        # This is called for every audio chunk, so we try to keep it cheap.
+        size = len(data)
+        end = self._write_index + size
+        if end > self._capacity:
+            self._make_room(size)
+            end = self._write_index + size
+        self._view[self._write_index : end] = data
+        self._write_index = end
+
+    def peek(self, size: int) -> memoryview:
+        """Returns a view of the next `size` bytes without consuming them."""
+        end = self._read_index + size
+        if end > self._write_index:
+            raise ValueError(f"Only {len(self)} bytes available, {size} requested")
+        return self._view[self._read_index : end]
+
+    def read(self, size: int) -> memoryview:
+        """Returns a view of the next `size` bytes and consumes them."""
+        start = self._read_index
+        end = start + size
+        if end > self._write_index:
+            raise ValueError(f"Only {len(self)} bytes available, {size} requested")
+        if end == self._write_index:
+            # Empty, start from the beginning again. The view we return is
+            # still valid because we don't touch the data.
+            self._read_index = 0
+            self._write_index = 0
+        else:
+            self._read_index = end
+        return self._view[start:end]
+
+    def skip(self, size: int):
+        self._read_index += min(size, len(self))
+        if self._read_index == self._write_index:
+            self._read_index = 0
+            self._write_index = 0
+
+    def clear(self):
+        self._read_index = 0
+        self._write_index = 0
+
+    def _make_room(self, size: int):
+        unread = len(self)
+        if unread + size > self._capacity:
+            capacity = max(self._capacity * 2, unread + size)
+            buffer = bytearray(capacity)
+            buffer[:unread] = self._view[self._read_index : self._write_index]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+            self._capacity = capacity
+        elif unread > 0:
+            # Source and destination might overlap, so copy the (few) unread
+            # bytes first.
+            self._buffer[:unread] = bytes(self._view[self._read_index : self._write_index])
+        self._read_index = 0
+        self._write_index = unread
@@ -4,20 +4,24 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
-import audioop
-
 import numpy as np
 import pyloudnorm as pyln
 import soxr
 
+from pipecat.audio.codecs import g711
 from pipecat.audio.resamplers.base_audio_resampler import BaseAudioResampler
 from pipecat.audio.resamplers.soxr_resampler import SOXRAudioResampler
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
 
 
 def create_default_resampler(**kwargs) -> BaseAudioResampler:
     return SOXRAudioResampler(**kwargs)
 
 
+def create_stream_resampler(**kwargs) -> BaseAudioResampler:
+    return SOXRStreamAudioResampler(**kwargs)
+
+
 def resample_audio(audio: bytes, original_rate: int, target_rate: int) -> bytes:
     import warnings
 
@@ -32,23 +36,19 @@ def resample_audio(audio: bytes, original_rate: int, target_rate: int) -> bytes:
         return audio
     audio_data = np.frombuffer(audio, dtype=np.int16)
     resampled_audio = soxr.resample(audio_data, original_rate, target_rate)
-    return resampled_audio.astype(np.int16).tobytes()
+    return resampled_audio.astype(np.int16, copy=False).tobytes()
 
 
 def mix_audio(audio1: bytes, audio2: bytes) -> bytes:
     data1 = np.frombuffer(audio1, dtype=np.int16)
     data2 = np.frombuffer(audio2, dtype=np.int16)
 
-    # Max length
-    max_length = max(len(data1), len(data2))
-
-    # Zero-pad the arrays to the same length
-    padded1 = np.pad(data1, (0, max_length - len(data1)), mode="constant")
-    padded2 = np.pad(data2, (0, max_length - len(data2)), mode="constant")
-
-    # Mix the arrays
-    mixed_audio = padded1.astype(np.int32) + padded2.astype(np.int32)
-    mixed_audio = np.clip(mixed_audio, -32768, 32767).astype(np.int16)
+    # Mix into a single zero-padded int32 array and clip it in place, so the
+    # only other allocations are the final int16 array and bytes.
+    mixed_audio = np.zeros(max(len(data1), len(data2)), dtype=np.int32)
+    mixed_audio[: len(data1)] += data1
+    mixed_audio[: len(data2)] += data2
+    np.clip(mixed_audio, -32768, 32767, out=mixed_audio)
 
     return mixed_audio.astype(np.int16).tobytes()
 
@@ -58,12 +58,12 @@ def interleave_stereo_audio(left_audio: bytes, right_audio: bytes) -> bytes:
     right = np.frombuffer(right_audio, dtype=np.int16)
 
     min_length = min(len(left), len(right))
-    left = left[:min_length]
-    right = right[:min_length]
 
-    stereo = np.column_stack((left, right))
+    stereo = np.empty((min_length, 2), dtype=np.int16)
+    stereo[:, 0] = left[:min_length]
+    stereo[:, 1] = right[:min_length]
 
-    return stereo.astype(np.int16).tobytes()
+    return stereo.tobytes()
 
 
 def normalize_value(value, min_value, max_value):
@@ -95,7 +95,7 @@ async def ulaw_to_pcm(
     ulaw_bytes: bytes, in_rate: int, out_rate: int, resampler: BaseAudioResampler
 ):
     # Convert μ-law to PCM
-    in_pcm_bytes = audioop.ulaw2lin(ulaw_bytes, 2)
+    in_pcm_bytes = g711.decode(ulaw_bytes, "ulaw").tobytes()
 
     # Resample
     out_pcm_bytes = await resampler.resample(in_pcm_bytes, in_rate, out_rate)
@@ -108,7 +108,7 @@ async def pcm_to_ulaw(pcm_bytes: bytes, in_rate: int, out_rate: int, resampler:
     in_pcm_bytes = await resampler.resample(pcm_bytes, in_rate, out_rate)
 
     # Convert PCM to μ-law
-    out_ulaw_bytes = audioop.lin2ulaw(in_pcm_bytes, 2)
+    out_ulaw_bytes = g711.encode(np.frombuffer(in_pcm_bytes, dtype=np.int16), "ulaw")
 
     return out_ulaw_bytes
 
@@ -117,7 +117,7 @@ async def alaw_to_pcm(
     alaw_bytes: bytes, in_rate: int, out_rate: int, resampler: BaseAudioResampler
 ) -> bytes:
     # Convert a-law to PCM
-    in_pcm_bytes = audioop.alaw2lin(alaw_bytes, 2)
+    in_pcm_bytes = g711.decode(alaw_bytes, "alaw").tobytes()
 
     # Resample
     out_pcm_bytes = await resampler.resample(in_pcm_bytes, in_rate, out_rate)
@@ -129,7 +129,7 @@ async def pcm_to_alaw(pcm_bytes: bytes, in_rate: int, out_rate: int, resampler:
     # Resample
     in_pcm_bytes = await resampler.resample(pcm_bytes, in_rate, out_rate)
 
-    # Convert PCM to μ-law
-    out_alaw_bytes = audioop.lin2alaw(in_pcm_bytes, 2)
+    # Convert PCM to a-law
+    out_alaw_bytes = g711.encode(np.frombuffer(in_pcm_bytes, dtype=np.int16), "alaw")
 
     return out_alaw_bytes
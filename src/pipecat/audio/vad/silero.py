@@ -4,8 +4,13 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
+import functools
+import queue
+import threading
 import time
-from typing import Optional
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from loguru import logger
@@ -24,22 +29,69 @@ except ModuleNotFoundError as e:
     raise Exception(f"Missing module(s): {e}")
 
 
+_sessions: Dict[Tuple[str, bool], "onnxruntime.InferenceSession"] = {}
+_sessions_lock = threading.Lock()
+
+
+def _create_onnx_session(path, force_onnx_cpu: bool) -> "onnxruntime.InferenceSession":
+    # Sessions are run from many threads at the same time (one per analyzer),
+    # so each inference runs in the calling thread to avoid oversubscribing
+    # the CPU with ONNX thread pools.
+    opts = onnxruntime.SessionOptions()
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
+    opts.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+    opts.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
+        return onnxruntime.InferenceSession(
+            path, providers=["CPUExecutionProvider"], sess_options=opts
+        )
+    else:
+        return onnxruntime.InferenceSession(path, sess_options=opts)
+
+
+def get_onnx_session(path, force_onnx_cpu: bool = True) -> "onnxruntime.InferenceSession":
+    """Returns the process-wide ONNX inference session of the given model,
+    creating it the first time. ONNX sessions can be run concurrently from
+    multiple threads and the Silero model keeps no state in the session, so a
+    single session can be shared by all the analyzers.
+
+    """
+    key = (str(path), force_onnx_cpu)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if not session:
+            session = _create_onnx_session(path, force_onnx_cpu)
+            _sessions[key] = session
+        return session
+
+
+def clear_onnx_sessions():
+    """Releases the shared ONNX sessions. Models using them keep working, new
+    ones will create a new session.
+
+    """
+    with _sessions_lock:
+        _sessions.clear()
+
+
 class SileroOnnxModel:
-    def __init__(self, path, force_onnx_cpu=True):
+    """Silero VAD model. The ONNX session is shared with all the other models
+    loaded from the same file (see `get_onnx_session()`) unless `shared` is
+    False. The RNN state is kept per model.
+
+    """
+
+    def __init__(self, path, force_onnx_cpu=True, shared: bool = True):
         import numpy as np
 
         global np
 
-        opts = onnxruntime.SessionOptions()
-        opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = 1
-
-        if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
-            self.session = onnxruntime.InferenceSession(
-                path, providers=["CPUExecutionProvider"], sess_options=opts
-            )
+        if shared:
+            self.session = get_onnx_session(path, force_onnx_cpu)
         else:
-            self.session = onnxruntime.InferenceSession(path, sess_options=opts)
+            self.session = _create_onnx_session(path, force_onnx_cpu)
 
         self.reset_states()
         self.sample_rates = [8000, 16000]
@@ -104,34 +156,201 @@ class SileroOnnxModel:
         return out
 
 
-class SileroVADAnalyzer(VADAnalyzer):
-    def __init__(self, *, sample_rate: Optional[int] = None, params: VADParams = VADParams()):
-        super().__init__(sample_rate=sample_rate, params=params)
+@functools.cache
+def _model_file_path():
+    model_name = "silero_vad.onnx"
+    package_path = "pipecat.audio.vad.data"
 
-        logger.debug("Loading Silero VAD model...")
+    try:
+        import importlib_resources as impresources
 
-        model_name = "silero_vad.onnx"
-        package_path = "pipecat.audio.vad.data"
+        model_file_path = str(impresources.files(package_path).joinpath(model_name))
+    except BaseException:
+        from importlib import resources as impresources
 
         try:
-            import importlib_resources as impresources
-
-            model_file_path = str(impresources.files(package_path).joinpath(model_name))
+            with impresources.path(package_path, model_name) as f:
+                model_file_path = f
         except BaseException:
-            from importlib import resources as impresources
+            model_file_path = str(impresources.files(package_path).joinpath(model_name))
 
-            try:
-                with impresources.path(package_path, model_name) as f:
-                    model_file_path = f
-            except BaseException:
-                model_file_path = str(impresources.files(package_path).joinpath(model_name))
+    return model_file_path
 
-        self._model = SileroOnnxModel(model_file_path, force_onnx_cpu=True)
 
-        self._last_reset_time = 0
+@dataclass
+class SileroVADSessionState:
+    """Model state of a single audio stream analyzed by a
+    `SileroVADBatchService`.
+
+    """
+
+    state: np.ndarray = field(default_factory=lambda: np.zeros((2, 1, 128), dtype="float32"))
+    context: Optional[np.ndarray] = None
+
+    def reset(self):
+        self.state = np.zeros((2, 1, 128), dtype="float32")
+        self.context = None
+
+
+@dataclass
+class _BatchRequest:
+    audio: np.ndarray
+    sample_rate: int
+    session: SileroVADSessionState
+    future: Future
+
+
+class SileroVADBatchService:
+    """Runs Silero VAD inference for many audio streams (e.g. all the sessions
+    of a server) with a single model. `SileroVADAnalyzer`s created with this
+    service submit their audio windows, which are collected for at most
+    `max_delay` seconds (or until `max_batch_size` windows are pending) and
+    analyzed with a single batched ONNX call. Each stream keeps its own model
+    state (`SileroVADSessionState`).
+
+    VAD analysis already runs in a thread (see `BaseInputTransport`), so
+    `infer()` blocks that thread until the batch the window belongs to has been
+    analyzed. Inference runs in a separate thread that is started with the
+    first request.
+
+    """
 
+    def __init__(self, *, max_batch_size: int = 256, max_delay: float = 0.002):
+        logger.debug("Loading Silero VAD model for batch inference...")
+        self._model = SileroOnnxModel(_model_file_path(), force_onnx_cpu=True)
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._queue: queue.Queue[Optional[_BatchRequest]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._num_batches = 0
+        self._num_windows = 0
         logger.debug("Loaded Silero VAD")
 
+    @property
+    def num_batches(self) -> int:
+        """Number of ONNX calls made so far."""
+        return self._num_batches
+
+    @property
+    def num_windows(self) -> int:
+        """Number of audio windows analyzed so far."""
+        return self._num_windows
+
+    def infer(self, audio: np.ndarray, sample_rate: int, session: SileroVADSessionState) -> float:
+        """Returns the voice confidence of the given audio window (float32
+        samples) and updates the session state.
+
+        """
+        with self._thread_lock:
+            if not self._thread:
+                self._thread = threading.Thread(target=self._inference_thread_handler, daemon=True)
+                self._thread.start()
+        future = Future()
+        self._queue.put(_BatchRequest(audio, sample_rate, session, future))
+        return future.result()
+
+    def close(self):
+        """Stops the inference thread. Pending requests are still analyzed."""
+        with self._thread_lock:
+            if self._thread:
+                self._queue.put(None)
+                self._thread.join()
+                self._thread = None
+
+    def _next_batch(self) -> Optional[List[_BatchRequest]]:
+        request = self._queue.get()
+        if not request:
+            return None
+        batch = [request]
+        deadline = time.monotonic() + self._max_delay
+        while len(batch) < self._max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                request = (
+                    self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if not request:
+                # Stop after this batch.
+                self._queue.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _inference_thread_handler(self):
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                break
+            # A single call can only analyze windows with the same sample rate.
+            by_sample_rate: Dict[int, List[_BatchRequest]] = {}
+            for request in batch:
+                by_sample_rate.setdefault(request.sample_rate, []).append(request)
+            for sample_rate, requests in by_sample_rate.items():
+                try:
+                    self._run_batch(requests, sample_rate)
+                except Exception as e:
+                    for request in requests:
+                        if not request.future.done():
+                            request.future.set_exception(e)
+
+    def _run_batch(self, requests: List[_BatchRequest], sample_rate: int):
+        num_samples = 512 if sample_rate == 16000 else 256
+        context_size = 64 if sample_rate == 16000 else 32
+
+        x = np.empty((len(requests), context_size + num_samples), dtype="float32")
+        state = np.empty((2, len(requests), 128), dtype="float32")
+        for i, request in enumerate(requests):
+            session = request.session
+            if session.context is None or session.context.shape[-1] != context_size:
+                x[i, :context_size] = 0
+            else:
+                x[i, :context_size] = session.context
+            x[i, context_size:] = request.audio
+            state[:, i, :] = session.state[:, 0, :]
+
+        ort_inputs = {"input": x, "state": state, "sr": np.array(sample_rate, dtype="int64")}
+        (out, new_state) = self._model.session.run(None, ort_inputs)
+
+        self._num_batches += 1
+        self._num_windows += len(requests)
+
+        for i, request in enumerate(requests):
+            session = request.session
+            session.state = new_state[:, i : i + 1, :].copy()
+            session.context = x[i, -context_size:].copy()
+            request.future.set_result(float(out[i][0]))
+
+
+class SileroVADAnalyzer(VADAnalyzer):
+    """Silero VAD analyzer. By default every analyzer loads its own model. If
+    a `batch_service` is given, inference is shared (and batched) with all the
+    other analyzers using the same service.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: Optional[int] = None,
+        params: VADParams = VADParams(),
+        batch_service: Optional[SileroVADBatchService] = None,
+    ):
+        super().__init__(sample_rate=sample_rate, params=params)
+
+        self._batch_service = batch_service
+        self._model: Optional[SileroOnnxModel] = None
+        self._session = SileroVADSessionState()
+
+        if not batch_service:
+            logger.debug("Loading Silero VAD model...")
+            self._model = SileroOnnxModel(_model_file_path(), force_onnx_cpu=True)
+            logger.debug("Loaded Silero VAD")
+
+        self._last_reset_time = 0
+
     #
     # VADAnalyzer
     #
@@ -148,16 +367,24 @@ class SileroVADAnalyzer(VADAnalyzer):
     def voice_confidence(self, buffer) -> float:
         try:
             audio_int16 = np.frombuffer(buffer, np.int16)
-            # Divide by 32768 because we have signed 16-bit data.
-            audio_float32 = np.frombuffer(audio_int16, dtype=np.int16).astype(np.float32) / 32768.0
-            new_confidence = self._model(audio_float32, self.sample_rate)[0]
+            # Divide by 32768 because we have signed 16-bit data. This converts
+            # and scales in a single allocation.
+            audio_float32 = np.multiply(audio_int16, 1.0 / 32768.0, dtype=np.float32)
+            if self._batch_service:
+                new_confidence = self._batch_service.infer(
+                    audio_float32, self.sample_rate, self._session
+                )
+            else:
+                new_confidence = float(self._model(audio_float32, self.sample_rate)[0][0])
 
             # We need to reset the model from time to time because it doesn't
             # really need all the data and memory will keep growing otherwise.
             curr_time = time.time()
             diff_time = curr_time - self._last_reset_time
             if diff_time >= _MODEL_RESET_STATES_TIME:
-                self._model.reset_states()
+                if self._model:
+                    self._model.reset_states()
+                self._session.reset()
                 self._last_reset_time = curr_time
 
             return new_confidence
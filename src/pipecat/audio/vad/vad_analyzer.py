@@ -11,7 +11,9 @@ from typing import Optional
 from loguru import logger
 from pydantic import BaseModel
 
-from pipecat.audio.utils import calculate_audio_volume, exp_smoothing
+from pipecat.audio.loudness import LoudnessMeter
+from pipecat.audio.ring_buffer import AudioRingBuffer
+from pipecat.audio.utils import exp_smoothing
 
 VAD_CONFIDENCE = 0.7
 VAD_START_SECS = 0.2
@@ -40,9 +42,12 @@ class VADAnalyzer:
         self._params = params
         self._num_channels = 1
 
-        self._vad_buffer = b""
+        # Audio is accumulated until we have enough for the analyzer. Windows
+        # are passed to `voice_confidence()` as views of this buffer.
+        self._vad_buffer = AudioRingBuffer()
 
         # Volume exponential smoothing
+        self._loudness_meter = LoudnessMeter()
         self._smoothing_factor = 0.2
         self._prev_volume = 0
 
@@ -64,10 +69,15 @@ class VADAnalyzer:
 
     @abstractmethod
     def voice_confidence(self, buffer) -> float:
+        """Returns the voice confidence of the given audio window. `buffer` is
+        a `memoryview` only valid during this call.
+
+        """
         pass
 
     def set_sample_rate(self, sample_rate: int):
         self._sample_rate = self._init_sample_rate or sample_rate
+        self._loudness_meter.set_sample_rate(self._sample_rate)
         self.set_params(self._params)
 
     def set_params(self, params: VADParams):
@@ -85,18 +95,17 @@ class VADAnalyzer:
         self._vad_state: VADState = VADState.QUIET
 
     def _get_smoothed_volume(self, audio: bytes) -> float:
-        volume = calculate_audio_volume(audio, self.sample_rate)
+        volume = self._loudness_meter.volume(audio)
         return exp_smoothing(volume, self._prev_volume, self._smoothing_factor)
 
     def analyze_audio(self, buffer) -> VADState:
-        self._vad_buffer += buffer
+        self._vad_buffer.write(buffer)
 
         num_required_bytes = self._vad_frames_num_bytes
         if len(self._vad_buffer) < num_required_bytes:
             return self._vad_state
 
-        audio_frames = self._vad_buffer[:num_required_bytes]
-        self._vad_buffer = self._vad_buffer[num_required_bytes:]
+        audio_frames = self._vad_buffer.read(num_required_bytes)
 
         confidence = self.voice_confidence(audio_frames)
 
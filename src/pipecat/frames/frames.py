@@ -19,6 +19,8 @@ from typing import (
     Tuple,
 )
 
+import numpy as np
+
 from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.clocks.base_clock import BaseClock
 from pipecat.metrics.metrics import MetricsData
@@ -29,6 +31,8 @@ from pipecat.utils.utils import obj_count, obj_id
 
 if TYPE_CHECKING:
     from pipecat.observers.base_observer import BaseObserver
+    from pipecat.tracing.span import SpanContext
+    from pipecat.tracing.tracer import Tracer
 
 
 class KeypadEntry(str, Enum):
@@ -60,12 +64,15 @@ class Frame:
     name: str = field(init=False)
     pts: Optional[int] = field(init=False)
     metadata: Dict[str, Any] = field(init=False)
+    trace_context: Optional["SpanContext"] = field(init=False)
 
     def __post_init__(self):
         self.id: int = obj_id()
         self.name: str = f"{self.__class__.__name__}#{obj_count(self)}"
         self.pts: Optional[int] = None
         self.metadata: Dict[str, Any] = {}
+        # Only set if tracing is enabled (see `pipecat.tracing.tracer.Tracer`).
+        self.trace_context: Optional["SpanContext"] = None
 
     def __str__(self):
         return self.name
@@ -119,6 +126,24 @@ class AudioRawFrame:
     def __post_init__(self):
         self.num_frames = int(len(self.audio) / (self.num_channels * 2))
 
+    @property
+    def samples(self) -> np.ndarray:
+        """The audio as a read-only numpy array of 16-bit samples, with shape
+        `(num_frames,)` for mono audio and `(num_frames, num_channels)`
+        otherwise. The array is a view of `audio` (no copies) and it's cached
+        until `audio` is replaced.
+
+        """
+        cached = self.__dict__.get("_samples")
+        if cached is None or cached[0] is not self.audio:
+            samples = np.frombuffer(self.audio, dtype=np.int16)
+            if self.num_channels > 1:
+                samples = samples.reshape(-1, self.num_channels)
+            samples.flags.writeable = False
+            cached = (self.audio, samples)
+            self.__dict__["_samples"] = cached
+        return cached[1]
+
 
 @dataclass
 class ImageRawFrame:
@@ -446,6 +471,7 @@ class StartFrame(SystemFrame):
     enable_usage_metrics: bool = False
     observer: Optional["BaseObserver"] = None
     report_only_initial_ttfb: bool = False
+    tracer: Optional["Tracer"] = None
 
 
 @dataclass
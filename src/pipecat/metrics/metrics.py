@@ -30,3 +30,54 @@ class LLMUsageMetricsData(MetricsData):
 
 class TTSUsageMetricsData(MetricsData):
     value: int
+
+
+class MemoryUsageMetricsData(MetricsData):
+    value: int
+
+
+class RTFMetricsData(MetricsData):
+    """Real-time factor: wall time divided by audio duration. Values greater
+    than 1 mean audio is processed (or generated) slower than real time.
+
+    Attributes:
+        value: Real-time factor of the last utterance.
+        window_value: Real-time factor of the last utterances (sliding window).
+        audio_duration: Audio duration (in seconds) of the last utterance.
+    """
+
+    value: float
+    window_value: float
+    audio_duration: float
+
+
+class STTFinalizationMetricsData(MetricsData):
+    """Time (in seconds) from the moment the user stops speaking until the
+    final transcription is received. Reported by streaming STT services, where
+    audio is sent in real time and the real-time factor is not meaningful.
+
+    """
+
+    value: float
+
+
+class PlayoutMetricsData(MetricsData):
+    """Audio playout of an output transport, reported when the bot stops
+    speaking.
+
+    Attributes:
+        value: Mean jitter (in seconds) of the audio chunks, i.e. how late or
+            early they were written compared to the playout clock.
+        max_jitter: Maximum jitter (in seconds).
+        underruns: Number of times the transport ran out of audio in the middle
+            of an utterance.
+        overruns: Number of times the audio waiting to be played exceeded the
+            maximum buffer size.
+        audio_duration: Audio duration (in seconds) that was played.
+    """
+
+    value: float
+    max_jitter: float
+    underruns: int
+    overruns: int
+    audio_duration: float
@@ -42,3 +42,11 @@ class BaseObserver(ABC):
 
         """
         pass
+
+    def memory_usage(self) -> int:
+        """Returns an estimate, in bytes, of the memory retained by this
+        observer. Observers that accumulate state during a session should
+        override this.
+
+        """
+        return 0
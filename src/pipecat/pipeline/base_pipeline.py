@@ -5,7 +5,7 @@
 #
 
 from abc import abstractmethod
-from typing import List
+from typing import Dict, List
 
 from pipecat.processors.frame_processor import FrameProcessor
 
@@ -17,3 +17,19 @@ class BasePipeline(FrameProcessor):
     @abstractmethod
     def processors_with_metrics(self) -> List[FrameProcessor]:
         pass
+
+    def processors_memory_usage(self) -> Dict[str, int]:
+        """Returns the memory usage (see `FrameProcessor.memory_usage()`) of
+        this pipeline and all the processors inside it, indexed by processor
+        name.
+
+        """
+        return {self.name: self.memory_usage()}
+
+    def processors_queue_sizes(self) -> Dict[str, int]:
+        """Returns the number of queued frames (see
+        `FrameProcessor.queue_size()`) of this pipeline and all the processors
+        inside it, indexed by processor name.
+
+        """
+        return {self.name: self.queue_size()}
@@ -0,0 +1,193 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from loguru import logger
+
+from pipecat.frames.frames import AudioRawFrame, Frame, ImageRawFrame, TextFrame
+
+if TYPE_CHECKING:
+    from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+@dataclass
+class FlightRecorderEntry:
+    """Metadata of a frame that has been pushed from one processor to another."""
+
+    timestamp: int
+    frame_id: int
+    frame_type: str
+    direction: str
+    src: str
+    dst: str
+    size: int
+
+    def to_dict(self):
+        return {
+            "timestamp": self.timestamp,
+            "frame_id": self.frame_id,
+            "frame_type": self.frame_type,
+            "direction": self.direction,
+            "src": self.src,
+            "dst": self.dst,
+            "size": self.size,
+        }
+
+
+class FlightRecorder:
+    """A fixed-size ring buffer that records compact metadata of every frame
+    pushed between processors of a pipeline task: frame type, frame id,
+    direction, source and destination processors, pipeline clock timestamp
+    and payload size.
+
+    It is meant to be always on, so recording does the minimum amount of work
+    (no formatting, no allocations other than a tuple per frame). The recorded
+    entries can be dumped to a file (one JSON object per line) on demand with
+    `dump()` and, if `dump_dir` is given, the pipeline task dumps them
+    automatically when an error is received or when the task is cancelled.
+
+    Args:
+        size: Maximum number of entries kept (oldest are overwritten).
+        dump_dir: Directory where automatic dumps are written.
+        dump_on_error: Whether to dump automatically on `ErrorFrame`.
+        dump_on_cancel: Whether to dump automatically when cancelled.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 2048,
+        dump_dir: Optional[str] = None,
+        dump_on_error: bool = True,
+        dump_on_cancel: bool = True,
+    ):
+        if size <= 0:
+            raise ValueError("FlightRecorder size needs to be greater than 0")
+
+        self._size = size
+        self._dump_dir = dump_dir
+        self._dump_on_error = dump_on_error
+        self._dump_on_cancel = dump_on_cancel
+
+        self._entries: List[Optional[Tuple]] = [None] * size
+        self._count = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def count(self) -> int:
+        """Total number of frames recorded (including overwritten ones)."""
+        return self._count
+
+    def record(
+        self,
+        src: "FrameProcessor",
+        dst: "FrameProcessor",
+        frame: Frame,
+        direction: "FrameDirection",
+        timestamp: int,
+    ):
+        # Keep this as cheap as possible, it's called for every pushed frame.
+        if isinstance(frame, AudioRawFrame):
+            size = len(frame.audio)
+        elif isinstance(frame, ImageRawFrame):
+            size = len(frame.image)
+        elif isinstance(frame, TextFrame):
+            size = len(frame.text)
+        else:
+            size = 0
+        self._entries[self._count % self._size] = (
+            timestamp,
+            frame.id,
+            frame.__class__,
+            direction,
+            src.name,
+            dst.name,
+            size,
+        )
+        self._count += 1
+
+    def entries(self) -> List[FlightRecorderEntry]:
+        """Returns the recorded entries, oldest first."""
+        if self._count <= self._size:
+            raw = self._entries[: self._count]
+        else:
+            index = self._count % self._size
+            raw = self._entries[index:] + self._entries[:index]
+        return [
+            FlightRecorderEntry(
+                timestamp=timestamp,
+                frame_id=frame_id,
+                frame_type=frame_type.__name__,
+                direction=direction.name.lower(),
+                src=src,
+                dst=dst,
+                size=size,
+            )
+            for (timestamp, frame_id, frame_type, direction, src, dst, size) in raw
+        ]
+
+    def clear(self):
+        self._entries = [None] * self._size
+        self._count = 0
+
+    def dump(self, file_name: str, *, reason: str = "on_demand") -> str:
+        """Writes the recorded entries to the given file and returns the file
+        name. The first line is a header with the dump reason.
+
+        """
+        self._write(file_name, self.entries(), self._count, reason)
+        return file_name
+
+    async def maybe_dump(self, name: str, reason: str) -> Optional[str]:
+        """Dumps the recorded entries to `dump_dir` if automatic dumps have been
+        configured for the given reason ("error" or "cancel"). The file is
+        written in a separate thread.
+
+        """
+        if not self._dump_dir:
+            return None
+        if reason == "error" and not self._dump_on_error:
+            return None
+        if reason == "cancel" and not self._dump_on_cancel:
+            return None
+
+        file_name = os.path.join(
+            self._dump_dir,
+            f"{name}-{reason}-{time.strftime('%Y%m%d-%H%M%S')}-{self._count}.jsonl",
+        )
+        try:
+            # Take the snapshot now, frames keep being recorded while we write.
+            entries = self.entries()
+            await asyncio.to_thread(self._write, file_name, entries, self._count, reason)
+            logger.info(f"Flight recorder dumped to {file_name}")
+            return file_name
+        except Exception as e:
+            logger.error(f"Unable to dump flight recorder to {file_name}: {e}")
+            return None
+
+    def _write(
+        self, file_name: str, entries: List[FlightRecorderEntry], total_frames: int, reason: str
+    ):
+        with open(file_name, "w") as f:
+            header = {
+                "reason": reason,
+                "time": time.time(),
+                "total_frames": total_frames,
+                "entries": len(entries),
+            }
+            f.write(json.dumps(header) + "\n")
+            for entry in entries:
+                f.write(json.dumps(entry.to_dict()) + "\n")
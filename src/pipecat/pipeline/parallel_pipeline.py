@@ -21,6 +21,7 @@ from pipecat.frames.frames import (
 from pipecat.pipeline.base_pipeline import BasePipeline
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.utils.memory import deep_sizeof
 
 
 class ParallelPipelineSource(FrameProcessor):
@@ -112,10 +113,25 @@ class ParallelPipeline(BasePipeline):
     def processors_with_metrics(self) -> List[FrameProcessor]:
         return list(chain.from_iterable(p.processors_with_metrics() for p in self._pipelines))
 
+    def processors_memory_usage(self) -> Dict[str, int]:
+        usage = {self.name: self.memory_usage()}
+        for p in self._pipelines:
+            usage.update(p.processors_memory_usage())
+        return usage
+
+    def processors_queue_sizes(self) -> Dict[str, int]:
+        sizes = {self.name: self.queue_size()}
+        for p in self._pipelines:
+            sizes.update(p.processors_queue_sizes())
+        return sizes
+
     #
     # Frame processor
     #
 
+    def memory_usage(self) -> int:
+        return deep_sizeof(self._seen_ids) + deep_sizeof(self._endframe_counter)
+
     async def cleanup(self):
         await super().cleanup()
         await asyncio.gather(*[s.cleanup() for s in self._sources])
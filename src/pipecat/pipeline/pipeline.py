@@ -4,7 +4,7 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
-from typing import Callable, Coroutine, List
+from typing import Callable, Coroutine, Dict, List
 
 from pipecat.frames.frames import Frame
 from pipecat.pipeline.base_pipeline import BasePipeline
@@ -66,6 +66,24 @@ class Pipeline(BasePipeline):
                 services.append(p)
         return services
 
+    def processors_memory_usage(self) -> Dict[str, int]:
+        usage = {self.name: self.memory_usage()}
+        for p in self._processors:
+            if isinstance(p, BasePipeline):
+                usage.update(p.processors_memory_usage())
+            else:
+                usage[p.name] = p.memory_usage()
+        return usage
+
+    def processors_queue_sizes(self) -> Dict[str, int]:
+        sizes = {self.name: self.queue_size()}
+        for p in self._processors:
+            if isinstance(p, BasePipeline):
+                sizes.update(p.processors_queue_sizes())
+            else:
+                sizes[p.name] = p.queue_size()
+        return sizes
+
     #
     # Frame processor
     #
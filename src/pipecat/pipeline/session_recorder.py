@@ -0,0 +1,241 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import pickle
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Type
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    Frame,
+    InputAudioRawFrame,
+    LLMFullResponseEndFrame,
+    LLMMessagesFrame,
+    MetricsFrame,
+    StartFrame,
+    TextFrame,
+    TTSSpeakFrame,
+)
+from pipecat.observers.base_observer import BaseObserver
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContextFrame
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.ai_services import LLMService, STTService, TTSService
+from pipecat.transports.base_input import BaseInputTransport
+
+# The frames that make a service do some work (i.e. requests). Service
+# responses are attributed to the last request received.
+SERVICE_REQUEST_TYPES: Dict[str, Tuple[Type[Frame], ...]] = {
+    "stt": (InputAudioRawFrame,),
+    "llm": (OpenAILLMContextFrame, LLMMessagesFrame),
+    "tts": (TextFrame, TTSSpeakFrame, LLMFullResponseEndFrame),
+}
+
+# Number of recently received frame ids we remember for every processor, to
+# tell generated frames from frames that are just passed through.
+RECENT_FRAMES_SIZE = 1024
+
+
+@dataclass
+class RecordedFrame:
+    """A frame pushed at `timestamp` (pipeline clock nanoseconds, relative to
+    the start of the session). A recorded response without frame means the
+    request frame itself was pushed (i.e. passed through).
+
+    """
+
+    timestamp: int
+    frame: Optional[Frame]
+    direction: FrameDirection = FrameDirection.DOWNSTREAM
+
+
+@dataclass
+class RecordedRequest:
+    """A request received by a service (see `SERVICE_REQUEST_TYPES`) at
+    `timestamp` and the frames the service pushed until the next request.
+
+    """
+
+    timestamp: int
+    responses: List[RecordedFrame] = field(default_factory=list)
+
+
+@dataclass
+class SessionRecording:
+    """Everything needed to replay a session offline (see
+    `pipecat.tests.replay`): the frames pushed by the input transport and the
+    requests and responses of every service. Services are indexed by their
+    role (`stt`, `llm` or `tts`) and, if there are more services with the same
+    role, by role and position (e.g. `tts:1`).
+
+    """
+
+    inputs: List[RecordedFrame] = field(default_factory=list)
+    services: Dict[str, List[RecordedRequest]] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> int:
+        """Returns the time of the last recorded frame, in nanoseconds."""
+        timestamps = [f.timestamp for f in self.inputs[-1:]]
+        for requests in self.services.values():
+            for request in requests[-1:]:
+                timestamps.append(request.timestamp)
+                timestamps.extend(r.timestamp for r in request.responses[-1:])
+        return max(timestamps, default=0)
+
+    def save(self, file_name: str):
+        """Saves the recording to the given file (pickled)."""
+        with open(file_name, "wb") as f:
+            pickle.dump(self, f)
+
+    @classmethod
+    def load(cls, file_name: str) -> "SessionRecording":
+        """Loads a recording saved with `save()`. Recordings are pickled, so
+        only load recordings you trust.
+
+        """
+        with open(file_name, "rb") as f:
+            recording = pickle.load(f)
+        if not isinstance(recording, cls):
+            raise ValueError(f"{file_name} is not a session recording")
+        return recording
+
+
+class SessionRecorder(BaseObserver):
+    """Records a session so it can be replayed offline, deterministically and
+    without calling any external service (see `pipecat.tests.replay`). This is
+    useful to reproduce and benchmark latency and CPU regressions.
+
+    Every frame generated by the input transport is recorded with its
+    timestamp. For every LLM, TTS and STT service, the requests it receives
+    (see `SERVICE_REQUEST_TYPES`) are recorded with the frames it generates
+    (e.g. LLM text, TTS audio or transcriptions) or passes through after
+    each of them. Metrics frames are not recorded.
+
+    Add it to the pipeline task observers and save the recording when the
+    session is over:
+
+        recorder = SessionRecorder()
+        task = PipelineTask(pipeline, params=PipelineParams(observers=[recorder]))
+        ...
+        recorder.recording.save("session.pkl")
+
+    """
+
+    def __init__(self):
+        self._recording = SessionRecording()
+        self._start_timestamp: Optional[int] = None
+        self._service_keys: Dict[int, str] = {}
+        self._role_counts: Dict[str, int] = {}
+        self._recent_frames: Dict[int, OrderedDict] = {}
+
+    @property
+    def recording(self) -> SessionRecording:
+        return self._recording
+
+    async def on_push_frame(
+        self,
+        src: FrameProcessor,
+        dst: FrameProcessor,
+        frame: Frame,
+        direction: FrameDirection,
+        timestamp: int,
+    ):
+        if isinstance(frame, StartFrame) and self._start_timestamp is None:
+            self._start_timestamp = timestamp
+
+        if self._start_timestamp is None or isinstance(frame, MetricsFrame):
+            return
+
+        timestamp -= self._start_timestamp
+
+        dst_role = self._role(dst)
+        if dst_role:
+            self._handle_received(dst, dst_role, frame, direction, timestamp)
+
+        src_role = self._role(src)
+        if src_role:
+            self._handle_pushed(src, src_role, frame, direction, timestamp)
+
+    def _role(self, processor: FrameProcessor) -> Optional[str]:
+        if isinstance(processor, BaseInputTransport):
+            return "input"
+        elif isinstance(processor, STTService):
+            return "stt"
+        elif isinstance(processor, LLMService):
+            return "llm"
+        elif isinstance(processor, TTSService):
+            return "tts"
+        return None
+
+    def _service_key(self, processor: FrameProcessor, role: str) -> str:
+        key = self._service_keys.get(processor.id)
+        if not key:
+            count = self._role_counts.get(role, 0)
+            self._role_counts[role] = count + 1
+            key = role if count == 0 else f"{role}:{count}"
+            self._service_keys[processor.id] = key
+            self._recording.services[key] = []
+        return key
+
+    def _handle_received(
+        self,
+        processor: FrameProcessor,
+        role: str,
+        frame: Frame,
+        direction: FrameDirection,
+        timestamp: int,
+    ):
+        recent = self._recent_frames.setdefault(processor.id, OrderedDict())
+
+        request = None
+        request_types = SERVICE_REQUEST_TYPES.get(role)
+        if request_types and direction == FrameDirection.DOWNSTREAM:
+            if isinstance(frame, request_types):
+                request = RecordedRequest(timestamp=timestamp)
+                key = self._service_key(processor, role)
+                self._recording.services[key].append(request)
+
+        recent[frame.id] = request
+        if len(recent) > RECENT_FRAMES_SIZE:
+            recent.popitem(last=False)
+
+    def _handle_pushed(
+        self,
+        processor: FrameProcessor,
+        role: str,
+        frame: Frame,
+        direction: FrameDirection,
+        timestamp: int,
+    ):
+        recent = self._recent_frames.get(processor.id)
+        passthrough = recent is not None and frame.id in recent
+
+        if role == "input":
+            # We only want what comes from the transport, not frames that
+            # come from the pipeline task (e.g. EndFrame).
+            if not passthrough and direction == FrameDirection.DOWNSTREAM:
+                self._recording.inputs.append(RecordedFrame(timestamp=timestamp, frame=frame))
+            return
+
+        key = self._service_key(processor, role)
+        requests = self._recording.services[key]
+
+        if passthrough:
+            request = recent.pop(frame.id)
+            # Passed through requests are replayed as responses, other frames
+            # are just passed through when replaying.
+            if request:
+                request.responses.append(
+                    RecordedFrame(timestamp=timestamp, frame=None, direction=direction)
+                )
+        elif requests:
+            requests[-1].responses.append(
+                RecordedFrame(timestamp=timestamp, frame=frame, direction=direction)
+            )
+        else:
+            logger.debug(f"{self}: ignoring {frame} pushed by {processor} before any request")
@@ -7,7 +7,7 @@
 import asyncio
 from dataclasses import dataclass
 from itertools import chain
-from typing import List
+from typing import Dict, List
 
 from loguru import logger
 
@@ -99,6 +99,18 @@ class SyncParallelPipeline(BasePipeline):
     def processors_with_metrics(self) -> List[FrameProcessor]:
         return list(chain.from_iterable(p.processors_with_metrics() for p in self._pipelines))
 
+    def processors_memory_usage(self) -> Dict[str, int]:
+        usage = {self.name: self.memory_usage()}
+        for p in self._pipelines:
+            usage.update(p.processors_memory_usage())
+        return usage
+
+    def processors_queue_sizes(self) -> Dict[str, int]:
+        sizes = {self.name: self.queue_size()}
+        for p in self._pipelines:
+            sizes.update(p.processors_queue_sizes())
+        return sizes
+
     #
     # Frame processor
     #
@@ -5,7 +5,7 @@
 #
 
 import asyncio
-from typing import Any, AsyncIterable, Dict, Iterable, List
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Set
 
 from loguru import logger
 from pydantic import BaseModel, ConfigDict
@@ -24,17 +24,26 @@ from pipecat.frames.frames import (
     StartFrame,
     StopTaskFrame,
 )
-from pipecat.metrics.metrics import ProcessingMetricsData, TTFBMetricsData
+from pipecat.metrics.metrics import (
+    MemoryUsageMetricsData,
+    ProcessingMetricsData,
+    TTFBMetricsData,
+)
 from pipecat.observers.base_observer import BaseObserver
 from pipecat.pipeline.base_pipeline import BasePipeline
 from pipecat.pipeline.base_task import BaseTask
+from pipecat.pipeline.flight_recorder import FlightRecorder
 from pipecat.pipeline.task_observer import TaskObserver
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.tracing.tracer import Tracer
+from pipecat.utils import log
 from pipecat.utils.asyncio import TaskManager
+from pipecat.utils.memory import GrowthDetector
 from pipecat.utils.utils import obj_count, obj_id
 
 HEARTBEAT_SECONDS = 1.0
 HEARTBEAT_MONITOR_SECONDS = HEARTBEAT_SECONDS * 5
+MEMORY_USAGE_SECONDS = 10.0
 
 
 class PipelineParams(BaseModel):
@@ -45,13 +54,22 @@ class PipelineParams(BaseModel):
         audio_in_sample_rate: Input audio sample rate in Hz.
         audio_out_sample_rate: Output audio sample rate in Hz.
         enable_heartbeats: Whether to enable heartbeat monitoring.
+        enable_memory_usage_metrics: Whether to periodically report the memory
+            used by each processor (see `FrameProcessor.memory_usage()`) and
+            warn about processors whose memory keeps growing.
         enable_metrics: Whether to enable metrics collection.
         enable_usage_metrics: Whether to enable usage metrics.
+        flight_recorder: Flight recorder used to record metadata of every frame
+            pushed in the pipeline. If not provided, a default one (which only
+            dumps on demand) is created for each task.
         heartbeats_period_secs: Period between heartbeats in seconds.
+        memory_usage_period_secs: Period between memory usage reports in seconds.
         observers: List of observers for monitoring pipeline execution.
         report_only_initial_ttfb: Whether to report only initial time to first byte.
         send_initial_empty_metrics: Whether to send initial empty metrics.
         start_metadata: Additional metadata for pipeline start.
+        tracer: Tracer used to create spans for turns, service requests and
+            function calls. Tracing is disabled if not provided.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -60,13 +78,17 @@ class PipelineParams(BaseModel):
     audio_in_sample_rate: int = 16000
     audio_out_sample_rate: int = 24000
     enable_heartbeats: bool = False
+    enable_memory_usage_metrics: bool = False
     enable_metrics: bool = False
     enable_usage_metrics: bool = False
+    flight_recorder: Optional[FlightRecorder] = None
     heartbeats_period_secs: float = HEARTBEAT_SECONDS
+    memory_usage_period_secs: float = MEMORY_USAGE_SECONDS
     observers: List[BaseObserver] = []
     report_only_initial_ttfb: bool = False
     send_initial_empty_metrics: bool = True
     start_metadata: Dict[str, Any] = {}
+    tracer: Optional[Tracer] = None
 
 
 class PipelineTaskSource(FrameProcessor):
@@ -160,7 +182,13 @@ class PipelineTask(BaseTask):
 
         self._task_manager = TaskManager()
 
-        self._observer = TaskObserver(observers=params.observers, task_manager=self._task_manager)
+        self._flight_recorder = params.flight_recorder or FlightRecorder()
+
+        self._observer = TaskObserver(
+            observers=params.observers,
+            task_manager=self._task_manager,
+            flight_recorder=self._flight_recorder,
+        )
 
     @property
     def id(self) -> int:
@@ -177,6 +205,49 @@ class PipelineTask(BaseTask):
         """Returns the pipeline parameters of this task."""
         return self._params
 
+    @property
+    def flight_recorder(self) -> FlightRecorder:
+        """Returns the flight recorder of this task."""
+        return self._flight_recorder
+
+    async def dump_flight_recorder(self, file_name: str) -> str:
+        """Writes the latest frames recorded by the flight recorder to the
+        given file (in a separate thread).
+
+        Args:
+            file_name: The file where the recorded frames will be written.
+        """
+        await asyncio.to_thread(self._flight_recorder.dump, file_name)
+        return file_name
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Returns an estimate, in bytes, of the memory retained by each
+        processor in the pipeline and by each observer, indexed by name.
+
+        """
+        usage = self._pipeline.processors_memory_usage()
+        for i, observer in enumerate(self._params.observers):
+            usage[f"{observer.__class__.__name__}#{i}"] = observer.memory_usage()
+        return usage
+
+    def queue_sizes(self) -> Dict[str, int]:
+        """Returns the number of frames waiting in the queues of each processor
+        in the pipeline and in this task's own queues, indexed by name.
+
+        """
+        sizes = self._pipeline.processors_queue_sizes()
+        sizes[f"{self}::up_queue"] = self._up_queue.qsize()
+        sizes[f"{self}::down_queue"] = self._down_queue.qsize()
+        sizes[f"{self}::push_queue"] = self._push_queue.qsize()
+        return sizes
+
+    def current_tasks(self) -> Set[asyncio.Task]:
+        """Returns the tasks created by the processors of this pipeline task
+        (see `TaskManager`) that haven't been waited for or cancelled yet.
+
+        """
+        return self._task_manager.current_tasks()
+
     def set_event_loop(self, loop: asyncio.AbstractEventLoop):
         self._task_manager.set_event_loop(loop)
 
@@ -198,6 +269,7 @@ class PipelineTask(BaseTask):
     async def cancel(self):
         """Stops the running pipeline immediately."""
         logger.debug(f"Canceling pipeline task {self}")
+        await self._flight_recorder.maybe_dump(self.name, "cancel")
         # Make sure everything is cleaned up downstream. This is sent
         # out-of-band from the main streaming task which is what we want since
         # we want to cancel right away.
@@ -220,6 +292,8 @@ class PipelineTask(BaseTask):
             pass
         await self._cancel_tasks()
         await self._cleanup()
+        if self._params.tracer:
+            self._params.tracer.stop()
         self._print_dangling_tasks()
         self._finished = True
 
@@ -268,8 +342,15 @@ class PipelineTask(BaseTask):
                 self._heartbeat_monitor_handler(), f"{self}::_heartbeat_monitor_handler"
             )
 
+    def _maybe_start_memory_usage_task(self):
+        if self._params.enable_memory_usage_metrics:
+            self._memory_usage_task = self._task_manager.create_task(
+                self._memory_usage_handler(), f"{self}::_memory_usage_handler"
+            )
+
     async def _cancel_tasks(self):
         await self._maybe_cancel_heartbeat_tasks()
+        await self._maybe_cancel_memory_usage_task()
 
         await self._task_manager.cancel_task(self._process_up_task)
         await self._task_manager.cancel_task(self._process_down_task)
@@ -281,6 +362,10 @@ class PipelineTask(BaseTask):
             await self._task_manager.cancel_task(self._heartbeat_push_task)
             await self._task_manager.cancel_task(self._heartbeat_monitor_task)
 
+    async def _maybe_cancel_memory_usage_task(self):
+        if self._params.enable_memory_usage_metrics:
+            await self._task_manager.cancel_task(self._memory_usage_task)
+
     def _initial_metrics_frame(self) -> MetricsFrame:
         processors = self._pipeline.processors_with_metrics()
         data = []
@@ -306,7 +391,11 @@ class PipelineTask(BaseTask):
         """
         self._clock.start()
 
+        if self._params.tracer:
+            self._params.tracer.start(task=self.name)
+
         self._maybe_start_heartbeat_tasks()
+        self._maybe_start_memory_usage_task()
 
         start_frame = StartFrame(
             clock=self._clock,
@@ -318,6 +407,7 @@ class PipelineTask(BaseTask):
             enable_usage_metrics=self._params.enable_usage_metrics,
             observer=self._observer,
             report_only_initial_ttfb=self._params.report_only_initial_ttfb,
+            tracer=self._params.tracer,
         )
         start_frame.metadata = self._params.start_metadata
         await self._source.queue_frame(start_frame, FrameDirection.DOWNSTREAM)
@@ -353,11 +443,13 @@ class PipelineTask(BaseTask):
                 await self.queue_frame(EndFrame())
             elif isinstance(frame, CancelTaskFrame):
                 # Tell the task we should end right away.
+                await self._flight_recorder.maybe_dump(self.name, "cancel")
                 await self.queue_frame(CancelFrame())
             elif isinstance(frame, StopTaskFrame):
                 await self.queue_frame(StopTaskFrame())
             elif isinstance(frame, ErrorFrame):
                 logger.error(f"Error running app: {frame}")
+                await self._flight_recorder.maybe_dump(self.name, "error")
                 if frame.fatal:
                     # Cancel all tasks downstream.
                     await self.queue_frame(CancelFrame())
@@ -401,13 +493,39 @@ class PipelineTask(BaseTask):
             try:
                 frame = await asyncio.wait_for(self._heartbeat_queue.get(), timeout=wait_time)
                 process_time = (self._clock.get_time() - frame.timestamp) / 1_000_000_000
-                logger.trace(f"{self}: heartbeat frame processed in {process_time} seconds")
+                log.trace(
+                    "{task}: heartbeat frame processed in {process_time} seconds",
+                    task=self,
+                    process_time=process_time,
+                )
                 self._heartbeat_queue.task_done()
             except asyncio.TimeoutError:
                 logger.warning(
                     f"{self}: heartbeat frame not received for more than {wait_time} seconds"
                 )
 
+    async def _memory_usage_handler(self):
+        """This task periodically reports (as metrics) the memory used by each
+        processor and logs a warning if the memory of a processor keeps
+        growing.
+
+        """
+        detectors: Dict[str, GrowthDetector] = {}
+        while True:
+            await asyncio.sleep(self._params.memory_usage_period_secs)
+            data = []
+            for name, value in self.memory_usage().items():
+                if value == 0:
+                    continue
+                data.append(MemoryUsageMetricsData(processor=name, value=value))
+                detector = detectors.setdefault(name, GrowthDetector())
+                if detector.add_sample(value):
+                    growth = detector.growth
+                    logger.warning(f"{self}: memory usage of {name} grew {growth} bytes steadily")
+                    detector.reset()
+            if data:
+                await self._source.queue_frame(MetricsFrame(data=data))
+
     def _print_dangling_tasks(self):
         tasks = [t.get_name() for t in self._task_manager.current_tasks()]
         if tasks:
@@ -5,12 +5,13 @@
 #
 
 import asyncio
-from typing import List
+from typing import List, Optional
 
 from attr import dataclass
 
 from pipecat.frames.frames import Frame
 from pipecat.observers.base_observer import BaseObserver
+from pipecat.pipeline.flight_recorder import FlightRecorder
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.utils.asyncio import TaskManager
 from pipecat.utils.utils import obj_count, obj_id
@@ -53,13 +54,23 @@ class TaskObserver(BaseObserver):
     is received, it will be put in a queue for efficiency and later processed by
     each task.
 
+    If a flight recorder is given, frames are recorded synchronously (recording
+    is cheap and we don't want to lose frames if the pipeline is stuck).
+
     """
 
-    def __init__(self, *, observers: List[BaseObserver] = [], task_manager: TaskManager):
+    def __init__(
+        self,
+        *,
+        observers: List[BaseObserver] = [],
+        task_manager: TaskManager,
+        flight_recorder: Optional[FlightRecorder] = None,
+    ):
         self._id: int = obj_id()
         self._name: str = f"{self.__class__.__name__}#{obj_count(self)}"
         self._observers = observers
         self._task_manager = task_manager
+        self._flight_recorder = flight_recorder
         self._proxies: List[Proxy] = []
 
     @property
@@ -87,6 +98,9 @@ class TaskObserver(BaseObserver):
         direction: FrameDirection,
         timestamp: int,
     ):
+        if self._flight_recorder:
+            self._flight_recorder.record(src, dst, frame, direction, timestamp)
+
         for proxy in self._proxies:
             await proxy.queue.put(
                 ObserverData(
@@ -5,6 +5,7 @@
 #
 
 import asyncio
+import sys
 import time
 from abc import abstractmethod
 from typing import List
@@ -34,6 +35,7 @@ from pipecat.processors.aggregators.openai_llm_context import (
     OpenAILLMContextFrame,
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.utils.memory import deep_sizeof
 
 
 class BaseLLMResponseAggregator(FrameProcessor):
@@ -120,6 +122,9 @@ class LLMResponseAggregator(BaseLLMResponseAggregator):
     def role(self) -> str:
         return self._role
 
+    def memory_usage(self) -> int:
+        return deep_sizeof(self._messages) + sys.getsizeof(self._aggregation)
+
     def add_messages(self, messages):
         self._messages.extend(messages)
 
@@ -171,6 +176,11 @@ class LLMContextResponseAggregator(BaseLLMResponseAggregator):
     def context(self):
         return self._context
 
+    def memory_usage(self) -> int:
+        # Note that the context is usually shared between the user and the
+        # assistant aggregators, so both will report it.
+        return deep_sizeof(self._context.messages) + sys.getsizeof(self._aggregation)
+
     def get_context_frame(self) -> OpenAILLMContextFrame:
         return OpenAILLMContextFrame(context=self._context)
 
@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
+import sys
 import time
 from typing import Optional
 
@@ -80,6 +81,9 @@ class AudioBufferProcessor(FrameProcessor):
             self._bot_audio_buffer
         )
 
+    def memory_usage(self) -> int:
+        return sys.getsizeof(self._user_audio_buffer) + sys.getsizeof(self._bot_audio_buffer)
+
     def merge_audio_buffers(self) -> bytes:
         if self._num_channels == 1:
             return mix_audio(bytes(self._user_audio_buffer), bytes(self._bot_audio_buffer))
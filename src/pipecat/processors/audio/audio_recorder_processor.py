@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from typing import Optional
+
+from pipecat.audio.recorder import AudioRecorder
+from pipecat.audio.utils import create_default_resampler
+from pipecat.frames.frames import (
+    AudioRawFrame,
+    CancelFrame,
+    EndFrame,
+    Frame,
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    StartFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+class AudioRecorderProcessor(FrameProcessor):
+    """This processor records the conversation (input and output audio) to a
+    sound file while it happens. Unlike `AudioBufferProcessor`, audio is not
+    kept in memory: it's written incrementally by a background thread, so it's
+    suitable for long calls. The file format (e.g. WAV, FLAC or Ogg) is given by
+    the file name extension, or by `format` and `subtype` (see `soundfile`).
+
+    User and bot audio are aligned using the time (from the pipeline clock) the
+    frames reach this processor, so it works with both continuous and
+    intermittent user streams. With mono audio user and bot audio will be
+    mixed, in the case of stereo the left channel will be used for the user's
+    audio and the right channel for the bot.
+
+    Call `start_recording()` to start (if the pipeline hasn't started yet,
+    recording starts with it). Recording stops (and the file is closed) when
+    `stop_recording()` is called or the pipeline ends.
+
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        *,
+        sample_rate: Optional[int] = None,
+        num_channels: int = 1,
+        max_delay_secs: float = 1.0,
+        format: Optional[str] = None,
+        subtype: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._file_name = file_name
+        self._init_sample_rate = sample_rate
+        self._sample_rate = 0
+        self._num_channels = num_channels
+        self._max_delay_secs = max_delay_secs
+        self._format = format
+        self._subtype = subtype
+
+        self._recorder: Optional[AudioRecorder] = None
+        # Whether `start_recording()` was called before the sample rate and the
+        # clock were known (i.e. before StartFrame).
+        self._start_pending = False
+
+        # Audio is positioned by the time it's received, so it's resampled as
+        # it arrives. A stream resampler would keep part of it (and release it
+        # later or never).
+        self._resampler = create_default_resampler()
+
+        self._register_event_handler("on_recording_stopped")
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def num_channels(self) -> int:
+        return self._num_channels
+
+    def memory_usage(self) -> int:
+        return self._recorder.memory_usage() if self._recorder else 0
+
+    async def start_recording(self):
+        if self._recorder:
+            return
+        if not self._sample_rate or not self._clock:
+            self._start_pending = True
+            return
+        self._start_pending = False
+        self._recorder = AudioRecorder(
+            self._file_name,
+            sample_rate=self._sample_rate,
+            num_channels=self._num_channels,
+            max_delay_secs=self._max_delay_secs,
+            format=self._format,
+            subtype=self._subtype,
+        )
+        self._recorder.start(self.get_clock().get_time())
+
+    async def stop_recording(self):
+        self._start_pending = False
+        if not self._recorder:
+            return
+        recorder = self._recorder
+        self._recorder = None
+        await recorder.stop()
+        await self._call_event_handler("on_recording_stopped", recorder.file_name)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, StartFrame):
+            self._sample_rate = self._init_sample_rate or frame.audio_out_sample_rate
+            if self._start_pending:
+                await self.start_recording()
+
+        if self._recorder:
+            if isinstance(frame, InputAudioRawFrame):
+                audio = await self._resample_audio(frame)
+                await self._recorder.write_user_audio(audio, self.get_clock().get_time())
+            elif isinstance(frame, OutputAudioRawFrame):
+                audio = await self._resample_audio(frame)
+                await self._recorder.write_bot_audio(audio, self.get_clock().get_time())
+
+        if isinstance(frame, (CancelFrame, EndFrame)):
+            await self.stop_recording()
+
+        await self.push_frame(frame, direction)
+
+    async def _resample_audio(self, frame: AudioRawFrame) -> bytes:
+        return await self._resampler.resample(frame.audio, frame.sample_rate, self._sample_rate)
@@ -32,6 +32,7 @@ from pipecat.frames.frames import (
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.services.ai_services import STTService
+from pipecat.utils import log
 
 
 class STTMuteStrategy(Enum):
@@ -191,7 +192,9 @@ class STTMuteFilter(FrameProcessor):
             if not self.is_muted:
                 await self.push_frame(frame, direction)
             else:
-                logger.debug(f"{frame.__class__.__name__} suppressed - STT currently muted")
+                log.debug(
+                    "{frame} suppressed - STT currently muted", frame=frame.__class__.__name__
+                )
         else:
             # Pass all other frames through
             await self.push_frame(frame, direction)
@@ -5,6 +5,7 @@
 #
 
 import re
+import sys
 import time
 from enum import Enum
 
@@ -42,6 +43,9 @@ class WakeCheckFilter(FrameProcessor):
             )
             self._wake_patterns.append(pattern)
 
+    def memory_usage(self) -> int:
+        return sum(sys.getsizeof(p.accumulator) for p in self._participant_states.values())
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
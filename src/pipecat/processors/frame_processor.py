@@ -6,8 +6,9 @@
 
 import asyncio
 import inspect
+from contextlib import contextmanager
 from enum import Enum
-from typing import Awaitable, Callable, Coroutine, Optional
+from typing import Awaitable, Callable, Coroutine, Iterator, List, Optional
 
 from loguru import logger
 
@@ -23,6 +24,9 @@ from pipecat.frames.frames import (
 )
 from pipecat.metrics.metrics import LLMTokenUsage, MetricsData
 from pipecat.processors.metrics.frame_processor_metrics import FrameProcessorMetrics
+from pipecat.tracing.span import Span, SpanContext
+from pipecat.tracing.tracer import Tracer
+from pipecat.utils import log
 from pipecat.utils.asyncio import TaskManager
 from pipecat.utils.utils import obj_count, obj_id
 
@@ -72,6 +76,15 @@ class FrameProcessor:
         self._metrics = metrics or FrameProcessorMetrics()
         self._metrics.set_processor_name(self.name)
 
+        # Tracing. The tracer is only available (from the StartFrame) if tracing
+        # has been enabled in the pipeline task. We keep the trace context of
+        # the last non-system frame received, which is used as the parent of
+        # the spans created by this processor, and the spans currently open.
+        self._tracer: Optional[Tracer] = None
+        self._trace_input_context: Optional[SpanContext] = None
+        self._trace_input_frame_id: Optional[int] = None
+        self._trace_spans: List[Span] = []
+
         # Processors have an input queue. The input queue will be processed
         # immediately (default) or it will block if `pause_processing_frames()`
         # is called. To resume processing frames we need to call
@@ -109,9 +122,36 @@ class FrameProcessor:
     def report_only_initial_ttfb(self):
         return self._report_only_initial_ttfb
 
+    @property
+    def tracing_enabled(self) -> bool:
+        return self._tracer is not None
+
     def can_generate_metrics(self) -> bool:
         return False
 
+    def memory_usage(self) -> int:
+        """Returns an estimate, in bytes, of the memory retained by this
+        processor (e.g. buffers, conversation history or sets of seen frame
+        ids). Processors that accumulate state during a session should override
+        this so memory can be attributed to them (see
+        `PipelineParams.enable_memory_usage_metrics`).
+
+        """
+        return 0
+
+    def queue_size(self) -> int:
+        """Returns the number of frames waiting in this processor's input and
+        push queues. A number that keeps growing means this processor (or the
+        next one) can't keep up with the frames it receives.
+
+        """
+        size = 0
+        if self.__input_frame_task:
+            size += self.__input_queue.qsize()
+        if self.__push_frame_task:
+            size += self.__push_queue.qsize()
+        return size
+
     def set_core_metrics_data(self, data: MetricsData):
         self._metrics.set_core_metrics_data(data)
 
@@ -135,6 +175,34 @@ class FrameProcessor:
             if frame:
                 await self.push_frame(frame)
 
+    async def start_rtf_metrics(self):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            await self._metrics.start_rtf_metrics()
+
+    def update_rtf_metrics(self, audio_duration: float):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            self._metrics.update_rtf_metrics(audio_duration)
+
+    async def stop_rtf_metrics(self, end_time: Optional[float] = None):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            frame = await self._metrics.stop_rtf_metrics(end_time)
+            if frame:
+                await self.push_frame(frame)
+
+    async def start_finalization_metrics(self):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            await self._metrics.start_finalization_metrics()
+
+    def reset_finalization_metrics(self):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            self._metrics.reset_finalization_metrics()
+
+    async def stop_finalization_metrics(self):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            frame = await self._metrics.stop_finalization_metrics()
+            if frame:
+                await self.push_frame(frame)
+
     async def start_llm_usage_metrics(self, tokens: LLMTokenUsage):
         if self.can_generate_metrics() and self.usage_metrics_enabled:
             frame = await self._metrics.start_llm_usage_metrics(tokens)
@@ -151,6 +219,58 @@ class FrameProcessor:
         await self.stop_ttfb_metrics()
         await self.stop_processing_metrics()
 
+    def start_span(
+        self, name: str, *, frame: Optional[Frame] = None, **attributes
+    ) -> Optional[Span]:
+        """Starts a tracing span if tracing is enabled, otherwise returns None.
+
+        The span parent is the trace context of the given frame, or the one of
+        the last (non-system) frame received by this processor, or the current
+        turn. Frames pushed while the span is open will nest under it.
+
+        """
+        if not self._tracer:
+            return None
+
+        if frame:
+            parent = frame.trace_context
+            links = [frame.id]
+        else:
+            parent = self._trace_input_context
+            links = [self._trace_input_frame_id] if self._trace_input_frame_id is not None else []
+
+        span = self._tracer.start_span(
+            name,
+            parent=parent or self._tracer.current_context(),
+            links=links,
+            attributes={"processor": self.name, **attributes},
+        )
+        self._trace_spans.append(span)
+        return span
+
+    def end_span(self, span: Optional[Span], *, error: Optional[str] = None, **attributes):
+        if not span or not self._tracer:
+            return
+        if span in self._trace_spans:
+            self._trace_spans.remove(span)
+        self._tracer.end_span(span, error=error, attributes=attributes)
+
+    @contextmanager
+    def trace_span(
+        self, name: str, *, frame: Optional[Frame] = None, **attributes
+    ) -> Iterator[Optional[Span]]:
+        """Context manager that wraps `start_span()` and `end_span()`. It does
+        nothing if tracing is disabled.
+
+        """
+        span = self.start_span(name, frame=frame, **attributes)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, error=repr(e))
+            raise
+        self.end_span(span)
+
     def create_task(self, coroutine: Coroutine) -> asyncio.Task:
         if not self._task_manager:
             raise Exception(f"{self} TaskManager is still not initialized.")
@@ -217,14 +337,18 @@ class FrameProcessor:
             await self.__input_queue.put((frame, direction, callback))
 
     async def pause_processing_frames(self):
-        logger.trace(f"{self}: pausing frame processing")
+        log.trace("{processor}: pausing frame processing", processor=self)
         self.__should_block_frames = True
 
     async def resume_processing_frames(self):
-        logger.trace(f"{self}: resuming frame processing")
+        log.trace("{processor}: resuming frame processing", processor=self)
         self.__input_event.set()
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
+        if self._tracer and frame.trace_context and not isinstance(frame, SystemFrame):
+            self._trace_input_context = frame.trace_context
+            self._trace_input_frame_id = frame.id
+
         if isinstance(frame, StartFrame):
             self._clock = frame.clock
             self._task_manager = frame.task_manager
@@ -233,6 +357,7 @@ class FrameProcessor:
             self._enable_usage_metrics = frame.enable_usage_metrics
             self._report_only_initial_ttfb = frame.report_only_initial_ttfb
             self._observer = frame.observer
+            self._tracer = frame.tracer
             await self.__start(frame)
         elif isinstance(frame, StartInterruptionFrame):
             await self._start_interruption()
@@ -249,6 +374,10 @@ class FrameProcessor:
         if not self._check_ready(frame):
             return
 
+        if self._tracer:
+            span_context = self._trace_spans[-1].context if self._trace_spans else None
+            self._tracer.on_push_frame(frame, span_context)
+
         if isinstance(frame, SystemFrame):
             await self.__internal_push_frame(frame, direction)
         else:
@@ -280,6 +409,10 @@ class FrameProcessor:
     #
 
     async def _start_interruption(self):
+        # Any span that is still open will not finish properly.
+        for span in list(self._trace_spans):
+            self.end_span(span, error="interrupted")
+
         try:
             # Cancel the push frame task. This will stop pushing frames downstream.
             await self.__cancel_push_task()
@@ -305,14 +438,23 @@ class FrameProcessor:
         try:
             timestamp = self._clock.get_time() if self._clock else 0
             if direction == FrameDirection.DOWNSTREAM and self._next:
-                logger.trace(f"Pushing {frame} from {self} to {self._next}")
+                if log.trace_enabled():
+                    log.trace(
+                        "Pushing {frame} from {src} to {dst}", frame=frame, src=self, dst=self._next
+                    )
                 if self._observer:
                     await self._observer.on_push_frame(
                         self, self._next, frame, direction, timestamp
                     )
                 await self._next.queue_frame(frame, direction)
             elif direction == FrameDirection.UPSTREAM and self._prev:
-                logger.trace(f"Pushing {frame} upstream from {self} to {self._prev}")
+                if log.trace_enabled():
+                    log.trace(
+                        "Pushing {frame} upstream from {src} to {dst}",
+                        frame=frame,
+                        src=self,
+                        dst=self._prev,
+                    )
                 if self._observer:
                     await self._observer.on_push_frame(
                         self, self._prev, frame, direction, timestamp
@@ -348,11 +490,11 @@ class FrameProcessor:
     async def __input_frame_task_handler(self):
         while True:
             if self.__should_block_frames:
-                logger.trace(f"{self}: frame processing paused")
+                log.trace("{processor}: frame processing paused", processor=self)
                 await self.__input_event.wait()
                 self.__input_event.clear()
                 self.__should_block_frames = False
-                logger.trace(f"{self}: frame processing resumed")
+                log.trace("{processor}: frame processing resumed", processor=self)
 
             (frame, direction, callback) = await self.__input_queue.get()
 
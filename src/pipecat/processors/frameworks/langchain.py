@@ -16,6 +16,7 @@ from pipecat.frames.frames import (
     TextFrame,
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.utils import log
 
 try:
     from langchain_core.messages import AIMessageChunk
@@ -41,7 +42,7 @@ class LangchainProcessor(FrameProcessor):
         if isinstance(frame, LLMMessagesFrame):
             # Messages are accumulated on the context as a list of messages.
             # The last one by the human is the one we want to send to the LLM.
-            logger.debug(f"Got transcription frame {frame}")
+            log.debug("Got transcription frame {frame}", frame=frame)
             text: str = frame.messages[-1]["content"]
 
             await self._ainvoke(text.strip())
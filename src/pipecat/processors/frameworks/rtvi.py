@@ -6,6 +6,7 @@
 
 import asyncio
 import base64
+import sys
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -63,6 +64,7 @@ from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.transports.base_input import BaseInputTransport
 from pipecat.transports.base_output import BaseOutputTransport
 from pipecat.transports.base_transport import BaseTransport
+from pipecat.utils.memory import deep_sizeof
 from pipecat.utils.string import match_endofsentence
 
 RTVI_PROTOCOL_VERSION = "0.3.0"
@@ -657,6 +659,9 @@ class RTVIObserver(BaseObserver):
         self._bot_transcription = ""
         self._frames_seen = set()
 
+    def memory_usage(self) -> int:
+        return deep_sizeof(self._frames_seen) + sys.getsizeof(self._bot_transcription)
+
     async def on_push_frame(
         self,
         src: FrameProcessor,
@@ -5,18 +5,25 @@
 #
 
 import time
-
-from loguru import logger
+from collections import deque
+from typing import Deque, Optional, Tuple
 
 from pipecat.frames.frames import MetricsFrame
 from pipecat.metrics.metrics import (
     LLMTokenUsage,
     LLMUsageMetricsData,
     MetricsData,
+    PlayoutMetricsData,
     ProcessingMetricsData,
+    RTFMetricsData,
+    STTFinalizationMetricsData,
     TTFBMetricsData,
     TTSUsageMetricsData,
 )
+from pipecat.utils import log
+
+# Number of utterances used to compute the sliding window real-time factor.
+RTF_WINDOW_SIZE = 10
 
 
 class FrameProcessorMetrics:
@@ -24,6 +31,10 @@ class FrameProcessorMetrics:
         self._start_ttfb_time = 0
         self._start_processing_time = 0
         self._should_report_ttfb = True
+        self._start_rtf_time = 0
+        self._rtf_audio_duration = 0.0
+        self._rtf_window: Deque[Tuple[float, float]] = deque(maxlen=RTF_WINDOW_SIZE)
+        self._start_finalization_time = 0
 
     def _processor_name(self):
         return self._core_metrics_data.processor
@@ -47,7 +58,7 @@ class FrameProcessorMetrics:
             return None
 
         value = time.time() - self._start_ttfb_time
-        logger.debug(f"{self._processor_name()} TTFB: {value}")
+        log.debug("{processor} TTFB: {value}", processor=self._processor_name(), value=value)
         ttfb = TTFBMetricsData(
             processor=self._processor_name(), value=value, model=self._model_name()
         )
@@ -62,16 +73,105 @@ class FrameProcessorMetrics:
             return None
 
         value = time.time() - self._start_processing_time
-        logger.debug(f"{self._processor_name()} processing time: {value}")
+        log.debug(
+            "{processor} processing time: {value}", processor=self._processor_name(), value=value
+        )
         processing = ProcessingMetricsData(
             processor=self._processor_name(), value=value, model=self._model_name()
         )
         self._start_processing_time = 0
         return MetricsFrame(data=[processing])
 
+    async def start_rtf_metrics(self):
+        self._start_rtf_time = time.time()
+        self._rtf_audio_duration = 0.0
+
+    def update_rtf_metrics(self, audio_duration: float):
+        if self._start_rtf_time > 0:
+            self._rtf_audio_duration += audio_duration
+
+    async def stop_rtf_metrics(self, end_time: Optional[float] = None):
+        if self._start_rtf_time == 0:
+            return None
+
+        wall_time = (end_time or time.time()) - self._start_rtf_time
+        audio_duration = self._rtf_audio_duration
+        self._start_rtf_time = 0
+        self._rtf_audio_duration = 0.0
+        if audio_duration <= 0:
+            return None
+
+        self._rtf_window.append((wall_time, audio_duration))
+        value = wall_time / audio_duration
+        window_value = sum(w for w, _ in self._rtf_window) / sum(a for _, a in self._rtf_window)
+        log.debug(
+            "{processor} RTF: {value} (window: {window_value})",
+            processor=self._processor_name(),
+            value=value,
+            window_value=window_value,
+        )
+        rtf = RTFMetricsData(
+            processor=self._processor_name(),
+            model=self._model_name(),
+            value=value,
+            window_value=window_value,
+            audio_duration=audio_duration,
+        )
+        return MetricsFrame(data=[rtf])
+
+    async def start_finalization_metrics(self):
+        self._start_finalization_time = time.time()
+
+    def reset_finalization_metrics(self):
+        self._start_finalization_time = 0
+
+    async def stop_finalization_metrics(self):
+        if self._start_finalization_time == 0:
+            return None
+
+        value = time.time() - self._start_finalization_time
+        log.debug(
+            "{processor} STT finalization: {value}", processor=self._processor_name(), value=value
+        )
+        finalization = STTFinalizationMetricsData(
+            processor=self._processor_name(), value=value, model=self._model_name()
+        )
+        self._start_finalization_time = 0
+        return MetricsFrame(data=[finalization])
+
+    async def playout_metrics(
+        self,
+        *,
+        jitter: float,
+        max_jitter: float,
+        underruns: int,
+        overruns: int,
+        audio_duration: float,
+    ):
+        log.debug(
+            "{processor} playout jitter: {jitter} (max: {max_jitter}), underruns: {underruns}, overruns: {overruns}",
+            processor=self._processor_name(),
+            jitter=jitter,
+            max_jitter=max_jitter,
+            underruns=underruns,
+            overruns=overruns,
+        )
+        playout = PlayoutMetricsData(
+            processor=self._processor_name(),
+            value=jitter,
+            max_jitter=max_jitter,
+            underruns=underruns,
+            overruns=overruns,
+            audio_duration=audio_duration,
+        )
+        return MetricsFrame(data=[playout])
+
     async def start_llm_usage_metrics(self, tokens: LLMTokenUsage):
-        logger.debug(
-            f"{self._processor_name()} prompt tokens: {tokens.prompt_tokens}, completion tokens: {tokens.completion_tokens}"
+        log.debug(
+            "{processor} prompt tokens: {prompt_tokens}, completion tokens: {completion_tokens}",
+            processor=self._processor_name(),
+            prompt_tokens=tokens.prompt_tokens,
+            completion_tokens=tokens.completion_tokens,
         )
         value = LLMUsageMetricsData(
             processor=self._processor_name(), model=self._model_name(), value=tokens
@@ -82,5 +182,9 @@ class FrameProcessorMetrics:
         characters = TTSUsageMetricsData(
             processor=self._processor_name(), model=self._model_name(), value=len(text)
         )
-        logger.debug(f"{self._processor_name()} usage characters: {characters.value}")
+        log.debug(
+            "{processor} usage characters: {characters}",
+            processor=self._processor_name(),
+            characters=characters.value,
+        )
         return MetricsFrame(data=[characters])
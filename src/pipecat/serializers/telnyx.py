@@ -10,13 +10,7 @@ from typing import Optional
 
 from pydantic import BaseModel
 
-from pipecat.audio.utils import (
-    alaw_to_pcm,
-    create_default_resampler,
-    pcm_to_alaw,
-    pcm_to_ulaw,
-    ulaw_to_pcm,
-)
+from pipecat.audio.codecs.g711 import G711Decoder, G711Encoder, G711Law
 from pipecat.frames.frames import (
     AudioRawFrame,
     Frame,
@@ -51,7 +45,22 @@ class TelnyxFrameSerializer(FrameSerializer):
         self._telnyx_sample_rate = self._params.telnyx_sample_rate
         self._sample_rate = 0  # Pipeline input rate
 
-        self._resampler = create_default_resampler()
+        # Audio is encoded/decoded and resampled in one pass. They keep the
+        # resampling filter state between packets.
+        self._encoder = G711Encoder(
+            self._g711_law(self._params.inbound_encoding), sample_rate=self._telnyx_sample_rate
+        )
+        self._decoder = G711Decoder(
+            self._g711_law(self._params.outbound_encoding), sample_rate=self._telnyx_sample_rate
+        )
+
+    @staticmethod
+    def _g711_law(encoding: str) -> G711Law:
+        if encoding == "PCMU":
+            return "ulaw"
+        elif encoding == "PCMA":
+            return "alaw"
+        raise ValueError(f"Unsupported encoding: {encoding}")
 
     @property
     def type(self) -> FrameSerializerType:
@@ -65,16 +74,7 @@ class TelnyxFrameSerializer(FrameSerializer):
             data = frame.audio
 
             # Output: Convert PCM at frame's rate to 8kHz encoded for Telnyx
-            if self._params.inbound_encoding == "PCMU":
-                serialized_data = await pcm_to_ulaw(
-                    data, frame.sample_rate, self._telnyx_sample_rate, self._resampler
-                )
-            elif self._params.inbound_encoding == "PCMA":
-                serialized_data = await pcm_to_alaw(
-                    data, frame.sample_rate, self._telnyx_sample_rate, self._resampler
-                )
-            else:
-                raise ValueError(f"Unsupported encoding: {self._params.inbound_encoding}")
+            serialized_data = self._encoder.encode(data, frame.sample_rate)
 
             payload = base64.b64encode(serialized_data).decode("utf-8")
             answer = {
@@ -85,6 +85,7 @@ class TelnyxFrameSerializer(FrameSerializer):
             return json.dumps(answer)
 
         if isinstance(frame, StartInterruptionFrame):
+            self._encoder.reset()
             answer = {"event": "clear"}
             return json.dumps(answer)
 
@@ -96,22 +97,7 @@ class TelnyxFrameSerializer(FrameSerializer):
             payload = base64.b64decode(payload_base64)
 
             # Input: Convert Telnyx's 8kHz encoded audio to PCM at pipeline input rate
-            if self._params.outbound_encoding == "PCMU":
-                deserialized_data = await ulaw_to_pcm(
-                    payload,
-                    self._telnyx_sample_rate,
-                    self._sample_rate,
-                    self._resampler,
-                )
-            elif self._params.outbound_encoding == "PCMA":
-                deserialized_data = await alaw_to_pcm(
-                    payload,
-                    self._telnyx_sample_rate,
-                    self._sample_rate,
-                    self._resampler,
-                )
-            else:
-                raise ValueError(f"Unsupported encoding: {self._params.outbound_encoding}")
+            deserialized_data = self._decoder.decode(payload, self._sample_rate)
 
             audio_frame = InputAudioRawFrame(
                 audio=deserialized_data, num_channels=1, sample_rate=self._sample_rate
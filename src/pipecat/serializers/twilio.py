@@ -10,7 +10,7 @@ from typing import Optional
 
 from pydantic import BaseModel
 
-from pipecat.audio.utils import create_default_resampler, pcm_to_ulaw, ulaw_to_pcm
+from pipecat.audio.codecs.g711 import G711Decoder, G711Encoder
 from pipecat.frames.frames import (
     AudioRawFrame,
     Frame,
@@ -37,7 +37,10 @@ class TwilioFrameSerializer(FrameSerializer):
         self._twilio_sample_rate = self._params.twilio_sample_rate
         self._sample_rate = 0  # Pipeline input rate
 
-        self._resampler = create_default_resampler()
+        # Audio is encoded/decoded and resampled in one pass. They keep the
+        # resampling filter state between packets.
+        self._encoder = G711Encoder("ulaw", sample_rate=self._twilio_sample_rate)
+        self._decoder = G711Decoder("ulaw", sample_rate=self._twilio_sample_rate)
 
     @property
     def type(self) -> FrameSerializerType:
@@ -48,15 +51,14 @@ class TwilioFrameSerializer(FrameSerializer):
 
     async def serialize(self, frame: Frame) -> str | bytes | None:
         if isinstance(frame, StartInterruptionFrame):
+            self._encoder.reset()
             answer = {"event": "clear", "streamSid": self._stream_sid}
             return json.dumps(answer)
         elif isinstance(frame, AudioRawFrame):
             data = frame.audio
 
             # Output: Convert PCM at frame's rate to 8kHz μ-law for Twilio
-            serialized_data = await pcm_to_ulaw(
-                data, frame.sample_rate, self._twilio_sample_rate, self._resampler
-            )
+            serialized_data = self._encoder.encode(data, frame.sample_rate)
             payload = base64.b64encode(serialized_data).decode("utf-8")
             answer = {
                 "event": "media",
@@ -76,9 +78,7 @@ class TwilioFrameSerializer(FrameSerializer):
             payload = base64.b64decode(payload_base64)
 
             # Input: Convert Twilio's 8kHz μ-law to PCM at pipeline input rate
-            deserialized_data = await ulaw_to_pcm(
-                payload, self._twilio_sample_rate, self._sample_rate, self._resampler
-            )
+            deserialized_data = self._decoder.decode(payload, self._sample_rate)
             audio_frame = InputAudioRawFrame(
                 audio=deserialized_data, num_channels=1, sample_rate=self._sample_rate
             )
@@ -6,13 +6,15 @@
 
 import asyncio
 import io
+import time
 import wave
 from abc import abstractmethod
 from typing import Any, AsyncGenerator, Dict, List, Mapping, Optional, Tuple
 
 from loguru import logger
 
-from pipecat.audio.utils import calculate_audio_volume, exp_smoothing
+from pipecat.audio.loudness import LoudnessMeter
+from pipecat.audio.utils import exp_smoothing
 from pipecat.frames.frames import (
     AudioRawFrame,
     BotStoppedSpeakingFrame,
@@ -22,6 +24,7 @@ from pipecat.frames.frames import (
     Frame,
     InterimTranscriptionFrame,
     LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
     StartFrame,
     StartInterruptionFrame,
     STTMuteFrame,
@@ -35,12 +38,16 @@ from pipecat.frames.frames import (
     TTSTextFrame,
     TTSUpdateSettingsFrame,
     UserImageRequestFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
     VisionImageRawFrame,
 )
 from pipecat.metrics.metrics import MetricsData
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.tracing.span import Span
 from pipecat.transcriptions.language import Language
+from pipecat.utils import log
 from pipecat.utils.string import match_endofsentence
 from pipecat.utils.text.base_text_filter import BaseTextFilter
 from pipecat.utils.time import seconds_to_nanoseconds
@@ -139,6 +146,7 @@ class LLMService(AIService):
         super().__init__(**kwargs)
         self._callbacks = {}
         self._start_callbacks = {}
+        self._llm_span: Optional[Span] = None
 
     # TODO-CB: callback function type
     def register_function(self, function_name: Optional[str], callback, start_callback=None):
@@ -175,14 +183,17 @@ class LLMService(AIService):
             f = self._callbacks[None]
         else:
             return None
-        await context.call_function(
-            f,
-            function_name=function_name,
-            tool_call_id=tool_call_id,
-            arguments=arguments,
-            llm=self,
-            run_llm=run_llm,
-        )
+        with self.trace_span(
+            "function_call", function_name=function_name, tool_call_id=tool_call_id
+        ):
+            await context.call_function(
+                f,
+                function_name=function_name,
+                tool_call_id=tool_call_id,
+                arguments=arguments,
+                llm=self,
+                run_llm=run_llm,
+            )
 
     # QUESTION FOR CB: maybe this isn't needed anymore?
     async def call_start_function(self, context: OpenAILLMContext, function_name: str):
@@ -196,6 +207,19 @@ class LLMService(AIService):
             UserImageRequestFrame(user_id=user_id, context=text_content), FrameDirection.UPSTREAM
         )
 
+    async def push_frame(self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM):
+        # All LLM services wrap their responses with LLMFullResponseStartFrame
+        # and LLMFullResponseEndFrame, so that's what we trace as a request.
+        if self.tracing_enabled and isinstance(frame, LLMFullResponseStartFrame):
+            self.end_span(self._llm_span)
+            self._llm_span = self.start_span("llm", model=self.model_name)
+
+        await super().push_frame(frame, direction)
+
+        if self._llm_span and isinstance(frame, LLMFullResponseEndFrame):
+            self.end_span(self._llm_span)
+            self._llm_span = None
+
 
 class TTSService(AIService):
     def __init__(
@@ -240,6 +264,10 @@ class TTSService(AIService):
         self._current_sentence: str = ""
         self._processing_text: bool = False
 
+        # Time of the last audio frame of the current utterance, used to
+        # compute the real-time factor.
+        self._rtf_last_audio_time = 0.0
+
     @property
     def sample_rate(self) -> int:
         return self._sample_rate
@@ -345,6 +373,18 @@ class TTSService(AIService):
             await self.push_frame(frame, direction)
 
     async def push_frame(self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM):
+        # Real-time factor of an utterance: from the moment we start the TTS
+        # request until we get the last audio frame. TTSStoppedFrame might be
+        # pushed a while after the last audio frame (see `push_stop_frames`).
+        if isinstance(frame, TTSStartedFrame):
+            await self.start_rtf_metrics()
+            self._rtf_last_audio_time = 0.0
+        elif isinstance(frame, TTSAudioRawFrame):
+            self.update_rtf_metrics(frame.num_frames / frame.sample_rate)
+            self._rtf_last_audio_time = time.time()
+        elif isinstance(frame, TTSStoppedFrame):
+            await self.stop_rtf_metrics(self._rtf_last_audio_time or None)
+
         if self._push_silence_after_stop and isinstance(frame, TTSStoppedFrame):
             silence_num_bytes = int(self._silence_time_s * self.sample_rate * 2)  # 16-bit
             await self.push_frame(
@@ -408,7 +448,8 @@ class TTSService(AIService):
         if self._text_filter:
             self._text_filter.reset_interruption()
             text = self._text_filter.filter(text)
-        await self.process_generator(self.run_tts(text))
+        with self.trace_span("tts", model=self.model_name, voice=self._voice_id, text=text):
+            await self.process_generator(self.run_tts(text))
         await self.stop_processing_metrics()
         if self._push_text_frames:
             # We send the original text after the audio. This way, if we are
@@ -524,12 +565,19 @@ class AudioContextWordTTSService(WordTTSService):
         """Create a new audio context."""
         await self._contexts_queue.put(context_id)
         self._contexts[context_id] = asyncio.Queue()
-        logger.trace(f"{self} created audio context {context_id}")
+        log.trace(
+            "{processor} created audio context {context_id}", processor=self, context_id=context_id
+        )
 
     async def append_to_audio_context(self, context_id: str, frame: TTSAudioRawFrame):
         """Append audio to an existing context."""
         if self.audio_context_available(context_id):
-            logger.trace(f"{self} appending audio {frame} to audio context {context_id}")
+            log.trace(
+                "{processor} appending audio {frame} to audio context {context_id}",
+                processor=self,
+                frame=frame,
+                context_id=context_id,
+            )
             await self._contexts[context_id].put(frame)
         else:
             logger.warning(f"{self} unable to append audio to context {context_id}")
@@ -540,7 +588,11 @@ class AudioContextWordTTSService(WordTTSService):
             # We just mark the audio context for deletion by appending
             # None. Once we reach None while handling audio we know we can
             # safely remove the context.
-            logger.trace(f"{self} marking audio context {context_id} for deletion")
+            log.trace(
+                "{processor} marking audio context {context_id} for deletion",
+                processor=self,
+                context_id=context_id,
+            )
             await self._contexts[context_id].put(None)
         else:
             logger.warning(f"{self} unable to remove context {context_id}")
@@ -607,7 +659,11 @@ class AudioContextWordTTSService(WordTTSService):
                 running = frame is not None
             except asyncio.TimeoutError:
                 # We didn't get audio, so let's consider this context finished.
-                logger.trace(f"{self} time out on audio context {context_id}")
+                log.trace(
+                    "{processor} time out on audio context {context_id}",
+                    processor=self,
+                    context_id=context_id,
+                )
                 break
 
 
@@ -627,6 +683,12 @@ class STTService(AIService):
         self._sample_rate = 0
         self._settings: Dict[str, Any] = {}
         self._muted: bool = False
+        # Streaming STT services receive audio continuously, so we trace a
+        # request from the moment the user starts speaking until we get the
+        # final transcription, and measure the time from the moment the user
+        # stops speaking until then.
+        self._track_utterances = True
+        self._stt_span: Optional[Span] = None
 
     @property
     def is_muted(self) -> bool:
@@ -690,8 +752,26 @@ class STTService(AIService):
             self._muted = frame.mute
             logger.debug(f"STT service {'muted' if frame.mute else 'unmuted'}")
         else:
+            if self._track_utterances and isinstance(frame, UserStartedSpeakingFrame):
+                self.reset_finalization_metrics()
+                if self.tracing_enabled:
+                    self.end_span(self._stt_span)
+                    self._stt_span = self.start_span("stt", frame=frame, model=self.model_name)
+            elif self._track_utterances and isinstance(frame, UserStoppedSpeakingFrame):
+                # Audio is streamed in real time, so what matters is how long
+                # it takes to get the final transcription once the user stops.
+                await self.start_finalization_metrics()
             await self.push_frame(frame, direction)
 
+    async def push_frame(self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM):
+        await super().push_frame(frame, direction)
+
+        if self._track_utterances and isinstance(frame, TranscriptionFrame):
+            await self.stop_finalization_metrics()
+            if self._stt_span:
+                self.end_span(self._stt_span, transcript=frame.text)
+                self._stt_span = None
+
 
 class SegmentedSTTService(STTService):
     """SegmentedSTTService is an STTService that will detect speech and will run
@@ -716,8 +796,12 @@ class SegmentedSTTService(STTService):
         self._wave = None
         self._silence_num_frames = 0
         # Volume exponential smoothing
+        self._loudness_meter = LoudnessMeter()
         self._smoothing_factor = 0.2
         self._prev_volume = 0
+        # We trace (and compute the real-time factor of) each segment we
+        # transcribe instead.
+        self._track_utterances = False
 
     async def process_audio_frame(self, frame: AudioRawFrame, direction: FrameDirection):
         # Try to filter out empty background noise
@@ -740,7 +824,11 @@ class SegmentedSTTService(STTService):
             self._silence_num_frames = 0
             self._wave.close()
             self._content.seek(0)
-            await self.process_generator(self.run_stt(self._content.read()))
+            await self.start_rtf_metrics()
+            self.update_rtf_metrics(buffer_secs)
+            with self.trace_span("stt", model=self.model_name, audio_secs=buffer_secs):
+                await self.process_generator(self.run_stt(self._content.read()))
+            await self.stop_rtf_metrics()
             (self._content, self._wave) = self._new_wave()
 
     async def start(self, frame: StartFrame):
@@ -764,7 +852,8 @@ class SegmentedSTTService(STTService):
         return (content, ww)
 
     def _get_smoothed_volume(self, frame: AudioRawFrame) -> float:
-        volume = calculate_audio_volume(frame.audio, frame.sample_rate)
+        self._loudness_meter.set_sample_rate(frame.sample_rate)
+        volume = self._loudness_meter.volume(frame.audio)
         return exp_smoothing(volume, self._prev_volume, self._smoothing_factor)
 
 
@@ -30,6 +30,7 @@ from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_services import AudioContextWordTTSService, TTSService
 from pipecat.services.websocket_service import WebsocketService
 from pipecat.transcriptions.language import Language
+from pipecat.utils import log
 
 # See .env.example for Cartesia configuration needed
 try:
@@ -237,7 +238,7 @@ class CartesiaTTSService(AudioContextWordTTSService, WebsocketService):
     async def flush_audio(self):
         if not self._context_id or not self._websocket:
             return
-        logger.trace(f"{self}: flushing audio")
+        log.trace("{processor}: flushing audio", processor=self)
         msg = self._build_msg(text="", continue_transcript=False)
         await self._websocket.send(msg)
         self._context_id = None
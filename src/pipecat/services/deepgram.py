@@ -26,6 +26,7 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_services import STTService, TTSService
 from pipecat.transcriptions.language import Language
+from pipecat.utils import log
 from pipecat.utils.time import time_now_iso8601
 
 # See .env.example for Deepgram configuration needed
@@ -252,4 +253,8 @@ class DeepgramSTTService(STTService):
         elif isinstance(frame, UserStoppedSpeakingFrame):
             # https://developers.deepgram.com/docs/finalize
             await self._connection.finalize()
-            logger.trace(f"Triggered finalize event on: {frame.name=}, {direction=}")
+            log.trace(
+                "Triggered finalize event on: {frame}, {direction}",
+                frame=frame.name,
+                direction=direction,
+            )
@@ -56,6 +56,7 @@ from pipecat.services.openai import (
     OpenAIUserContextAggregator,
 )
 from pipecat.transcriptions.language import Language
+from pipecat.utils import log
 from pipecat.utils.time import time_now_iso8601
 
 try:
@@ -1742,7 +1743,7 @@ class GoogleSTTService(STTService):
     async def _request_generator(self):
         """Generates requests for the streaming recognize method."""
         recognizer_path = f"projects/{self._project_id}/locations/{self._location}/recognizers/_"
-        logger.trace(f"Using recognizer path: {recognizer_path}")
+        log.trace("Using recognizer path: {path}", path=recognizer_path)
 
         try:
             # Send initial config
@@ -0,0 +1,572 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Mock AI services that don't call any external API. They emulate the
+latency of real services (see `MockLatency`), can inject failures and are
+useful for tests, benchmarks and load testing.
+
+"""
+
+import asyncio
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, Literal, Optional, Sequence, Union
+
+import numpy as np
+from loguru import logger
+
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    ErrorFrame,
+    Frame,
+    InputAudioRawFrame,
+    InterimTranscriptionFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMMessagesFrame,
+    LLMTextFrame,
+    StartFrame,
+    StartInterruptionFrame,
+    StopInterruptionFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.metrics.metrics import LLMTokenUsage
+from pipecat.processors.aggregators.openai_llm_context import (
+    OpenAILLMContext,
+    OpenAILLMContextFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.services.ai_services import LLMService, STTService, TTSService
+from pipecat.transcriptions.language import Language
+from pipecat.utils.time import time_now_iso8601
+
+DEFAULT_RESPONSE = "Hello! This is a mock response. How can I help you today?"
+
+
+@dataclass
+class MockLatency:
+    """A latency distribution, in seconds.
+
+    Attributes:
+        mean: Mean latency.
+        jitter: Spread of the latency. It's the standard deviation for the
+            `normal` and `lognormal` distributions and the maximum deviation
+            from the mean for `uniform`.
+        distribution: `fixed` (always `mean`), `uniform`, `normal` or
+            `lognormal` (long tail, like most network services).
+        min: Minimum latency.
+        max: Maximum latency, if any.
+    """
+
+    mean: float = 0.0
+    jitter: float = 0.0
+    distribution: Literal["fixed", "uniform", "normal", "lognormal"] = "normal"
+    min: float = 0.0
+    max: Optional[float] = None
+
+    def sample(self, rng: random.Random) -> float:
+        if self.jitter <= 0 or self.distribution == "fixed":
+            value = self.mean
+        elif self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.jitter, self.mean + self.jitter)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.jitter)
+        elif self.distribution == "lognormal" and self.mean > 0:
+            sigma2 = math.log(1 + (self.jitter / self.mean) ** 2)
+            value = rng.lognormvariate(math.log(self.mean) - sigma2 / 2, math.sqrt(sigma2))
+        else:
+            value = self.mean
+        value = max(self.min, value)
+        return min(self.max, value) if self.max is not None else value
+
+
+LatencyType = Union[float, MockLatency]
+
+
+def _latency(value: LatencyType) -> MockLatency:
+    return value if isinstance(value, MockLatency) else MockLatency(mean=value)
+
+
+class MockBehavior:
+    """Randomness shared by the mock services: latencies and injected failures.
+    A `seed` makes them reproducible.
+
+    """
+
+    def __init__(self, *, failure_rate: float = 0.0, seed: Optional[int] = None):
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError("failure_rate needs to be between 0 and 1")
+        self._failure_rate = failure_rate
+        self._rng = random.Random(seed)
+
+    def latency(self, latency: MockLatency) -> float:
+        return latency.sample(self._rng)
+
+    async def sleep(self, latency: MockLatency):
+        secs = self.latency(latency)
+        if secs > 0:
+            await asyncio.sleep(secs)
+
+    def should_fail(self) -> bool:
+        return self._failure_rate > 0 and self._rng.random() < self._failure_rate
+
+
+@dataclass
+class MockFunctionCall:
+    """A function call requested by `MockLLMService`."""
+
+    function_name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+
+
+def generate_tone(
+    duration: float, sample_rate: int, *, frequency: float = 440.0, amplitude: float = 0.5
+) -> bytes:
+    """Returns `duration` seconds of 16-bit mono sine tone."""
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    tone = amplitude * np.sin(2 * np.pi * frequency * t)
+    return (tone * 32767).astype(np.int16).tobytes()
+
+
+def audio_rms(audio: bytes) -> float:
+    """Returns the RMS (between 0 and 1) of 16-bit audio."""
+    samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+    return float(np.sqrt(np.mean(samples**2))) if len(samples) > 0 else 0.0
+
+
+class MockLLMService(LLMService):
+    """Responds to every context with the same text. The first token is pushed
+    after `latency` seconds and the following ones (words) every
+    `token_interval` seconds. Both can be a `MockLatency` distribution.
+
+    If `function_calls` are given, they are called (they need to be registered
+    with `register_function()`) instead of responding with text, unless the
+    last message in the context is a function call result.
+
+    A fraction (`failure_rate`) of the requests fail with a non-fatal
+    `ErrorFrame` after the first token latency.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        response: str = DEFAULT_RESPONSE,
+        latency: LatencyType = 0.5,
+        token_interval: LatencyType = 0.02,
+        function_calls: Sequence[MockFunctionCall] = (),
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._response = response
+        self._latency = _latency(latency)
+        self._token_interval = _latency(token_interval)
+        self._function_calls = list(function_calls)
+        self._behavior = MockBehavior(failure_rate=failure_rate, seed=seed)
+        self._function_call_count = 0
+        self.set_model_name("mock-llm")
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def _process_context(self, context: OpenAILLMContext):
+        await self.start_ttfb_metrics()
+        await self._behavior.sleep(self._latency)
+        await self.stop_ttfb_metrics()
+
+        if self._behavior.should_fail():
+            await self.push_error(ErrorFrame(f"{self} injected failure"))
+            return
+
+        messages = context.get_messages()
+        if self._function_calls and not (messages and messages[-1].get("role") == "tool"):
+            await self._call_functions(context)
+            return
+
+        words = self._response.split(" ")
+        for i, word in enumerate(words):
+            if i > 0:
+                await self._behavior.sleep(self._token_interval)
+            await self.push_frame(LLMTextFrame(word if i == 0 else f" {word}"))
+
+        # Words are good enough as tokens.
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in messages)
+        await self.start_llm_usage_metrics(
+            LLMTokenUsage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=len(words),
+                total_tokens=prompt_tokens + len(words),
+            )
+        )
+
+    async def _call_functions(self, context: OpenAILLMContext):
+        for function_call in self._function_calls:
+            name = function_call.function_name
+            if not self.has_function(name):
+                logger.warning(f"{self}: function '{name}' is not registered, ignoring call")
+                continue
+            self._function_call_count += 1
+            await self.call_start_function(context, name)
+            await self.call_function(
+                context=context,
+                tool_call_id=f"mock_call_{self._function_call_count}",
+                function_name=name,
+                arguments=dict(function_call.arguments),
+                run_llm=False,
+            )
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        context = None
+        if isinstance(frame, OpenAILLMContextFrame):
+            context = frame.context
+        elif isinstance(frame, LLMMessagesFrame):
+            context = OpenAILLMContext.from_messages(frame.messages)
+        else:
+            await self.push_frame(frame, direction)
+
+        if context:
+            await self.push_frame(LLMFullResponseStartFrame())
+            await self.start_processing_metrics()
+            await self._process_context(context)
+            await self.stop_processing_metrics()
+            await self.push_frame(LLMFullResponseEndFrame())
+
+
+class MockTTSService(TTSService):
+    """Generates a sine tone for every text. The audio duration depends on the
+    text length (`secs_per_char`). The first audio chunk is generated after
+    `latency` seconds (or a `MockLatency` distribution) and audio is generated
+    `speed` times faster than real time (0 means as fast as possible).
+
+    A fraction (`failure_rate`) of the requests fail with a non-fatal
+    `ErrorFrame` after the first chunk latency.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: LatencyType = 0.2,
+        secs_per_char: float = 0.06,
+        speed: float = 0.0,
+        frequency: float = 440.0,
+        chunk_secs: float = 0.1,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        sample_rate: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(sample_rate=sample_rate, **kwargs)
+        self._latency = _latency(latency)
+        self._secs_per_char = secs_per_char
+        self._speed = speed
+        self._frequency = frequency
+        self._chunk_secs = chunk_secs
+        self._behavior = MockBehavior(failure_rate=failure_rate, seed=seed)
+        self.set_model_name("mock-tts")
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        logger.debug(f"Generating TTS: [{text}]")
+
+        await self.start_ttfb_metrics()
+        await self.start_tts_usage_metrics(text)
+        yield TTSStartedFrame()
+
+        await self._behavior.sleep(self._latency)
+
+        if self._behavior.should_fail():
+            await self.stop_ttfb_metrics()
+            yield ErrorFrame(f"{self} injected failure")
+            yield TTSStoppedFrame()
+            return
+
+        audio = generate_tone(
+            len(text) * self._secs_per_char, self.sample_rate, frequency=self._frequency
+        )
+        chunk_size = int(self.sample_rate * self._chunk_secs) * 2
+        for i in range(0, len(audio), chunk_size):
+            await self.stop_ttfb_metrics()
+            chunk = audio[i : i + chunk_size]
+            yield TTSAudioRawFrame(audio=chunk, sample_rate=self.sample_rate, num_channels=1)
+            if self._speed > 0:
+                await asyncio.sleep(len(chunk) / 2 / self.sample_rate / self._speed)
+
+        yield TTSStoppedFrame()
+
+
+class MockSTTService(STTService):
+    """Streaming speech-to-text service that outputs the same transcription
+    for every utterance. An utterance is voiced audio (with an RMS above
+    `min_rms`) followed by `endpointing_secs` of silence, and the
+    transcription is pushed `latency` seconds (or a `MockLatency`
+    distribution) after the utterance ends. If `interim_interval` is given, an
+    interim transcription is pushed every that many seconds of voiced audio.
+
+    A fraction (`failure_rate`) of the utterances fail with a non-fatal
+    `ErrorFrame` instead of a transcription.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        transcript: str = "Hello, this is a mock transcription.",
+        latency: LatencyType = 0.2,
+        endpointing_secs: float = 0.3,
+        min_rms: float = 0.01,
+        interim_interval: Optional[float] = None,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        sample_rate: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(sample_rate=sample_rate, **kwargs)
+        self._transcript = transcript
+        self._latency = _latency(latency)
+        self._endpointing_secs = endpointing_secs
+        self._min_rms = min_rms
+        self._interim_interval = interim_interval
+        self._behavior = MockBehavior(failure_rate=failure_rate, seed=seed)
+        self._voiced = False
+        self._voiced_secs = 0.0
+        self._silence_secs = 0.0
+        self._utterance_queue = asyncio.Queue()
+        self._transcription_task = None
+        self.set_model_name("mock-stt")
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def set_model(self, model: str):
+        self.set_model_name(model)
+
+    async def set_language(self, language: Language):
+        pass
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        self._transcription_task = self.create_task(self._transcription_task_handler())
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        await self._cancel_transcription_task()
+
+    async def cancel(self, frame: CancelFrame):
+        await super().cancel(frame)
+        await self._cancel_transcription_task()
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        secs = len(audio) / 2 / self.sample_rate
+        if audio_rms(audio) >= self._min_rms:
+            self._voiced = True
+            self._silence_secs = 0.0
+            self._voiced_secs += secs
+            if self._interim_interval and self._voiced_secs >= self._interim_interval:
+                self._voiced_secs = 0.0
+                yield InterimTranscriptionFrame(
+                    text=self._transcript, user_id="", timestamp=time_now_iso8601()
+                )
+        elif self._voiced:
+            self._silence_secs += secs
+            if self._silence_secs >= self._endpointing_secs:
+                self._voiced = False
+                self._voiced_secs = 0.0
+                self._silence_secs = 0.0
+                await self._utterance_queue.put(self._transcript)
+        yield None
+
+    async def _cancel_transcription_task(self):
+        if self._transcription_task:
+            await self.cancel_task(self._transcription_task)
+            self._transcription_task = None
+
+    async def _transcription_task_handler(self):
+        while True:
+            text = await self._utterance_queue.get()
+            await self.start_ttfb_metrics()
+            await self._behavior.sleep(self._latency)
+            await self.stop_ttfb_metrics()
+            if self._behavior.should_fail():
+                await self.push_error(ErrorFrame(f"{self} injected failure"))
+                continue
+            await self.push_frame(
+                TranscriptionFrame(text=text, user_id="", timestamp=time_now_iso8601())
+            )
+
+
+class MockRealtimeLLMService(LLMService):
+    """Speech-to-speech service, like the realtime (multimodal live) LLM
+    services. It consumes the input audio and detects utterances the same way
+    `MockSTTService` does: it pushes `UserStartedSpeakingFrame` (interrupting
+    the current response if interruptions are allowed) when the user starts
+    speaking and `UserStoppedSpeakingFrame` after `endpointing_secs` of
+    silence. The response starts `latency` seconds after that: the user
+    transcription, the response text (one `LLMTextFrame` and `TTSTextFrame`
+    per word) and its audio (a sine tone of `secs_per_char` seconds per
+    character, generated `speed` times faster than real time).
+
+    Contexts (`OpenAILLMContextFrame` or `LLMMessagesFrame`) are responded to
+    the same way. A fraction (`failure_rate`) of the responses fail with a
+    non-fatal `ErrorFrame`.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        transcript: str = "Hello, this is a mock transcription.",
+        response: str = DEFAULT_RESPONSE,
+        latency: LatencyType = 0.5,
+        endpointing_secs: float = 0.5,
+        min_rms: float = 0.01,
+        secs_per_char: float = 0.06,
+        speed: float = 1.0,
+        frequency: float = 440.0,
+        chunk_secs: float = 0.1,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        sample_rate: int = 24000,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._transcript = transcript
+        self._response = response
+        self._latency = _latency(latency)
+        self._endpointing_secs = endpointing_secs
+        self._min_rms = min_rms
+        self._secs_per_char = secs_per_char
+        self._speed = speed
+        self._frequency = frequency
+        self._chunk_secs = chunk_secs
+        self._sample_rate = sample_rate
+        self._behavior = MockBehavior(failure_rate=failure_rate, seed=seed)
+        self._voiced = False
+        self._silence_secs = 0.0
+        self._response_task: Optional[asyncio.Task] = None
+        self.set_model_name("mock-realtime")
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        # Let the current response finish.
+        if self._response_task:
+            await self.wait_for_task(self._response_task)
+            self._response_task = None
+
+    async def cancel(self, frame: CancelFrame):
+        await super().cancel(frame)
+        await self._cancel_response_task()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, InputAudioRawFrame):
+            await self._handle_audio(frame)
+        elif isinstance(frame, (OpenAILLMContextFrame, LLMMessagesFrame)):
+            await self._start_response(None)
+        else:
+            await self.push_frame(frame, direction)
+
+    async def _handle_audio(self, frame: InputAudioRawFrame):
+        secs = frame.num_frames / frame.sample_rate
+        if audio_rms(frame.audio) >= self._min_rms:
+            self._silence_secs = 0.0
+            if not self._voiced:
+                self._voiced = True
+                await self._handle_user_started_speaking()
+        elif self._voiced:
+            self._silence_secs += secs
+            if self._silence_secs >= self._endpointing_secs:
+                self._voiced = False
+                self._silence_secs = 0.0
+                await self.push_frame(StopInterruptionFrame())
+                await self.push_frame(UserStoppedSpeakingFrame())
+                await self._start_response(self._transcript)
+
+    async def _handle_user_started_speaking(self):
+        if self.interruptions_allowed:
+            await self._cancel_response_task()
+            await self._start_interruption()
+            await self.push_frame(StartInterruptionFrame())
+        await self.push_frame(UserStartedSpeakingFrame())
+
+    async def _start_response(self, transcript: Optional[str]):
+        await self._cancel_response_task()
+        self._response_task = self.create_task(self._response_task_handler(transcript))
+
+    async def _cancel_response_task(self):
+        if self._response_task:
+            await self.cancel_task(self._response_task)
+            self._response_task = None
+
+    async def _response_task_handler(self, transcript: Optional[str]):
+        await self.start_ttfb_metrics()
+        await self.start_processing_metrics()
+        await self._behavior.sleep(self._latency)
+
+        if transcript:
+            await self.push_frame(
+                TranscriptionFrame(text=transcript, user_id="", timestamp=time_now_iso8601())
+            )
+
+        if self._behavior.should_fail():
+            await self.stop_all_metrics()
+            await self.push_error(ErrorFrame(f"{self} injected failure"))
+            return
+
+        await self.push_frame(LLMFullResponseStartFrame())
+        await self.push_frame(TTSStartedFrame())
+
+        words = self._response.split(" ")
+        chunk_size = int(self._sample_rate * self._chunk_secs) * 2
+        for i, word in enumerate(words):
+            text = word if i == 0 else f" {word}"
+            await self.push_frame(LLMTextFrame(text))
+            await self.push_frame(TTSTextFrame(text))
+            audio = generate_tone(
+                len(text) * self._secs_per_char, self._sample_rate, frequency=self._frequency
+            )
+            for j in range(0, len(audio), chunk_size):
+                await self.stop_ttfb_metrics()
+                chunk = audio[j : j + chunk_size]
+                await self.push_frame(
+                    TTSAudioRawFrame(audio=chunk, sample_rate=self._sample_rate, num_channels=1)
+                )
+                if self._speed > 0:
+                    await asyncio.sleep(len(chunk) / 2 / self._sample_rate / self._speed)
+
+        await self.push_frame(TTSStoppedFrame())
+        await self.push_frame(LLMFullResponseEndFrame())
+        await self.stop_processing_metrics()
+
+
+def mock_function_result(result: Any):
+    """Returns a function handler (for `LLMService.register_function()`) that
+    always returns `result`.
+
+    """
+
+    async def handler(function_name, tool_call_id, arguments, llm, context, result_callback):
+        await result_callback(result)
+
+    return handler
@@ -4,7 +4,6 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
-import asyncio
 import base64
 import json
 import time
@@ -44,6 +43,7 @@ from pipecat.processors.aggregators.openai_llm_context import (
 from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_services import LLMService
 from pipecat.services.openai import OpenAIContextAggregatorPair
+from pipecat.utils import log
 from pipecat.utils.time import time_now_iso8601
 
 from . import events
@@ -182,9 +182,11 @@ class OpenAIRealtimeBetaLLMService(LLMService):
             elapsed_ms = int(time.time() * 1000 - current.start_time_ms)
             truncate_ms = min(elapsed_ms, audio_duration_ms)
 
-            logger.trace(
-                f"Truncating audio: duration={audio_duration_ms}ms, "
-                f"elapsed={elapsed_ms}ms, truncate={truncate_ms}ms"
+            log.trace(
+                "Truncating audio: duration={duration}ms, elapsed={elapsed}ms, truncate={truncate}ms",
+                duration=audio_duration_ms,
+                elapsed=elapsed_ms,
+                truncate=truncate_ms,
             )
 
             await self.send_client_event(
@@ -33,6 +33,7 @@ from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_services import TTSService
 from pipecat.services.websocket_service import WebsocketService
 from pipecat.transcriptions.language import Language
+from pipecat.utils import log
 
 try:
     from pyht.async_client import AsyncClient
@@ -253,7 +254,7 @@ class PlayHTTTSService(TTSService, WebsocketService):
                 frame = TTSAudioRawFrame(message, self.sample_rate, 1)
                 await self.push_frame(frame)
             else:
-                logger.debug(f"Received text message: {message}")
+                log.debug("Received text message: {message}", message=message)
                 try:
                     msg = json.loads(message)
                     if msg.get("type") == "start":
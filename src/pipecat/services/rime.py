@@ -31,6 +31,7 @@ from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_services import AudioContextWordTTSService, TTSService
 from pipecat.services.websocket_service import WebsocketService
 from pipecat.transcriptions.language import Language
+from pipecat.utils import log
 
 try:
     import websockets
@@ -250,7 +251,7 @@ class RimeTTSService(AudioContextWordTTSService, WebsocketService):
     async def flush_audio(self):
         if not self._context_id or not self._websocket:
             return
-        logger.trace(f"{self}: flushing audio")
+        log.trace("{processor}: flushing audio", processor=self)
         self._context_id = None
 
     async def _receive_messages(self):
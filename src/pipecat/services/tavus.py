@@ -12,7 +12,7 @@ import base64
 import aiohttp
 from loguru import logger
 
-from pipecat.audio.utils import create_default_resampler
+from pipecat.audio.utils import create_stream_resampler
 from pipecat.frames.frames import (
     CancelFrame,
     EndFrame,
@@ -25,6 +25,7 @@ from pipecat.frames.frames import (
 )
 from pipecat.processors.frame_processor import FrameDirection
 from pipecat.services.ai_services import AIService
+from pipecat.utils import log
 
 
 class TavusVideoService(AIService):
@@ -47,7 +48,7 @@ class TavusVideoService(AIService):
 
         self._conversation_id: str
 
-        self._resampler = create_default_resampler()
+        self._resampler = create_stream_resampler()
 
     async def initialize(self) -> str:
         url = "https://tavusapi.com/v2/conversations"
@@ -95,8 +96,14 @@ class TavusVideoService(AIService):
         """Encodes audio to base64 and sends it to Tavus"""
         if not done:
             audio = await self._resampler.resample(audio, in_rate, 16000)
+            # The resampler returns audio in bursts.
+            if not audio:
+                return
+        await self._send_audio(audio, done)
+
+    async def _send_audio(self, audio: bytes, done: bool) -> None:
         audio_base64 = base64.b64encode(audio).decode("utf-8")
-        logger.trace(f"{self}: sending {len(audio)} bytes")
+        log.trace("{processor}: sending {size} bytes", processor=self, size=len(audio))
         await self._send_audio_message(audio_base64, done=done)
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
@@ -108,10 +115,15 @@ class TavusVideoService(AIService):
         elif isinstance(frame, TTSAudioRawFrame):
             await self._encode_audio_and_send(frame.audio, frame.sample_rate, done=False)
         elif isinstance(frame, TTSStoppedFrame):
+            # The resampler might still be holding the end of the audio.
+            audio = await self._resampler.flush()
+            if audio:
+                await self._send_audio(audio, done=False)
             await self._encode_audio_and_send(b"\x00", 16000, done=True)
             await self.stop_ttfb_metrics()
             await self.stop_processing_metrics()
         elif isinstance(frame, StartInterruptionFrame):
+            self._resampler.clear()
             await self._send_interrupt_message()
         else:
             await self.push_frame(frame, direction)
@@ -9,7 +9,7 @@ from typing import Any, AsyncGenerator, Dict, Optional
 import aiohttp
 from loguru import logger
 
-from pipecat.audio.utils import create_default_resampler
+from pipecat.audio.utils import create_stream_resampler
 from pipecat.frames.frames import (
     ErrorFrame,
     Frame,
@@ -89,7 +89,7 @@ class XTTSService(TTSService):
         self._studio_speakers: Optional[Dict[str, Any]] = None
         self._aiohttp_session = aiohttp_session
 
-        self._resampler = create_default_resampler()
+        self._resampler = create_stream_resampler()
 
     def can_generate_metrics(self) -> bool:
         return True
@@ -146,6 +146,9 @@ class XTTSService(TTSService):
 
             yield TTSStartedFrame()
 
+            # Discard anything left from a previous (interrupted) request.
+            self._resampler.clear()
+
             buffer = bytearray()
             async for chunk in r.content.iter_chunked(1024):
                 if len(chunk) > 0:
@@ -170,11 +173,15 @@ class XTTSService(TTSService):
                         frame = TTSAudioRawFrame(resampled_audio, self.sample_rate, 1)
                         yield frame
 
-            # Process any remaining data in the buffer.
+            # Process any remaining data in the buffer and the audio still
+            # held by the resampler.
+            resampled_audio = b""
             if len(buffer) > 0:
                 resampled_audio = await self._resampler.resample(
                     bytes(buffer), 24000, self.sample_rate
                 )
+            resampled_audio += await self._resampler.flush()
+            if len(resampled_audio) > 0:
                 frame = TTSAudioRawFrame(resampled_audio, self.sample_rate, 1)
                 yield frame
 
@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Load generator command line.
+
+Run a scenario against mock bots started in the same process:
+
+    python -m pipecat.tests.loadgen scenario.json --callers 100
+
+Or start the mock bots in one process (or machine) and the callers in another:
+
+    python -m pipecat.tests.loadgen scenario.json --serve
+    python -m pipecat.tests.loadgen scenario.json --no-bot
+
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from loguru import logger
+
+from pipecat.tests.loadgen.bot import LoadTestBotServer
+from pipecat.tests.loadgen.runner import run_load_test
+from pipecat.tests.loadgen.scenario import LoadScenario
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m pipecat.tests.loadgen",
+        description="Simulates concurrent callers talking to a Pipecat bot with mock services.",
+    )
+    parser.add_argument("scenario", nargs="?", help="scenario JSON file (see LoadScenario)")
+    parser.add_argument("--callers", type=int, help="number of simultaneous callers")
+    parser.add_argument("--ramp-up", type=float, help="seconds to start all the callers")
+    parser.add_argument("--transport", choices=["websocket_server", "fastapi"])
+    parser.add_argument("--host", help="bot host")
+    parser.add_argument("--port", type=int, help="bot port (first port for websocket_server)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--serve", action="store_true", help="only run the mock bots")
+    mode.add_argument("--no-bot", action="store_true", help="connect to already running bots")
+    parser.add_argument("--json", help="also write the report to this JSON file")
+    parser.add_argument("-v", "--verbose", action="count", default=0)
+    return parser.parse_args(argv)
+
+
+def load_scenario(args: argparse.Namespace) -> LoadScenario:
+    scenario = LoadScenario.from_file(args.scenario) if args.scenario else LoadScenario()
+    overrides = {
+        "callers": args.callers,
+        "ramp_up_secs": args.ramp_up,
+        "transport": args.transport,
+        "host": args.host,
+        "port": args.port,
+    }
+    return scenario.model_copy(update={k: v for k, v in overrides.items() if v is not None})
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level=["WARNING", "INFO", "DEBUG", "TRACE"][min(args.verbose, 3)])
+
+    scenario = load_scenario(args)
+
+    if args.serve:
+        logger.warning(f"Serving {scenario.transport} mock bots on {scenario.host}:{scenario.port}")
+        await LoadTestBotServer(scenario).run()
+        return
+
+    report = await run_load_test(scenario, start_bot=not args.no_bot)
+    print(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,231 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+from typing import List, Optional
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.llm_response import (
+    LLMAssistantContextAggregator,
+    LLMUserContextAggregator,
+)
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.serializers.protobuf import ProtobufFrameSerializer
+from pipecat.services.mock import MockLLMService, MockSTTService, MockTTSService
+from pipecat.tests.loadgen.scenario import LoadScenario
+from pipecat.transports.base_transport import BaseTransport
+
+
+class EnergyVADAnalyzer(VADAnalyzer):
+    """A VAD analyzer that considers voice anything with an RMS above
+    `min_rms`. It's cheap and it works with the tones generated by the load
+    test callers (which Silero would not detect as speech).
+
+    """
+
+    def __init__(
+        self,
+        *,
+        min_rms: float = 0.01,
+        sample_rate: Optional[int] = None,
+        params: VADParams = VADParams(),
+    ):
+        super().__init__(sample_rate=sample_rate, params=params)
+        self._min_rms = min_rms
+
+    def num_frames_required(self) -> int:
+        # 20ms
+        return int(self.sample_rate * 0.02)
+
+    def voice_confidence(self, buffer) -> float:
+        samples = np.frombuffer(buffer, dtype=np.int16).astype(np.float32) / 32768.0
+        rms = float(np.sqrt(np.mean(samples**2))) if len(samples) > 0 else 0.0
+        return 1.0 if rms >= self._min_rms else 0.0
+
+
+def create_bot_task(transport: BaseTransport, scenario: LoadScenario) -> PipelineTask:
+    """Creates the task of a voice bot (STT, LLM and TTS) that uses mock
+    services with the latencies from the scenario.
+
+    """
+    bot = scenario.bot
+
+    stt = MockSTTService(
+        transcript=bot.stt_transcript,
+        latency=bot.stt_latency,
+        endpointing_secs=bot.stt_endpointing_secs,
+    )
+    llm = MockLLMService(
+        response=bot.llm_response,
+        latency=bot.llm_latency,
+        token_interval=bot.llm_token_interval,
+    )
+    tts = MockTTSService(latency=bot.tts_latency, secs_per_char=bot.tts_secs_per_char)
+
+    context = OpenAILLMContext()
+
+    pipeline = Pipeline(
+        [
+            transport.input(),
+            stt,
+            LLMUserContextAggregator(context),
+            llm,
+            tts,
+            transport.output(),
+            LLMAssistantContextAggregator(context),
+        ]
+    )
+
+    return PipelineTask(
+        pipeline,
+        params=PipelineParams(
+            allow_interruptions=bot.allow_interruptions,
+            audio_in_sample_rate=scenario.sample_rate,
+            audio_out_sample_rate=scenario.sample_rate,
+        ),
+    )
+
+
+def _transport_params(scenario: LoadScenario) -> dict:
+    return {
+        "audio_in_enabled": True,
+        "audio_out_enabled": True,
+        "add_wav_header": False,
+        "vad_enabled": True,
+        "vad_analyzer": EnergyVADAnalyzer(params=VADParams(stop_secs=scenario.bot.vad_stop_secs)),
+        "vad_audio_passthrough": True,
+        "serializer": ProtobufFrameSerializer(),
+    }
+
+
+class LoadTestBotServer:
+    """Runs the mock bots the load test callers talk to. With the
+    `websocket_server` transport a server is started for every caller (in
+    consecutive ports) and with `fastapi` a single FastAPI app (served with
+    uvicorn) creates a bot for every websocket connection.
+
+    A new bot is created every time a caller disconnects, so the server can be
+    used for multiple load test runs.
+
+    """
+
+    def __init__(self, scenario: LoadScenario):
+        self._scenario = scenario
+        self._running = False
+        self._tasks: List[asyncio.Task] = []
+        self._uvicorn_server = None
+
+    async def start(self):
+        self._running = True
+        loop = asyncio.get_running_loop()
+        if self._scenario.transport == "websocket_server":
+            for i in range(self._scenario.callers):
+                port = self._scenario.port + i
+                self._tasks.append(loop.create_task(self._websocket_server_handler(port)))
+        else:
+            self._tasks.append(loop.create_task(self._fastapi_handler()))
+
+    async def stop(self):
+        self._running = False
+        if self._uvicorn_server:
+            self._uvicorn_server.should_exit = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run(self):
+        """Runs the bots until cancelled."""
+        await self.start()
+        try:
+            await asyncio.gather(*self._tasks)
+        finally:
+            await self.stop()
+
+    async def _run_bot(self, transport: BaseTransport):
+        task = create_bot_task(transport, self._scenario)
+
+        disconnected = asyncio.Event()
+
+        @transport.event_handler("on_client_disconnected")
+        async def on_client_disconnected(transport, client):
+            disconnected.set()
+
+        async def cancel_on_disconnect():
+            await disconnected.wait()
+            await task.cancel()
+
+        cancel_task = asyncio.create_task(cancel_on_disconnect())
+        try:
+            await PipelineRunner(handle_sigint=False).run(task)
+        finally:
+            cancel_task.cancel()
+            if not task.has_finished():
+                await task.cancel()
+
+    async def _websocket_server_handler(self, port: int):
+        from pipecat.transports.network.websocket_server import (
+            WebsocketServerParams,
+            WebsocketServerTransport,
+        )
+
+        while self._running:
+            transport = WebsocketServerTransport(
+                params=WebsocketServerParams(**_transport_params(self._scenario)),
+                host=self._scenario.host,
+                port=port,
+            )
+            await self._run_bot(transport)
+
+    def create_app(self):
+        """Returns a FastAPI app that creates a bot for every websocket
+        connection to the scenario path.
+
+        """
+        from fastapi import FastAPI, WebSocket
+
+        from pipecat.transports.network.fastapi_websocket import (
+            FastAPIWebsocketParams,
+            FastAPIWebsocketTransport,
+        )
+
+        app = FastAPI()
+
+        @app.websocket(self._scenario.path)
+        async def websocket_endpoint(websocket: WebSocket):
+            await websocket.accept()
+            transport = FastAPIWebsocketTransport(
+                websocket=websocket,
+                params=FastAPIWebsocketParams(**_transport_params(self._scenario)),
+            )
+            await self._run_bot(transport)
+
+        return app
+
+    async def _fastapi_handler(self):
+        try:
+            import uvicorn
+        except ModuleNotFoundError as e:
+            logger.error(f"Exception: {e}")
+            logger.error(
+                "In order to use the FastAPI load test bot, you need to `pip install uvicorn`."
+            )
+            raise Exception(f"Missing module: {e}")
+
+        config = uvicorn.Config(
+            self.create_app(),
+            host=self._scenario.host,
+            port=self._scenario.port,
+            log_level="warning",
+        )
+        self._uvicorn_server = uvicorn.Server(config)
+        await self._uvicorn_server.serve()
@@ -0,0 +1,257 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+import wave
+from typing import Callable, List, Optional
+
+from loguru import logger
+
+from pipecat.audio.utils import resample_audio
+from pipecat.frames.frames import InputAudioRawFrame, OutputAudioRawFrame
+from pipecat.serializers.protobuf import ProtobufFrameSerializer
+from pipecat.services.mock import generate_tone
+from pipecat.tests.loadgen.report import CallerResult
+from pipecat.tests.loadgen.scenario import CallerTurn, LoadScenario
+
+try:
+    import websockets
+except ModuleNotFoundError as e:
+    logger.error(f"Exception: {e}")
+    logger.error(
+        "In order to use the load generator, you need to `pip install pipecat-ai[websocket]`."
+    )
+    raise Exception(f"Missing module: {e}")
+
+# Frequency of the tone used for generated utterances.
+CALLER_TONE_FREQUENCY = 220.0
+
+
+def load_turn_audio(turn: CallerTurn, sample_rate: int) -> bytes:
+    """Returns the 16-bit mono audio of the given turn at the given sample
+    rate, either from the turn WAV file or a generated tone.
+
+    """
+    if not turn.audio:
+        return generate_tone(turn.duration, sample_rate, frequency=CALLER_TONE_FREQUENCY)
+
+    with wave.open(turn.audio, "rb") as wf:
+        if wf.getsampwidth() != 2 or wf.getnchannels() != 1:
+            raise ValueError(f"{turn.audio}: only 16-bit mono WAV files are supported")
+        audio = wf.readframes(wf.getnframes())
+        if wf.getframerate() != sample_rate:
+            audio = resample_audio(audio, wf.getframerate(), sample_rate)
+    return audio
+
+
+async def serialize_audio(audio: bytes, scenario: LoadScenario) -> List[bytes]:
+    """Splits the audio in chunks of the scenario chunk duration (the last one
+    padded with silence) and serializes them.
+
+    """
+    serializer = ProtobufFrameSerializer()
+    chunk_size = int(scenario.sample_rate * scenario.chunk_secs) * 2
+    payloads = []
+    for i in range(0, len(audio), chunk_size):
+        chunk = audio[i : i + chunk_size].ljust(chunk_size, b"\x00")
+        frame = OutputAudioRawFrame(audio=chunk, sample_rate=scenario.sample_rate, num_channels=1)
+        payloads.append(await serializer.serialize(frame))
+    return payloads
+
+
+class SimulatedCaller:
+    """A caller that connects to a bot over a websocket, streams audio in real
+    time (silence when it's not speaking) following the scenario turns and
+    measures the bot responses.
+
+    Bot audio is considered to be played in real time from the moment it's
+    received, so a new response starts when audio is received after the
+    previous one has been played (plus the scenario response gap). If audio is
+    received late, after the previous one has been played, it's counted as
+    dropped audio.
+
+    """
+
+    def __init__(
+        self,
+        caller_id: int,
+        scenario: LoadScenario,
+        turns_payloads: List[List[bytes]],
+        silence_payload: bytes,
+    ):
+        self._caller_id = caller_id
+        self._scenario = scenario
+        self._turns_payloads = turns_payloads
+        self._silence_payload = silence_payload
+        self._serializer = ProtobufFrameSerializer()
+
+        self._result = CallerResult(caller_id=caller_id)
+        self._connected_at = 0.0
+
+        self._next_send_time = 0.0
+
+        self._awaiting_response_since: Optional[float] = None
+        self._response_started_at: Optional[float] = None
+        self._last_audio_time: Optional[float] = None
+        self._playout_end_time: Optional[float] = None
+        self._barge_in_time: Optional[float] = None
+
+    @property
+    def connected_at(self) -> float:
+        return self._connected_at
+
+    async def run(self) -> CallerResult:
+        try:
+            websocket = await self._connect()
+        except Exception as e:
+            self._result.error = f"unable to connect: {e}"
+            return self._result
+
+        self._result.connected = True
+        self._connected_at = time.monotonic()
+
+        receive_task = asyncio.create_task(self._receive_task_handler(websocket))
+        try:
+            await self._run_turns(websocket)
+            if not self._result.error:
+                self._result.completed = self._result.timeouts == 0
+        except websockets.ConnectionClosed as e:
+            self._result.error = f"connection closed: {e}"
+        finally:
+            self._result.duration = time.monotonic() - self._connected_at
+            receive_task.cancel()
+            await asyncio.gather(receive_task, return_exceptions=True)
+            await websocket.close()
+
+        return self._result
+
+    async def _connect(self):
+        deadline = time.monotonic() + self._scenario.connect_timeout
+        url = self._scenario.caller_url(self._caller_id)
+        while True:
+            try:
+                return await websockets.connect(url, max_size=None)
+            except (OSError, websockets.WebSocketException):
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+
+    async def _run_turns(self, websocket):
+        for i, turn in enumerate(self._scenario.turns):
+            if i == 0:
+                await self._stream_silence(websocket, turn.delay)
+            elif turn.barge_in_after is not None:
+                if await self._wait_response_start(websocket):
+                    barge_in_time = self._response_started_at + turn.barge_in_after
+                    await self._stream_silence_until(
+                        websocket, lambda: time.monotonic() >= barge_in_time
+                    )
+            else:
+                if await self._wait_response_start(websocket):
+                    await self._wait_response_end(websocket)
+                await self._stream_silence(websocket, turn.delay)
+
+            await self._speak(websocket, self._turns_payloads[i])
+
+        if await self._wait_response_start(websocket):
+            await self._wait_response_end(websocket)
+
+    async def _speak(self, websocket, payloads: List[bytes]):
+        if self._bot_speaking():
+            self._barge_in_time = time.monotonic()
+        self._awaiting_response_since = None
+        self._response_started_at = None
+        for payload in payloads:
+            await self._send(websocket, payload)
+        self._awaiting_response_since = time.monotonic()
+
+    async def _wait_response_start(self, websocket) -> bool:
+        timeout = self._scenario.response_timeout
+        deadline = (self._awaiting_response_since or time.monotonic()) + timeout
+        await self._stream_silence_until(
+            websocket,
+            lambda: self._response_started_at is not None or time.monotonic() > deadline,
+        )
+        if self._response_started_at is None:
+            self._result.timeouts += 1
+            self._awaiting_response_since = None
+            logger.warning(f"Caller {self._caller_id}: no bot response after {timeout}s")
+            return False
+        return True
+
+    async def _wait_response_end(self, websocket):
+        await self._stream_silence_until(websocket, lambda: not self._bot_speaking())
+
+    async def _stream_silence(self, websocket, duration: float):
+        end_time = time.monotonic() + duration
+        await self._stream_silence_until(websocket, lambda: time.monotonic() >= end_time)
+
+    async def _stream_silence_until(self, websocket, condition: Callable[[], bool]):
+        while not condition():
+            await self._send(websocket, self._silence_payload)
+
+    async def _send(self, websocket, payload: bytes):
+        now = time.monotonic()
+        if not self._next_send_time:
+            self._next_send_time = now
+        delay = self._next_send_time - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+        elif -delay > self._scenario.chunk_secs:
+            # We are not able to keep up, so start over from now.
+            self._result.late_input_chunks += 1
+            self._next_send_time = now
+        await websocket.send(payload)
+        self._next_send_time += self._scenario.chunk_secs
+        self._check_interruption()
+
+    def _bot_speaking(self) -> bool:
+        return self._playout_end_time is not None and time.monotonic() < self._playout_end_time
+
+    def _check_interruption(self):
+        if self._barge_in_time is None:
+            return
+        now = time.monotonic()
+        if now - self._last_audio_time >= self._scenario.response_gap_secs:
+            latency = max(0.0, self._last_audio_time - self._barge_in_time)
+            self._result.interruption_latencies.append(latency)
+            self._barge_in_time = None
+            # A real client would stop playing the audio it has buffered.
+            self._playout_end_time = self._last_audio_time
+
+    async def _receive_task_handler(self, websocket):
+        try:
+            async for message in websocket:
+                frame = await self._serializer.deserialize(message)
+                if isinstance(frame, InputAudioRawFrame):
+                    self._handle_audio(frame)
+        except websockets.ConnectionClosed as e:
+            if not self._result.error:
+                self._result.error = f"connection closed: {e}"
+
+    def _handle_audio(self, frame: InputAudioRawFrame):
+        now = time.monotonic()
+        duration = len(frame.audio) / (2 * frame.num_channels * frame.sample_rate)
+
+        new_response = (
+            self._playout_end_time is None
+            or now >= self._playout_end_time + self._scenario.response_gap_secs
+        )
+        if new_response:
+            self._playout_end_time = now + duration
+            if self._awaiting_response_since is not None:
+                self._result.response_latencies.append(now - self._awaiting_response_since)
+                self._awaiting_response_since = None
+                self._response_started_at = now
+        else:
+            if now > self._playout_end_time:
+                self._result.dropped_audio_secs += now - self._playout_end_time
+                self._playout_end_time = now
+            self._playout_end_time += duration
+
+        self._last_audio_time = now
+        self._result.bot_audio_secs += duration
@@ -0,0 +1,130 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+PERCENTILES = [50, 90, 95, 99]
+
+
+@dataclass
+class CallerResult:
+    """What a single simulated caller measured.
+
+    Attributes:
+        caller_id: Caller index.
+        connected: Whether the caller could connect to the bot.
+        completed: Whether the caller went through all the turns and got a
+            response to each of them.
+        error: The error that ended the session, if any.
+        response_latencies: Time from the end of each utterance until the
+            first audio of the bot response was received.
+        interruption_latencies: Time from the start of each barge-in until the
+            bot audio stopped.
+        timeouts: Number of turns without a bot response.
+        late_input_chunks: Audio chunks the caller could not send on time (the
+            caller was not able to stream in real time).
+        dropped_audio_secs: Time the bot audio was not received on time to be
+            played (i.e. playback buffer underruns).
+        bot_audio_secs: Bot audio received.
+        duration: Session duration.
+    """
+
+    caller_id: int
+    connected: bool = False
+    completed: bool = False
+    error: Optional[str] = None
+    response_latencies: List[float] = field(default_factory=list)
+    interruption_latencies: List[float] = field(default_factory=list)
+    timeouts: int = 0
+    late_input_chunks: int = 0
+    dropped_audio_secs: float = 0.0
+    bot_audio_secs: float = 0.0
+    duration: float = 0.0
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    result = {f"p{p}": float(np.percentile(values, p)) for p in PERCENTILES}
+    result["max"] = float(np.max(values))
+    return result
+
+
+@dataclass
+class LoadReport:
+    """Aggregated results of a load test run.
+
+    Attributes:
+        callers: Number of simulated callers.
+        sessions_connected: Callers that connected to the bot.
+        sessions_sustained: Callers that completed all their turns without
+            errors or timeouts.
+        max_concurrent_sessions: Maximum number of simultaneous sessions.
+        response_latency: Bot response latency percentiles (seconds).
+        interruption_latency: Interruption latency percentiles (seconds).
+        timeouts: Turns without a bot response.
+        late_input_chunks: Caller audio chunks not sent on time.
+        dropped_audio_secs: Bot audio not received on time to be played.
+        bot_audio_secs: Bot audio received.
+        errors: Errors by caller id.
+    """
+
+    callers: int = 0
+    sessions_connected: int = 0
+    sessions_sustained: int = 0
+    max_concurrent_sessions: int = 0
+    response_latency: Dict[str, float] = field(default_factory=dict)
+    interruption_latency: Dict[str, float] = field(default_factory=dict)
+    timeouts: int = 0
+    late_input_chunks: int = 0
+    dropped_audio_secs: float = 0.0
+    bot_audio_secs: float = 0.0
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_results(
+        cls, results: List[CallerResult], max_concurrent_sessions: int = 0
+    ) -> "LoadReport":
+        response_latencies = [v for r in results for v in r.response_latencies]
+        interruption_latencies = [v for r in results for v in r.interruption_latencies]
+        return cls(
+            callers=len(results),
+            sessions_connected=sum(1 for r in results if r.connected),
+            sessions_sustained=sum(1 for r in results if r.completed),
+            max_concurrent_sessions=max_concurrent_sessions,
+            response_latency=percentiles(response_latencies),
+            interruption_latency=percentiles(interruption_latencies),
+            timeouts=sum(r.timeouts for r in results),
+            late_input_chunks=sum(r.late_input_chunks for r in results),
+            dropped_audio_secs=sum(r.dropped_audio_secs for r in results),
+            bot_audio_secs=sum(r.bot_audio_secs for r in results),
+            errors={r.caller_id: r.error for r in results if r.error},
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def __str__(self):
+        def format_latency(latency: Dict[str, float]) -> str:
+            if not latency:
+                return "n/a"
+            return " ".join(f"{k}={v * 1000:.0f}ms" for k, v in latency.items())
+
+        lines = [
+            f"Sessions sustained: {self.sessions_sustained}/{self.callers} "
+            f"(connected: {self.sessions_connected}, max concurrent: {self.max_concurrent_sessions})",
+            f"Response latency: {format_latency(self.response_latency)}",
+            f"Interruption latency: {format_latency(self.interruption_latency)}",
+            f"Timeouts: {self.timeouts}",
+            f"Late input chunks: {self.late_input_chunks}",
+            f"Dropped audio: {self.dropped_audio_secs:.2f}s of {self.bot_audio_secs:.2f}s",
+        ]
+        for caller_id, error in self.errors.items():
+            lines.append(f"Caller {caller_id} error: {error}")
+        return "\n".join(lines)
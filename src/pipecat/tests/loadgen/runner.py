@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+from typing import List
+
+from pipecat.tests.loadgen.bot import LoadTestBotServer
+from pipecat.tests.loadgen.caller import SimulatedCaller, load_turn_audio, serialize_audio
+from pipecat.tests.loadgen.report import CallerResult, LoadReport
+from pipecat.tests.loadgen.scenario import LoadScenario
+
+
+def max_concurrent_sessions(callers: List[SimulatedCaller], results: List[CallerResult]) -> int:
+    events = []
+    for caller, result in zip(callers, results):
+        if result.connected:
+            events.append((caller.connected_at, 1))
+            events.append((caller.connected_at + result.duration, -1))
+    # Sessions that end at the same time another one starts don't overlap.
+    events.sort(key=lambda e: (e[0], e[1]))
+    current = maximum = 0
+    for _, delta in events:
+        current += delta
+        maximum = max(maximum, current)
+    return maximum
+
+
+async def run_load_test(scenario: LoadScenario, *, start_bot: bool = True) -> LoadReport:
+    """Runs the scenario callers (started evenly during the scenario ramp-up
+    time) and returns the aggregated report. If `start_bot` is True the mock
+    bots (see `LoadTestBotServer`) run in this same process, otherwise the
+    callers connect to already running bots (e.g. started with
+    `python -m pipecat.tests.loadgen --serve`).
+
+    """
+    turns_payloads = [
+        await serialize_audio(load_turn_audio(turn, scenario.sample_rate), scenario)
+        for turn in scenario.turns
+    ]
+    silence = bytes(int(scenario.sample_rate * scenario.chunk_secs) * 2)
+    silence_payload = (await serialize_audio(silence, scenario))[0]
+
+    callers = [
+        SimulatedCaller(i, scenario, turns_payloads, silence_payload)
+        for i in range(scenario.callers)
+    ]
+
+    async def run_caller(caller_id: int, caller: SimulatedCaller) -> CallerResult:
+        if scenario.callers > 1:
+            await asyncio.sleep(caller_id * scenario.ramp_up_secs / scenario.callers)
+        return await caller.run()
+
+    server = LoadTestBotServer(scenario) if start_bot else None
+    if server:
+        await server.start()
+    try:
+        results = await asyncio.gather(*[run_caller(i, c) for i, c in enumerate(callers)])
+    finally:
+        if server:
+            await server.stop()
+
+    return LoadReport.from_results(results, max_concurrent_sessions(callers, results))
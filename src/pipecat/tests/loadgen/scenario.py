@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class MockBotParams(BaseModel):
+    """Latencies of the mock services used by the load test bot (see
+    `pipecat.services.mock`).
+
+    Attributes:
+        stt_endpointing_secs: Silence needed by the STT service to consider an
+            utterance finished.
+        stt_latency: Time from the end of an utterance until the transcription.
+        stt_transcript: Transcription of every caller utterance.
+        llm_latency: Time to the first LLM token.
+        llm_token_interval: Time between LLM tokens (words).
+        llm_response: The response to every caller utterance.
+        tts_latency: Time to the first TTS audio chunk.
+        tts_secs_per_char: Seconds of TTS audio generated per character.
+        vad_stop_secs: Silence needed to consider the caller stopped speaking.
+        allow_interruptions: Whether the caller can interrupt the bot.
+    """
+
+    stt_endpointing_secs: float = 0.3
+    stt_latency: float = 0.2
+    stt_transcript: str = "Hello, this is a simulated caller."
+    llm_latency: float = 0.5
+    llm_token_interval: float = 0.02
+    llm_response: str = "Hello! This is a mock response. How can I help you today?"
+    tts_latency: float = 0.2
+    tts_secs_per_char: float = 0.06
+    vad_stop_secs: float = 0.8
+    allow_interruptions: bool = True
+
+
+class CallerTurn(BaseModel):
+    """Something the caller says.
+
+    Attributes:
+        audio: Path to a 16-bit mono WAV file with the utterance. If not given,
+            a tone of `duration` seconds is used.
+        duration: Duration of the generated utterance if no `audio` is given.
+        delay: Seconds to wait (streaming silence) after the bot finishes its
+            previous response, or after connecting for the first turn.
+        barge_in_after: If given, instead of waiting for the bot to finish, the
+            caller starts speaking this many seconds after the bot starts its
+            previous response (i.e. it interrupts the bot).
+    """
+
+    audio: Optional[str] = None
+    duration: float = 1.5
+    delay: float = 0.5
+    barge_in_after: Optional[float] = None
+
+
+class LoadScenario(BaseModel):
+    """A load test scenario. Every caller connects to the bot, streams audio in
+    real time (silence when it's not speaking) and goes through the same
+    turns.
+
+    Attributes:
+        transport: Transport the bot uses, `websocket_server` (one server,
+            i.e. port, per caller) or `fastapi` (one endpoint for all callers).
+        host: Host the bot listens on.
+        port: Port of the bot (the first one for `websocket_server`).
+        path: Websocket endpoint path for `fastapi`.
+        callers: Number of simultaneous callers.
+        ramp_up_secs: Time to start all the callers (evenly spread).
+        sample_rate: Sample rate of the audio sent and received.
+        chunk_secs: Duration of the audio chunks sent by the callers.
+        response_gap_secs: Silence between audio chunks that separates two
+            different bot responses.
+        response_timeout: Maximum time to wait for a bot response.
+        connect_timeout: Maximum time to wait for the bot to accept a caller.
+        turns: What every caller says.
+        bot: Mock services configuration of the bot.
+    """
+
+    transport: Literal["websocket_server", "fastapi"] = "websocket_server"
+    host: str = "localhost"
+    port: int = 8765
+    path: str = "/ws"
+    callers: int = 10
+    ramp_up_secs: float = 0.0
+    sample_rate: int = 16000
+    chunk_secs: float = 0.02
+    response_gap_secs: float = 0.25
+    response_timeout: float = 10.0
+    connect_timeout: float = 10.0
+    turns: List[CallerTurn] = Field(default_factory=lambda: [CallerTurn()])
+    bot: MockBotParams = Field(default_factory=MockBotParams)
+
+    def caller_url(self, caller_id: int) -> str:
+        if self.transport == "websocket_server":
+            return f"ws://{self.host}:{self.port + caller_id}"
+        return f"ws://{self.host}:{self.port}{self.path}"
+
+    @classmethod
+    def from_file(cls, path: str) -> "LoadScenario":
+        with open(path, "r") as f:
+            return cls.model_validate_json(f.read())
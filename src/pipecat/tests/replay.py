@@ -0,0 +1,200 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import dataclasses
+import time
+from typing import List, Optional, Sequence
+
+from loguru import logger
+
+from pipecat.frames.frames import CancelFrame, EndFrame, Frame, StartFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.session_recorder import (
+    SERVICE_REQUEST_TYPES,
+    RecordedFrame,
+    RecordedRequest,
+    SessionRecording,
+)
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+def _copy_frame(frame: Frame) -> Frame:
+    # Recorded frames are copied so every replayed frame gets a new id and
+    # name. `dataclasses.replace()` only copies init fields, so the timing and
+    # metadata of the frame are copied explicitly.
+    copy = dataclasses.replace(frame)
+    copy.pts = frame.pts
+    copy.metadata = dict(frame.metadata)
+    return copy
+
+
+class ReplayInput(FrameProcessor):
+    """Replaces the input transport of a recorded session (see
+    `SessionRecorder`). When the pipeline starts it pushes the frames the
+    input transport generated (audio, user started/stopped speaking...) at
+    their recorded times, `speed` times faster than real time (0 means as fast
+    as possible). The `on_replay_finished` event is triggered after the last
+    frame is pushed.
+
+    """
+
+    def __init__(self, recording: SessionRecording, *, speed: float = 1.0, **kwargs):
+        super().__init__(**kwargs)
+        self._recording = recording
+        self._speed = speed
+        self._replay_task: Optional[asyncio.Task] = None
+
+        self._register_event_handler("on_replay_finished")
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, StartFrame):
+            await self.push_frame(frame, direction)
+            self._replay_task = self.create_task(self._replay_task_handler())
+        elif isinstance(frame, (EndFrame, CancelFrame)):
+            await self._cancel_replay_task()
+            await self.push_frame(frame, direction)
+        else:
+            await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        await super().cleanup()
+        await self._cancel_replay_task()
+
+    async def _cancel_replay_task(self):
+        if self._replay_task:
+            await self.cancel_task(self._replay_task)
+            self._replay_task = None
+
+    async def _replay_task_handler(self):
+        start_time = time.monotonic()
+        for recorded in self._recording.inputs:
+            if self._speed > 0:
+                due_time = start_time + recorded.timestamp / 1e9 / self._speed
+                await asyncio.sleep(max(0.0, due_time - time.monotonic()))
+            else:
+                # Let the pipeline process the frames we push.
+                await asyncio.sleep(0)
+            await self.push_frame(_copy_frame(recorded.frame))
+        self._replay_task = None
+        await self._call_event_handler("on_replay_finished")
+
+
+class ReplayService(FrameProcessor):
+    """Replaces an LLM, TTS or STT service of a recorded session (see
+    `SessionRecorder`). `key` is the service key in the recording (e.g. `llm`
+    or `tts:1`).
+
+    Every time a request is received (see `SERVICE_REQUEST_TYPES`), the
+    responses recorded for the request in the same position are pushed with
+    their recorded delays, `speed` times faster than real time. With a speed
+    of 0 responses are pushed right away, which makes the replay fully
+    deterministic. All other frames are passed through.
+
+    """
+
+    def __init__(self, recording: SessionRecording, key: str, *, speed: float = 1.0, **kwargs):
+        super().__init__(**kwargs)
+        role = key.split(":")[0]
+        if role not in SERVICE_REQUEST_TYPES:
+            raise ValueError(f"Unknown service key '{key}'")
+        if key not in recording.services:
+            raise ValueError(f"Service '{key}' not found in recording")
+        self._key = key
+        self._requests: List[RecordedRequest] = recording.services[key]
+        self._request_types = SERVICE_REQUEST_TYPES[role]
+        self._speed = speed
+        self._request_index = 0
+        self._response_queue = asyncio.Queue()
+        self._response_task: Optional[asyncio.Task] = None
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, StartFrame):
+            await self.push_frame(frame, direction)
+            if self._speed > 0:
+                self._response_task = self.create_task(self._response_task_handler())
+        elif isinstance(frame, EndFrame):
+            # Wait for the pending responses before finishing.
+            await self._response_queue.join()
+            await self._cancel_response_task()
+            await self.push_frame(frame, direction)
+        elif isinstance(frame, CancelFrame):
+            await self._cancel_response_task()
+            await self.push_frame(frame, direction)
+        elif direction == FrameDirection.DOWNSTREAM and isinstance(frame, self._request_types):
+            await self._handle_request(frame)
+        else:
+            await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        await super().cleanup()
+        await self._cancel_response_task()
+
+    async def _handle_request(self, frame: Frame):
+        if self._request_index >= len(self._requests):
+            if self._request_index == len(self._requests):
+                logger.warning(f"{self}: no more recorded '{self._key}' requests")
+            self._request_index += 1
+            await self.push_frame(frame)
+            return
+
+        request = self._requests[self._request_index]
+        self._request_index += 1
+
+        if self._response_task:
+            await self._response_queue.put((time.monotonic(), request, frame))
+        else:
+            for response in request.responses:
+                await self._push_response(response, frame)
+
+    async def _push_response(self, response: RecordedFrame, request_frame: Frame):
+        frame = request_frame if response.frame is None else _copy_frame(response.frame)
+        await self.push_frame(frame, response.direction)
+
+    async def _cancel_response_task(self):
+        if self._response_task:
+            await self.cancel_task(self._response_task)
+            self._response_task = None
+
+    async def _response_task_handler(self):
+        while True:
+            (received_time, request, frame) = await self._response_queue.get()
+            for response in request.responses:
+                delay = (response.timestamp - request.timestamp) / 1e9 / self._speed
+                await asyncio.sleep(max(0.0, received_time + delay - time.monotonic()))
+                await self._push_response(response, frame)
+            self._response_queue.task_done()
+
+
+async def replay_session(
+    recording: SessionRecording,
+    processors: Sequence[FrameProcessor],
+    *,
+    speed: float = 1.0,
+    params: PipelineParams = PipelineParams(),
+) -> PipelineTask:
+    """Replays a recorded session. The given processors (usually the ones of
+    the recorded pipeline with `ReplayService`s instead of the real services
+    and without transports) are run after a `ReplayInput` until all the
+    recorded input frames have been pushed and processed. Returns the finished
+    pipeline task.
+
+    """
+    replay_input = ReplayInput(recording, speed=speed)
+    task = PipelineTask(Pipeline([replay_input, *processors]), params=params)
+
+    @replay_input.event_handler("on_replay_finished")
+    async def on_replay_finished(processor):
+        await task.queue_frame(EndFrame())
+
+    await PipelineRunner(handle_sigint=False).run(task)
+    return task
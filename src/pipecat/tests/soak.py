@@ -0,0 +1,410 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import argparse
+import asyncio
+import gc
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    ControlFrame,
+    EndFrame,
+    Frame,
+    InputAudioRawFrame,
+    LLMMessagesUpdateFrame,
+    TranscriptionFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.llm_response import (
+    LLMAssistantContextAggregator,
+    LLMUserContextAggregator,
+)
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.mock import (
+    MockLLMService,
+    MockSTTService,
+    MockTTSService,
+    generate_tone,
+)
+from pipecat.utils.memory import GrowthDetector, count_objects, current_rss
+from pipecat.utils.time import time_now_iso8601
+
+
+@dataclass
+class SoakIterationFrame(ControlFrame):
+    """This frame is pushed after the frames of every soak test iteration. When
+    it reaches the end of the pipeline we know the iteration has been
+    processed.
+
+    """
+
+    iteration: int = 0
+
+
+@dataclass
+class SoakResourceTolerances:
+    """Minimum growth (between the first and the last sample) of the process
+    resources sampled during a soak test for them to be considered growing.
+    Process-wide numbers are noisy (allocator arenas, interned strings,
+    caches...), so small increases are ignored.
+
+    Attributes:
+        rss: Resident set size growth, in bytes.
+        tasks: Growth in number of pipeline and asyncio tasks.
+        objects: Growth in number of objects of a single type.
+        queue_frames: Growth in number of frames waiting in a single queue.
+    """
+
+    rss: int = 32 * 1024 * 1024
+    tasks: int = 5
+    objects: int = 500
+    queue_frames: int = 10
+
+
+@dataclass
+class SoakTestResult:
+    """Memory usage samples (in bytes) of every processor and the names of the
+    processors whose memory usage kept growing.
+
+    Process resources are sampled at the same time and stored in `resources`:
+    `rss` (bytes), `tasks` (tasks created by the pipeline processors),
+    `asyncio_tasks`, `objects:<type>` (number of live objects of the type) and
+    `queue:<name>` (frames waiting in a processor's queues). The ones that kept
+    growing are listed in `growing_resources`.
+
+    Samples are taken every `sample_every` iterations.
+
+    """
+
+    iterations: int = 0
+    elapsed_secs: float = 0.0
+    sample_every: int = 1
+    samples: Dict[str, List[int]] = field(default_factory=dict)
+    growing: List[str] = field(default_factory=list)
+    resources: Dict[str, List[int]] = field(default_factory=dict)
+    growing_resources: List[str] = field(default_factory=list)
+
+    @property
+    def failed(self) -> bool:
+        return len(self.growing) > 0 or len(self.growing_resources) > 0
+
+    def assert_no_growth(self):
+        """Raises an `AssertionError` describing everything that kept growing."""
+        if not self.failed:
+            return
+        lines = [f"soak test found growth after {self.iterations} iterations:"]
+        for name in self.growing:
+            lines.append(f"  {name}: {_describe_growth(self.samples[name])}")
+        for name in self.growing_resources:
+            lines.append(f"  {name}: {_describe_growth(self.resources[name])}")
+        raise AssertionError("\n".join(lines))
+
+    def __str__(self):
+        lines = [
+            f"Iterations: {self.iterations} ({self.elapsed_secs:.1f}s, "
+            f"sampled every {self.sample_every})"
+        ]
+        for name in ["rss", "tasks", "asyncio_tasks"]:
+            if name in self.resources:
+                lines.append(f"{name}: {_describe_growth(self.resources[name])}")
+        if self.failed:
+            lines.append("Growing:")
+            lines.extend(f"  {name}" for name in self.growing + self.growing_resources)
+        else:
+            lines.append("No growth detected")
+        return "\n".join(lines)
+
+
+def _describe_growth(samples: List[int]) -> str:
+    return f"{samples[0]} -> {samples[-1]} ({len(samples)} samples)"
+
+
+def _is_growing(
+    samples: List[int], *, tolerance: float, min_growth: int, monotonicity: float
+) -> bool:
+    if len(samples) < 2:
+        return False
+    detector = GrowthDetector(
+        window=len(samples),
+        tolerance=tolerance,
+        min_growth=min_growth,
+        monotonicity=monotonicity,
+    )
+    for value in samples:
+        detector.add_sample(value)
+    if not detector.is_growing():
+        return False
+    # Values that are periodically released (e.g. a conversation context that
+    # is cleared every few turns) grow most of the time, but their peaks don't.
+    half = len(samples) // 2
+    first_peak = max(samples[:half])
+    return max(samples[half:]) - first_peak > max(min_growth, abs(first_peak) * tolerance)
+
+
+class ResourceSampler:
+    """Samples the process resources stored in `SoakTestResult.resources`.
+    Object types are tracked once they have at least `min_object_count` live
+    objects.
+
+    """
+
+    def __init__(self, task: PipelineTask, *, objects: bool = True, min_object_count: int = 100):
+        self._task = task
+        self._objects = objects
+        self._min_object_count = min_object_count
+        self._object_types: Set[str] = set()
+
+    def sample(self) -> Dict[str, int]:
+        values = {}
+        if self._objects:
+            # Get rid of garbage first, we only care about objects that are
+            # still referenced.
+            gc.collect()
+            counts = count_objects()
+            self._object_types.update(
+                t for t, count in counts.items() if count >= self._min_object_count
+            )
+            for t in self._object_types:
+                values[f"objects:{t}"] = counts.get(t, 0)
+        values["rss"] = current_rss()
+        values["tasks"] = len(self._task.current_tasks())
+        values["asyncio_tasks"] = len(asyncio.all_tasks())
+        for name, size in self._task.queue_sizes().items():
+            values[f"queue:{name}"] = size
+        return values
+
+    def min_growth(self, name: str, tolerances: SoakResourceTolerances) -> int:
+        if name == "rss":
+            return tolerances.rss
+        elif name.endswith("tasks"):
+            return tolerances.tasks
+        elif name.startswith("objects:"):
+            return tolerances.objects
+        return tolerances.queue_frames
+
+
+class SoakIterationSink(FrameProcessor):
+    def __init__(self, queue: asyncio.Queue):
+        super().__init__()
+        self._queue = queue
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, SoakIterationFrame):
+            await self._queue.put(frame)
+        else:
+            await self.push_frame(frame, direction)
+
+
+async def run_soak_test(
+    processor: FrameProcessor,
+    *,
+    frames_factory: Callable[[int], Sequence[Frame]],
+    iterations: int = 100,
+    duration_secs: Optional[float] = None,
+    warmup_iterations: int = 5,
+    iteration_timeout: float = 5.0,
+    sample_every: int = 1,
+    max_samples: int = 1000,
+    tolerance: float = 0.1,
+    min_growth: int = 0,
+    monotonicity: float = 0.8,
+    sample_resources: bool = True,
+    sample_objects: bool = True,
+    min_object_count: int = 100,
+    resource_tolerances: SoakResourceTolerances = SoakResourceTolerances(),
+    params: PipelineParams = PipelineParams(),
+) -> SoakTestResult:
+    """Runs the given processor (or pipeline) for the given number of
+    iterations, or until `duration_secs` have elapsed. On each iteration the
+    frames returned by `frames_factory` are queued and, once they have been
+    processed, the memory usage of every processor (see
+    `FrameProcessor.memory_usage()`) and the process resources (see
+    `SoakTestResult`) are sampled. Processors and resources that keep growing
+    after the warmup iterations are reported in the result (see
+    `GrowthDetector` for the meaning of the tolerance arguments and
+    `SoakResourceTolerances` for the minimum growth of each resource).
+
+    Samples are taken every `sample_every` iterations. To keep long runs
+    bounded, when `max_samples` is reached every other sample is dropped and
+    the sampling interval is doubled.
+
+    The processor needs to pass through `ControlFrame`s it doesn't know about.
+
+    """
+    queue = asyncio.Queue()
+    pipeline = Pipeline([processor, SoakIterationSink(queue)])
+    task = PipelineTask(pipeline, params=params)
+
+    sampler = ResourceSampler(task, objects=sample_objects, min_object_count=min_object_count)
+
+    result = SoakTestResult(sample_every=sample_every)
+
+    def take_samples():
+        for name, value in task.memory_usage().items():
+            result.samples.setdefault(name, []).append(value)
+        if sample_resources:
+            for name, value in sampler.sample().items():
+                result.resources.setdefault(name, []).append(value)
+
+    def decimate_samples():
+        for series in [result.samples, result.resources]:
+            for name, values in series.items():
+                series[name] = values[::2]
+        result.sample_every *= 2
+
+    start_time = time.monotonic()
+
+    def keep_running(i: int) -> bool:
+        if duration_secs is not None:
+            return time.monotonic() - start_time < duration_secs
+        return i < iterations
+
+    async def run_iterations():
+        num_samples = 0
+        try:
+            i = 0
+            while keep_running(i):
+                await task.queue_frames(frames_factory(i))
+                await task.queue_frame(SoakIterationFrame(iteration=i))
+                await asyncio.wait_for(queue.get(), timeout=iteration_timeout)
+                if i >= warmup_iterations and (i - warmup_iterations) % result.sample_every == 0:
+                    take_samples()
+                    num_samples += 1
+                    if num_samples >= max_samples:
+                        decimate_samples()
+                        num_samples = (num_samples + 1) // 2
+                result.iterations += 1
+                i += 1
+        finally:
+            result.elapsed_secs = time.monotonic() - start_time
+            await task.queue_frame(EndFrame())
+
+    runner = PipelineRunner(handle_sigint=False)
+    await asyncio.gather(runner.run(task), run_iterations())
+
+    for name, samples in result.samples.items():
+        if _is_growing(
+            samples, tolerance=tolerance, min_growth=min_growth, monotonicity=monotonicity
+        ):
+            result.growing.append(name)
+
+    for name, samples in result.resources.items():
+        if _is_growing(
+            samples,
+            tolerance=tolerance,
+            min_growth=sampler.min_growth(name, resource_tolerances),
+            monotonicity=monotonicity,
+        ):
+            result.growing_resources.append(name)
+
+    return result
+
+
+def create_mock_voice_pipeline() -> Pipeline:
+    """Creates a voice bot pipeline (STT, user context aggregator, LLM, TTS and
+    assistant context aggregator) with mock services that respond
+    immediately, so a soak test goes through as many turns as possible.
+
+    """
+    context = OpenAILLMContext()
+    return Pipeline(
+        [
+            MockSTTService(latency=0),
+            LLMUserContextAggregator(context),
+            MockLLMService(latency=0, token_interval=0),
+            MockTTSService(latency=0),
+            LLMAssistantContextAggregator(context),
+        ]
+    )
+
+
+def mock_voice_frames(
+    iteration: int,
+    *,
+    turns_per_conversation: Optional[int] = 10,
+    audio_secs: float = 0.1,
+    sample_rate: int = 16000,
+) -> List[Frame]:
+    """Returns the frames of a user turn for `create_mock_voice_pipeline()`:
+    the user speaks (`audio_secs` of audio, which the mock STT service sees as
+    a single long utterance) and the transcription, as an STT service would
+    push it, arrives before the user stops speaking. If
+    `turns_per_conversation` is given the LLM context is cleared every that
+    many turns, as if a new conversation started.
+
+    """
+    frames = []
+    if turns_per_conversation and iteration % turns_per_conversation == 0:
+        frames.append(LLMMessagesUpdateFrame(messages=[]))
+    audio = generate_tone(audio_secs, sample_rate)
+    chunk_size = int(sample_rate * 0.02) * 2
+    frames.append(UserStartedSpeakingFrame())
+    for i in range(0, len(audio), chunk_size):
+        frames.append(
+            InputAudioRawFrame(
+                audio=audio[i : i + chunk_size], sample_rate=sample_rate, num_channels=1
+            )
+        )
+    frames.append(
+        TranscriptionFrame(text=f"Turn {iteration}.", user_id="user", timestamp=time_now_iso8601())
+    )
+    frames.append(UserStoppedSpeakingFrame())
+    return frames
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m pipecat.tests.soak",
+        description="Runs a mock voice bot pipeline and checks for memory and resource growth.",
+    )
+    parser.add_argument("--iterations", type=int, default=1000, help="number of user turns")
+    parser.add_argument("--duration", type=float, help="run for this many seconds instead")
+    parser.add_argument("--sample-every", type=int, default=1, help="iterations between samples")
+    parser.add_argument(
+        "--turns-per-conversation",
+        type=int,
+        default=10,
+        help="clear the LLM context every this many turns (0 to never clear it)",
+    )
+    parser.add_argument("--no-objects", action="store_true", help="don't count live objects")
+    parser.add_argument("-v", "--verbose", action="count", default=0)
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level=["WARNING", "INFO", "DEBUG", "TRACE"][min(args.verbose, 3)])
+
+    result = await run_soak_test(
+        create_mock_voice_pipeline(),
+        frames_factory=lambda i: mock_voice_frames(
+            i, turns_per_conversation=args.turns_per_conversation
+        ),
+        iterations=args.iterations,
+        duration_secs=args.duration,
+        sample_every=args.sample_every,
+        sample_objects=not args.no_objects,
+    )
+    print(result)
+    return 1 if result.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
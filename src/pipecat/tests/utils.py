@@ -20,6 +20,7 @@ from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.tests.virtual_time import VirtualTimeEventLoop, run_with_virtual_time
 
 
 @dataclass
@@ -85,7 +86,31 @@ async def run_test(
     ignore_start: bool = True,
     start_metadata: Dict[str, Any] = {},
     send_end_frame: bool = True,
+    virtual_time: bool = False,
 ) -> Tuple[Sequence[Frame], Sequence[Frame]]:
+    """Runs `processor` in a pipeline, sends `frames_to_send` (a `SleepFrame`
+    waits before sending the next frame) and checks the types of the frames
+    received downstream and upstream.
+
+    If `virtual_time` is True, the test runs in a `VirtualTimeEventLoop` (in a
+    separate thread), so sleeps and timeouts don't take any real time.
+
+    """
+    if virtual_time and not isinstance(asyncio.get_running_loop(), VirtualTimeEventLoop):
+        return await asyncio.to_thread(
+            run_with_virtual_time,
+            run_test(
+                processor,
+                frames_to_send=frames_to_send,
+                expected_down_frames=expected_down_frames,
+                expected_up_frames=expected_up_frames,
+                ignore_start=ignore_start,
+                start_metadata=start_metadata,
+                send_end_frame=send_end_frame,
+                virtual_time=True,
+            ),
+        )
+
     received_up = asyncio.Queue()
     received_down = asyncio.Queue()
     source = QueuedFrameProcessor(
@@ -115,7 +140,7 @@ async def run_test(
         if send_end_frame:
             await task.queue_frame(EndFrame())
 
-    runner = PipelineRunner()
+    runner = PipelineRunner(handle_sigint=not virtual_time)
     await asyncio.gather(runner.run(task), push_frames())
 
     #
@@ -0,0 +1,215 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import selectors
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _VirtualTimeSelector(selectors.BaseSelector):
+    """Selector used by `VirtualTimeEventLoop`. The event loop calls `select()`
+    with the time left until the next scheduled callback. Instead of waiting,
+    we just check for I/O and, if there's none, advance the virtual time so the
+    callback is due right away.
+
+    """
+
+    def __init__(self, loop: "VirtualTimeEventLoop"):
+        self._loop = loop
+        self._selector = selectors.DefaultSelector()
+
+    def register(self, fileobj, events, data=None):
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout: Optional[float] = None):
+        events = self._selector.select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None or self._loop.pending_executor_calls > 0:
+            # Nothing scheduled or some work is running in a thread. Time
+            # doesn't move until we get a result (we get woken up by the
+            # loop's self-pipe).
+            return self._selector.select(None)
+        self._loop.advance(timeout)
+        return []
+
+    def close(self):
+        self._selector.close()
+
+    def get_key(self, fileobj):
+        return self._selector.get_key(fileobj)
+
+    def get_map(self):
+        return self._selector.get_map()
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """An asyncio event loop with a virtual clock. Whenever the loop has
+    nothing to do but wait for a timer (`asyncio.sleep()`,
+    `asyncio.wait_for()` timeouts, `loop.call_later()`...), the virtual time
+    jumps to the timer's deadline. This allows simulating minutes of a
+    conversation in milliseconds and makes timing deterministic.
+
+    Work running in executor threads (`loop.run_in_executor()`,
+    `asyncio.to_thread()`) takes no virtual time: the clock stops until the
+    thread finishes. Code that measures time with `time.time()` or
+    `time.monotonic()` only sees the virtual time inside `patch_time()`.
+
+    """
+
+    def __init__(self):
+        super().__init__(selector=_VirtualTimeSelector(self))
+        # The loop time starts at 0 to avoid floating point rounding of large
+        # values. `monotonic()` and `wall_time()` start at the real values.
+        self._virtual_time = 0.0
+        self._start_monotonic = time.monotonic()
+        self._start_wall_time = time.time()
+        self._pending_executor_calls = 0
+
+    @property
+    def pending_executor_calls(self) -> int:
+        return self._pending_executor_calls
+
+    @property
+    def elapsed(self) -> float:
+        """Virtual seconds elapsed since the loop was created."""
+        return self._virtual_time
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def monotonic(self) -> float:
+        """Virtual equivalent of `time.monotonic()`."""
+        return self._start_monotonic + self.elapsed
+
+    def wall_time(self) -> float:
+        """Virtual equivalent of `time.time()`."""
+        return self._start_wall_time + self.elapsed
+
+    def advance(self, seconds: float):
+        """Moves the virtual clock forward. Timers that become due will run in
+        the next loop iteration.
+
+        """
+        if seconds < 0:
+            raise ValueError("Virtual time can't go backwards")
+        self._virtual_time += seconds
+
+    def run_in_executor(self, executor, func, *args):
+        future = super().run_in_executor(executor, func, *args)
+        self._pending_executor_calls += 1
+        future.add_done_callback(self._executor_call_done)
+        return future
+
+    def _executor_call_done(self, future: asyncio.Future):
+        self._pending_executor_calls -= 1
+
+
+def _virtual_loop() -> Optional[VirtualTimeEventLoop]:
+    loop = asyncio._get_running_loop()
+    return loop if isinstance(loop, VirtualTimeEventLoop) else None
+
+
+_real_time = time.time
+_real_time_ns = time.time_ns
+_real_monotonic = time.monotonic
+_real_monotonic_ns = time.monotonic_ns
+
+
+def _time() -> float:
+    loop = _virtual_loop()
+    return loop.wall_time() if loop else _real_time()
+
+
+def _time_ns() -> int:
+    loop = _virtual_loop()
+    return int(loop.wall_time() * 1_000_000_000) if loop else _real_time_ns()
+
+
+def _monotonic() -> float:
+    loop = _virtual_loop()
+    return loop.monotonic() if loop else _real_monotonic()
+
+
+def _monotonic_ns() -> int:
+    loop = _virtual_loop()
+    return int(loop.monotonic() * 1_000_000_000) if loop else _real_monotonic_ns()
+
+
+_patch_lock = threading.Lock()
+_patch_count = 0
+
+
+@contextmanager
+def patch_time():
+    """Makes `time.time()`, `time.time_ns()`, `time.monotonic()` and
+    `time.monotonic_ns()` return the virtual time when they are called from a
+    `VirtualTimeEventLoop`. Calls from anywhere else (other threads or event
+    loops) still get the real time. This is needed for code that measures time
+    itself, like `SystemClock`, metrics or the context aggregators.
+
+    """
+    global _patch_count
+    with _patch_lock:
+        if _patch_count == 0:
+            time.time = _time
+            time.time_ns = _time_ns
+            time.monotonic = _monotonic
+            time.monotonic_ns = _monotonic_ns
+        _patch_count += 1
+    try:
+        yield
+    finally:
+        with _patch_lock:
+            _patch_count -= 1
+            if _patch_count == 0:
+                time.time = _real_time
+                time.time_ns = _real_time_ns
+                time.monotonic = _real_monotonic
+                time.monotonic_ns = _real_monotonic_ns
+
+
+def run_with_virtual_time(main: Coroutine[Any, Any, T], *, patch: bool = True) -> T:
+    """Same as `asyncio.run()` but with a `VirtualTimeEventLoop`. If `patch`
+    is True, `time` functions also return the virtual time (see
+    `patch_time()`).
+
+    """
+    loop = VirtualTimeEventLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        if patch:
+            with patch_time():
+                return loop.run_until_complete(_run_main(main))
+        return loop.run_until_complete(_run_main(main))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+async def _run_main(main: Coroutine[Any, Any, T]) -> T:
+    try:
+        return await main
+    finally:
+        # Same cleanup `asyncio.run()` does.
+        loop = asyncio.get_running_loop()
+        tasks = [t for t in asyncio.all_tasks(loop) if t is not asyncio.current_task()]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await loop.shutdown_asyncgens()
+        await loop.shutdown_default_executor()
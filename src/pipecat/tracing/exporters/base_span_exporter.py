@@ -0,0 +1,39 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from pipecat.tracing.span import Span
+
+
+class BaseSpanExporter(ABC):
+    """This is the base class for span exporters. A `Tracer` calls the exporter
+    every time a span starts and ends, so exporters can forward spans to a
+    tracing backend, keep them in memory or write them to a file.
+
+    Exporters are called from the event loop, so they should not block. If
+    exporting is expensive, buffer spans and write them in `shutdown()` or from
+    a separate thread.
+
+    """
+
+    def on_span_start(self, span: Span):
+        """Called when a span starts. Exporters that need to know about parent
+        spans before their children finish (e.g. OpenTelemetry) can override
+        this.
+
+        """
+        pass
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]):
+        """Called with spans that have finished."""
+        pass
+
+    def shutdown(self):
+        """Called when the tracer is stopped. Pending spans should be flushed."""
+        pass
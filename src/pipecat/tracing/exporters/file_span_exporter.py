@@ -0,0 +1,45 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import json
+from typing import List, Sequence
+
+from loguru import logger
+
+from pipecat.tracing.exporters.base_span_exporter import BaseSpanExporter
+from pipecat.tracing.span import Span
+
+
+class FileSpanExporter(BaseSpanExporter):
+    """Writes finished spans to a file, one JSON object per line (see
+    `Span.to_dict()`). Spans are buffered and written every `buffer_size`
+    spans and when the tracer is stopped.
+
+    """
+
+    def __init__(self, file_name: str, *, buffer_size: int = 64):
+        self._file_name = file_name
+        self._buffer_size = buffer_size
+        self._buffer: List[Span] = []
+
+    def export(self, spans: Sequence[Span]):
+        self._buffer.extend(spans)
+        if len(self._buffer) >= self._buffer_size:
+            self._flush()
+
+    def shutdown(self):
+        self._flush()
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        try:
+            with open(self._file_name, "a") as f:
+                for span in self._buffer:
+                    f.write(json.dumps(span.to_dict(), default=str) + "\n")
+        except Exception as e:
+            logger.error(f"Unable to write spans to {self._file_name}: {e}")
+        self._buffer = []
@@ -0,0 +1,30 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from typing import List, Sequence
+
+from pipecat.tracing.exporters.base_span_exporter import BaseSpanExporter
+from pipecat.tracing.span import Span
+
+
+class InMemorySpanExporter(BaseSpanExporter):
+    """Keeps finished spans in memory. Useful for tests and for inspecting
+    traces offline.
+
+    """
+
+    def __init__(self):
+        self._spans: List[Span] = []
+
+    @property
+    def spans(self) -> List[Span]:
+        return self._spans
+
+    def export(self, spans: Sequence[Span]):
+        self._spans.extend(spans)
+
+    def clear(self):
+        self._spans = []
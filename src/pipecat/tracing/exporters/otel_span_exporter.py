@@ -0,0 +1,71 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from typing import Any, Dict, Optional, Sequence
+
+from loguru import logger
+
+from pipecat.tracing.exporters.base_span_exporter import BaseSpanExporter
+from pipecat.tracing.span import Span, SpanStatus
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ModuleNotFoundError as e:
+    logger.error(f"Exception: {e}")
+    logger.error(
+        "In order to use the OpenTelemetry exporter, you need to `pip install pipecat-ai[tracing]`."
+    )
+    raise Exception(f"Missing module: {e}")
+
+
+def _otel_attribute(value: Any):
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+class OpenTelemetrySpanExporter(BaseSpanExporter):
+    """Forwards Pipecat spans to an OpenTelemetry tracer, so they can be
+    exported with any OpenTelemetry exporter (OTLP, Jaeger, console...). The
+    OpenTelemetry tracer provider needs to be configured by the application.
+
+    OpenTelemetry generates its own span ids, so spans are created when they
+    start (to be able to parent children) and ended when they finish.
+
+    """
+
+    def __init__(self, *, tracer: Optional["trace.Tracer"] = None):
+        self._tracer = tracer or trace.get_tracer("pipecat")
+        self._otel_spans: Dict[str, "trace.Span"] = {}
+
+    def on_span_start(self, span: Span):
+        context = None
+        if span.parent and span.parent.span_id in self._otel_spans:
+            context = trace.set_span_in_context(self._otel_spans[span.parent.span_id])
+        self._otel_spans[span.context.span_id] = self._tracer.start_span(
+            span.name, context=context, start_time=span.start_time
+        )
+
+    def export(self, spans: Sequence[Span]):
+        for span in spans:
+            otel_span = self._otel_spans.pop(span.context.span_id, None)
+            if not otel_span:
+                continue
+            for key, value in span.attributes.items():
+                otel_span.set_attribute(key, _otel_attribute(value))
+            otel_span.set_attribute("pipecat.frame_ids", [str(f) for f in span.links])
+            if span.status == SpanStatus.ERROR:
+                otel_span.set_status(Status(StatusCode.ERROR, span.status_message))
+            elif span.status == SpanStatus.OK:
+                otel_span.set_status(Status(StatusCode.OK))
+            otel_span.end(end_time=span.end_time)
+
+    def shutdown(self):
+        # End any span that didn't finish so the backend gets them.
+        for otel_span in self._otel_spans.values():
+            otel_span.end()
+        self._otel_spans = {}
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import os
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+def generate_trace_id() -> str:
+    """Generates a random 128-bit trace id (OpenTelemetry hex format)."""
+    return os.urandom(16).hex()
+
+
+def generate_span_id() -> str:
+    """Generates a random 64-bit span id (OpenTelemetry hex format)."""
+    return os.urandom(8).hex()
+
+
+class SpanStatus(str, Enum):
+    """Status of a finished span. Values match OpenTelemetry status codes."""
+
+    UNSET = "UNSET"
+    OK = "OK"
+    ERROR = "ERROR"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """Identifies a span inside a trace. This is what travels on frames (see
+    `Frame.trace_context`) so spans created by different processors, even in
+    different `ParallelPipeline` branches, nest under the right parent.
+
+    """
+
+    trace_id: str
+    span_id: str
+
+
+@dataclass
+class Span:
+    """A timed operation inside a trace.
+
+    Times are in nanoseconds since the epoch. Links are the ids of the frames
+    that triggered the span (e.g. the context frame that started an LLM
+    request), so spans can be correlated with frame logs and flight recorder
+    dumps.
+
+    """
+
+    name: str
+    context: SpanContext
+    parent: Optional[SpanContext] = None
+    start_time: int = field(default_factory=time.time_ns)
+    end_time: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    links: List[int] = field(default_factory=list)
+    status: SpanStatus = SpanStatus.UNSET
+    status_message: Optional[str] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Returns the span duration in seconds (None if the span has not ended)."""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1_000_000_000
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_status(self, status: SpanStatus, message: Optional[str] = None):
+        self.status = status
+        self.status_message = message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns an OTLP-like JSON representation of this span."""
+        return {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "parentSpanId": self.parent.span_id if self.parent else None,
+            "name": self.name,
+            "startTimeUnixNano": self.start_time,
+            "endTimeUnixNano": self.end_time,
+            "attributes": self.attributes,
+            "links": [{"frame.id": frame_id} for frame_id in self.links],
+            "status": {"code": self.status.value, "message": self.status_message},
+        }
+
+    def __str__(self):
+        return f"{self.name}({self.context.span_id})"
@@ -0,0 +1,200 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    Frame,
+    UserStartedSpeakingFrame,
+)
+from pipecat.tracing.exporters.base_span_exporter import BaseSpanExporter
+from pipecat.tracing.span import (
+    Span,
+    SpanContext,
+    SpanStatus,
+    generate_span_id,
+    generate_trace_id,
+)
+
+
+class Tracer:
+    """Creates spans for a pipeline session and hands them to an exporter.
+
+    A tracer is given to a `PipelineTask` (see `PipelineParams.tracer`) and is
+    distributed to all the processors with the `StartFrame`. The task starts a
+    root "session" span and the tracer keeps track of conversation turns: a
+    turn starts when the user starts speaking and finishes when the bot stops
+    speaking after having replied.
+
+    Processors create their own spans (e.g. LLM, TTS, STT requests or function
+    calls) with `FrameProcessor.start_span()`. Every frame pushed while tracing
+    is enabled gets a `trace_context` (if it didn't have one already) so spans
+    created further down the pipeline nest under the span that produced the
+    frame.
+
+    Args:
+        exporter: Where finished spans are sent.
+        attributes: Attributes added to the session span.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        exporter: BaseSpanExporter,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self._exporter = exporter
+        self._attributes = attributes or {}
+
+        self._trace_id = generate_trace_id()
+        self._session_span: Optional[Span] = None
+
+        self._turn_span: Optional[Span] = None
+        self._turn_frame_id: Optional[int] = None
+        self._turn_count = 0
+        self._bot_spoke_in_turn = False
+
+    @property
+    def trace_id(self) -> str:
+        return self._trace_id
+
+    @property
+    def session_span(self) -> Optional[Span]:
+        return self._session_span
+
+    @property
+    def turn_span(self) -> Optional[Span]:
+        return self._turn_span
+
+    def current_context(self) -> Optional[SpanContext]:
+        """Returns the context of the current turn or, if there's no turn, the
+        context of the session.
+
+        """
+        span = self._turn_span or self._session_span
+        return span.context if span else None
+
+    def start(self, **attributes):
+        """Starts the session span. Called by the pipeline task."""
+        if self._session_span:
+            return
+        self._session_span = self.start_span(
+            "session", attributes={**self._attributes, **attributes}
+        )
+
+    def stop(self):
+        """Finishes the current turn and the session span and shuts down the
+        exporter. Called by the pipeline task.
+
+        """
+        self._end_turn()
+        if self._session_span:
+            self.end_span(self._session_span)
+            self._session_span = None
+        try:
+            self._exporter.shutdown()
+        except Exception as e:
+            logger.exception(f"{self}: error shutting down span exporter: {e}")
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        parent: Optional[SpanContext] = None,
+        links: Optional[Sequence[int]] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Span:
+        """Starts a new span. If no parent is given the span becomes a root span
+        of this tracer's trace.
+
+        """
+        trace_id = parent.trace_id if parent else self._trace_id
+        span = Span(
+            name=name,
+            context=SpanContext(trace_id=trace_id, span_id=generate_span_id()),
+            parent=parent,
+            links=list(links or []),
+            attributes=dict(attributes or {}),
+        )
+        try:
+            self._exporter.on_span_start(span)
+        except Exception as e:
+            logger.exception(f"{self}: error starting span {span}: {e}")
+        return span
+
+    def end_span(
+        self,
+        span: Span,
+        *,
+        error: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        """Finishes the given span and exports it. Ending a span twice has no
+        effect.
+
+        """
+        if span.end_time is not None:
+            return
+        span.end_time = time.time_ns()
+        if attributes:
+            span.attributes.update(attributes)
+        if error:
+            span.set_status(SpanStatus.ERROR, error)
+        elif span.status == SpanStatus.UNSET:
+            span.set_status(SpanStatus.OK)
+        try:
+            self._exporter.export([span])
+        except Exception as e:
+            logger.exception(f"{self}: error exporting span {span}: {e}")
+
+    def on_push_frame(self, frame: Frame, span_context: Optional[SpanContext] = None):
+        """Called by processors every time they push a frame (only if tracing is
+        enabled). It updates turns and sets the frame trace context, if the
+        frame doesn't have one, to the given span context or to the current
+        turn.
+
+        """
+        if isinstance(frame, UserStartedSpeakingFrame):
+            self._start_turn(frame)
+        elif isinstance(frame, BotStartedSpeakingFrame):
+            self._bot_spoke_in_turn = self._turn_span is not None
+        elif isinstance(frame, BotStoppedSpeakingFrame):
+            if self._bot_spoke_in_turn:
+                self._end_turn()
+
+        if frame.trace_context is None:
+            frame.trace_context = span_context or self.current_context()
+
+    def _start_turn(self, frame: Frame):
+        # The same frame is pushed by multiple processors.
+        if frame.id == self._turn_frame_id:
+            return
+        # A previous turn that didn't finish was interrupted by the user.
+        self._end_turn(interrupted=True)
+        self._turn_count += 1
+        self._turn_frame_id = frame.id
+        self._bot_spoke_in_turn = False
+        self._turn_span = self.start_span(
+            "turn",
+            parent=self._session_span.context if self._session_span else None,
+            links=[frame.id],
+            attributes={"turn.number": self._turn_count},
+        )
+
+    def _end_turn(self, interrupted: bool = False):
+        if self._turn_span:
+            self.end_span(self._turn_span, attributes={"turn.interrupted": interrupted})
+            self._turn_span = None
+        self._bot_spoke_in_turn = False
+
+    def __str__(self):
+        return f"{self.__class__.__name__}({self._trace_id})"
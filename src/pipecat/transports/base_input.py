@@ -30,6 +30,7 @@ from pipecat.frames.frames import (
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.transports.base_transport import TransportParams
+from pipecat.utils import log
 
 
 class BaseInputTransport(FrameProcessor):
@@ -174,11 +175,13 @@ class BaseInputTransport(FrameProcessor):
     async def _vad_analyze(self, audio_frame: InputAudioRawFrame) -> VADState:
         state = VADState.QUIET
         if self.vad_analyzer:
-            logger.trace(f"{self}: analyzing VAD on {audio_frame}")
+            log.trace("{processor}: analyzing VAD on {frame}", processor=self, frame=audio_frame)
             state = await self.get_event_loop().run_in_executor(
                 self._executor, self.vad_analyzer.analyze_audio, audio_frame.audio
             )
-            logger.trace(f"{self}: done analyzing VAD on {audio_frame}")
+            log.trace(
+                "{processor}: done analyzing VAD on {frame}", processor=self, frame=audio_frame
+            )
         return state
 
     async def _handle_vad(self, audio_frame: InputAudioRawFrame, vad_state: VADState):
@@ -207,9 +210,14 @@ class BaseInputTransport(FrameProcessor):
 
             audio_passthrough = True
 
-            # If an audio filter is available, run it before VAD.
+            # If an audio filter is available, run it before VAD. Filters might
+            # keep audio until they have a complete frame, and then there's
+            # nothing to analyze or push.
             if self._params.audio_in_filter:
                 frame.audio = await self._params.audio_in_filter.filter(frame.audio)
+                if not frame.audio:
+                    self._audio_in_queue.task_done()
+                    continue
 
             # Check VAD and push event if necessary. We just care about
             # changes from QUIET to SPEAKING and vice versa.
@@ -8,12 +8,13 @@ import asyncio
 import itertools
 import sys
 import time
-from typing import AsyncGenerator, List
+from typing import AsyncGenerator, List, Optional
 
 from loguru import logger
 from PIL import Image
 
-from pipecat.audio.utils import create_default_resampler
+from pipecat.audio.playout import AudioPlayout
+from pipecat.audio.utils import create_default_resampler, create_stream_resampler
 from pipecat.frames.frames import (
     BotSpeakingFrame,
     BotStartedSpeakingFrame,
@@ -32,6 +33,7 @@ from pipecat.frames.frames import (
     TransportMessageFrame,
     TransportMessageUrgentFrame,
     TTSAudioRawFrame,
+    TTSStoppedFrame,
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.transports.base_transport import TransportParams
@@ -59,13 +61,22 @@ class BaseOutputTransport(FrameProcessor):
         # framerate.
         self._camera_images = None
 
-        # Output sample rate. It will be initialized on StartFrame.
+        # Output sample rate. It will be initialized on StartFrame. TTS audio
+        # is resampled as a stream, so the stream resampler needs to be
+        # flushed at the end of the bot audio. Any other audio (e.g. a sound)
+        # is resampled frame by frame, so nothing is held back.
         self._sample_rate = 0
+        self._stream_resampler = create_stream_resampler()
         self._resampler = create_default_resampler()
+        # Class of the audio frames being buffered, used for the audio released
+        # when flushing.
+        self._audio_cls: Optional[type] = None
 
-        # Chunk size that will be written. It will be computed on StartFrame
+        # Chunk size that will be written. Audio is split into chunks (and
+        # paced, if `audio_out_playout_clock` is enabled) by the playout engine.
+        # Both are initialized on StartFrame.
         self._audio_chunk_size = 0
-        self._audio_buffer = bytearray()
+        self._playout: Optional[AudioPlayout] = None
 
         self._stopped_event = asyncio.Event()
 
@@ -79,10 +90,16 @@ class BaseOutputTransport(FrameProcessor):
     async def start(self, frame: StartFrame):
         self._sample_rate = self._params.audio_out_sample_rate or frame.audio_out_sample_rate
 
-        # We will write 20ms audio at a time. If we receive long audio frames we
-        # will chunk them. This will help with interruption handling.
-        audio_bytes_10ms = int(self._sample_rate / 100) * self._params.audio_out_channels * 2
-        self._audio_chunk_size = audio_bytes_10ms * 2
+        # We will write 20ms audio at a time (by default). If we receive long
+        # audio frames we will chunk them. This will help with interruption
+        # handling.
+        self._playout = AudioPlayout(
+            sample_rate=self._sample_rate,
+            num_channels=self._params.audio_out_channels,
+            tick_secs=self._params.audio_out_10ms_chunks / 100,
+            paced=self._params.audio_out_playout_clock,
+        )
+        self._audio_chunk_size = self._playout.chunk_size
 
         # Start audio mixer.
         if self._params.audio_out_mixer:
@@ -91,6 +108,8 @@ class BaseOutputTransport(FrameProcessor):
         self._create_sink_tasks()
 
     async def stop(self, frame: EndFrame):
+        await self._flush_audio()
+
         # Let the sink tasks process the queue until they reach this EndFrame.
         await self._sink_clock_queue.put((sys.maxsize, frame.id, frame))
         await self._sink_queue.put(frame)
@@ -173,6 +192,8 @@ class BaseOutputTransport(FrameProcessor):
         elif direction == FrameDirection.UPSTREAM:
             await self.push_frame(frame, direction)
         else:
+            if isinstance(frame, TTSStoppedFrame):
+                await self._flush_audio()
             await self._sink_queue.put(frame)
 
     async def _handle_interruptions(self, frame: Frame):
@@ -180,6 +201,11 @@ class BaseOutputTransport(FrameProcessor):
             return
 
         if isinstance(frame, StartInterruptionFrame):
+            # Discard the audio that is still being resampled or chunked.
+            self._stream_resampler.clear()
+            self._audio_cls = None
+            if self._playout:
+                self._playout.clear()
             # Cancel sink and camera tasks.
             await self._cancel_sink_tasks()
             await self._cancel_camera_task()
@@ -193,22 +219,43 @@ class BaseOutputTransport(FrameProcessor):
         if not self._params.audio_out_enabled:
             return
 
+        # Don't mix the audio of different kinds of frames (e.g. bot audio and
+        # a sound) in the same chunk.
+        cls = type(frame)
+        if self._audio_cls and cls is not self._audio_cls:
+            await self._flush_audio()
+        self._audio_cls = cls
+
         # We might need to resample if incoming audio doesn't match the
         # transport sample rate.
-        resampled = await self._resampler.resample(
-            frame.audio, frame.sample_rate, self._sample_rate
-        )
+        if isinstance(frame, TTSAudioRawFrame):
+            resampler = self._stream_resampler
+        else:
+            resampler = self._resampler
+        resampled = await resampler.resample(frame.audio, frame.sample_rate, self._sample_rate)
 
-        cls = type(frame)
-        self._audio_buffer.extend(resampled)
-        while len(self._audio_buffer) >= self._audio_chunk_size:
-            chunk = cls(
-                bytes(self._audio_buffer[: self._audio_chunk_size]),
-                sample_rate=self._sample_rate,
-                num_channels=frame.num_channels,
+        await self._buffer_audio(resampled, cls, frame.num_channels)
+
+    async def _flush_audio(self):
+        if not self._playout or not self._audio_cls:
+            return
+        cls = self._audio_cls
+        self._audio_cls = None
+        # The stream resampler might still be holding the end of the bot audio.
+        audio = await self._stream_resampler.flush()
+        if audio:
+            await self._buffer_audio(audio, cls, self._params.audio_out_channels)
+        # The last chunk is padded with silence, so we always write full chunks.
+        await self._queue_audio_chunks(self._playout.flush(), cls, self._params.audio_out_channels)
+
+    async def _buffer_audio(self, audio: bytes, cls: type, num_channels: int):
+        await self._queue_audio_chunks(self._playout.write(audio), cls, num_channels)
+
+    async def _queue_audio_chunks(self, chunks: List[bytes], cls: type, num_channels: int):
+        for chunk in chunks:
+            await self._sink_queue.put(
+                cls(chunk, sample_rate=self._sample_rate, num_channels=num_channels)
             )
-            await self._sink_queue.put(chunk)
-            self._audio_buffer = self._audio_buffer[self._audio_chunk_size :]
 
     async def _handle_image(self, frame: OutputImageRawFrame | SpriteFrame):
         if not self._params.camera_out_enabled:
@@ -232,6 +279,25 @@ class BaseOutputTransport(FrameProcessor):
             await self.push_frame(BotStoppedSpeakingFrame())
             await self.push_frame(BotStoppedSpeakingFrame(), FrameDirection.UPSTREAM)
             self._bot_speaking = False
+            if self._playout:
+                self._playout.end_of_stream()
+                await self._report_playout_metrics()
+
+    async def _report_playout_metrics(self):
+        stats = self._playout.stats
+        self._playout.reset_stats()
+        if not self._params.audio_out_playout_clock or not self.metrics_enabled:
+            return
+        if stats.chunks == 0:
+            return
+        frame = await self._metrics.playout_metrics(
+            jitter=stats.mean_jitter,
+            max_jitter=stats.max_jitter,
+            underruns=stats.underruns,
+            overruns=stats.overruns,
+            audio_duration=stats.chunks * self._playout.tick_secs,
+        )
+        await self.push_frame(frame)
 
     #
     # Sink tasks
@@ -293,13 +359,25 @@ class BaseOutputTransport(FrameProcessor):
 
     def _next_frame(self) -> AsyncGenerator[Frame, None]:
         async def without_mixer(vad_stop_secs: float) -> AsyncGenerator[Frame, None]:
-            while True:
-                try:
-                    frame = await asyncio.wait_for(self._sink_queue.get(), timeout=vad_stop_secs)
-                    yield frame
-                except asyncio.TimeoutError:
-                    # Notify the bot stopped speaking upstream if necessary.
-                    await self._bot_stopped_speaking()
+            # Before Python 3.12, `asyncio.wait_for()` swallows the
+            # cancellation of this task (e.g. on interruptions) if a frame
+            # arrives at the same time, so we use `asyncio.wait()` instead.
+            get_task = None
+            try:
+                while True:
+                    if not get_task:
+                        get_task = asyncio.ensure_future(self._sink_queue.get())
+                    (done, _) = await asyncio.wait({get_task}, timeout=vad_stop_secs)
+                    if done:
+                        frame = get_task.result()
+                        get_task = None
+                        yield frame
+                    else:
+                        # Notify the bot stopped speaking upstream if necessary.
+                        await self._bot_stopped_speaking()
+            finally:
+                if get_task:
+                    get_task.cancel()
 
         async def with_mixer(vad_stop_secs: float) -> AsyncGenerator[Frame, None]:
             last_frame_time = 0
@@ -331,6 +409,12 @@ class BaseOutputTransport(FrameProcessor):
 
     async def _sink_task_handler(self):
         async for frame in self._next_frame():
+            # Wait until the audio is due, if we have a playout clock.
+            if isinstance(frame, OutputAudioRawFrame):
+                await self._playout.tick()
+            elif isinstance(frame, TTSStoppedFrame):
+                self._playout.end_of_stream()
+
             # Notify the bot started speaking upstream if necessary and that
             # it's actually speaking.
             if isinstance(frame, TTSAudioRawFrame):
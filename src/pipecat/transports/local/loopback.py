@@ -0,0 +1,278 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from pipecat.audio.utils import create_default_resampler
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    Frame,
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    StartFrame,
+    TransportMessageFrame,
+    TransportMessageUrgentFrame,
+)
+from pipecat.transports.base_input import BaseInputTransport
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import BaseTransport, TransportParams
+
+
+class LoopbackNetworkParams(BaseModel):
+    """Simulated network conditions for the frames sent by a loopback
+    transport.
+
+    Attributes:
+        latency: One-way delay in seconds.
+        jitter: Maximum random delay (uniformly distributed) added to the
+            latency. Frames are never reordered, as if the receiver had a
+            jitter buffer.
+        packet_loss: Probability of an audio packet being lost. Messages are
+            always delivered.
+        seed: Seed of the random generator used for jitter and packet loss.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    packet_loss: float = Field(default=0.0, ge=0.0, le=1.0)
+    seed: Optional[int] = None
+
+
+class LoopbackParams(TransportParams):
+    # Audio is written as fast as we get it, so we pace it with the playout
+    # clock to emulate an audio device playing it in real time.
+    audio_out_playout_clock: bool = True
+    network: LoopbackNetworkParams = LoopbackNetworkParams()
+
+
+@dataclass
+class LoopbackLinkStats:
+    """Counters of the packets sent through a loopback link. Packets sent while
+    the other side is not connected are not counted.
+
+    """
+
+    sent: int = 0
+    lost: int = 0
+    delivered: int = 0
+
+
+class LoopbackLink:
+    """One direction of the in-memory network between two loopback
+    transports. The sending side calls `send()` and the receiving input
+    transport gets the packets from `receive()` at their delivery time.
+
+    """
+
+    def __init__(self, params: LoopbackNetworkParams):
+        self._params = params
+        self._rng = random.Random(params.seed)
+        self._queue = asyncio.Queue()
+        self._last_delivery_time = 0.0
+        self._connected = False
+        self._stats = LoopbackLinkStats()
+
+    @property
+    def stats(self) -> LoopbackLinkStats:
+        return self._stats
+
+    def connect(self):
+        self._connected = True
+
+    def disconnect(self):
+        self._connected = False
+        # Packets in flight are lost.
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    async def send(self, frame: Frame):
+        if not self._connected:
+            return
+
+        self._stats.sent += 1
+
+        if isinstance(frame, OutputAudioRawFrame) and self._rng.random() < self._params.packet_loss:
+            self._stats.lost += 1
+            return
+
+        delay = self._params.latency
+        if self._params.jitter > 0:
+            delay += self._rng.uniform(0, self._params.jitter)
+        delivery_time = max(time.monotonic() + delay, self._last_delivery_time)
+        self._last_delivery_time = delivery_time
+        await self._queue.put((delivery_time, frame))
+
+    async def receive(self) -> Frame:
+        (delivery_time, frame) = await self._queue.get()
+        await asyncio.sleep(max(0.0, delivery_time - time.monotonic()))
+        self._stats.delivered += 1
+        return frame
+
+
+class LoopbackInputTransport(BaseInputTransport):
+    _params: LoopbackParams
+
+    def __init__(self, transport: "LoopbackTransport", params: LoopbackParams, **kwargs):
+        super().__init__(params, **kwargs)
+        self._transport = transport
+        self._resampler = create_default_resampler()
+        self._receive_task = None
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        self._receive_task = self.create_task(self._receive_task_handler())
+        await self._transport._connect()
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        await self._transport._disconnect()
+        await self._cancel_receive_task()
+
+    async def cancel(self, frame: CancelFrame):
+        await super().cancel(frame)
+        await self._transport._disconnect()
+        await self._cancel_receive_task()
+
+    async def _cancel_receive_task(self):
+        if self._receive_task:
+            await self.cancel_task(self._receive_task)
+            self._receive_task = None
+
+    async def _receive_task_handler(self):
+        link = self._transport._in_link
+        while True:
+            frame = await link.receive()
+            if isinstance(frame, OutputAudioRawFrame):
+                audio = await self._resampler.resample(
+                    frame.audio, frame.sample_rate, self.sample_rate
+                )
+                await self.push_audio_frame(
+                    InputAudioRawFrame(
+                        audio=audio,
+                        sample_rate=self.sample_rate,
+                        num_channels=frame.num_channels,
+                    )
+                )
+            else:
+                await self._transport._call_event_handler("on_message", frame.message)
+
+
+class LoopbackOutputTransport(BaseOutputTransport):
+    _params: LoopbackParams
+
+    def __init__(self, transport: "LoopbackTransport", params: LoopbackParams, **kwargs):
+        super().__init__(params, **kwargs)
+        self._transport = transport
+
+    async def send_message(self, frame: TransportMessageFrame | TransportMessageUrgentFrame):
+        await self._transport._out_link.send(frame)
+
+    async def write_raw_audio_frames(self, frames: bytes):
+        frame = OutputAudioRawFrame(
+            audio=frames,
+            sample_rate=self.sample_rate,
+            num_channels=self._params.audio_out_channels,
+        )
+        await self._transport._out_link.send(frame)
+
+
+class LoopbackTransport(BaseTransport):
+    """One end of an in-memory transport pair (see
+    `create_loopback_transports()`). Audio written by the output of one end is
+    received by the input of the other end, in real time and with the network
+    conditions given in `LoopbackParams.network` of the sending end. Messages
+    (`TransportMessageFrame`) are received with the `on_message` event.
+
+    The `on_peer_connected` and `on_peer_disconnected` events are triggered
+    when both ends are started (i.e. their input transports) and when the other
+    end stops.
+
+    """
+
+    def __init__(
+        self,
+        params: LoopbackParams,
+        in_link: LoopbackLink,
+        out_link: LoopbackLink,
+        input_name: Optional[str] = None,
+        output_name: Optional[str] = None,
+    ):
+        super().__init__(input_name=input_name, output_name=output_name)
+        self._params = params
+        self._in_link = in_link
+        self._out_link = out_link
+        self._peer: Optional["LoopbackTransport"] = None
+        self._connected = False
+
+        self._input: Optional[LoopbackInputTransport] = None
+        self._output: Optional[LoopbackOutputTransport] = None
+
+        # Register supported handlers. The user will only be able to register
+        # these handlers.
+        self._register_event_handler("on_peer_connected")
+        self._register_event_handler("on_peer_disconnected")
+        self._register_event_handler("on_message")
+
+    @property
+    def stats(self) -> LoopbackLinkStats:
+        """Stats of the packets sent by this end."""
+        return self._out_link.stats
+
+    def input(self) -> LoopbackInputTransport:
+        if not self._input:
+            self._input = LoopbackInputTransport(self, self._params, name=self._input_name)
+        return self._input
+
+    def output(self) -> LoopbackOutputTransport:
+        if not self._output:
+            self._output = LoopbackOutputTransport(self, self._params, name=self._output_name)
+        return self._output
+
+    async def _connect(self):
+        self._connected = True
+        if self._peer and self._peer._connected:
+            logger.debug(f"{self} connected to {self._peer}")
+            self._in_link.connect()
+            self._out_link.connect()
+            await self._call_event_handler("on_peer_connected", self._peer)
+            await self._peer._call_event_handler("on_peer_connected", self)
+
+    async def _disconnect(self):
+        if not self._connected:
+            return
+        self._connected = False
+        if self._peer and self._peer._connected:
+            logger.debug(f"{self} disconnected from {self._peer}")
+            self._in_link.disconnect()
+            self._out_link.disconnect()
+            await self._peer._call_event_handler("on_peer_disconnected", self)
+
+
+def create_loopback_transports(
+    bot_params: LoopbackParams = LoopbackParams(),
+    client_params: LoopbackParams = LoopbackParams(),
+) -> Tuple[LoopbackTransport, LoopbackTransport]:
+    """Creates a pair of connected loopback transports, one to be used by the
+    bot and another one by a simulated client, in the same process. The
+    network conditions of each direction are given by the params of the
+    sending end.
+
+    """
+    to_client = LoopbackLink(bot_params.network)
+    to_bot = LoopbackLink(client_params.network)
+    bot = LoopbackTransport(bot_params, in_link=to_bot, out_link=to_client)
+    client = LoopbackTransport(client_params, in_link=to_client, out_link=to_bot)
+    bot._peer = client
+    client._peer = bot
+    return (bot, client)
@@ -103,7 +103,7 @@ class WebRTCVADAnalyzer(VADAnalyzer):
     def voice_confidence(self, buffer) -> float:
         confidence = 0
         if len(buffer) > 0:
-            confidence = self._webrtc_vad.analyze_frames(buffer)
+            confidence = self._webrtc_vad.analyze_frames(bytes(buffer))
         return confidence
 
 
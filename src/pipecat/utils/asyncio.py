@@ -9,6 +9,16 @@ from typing import Coroutine, Optional, Set
 
 from loguru import logger
 
+from pipecat.utils import log
+
+# How often to check whether a cancelled task swallowed the cancellation.
+CANCEL_CHECK_SECS = 0.1
+
+# How long to wait before cancelling again a task that is still running after
+# being cancelled, when we can't tell whether it swallowed the cancellation or
+# it's still cleaning up (e.g. closing a websocket).
+CANCEL_GRACE_SECS = 2.0
+
 
 class TaskManager:
     def __init__(self) -> None:
@@ -42,7 +52,7 @@ class TaskManager:
             try:
                 await coroutine
             except asyncio.CancelledError:
-                logger.trace(f"{name}: task cancelled")
+                log.trace("{task}: task cancelled", task=name)
                 # Re-raise the exception to ensure the task is cancelled.
                 raise
             except Exception as e:
@@ -54,7 +64,7 @@ class TaskManager:
         task = self._loop.create_task(run_coroutine())
         task.set_name(name)
         self._add_task(task)
-        logger.trace(f"{name}: task created")
+        log.trace("{task}: task created", task=name)
         return task
 
     async def wait_for_task(self, task: asyncio.Task, timeout: Optional[float] = None):
@@ -79,7 +89,7 @@ class TaskManager:
         except asyncio.TimeoutError:
             logger.warning(f"{name}: timed out waiting for task to finish")
         except asyncio.CancelledError:
-            logger.trace(f"{name}: unexpected task cancellation (maybe Ctrl-C?)")
+            log.trace("{task}: unexpected task cancellation (maybe Ctrl-C?)", task=name)
         except Exception as e:
             logger.exception(f"{name}: unexpected exception while stopping task: {e}")
         finally:
@@ -100,10 +110,26 @@ class TaskManager:
         name = task.get_name()
         task.cancel()
         try:
-            if timeout:
-                await asyncio.wait_for(task, timeout=timeout)
-            else:
-                await task
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout if timeout else None
+            cancelled_at = loop.time()
+            while not task.done():
+                wait_time = CANCEL_CHECK_SECS
+                if deadline:
+                    wait_time = min(wait_time, deadline - loop.time())
+                    if wait_time <= 0:
+                        raise asyncio.TimeoutError
+                await asyncio.wait({task}, timeout=wait_time)
+                if not task.done() and (
+                    self._cancellation_swallowed(task)
+                    or loop.time() - cancelled_at >= CANCEL_GRACE_SECS
+                ):
+                    logger.warning(
+                        f"{name}: task still running after being cancelled, cancelling again"
+                    )
+                    task.cancel()
+                    cancelled_at = loop.time()
+            task.result()
         except asyncio.TimeoutError:
             logger.warning(f"{name}: timed out waiting for task to cancel")
         except asyncio.CancelledError:
@@ -114,6 +140,17 @@ class TaskManager:
         finally:
             self._remove_task(task)
 
+    def _cancellation_swallowed(self, task: asyncio.Task) -> bool:
+        """Whether the task is known to have swallowed its cancellation, i.e.
+        it caught `CancelledError` and called `uncancel()` (Python 3.11+). A
+        task might also swallow the cancellation without calling `uncancel()`,
+        e.g. `asyncio.wait_for()` before Python 3.12 if the awaited future
+        completes at the same time the task is cancelled, but then it can't be
+        told apart from a task that is still cleaning up.
+
+        """
+        return hasattr(task, "cancelling") and task.cancelling() == 0
+
     def current_tasks(self) -> Set[asyncio.Task]:
         """Returns the list of currently created/registered tasks."""
         return self._tasks
@@ -126,4 +163,6 @@ class TaskManager:
         try:
             self._tasks.remove(task)
         except KeyError as e:
-            logger.trace(f"{name}: unable to remove task (already removed?): {e}")
+            log.trace(
+                "{task}: unable to remove task (already removed?): {error}", task=name, error=e
+            )
@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Cheap logging helpers for hot paths.
+
+Calls like `logger.trace(f"Pushing {frame} from {src} to {dst}")` format the
+message (including the frame representation) every time, even if the TRACE
+level is disabled. The functions in this module compare the level with the
+minimum level of the loguru handlers first, which is just an integer
+comparison, and only then call loguru. Messages are formatted lazily by loguru
+using the given arguments, and keyword arguments are also added to the record
+`extra` dict as structured fields:
+
+    from pipecat.utils import log
+
+    log.trace("Pushing {frame} from {src} to {dst}", frame=frame, src=self, dst=dst)
+
+Building the arguments still has a small cost. On the hottest paths (e.g.
+for every frame pushed) or for code that needs to do extra work just for
+logging, guard the call with `log.trace_enabled()` or `log.debug_enabled()`:
+
+    if log.trace_enabled():
+        log.trace("Pushing {frame} from {src} to {dst}", frame=frame, src=self, dst=dst)
+
+Loguru doesn't expose the levels of its handlers, so this module keeps track
+of them: when it's imported, it hooks `add()` and `remove()` of loguru's
+logger, which are also used by `logger.configure()`. Applications configure
+loguru as usual:
+
+    logger.remove(0)
+    logger.add(sys.stderr, level="TRACE")
+
+If handlers were added before this module was imported, their levels are not
+known, so every message is given to loguru (which then filters it).
+
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+TRACE_LEVEL = logger.level("TRACE").no
+DEBUG_LEVEL = logger.level("DEBUG").no
+
+# Id of the handlers with unknown levels (added before this module was
+# imported).
+_UNKNOWN_HANDLERS = -1
+
+_Logger = type(logger)
+_logger_add = _Logger.add
+_logger_remove = _Logger.remove
+
+# Level number of every loguru handler.
+_handler_levels: Dict[int, int] = {}
+
+_min_level = 0
+
+
+def _level_no(level: Any) -> int:
+    return level if isinstance(level, int) else logger.level(level).no
+
+
+def _update_min_level():
+    global _min_level
+    _min_level = min(_handler_levels.values(), default=float("inf"))
+
+
+def _add(self, sink, *, level=os.getenv("LOGURU_LEVEL", "DEBUG"), **kwargs):
+    handler_id = _logger_add(self, sink, level=level, **kwargs)
+    _handler_levels[handler_id] = _level_no(level)
+    _update_min_level()
+    return handler_id
+
+
+def _remove(self, handler_id: Optional[int] = None):
+    _logger_remove(self, handler_id)
+    if handler_id is None:
+        _handler_levels.clear()
+    else:
+        _handler_levels.pop(handler_id, None)
+    _update_min_level()
+
+
+def _init_handler_levels():
+    # Handler ids are sequential, so a temporary handler tells us which
+    # handlers might exist: none, only loguru's default one (id 0, at
+    # `LOGURU_LEVEL`) or others we don't know about.
+    probe_id = _logger_add(logger, lambda _: None, level="CRITICAL")
+    _logger_remove(logger, probe_id)
+    autoinit = os.getenv("LOGURU_AUTOINIT", "1").lower() not in ("0", "false", "no", "n", "off")
+    if autoinit and probe_id == 1:
+        _handler_levels[0] = _level_no(os.getenv("LOGURU_LEVEL", "DEBUG"))
+    elif probe_id > int(autoinit):
+        _handler_levels[_UNKNOWN_HANDLERS] = 0
+    _update_min_level()
+
+
+_init_handler_levels()
+_Logger.add = _add
+_Logger.remove = _remove
+
+
+def level_enabled(level: int) -> bool:
+    """Returns whether a message with the given level number would be handled
+    by, at least, one of the loguru handlers.
+
+    """
+    return level >= _min_level
+
+
+def trace_enabled() -> bool:
+    return TRACE_LEVEL >= _min_level
+
+
+def debug_enabled() -> bool:
+    return DEBUG_LEVEL >= _min_level
+
+
+def trace(message: str, *args: Any, **fields: Any):
+    """Logs a lazily formatted TRACE message, only if TRACE is enabled."""
+    if TRACE_LEVEL >= _min_level:
+        logger.opt(depth=1).trace(message, *args, **fields)
+
+
+def debug(message: str, *args: Any, **fields: Any):
+    """Logs a lazily formatted DEBUG message, only if DEBUG is enabled."""
+    if DEBUG_LEVEL >= _min_level:
+        logger.opt(depth=1).debug(message, *args, **fields)
@@ -0,0 +1,159 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import gc
+import os
+import sys
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Optional, Set
+
+
+def deep_sizeof(obj: Any, *, max_depth: int = 8) -> int:
+    """Returns an estimate, in bytes, of the memory retained by the given
+    object, including the objects it references (containers, dataclasses and
+    regular objects). Objects referenced more than once are only counted once.
+
+    This is an estimate: it doesn't follow references from C extension types
+    and it stops at `max_depth` levels.
+
+    >>> deep_sizeof(b"1234") == sys.getsizeof(b"1234")
+    True
+    >>> deep_sizeof([]) < deep_sizeof([b"1234"])
+    True
+    """
+    seen: Set[int] = set()
+
+    def sizeof(o: Any, depth: int) -> int:
+        if id(o) in seen:
+            return 0
+        seen.add(id(o))
+
+        size = sys.getsizeof(o)
+
+        if depth >= max_depth or isinstance(o, (str, bytes, bytearray, memoryview, int, float)):
+            return size
+
+        if isinstance(o, dict):
+            size += sum(sizeof(k, depth + 1) + sizeof(v, depth + 1) for k, v in o.items())
+        elif isinstance(o, (list, tuple, set, frozenset, deque)):
+            size += sum(sizeof(i, depth + 1) for i in o)
+        elif hasattr(o, "__dict__"):
+            size += sizeof(vars(o), depth + 1)
+        elif hasattr(o, "__slots__"):
+            size += sum(sizeof(getattr(o, s), depth + 1) for s in o.__slots__ if hasattr(o, s))
+        return size
+
+    return sizeof(obj, 0)
+
+
+def current_rss() -> int:
+    """Returns the resident set size (RSS) of the current process in bytes.
+    If it's not available (it's only read from `/proc` on Linux) the peak RSS
+    is returned instead, or 0 if that's not available either (e.g. on
+    Windows).
+
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        try:
+            # Unix only.
+            import resource
+        except ModuleNotFoundError:
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS.
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def count_objects(*, min_count: int = 0) -> Dict[str, int]:
+    """Returns the number of objects tracked by the garbage collector for
+    every type (with at least `min_count` objects), indexed by the qualified
+    name of the type. This is slow (it goes through all the objects), so don't
+    call it on a hot path.
+
+    """
+    counts = Counter(type(o) for o in gc.get_objects())
+    return {
+        f"{t.__module__}.{t.__qualname__}": count
+        for t, count in counts.items()
+        if count >= min_count
+    }
+
+
+class GrowthDetector:
+    """Detects values (e.g. memory usage) that keep growing over time.
+
+    Samples are added with `add_sample()` and only the last `window` samples
+    are kept. Once the window is full, values are considered to be growing if
+    they grew more than `tolerance` (relative to the first sample in the
+    window) and most of the consecutive samples (at least `monotonicity`) did
+    not decrease. This distinguishes leaks from values that go up and down
+    (e.g. buffers that are periodically flushed).
+
+    Args:
+        window: Number of samples used to detect growth.
+        tolerance: Allowed relative growth over the window (0.1 is 10%).
+        min_growth: Allowed absolute growth over the window (e.g. bytes).
+        monotonicity: Fraction of non-decreasing consecutive samples needed
+            to consider the values are growing monotonically.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = 10,
+        tolerance: float = 0.1,
+        min_growth: float = 0,
+        monotonicity: float = 0.8,
+    ):
+        if window < 2:
+            raise ValueError("GrowthDetector window needs to be at least 2")
+
+        self._window = window
+        self._tolerance = tolerance
+        self._min_growth = min_growth
+        self._monotonicity = monotonicity
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    @property
+    def samples(self):
+        return list(self._samples)
+
+    @property
+    def growth(self) -> Optional[float]:
+        """Returns the growth over the current window or None if there are not
+        enough samples.
+
+        """
+        if len(self._samples) < 2:
+            return None
+        return self._samples[-1] - self._samples[0]
+
+    def add_sample(self, value: float) -> bool:
+        """Adds a new sample and returns whether the values are growing."""
+        self._samples.append(value)
+        return self.is_growing()
+
+    def is_growing(self) -> bool:
+        if len(self._samples) < self._window:
+            return False
+
+        samples = self._samples
+        growth = samples[-1] - samples[0]
+        if growth <= self._min_growth:
+            return False
+        if growth <= abs(samples[0]) * self._tolerance:
+            return False
+
+        steps = len(samples) - 1
+        non_decreasing = sum(1 for i in range(steps) if samples[i + 1] >= samples[i])
+        return non_decreasing / steps >= self._monotonicity
+
+    def reset(self):
+        self._samples.clear()
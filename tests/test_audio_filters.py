@@ -0,0 +1,152 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import threading
+import unittest
+
+import numpy as np
+
+from pipecat.audio.filters.frame_aligned_filter import FrameAlignedAudioFilter
+from pipecat.audio.filters.spectral_gating_filter import SpectralGatingFilter
+from pipecat.frames.frames import FilterEnableFrame, InputAudioRawFrame, StartFrame
+from pipecat.tests.utils import SleepFrame, run_test
+from pipecat.transports.base_input import BaseInputTransport
+from pipecat.transports.base_transport import TransportParams
+
+
+class HalfGainFilter(FrameAlignedAudioFilter):
+    """Halves the audio in frames of 160 samples."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.frame_shapes = []
+        self.threads = set()
+
+    def frame_length(self) -> int:
+        return 160
+
+    def filter_frames(self, frames: np.ndarray) -> np.ndarray:
+        self.frame_shapes.append(frames.shape)
+        self.threads.add(threading.current_thread())
+        return frames // 2
+
+
+def generate_audio(num_samples: int) -> np.ndarray:
+    return (np.arange(num_samples) % 1000).astype(np.int16)
+
+
+async def filter_chunks(filter: FrameAlignedAudioFilter, audio: np.ndarray, size: int):
+    await filter.start(16000)
+    result = b""
+    for i in range(0, len(audio), size):
+        result += await filter.filter(audio[i : i + size].tobytes())
+    await filter.stop()
+    return np.frombuffer(result, dtype=np.int16)
+
+
+class ChunkInputTransport(BaseInputTransport):
+    """Receives audio in chunks of 100 samples."""
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        audio = generate_audio(1000).tobytes()
+        for i in range(0, len(audio), 200):
+            await self.push_audio_frame(
+                InputAudioRawFrame(audio=audio[i : i + 200], sample_rate=16000, num_channels=1)
+            )
+
+
+def power_db(samples: np.ndarray) -> float:
+    return 10 * np.log10(np.mean(samples.astype(np.float64) ** 2))
+
+
+class TestFrameAlignedAudioFilter(unittest.IsolatedAsyncioTestCase):
+    async def test_framing(self):
+        audio = generate_audio(1000)
+        filter = HalfGainFilter()
+        # Chunks that are not a multiple of the frame length.
+        result = await filter_chunks(filter, audio, 250)
+        assert len(result) == 960
+        assert np.array_equal(result, audio[:960] // 2)
+        assert filter.frame_shapes == [(1, 160), (2, 160), (1, 160), (2, 160)]
+        assert filter.threads == {threading.current_thread()}
+
+    async def test_offload(self):
+        audio = generate_audio(3200)
+        filter = HalfGainFilter(offload=True)
+        result = await filter_chunks(filter, audio, 320)
+        assert np.array_equal(result, audio // 2)
+        # Always the same worker thread.
+        assert len(filter.threads) == 1
+        assert threading.current_thread() not in filter.threads
+
+    async def test_enable(self):
+        filter = HalfGainFilter()
+        await filter.start(16000)
+        audio = generate_audio(100).tobytes()
+        assert await filter.filter(audio) == b""
+
+        await filter.process_frame(FilterEnableFrame(enable=False))
+        assert await filter.filter(audio) is audio
+
+        # Buffered audio is discarded when the filter is disabled.
+        await filter.process_frame(FilterEnableFrame(enable=True))
+        assert await filter.filter(audio) == b""
+        assert len(await filter.filter(audio)) == 320
+        await filter.stop()
+
+    async def test_input_transport(self):
+        transport = ChunkInputTransport(
+            TransportParams(audio_in_enabled=True, audio_in_filter=HalfGainFilter())
+        )
+        (received_down, _) = await run_test(
+            transport,
+            frames_to_send=[SleepFrame()],
+            expected_down_frames=[InputAudioRawFrame] * 6,
+        )
+        # Chunks that don't complete a frame are not pushed.
+        assert [len(f.audio) for f in received_down] == [320] * 6
+
+
+class TestSpectralGatingFilter(unittest.IsolatedAsyncioTestCase):
+    # 3/4 of a 512 samples frame at 16kHz.
+    DELAY = 384
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        t = np.arange(32000) / 16000
+        self.tone = 5000 * np.sin(2 * np.pi * 440 * t)
+        self.noise = rng.normal(0, 500, len(t))
+
+    async def test_reconstruction(self):
+        # Without reduction the filter only delays the audio.
+        audio = (self.tone + self.noise).astype(np.int16)
+        result = await filter_chunks(SpectralGatingFilter(max_reduction_db=0), audio, 320)
+        error = result[self.DELAY :].astype(np.int32) - audio[: len(result) - self.DELAY]
+        assert np.max(np.abs(error)) <= 1
+
+    async def test_chunk_sizes(self):
+        audio = (self.tone + self.noise).astype(np.int16)
+        expected = await filter_chunks(SpectralGatingFilter(), audio, 320)
+        result = await filter_chunks(SpectralGatingFilter(), audio, 173)
+        assert np.array_equal(result, expected[: len(result)])
+
+    async def test_noise_reduction(self):
+        noise = self.noise.astype(np.int16)
+        result = await filter_chunks(SpectralGatingFilter(), noise, 320)
+        # Skip the first half second, used to learn the noise profile.
+        assert power_db(noise[8000:]) - power_db(result[8000:]) > 10
+
+        # A tone that starts after the noise profile is learned goes through.
+        tone = np.concatenate((np.zeros(8000), self.tone[8000:]))
+        result = await filter_chunks(
+            SpectralGatingFilter(), (tone + self.noise).astype(np.int16), 320
+        )
+        tone = tone[8000 : len(result) - self.DELAY]
+        result = result[8000 + self.DELAY :]
+        gain = np.dot(result, tone) / np.dot(tone, tone)
+        assert gain > 0.9
+        assert power_db(self.noise) - power_db(result - gain * tone) > 6
@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import json
+import unittest
+
+import numpy as np
+
+from pipecat.audio.codecs import g711
+from pipecat.audio.codecs.g711 import G711Decoder, G711Encoder
+from pipecat.audio.resamplers.soxr_resampler import SOXRAudioResampler
+from pipecat.audio.utils import alaw_to_pcm, pcm_to_alaw, pcm_to_ulaw, ulaw_to_pcm
+from pipecat.clocks.system_clock import SystemClock
+from pipecat.frames.frames import AudioRawFrame, InputAudioRawFrame, StartFrame
+from pipecat.serializers.twilio import TwilioFrameSerializer
+from pipecat.utils.asyncio import TaskManager
+
+try:
+    import audioop
+except ModuleNotFoundError:
+    # Removed in Python 3.13.
+    audioop = None
+
+ALL_SAMPLES = np.arange(65536, dtype=np.uint16).view(np.int16)
+ALL_CODES = bytes(range(256))
+
+
+def generate_tone(seconds: float, sample_rate: int) -> np.ndarray:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (8000 * np.sin(2 * np.pi * 1000 * t)).astype(np.int16)
+
+
+@unittest.skipIf(audioop is None, "audioop is not available")
+class TestG711Audioop(unittest.IsolatedAsyncioTestCase):
+    def test_encode(self):
+        assert g711.encode(ALL_SAMPLES, "ulaw") == audioop.lin2ulaw(ALL_SAMPLES.tobytes(), 2)
+        assert g711.encode(ALL_SAMPLES, "alaw") == audioop.lin2alaw(ALL_SAMPLES.tobytes(), 2)
+
+    def test_decode(self):
+        assert g711.decode(ALL_CODES, "ulaw").tobytes() == audioop.ulaw2lin(ALL_CODES, 2)
+        assert g711.decode(ALL_CODES, "alaw").tobytes() == audioop.alaw2lin(ALL_CODES, 2)
+
+    def test_codec_without_resampling(self):
+        audio = ALL_SAMPLES.tobytes()
+        assert G711Encoder("ulaw").encode(audio, 8000) == audioop.lin2ulaw(audio, 2)
+        assert G711Decoder("alaw").decode(ALL_CODES, 8000) == audioop.alaw2lin(ALL_CODES, 2)
+
+    async def test_utils(self):
+        audio = ALL_SAMPLES.tobytes()
+        resampler = SOXRAudioResampler()
+        assert await pcm_to_ulaw(audio, 8000, 8000, resampler) == audioop.lin2ulaw(audio, 2)
+        assert await pcm_to_alaw(audio, 8000, 8000, resampler) == audioop.lin2alaw(audio, 2)
+        assert await ulaw_to_pcm(ALL_CODES, 8000, 8000, resampler) == audioop.ulaw2lin(ALL_CODES, 2)
+        assert await alaw_to_pcm(ALL_CODES, 8000, 8000, resampler) == audioop.alaw2lin(ALL_CODES, 2)
+
+
+class TestG711Resampling(unittest.TestCase):
+    def test_encoder_chunks(self):
+        for rate in [16000, 24000]:
+            audio = generate_tone(0.5, rate)
+            expected = G711Encoder("ulaw").encode(audio.tobytes(), rate)
+            assert len(expected) == int(0.5 * 8000)
+            # Chunks that are not a multiple of the resampling factor.
+            encoder = G711Encoder("ulaw")
+            result = b""
+            for i in range(0, len(audio), 317):
+                result += encoder.encode(audio[i : i + 317].tobytes(), rate)
+            assert result == expected
+
+    def test_decoder_chunks(self):
+        data = G711Encoder("alaw").encode(generate_tone(0.5, 8000).tobytes(), 8000)
+        expected = G711Decoder("alaw").decode(data, 16000)
+        assert len(expected) == len(data) * 2 * 2
+        decoder = G711Decoder("alaw")
+        result = b"".join(
+            decoder.decode(data[i : i + 160], 16000) for i in range(0, len(data), 160)
+        )
+        assert result == expected
+
+    def test_round_trip(self):
+        for rate in [16000, 24000, 48000]:
+            audio = generate_tone(0.5, rate)
+            encoder = G711Encoder("ulaw")
+            decoder = G711Decoder("ulaw")
+            result = b""
+            for i in range(0, len(audio), rate // 50):
+                data = encoder.encode(audio[i : i + rate // 50].tobytes(), rate)
+                result += decoder.decode(data, rate)
+            result = np.frombuffer(result, dtype=np.int16).astype(np.float64)
+            assert len(result) == len(audio)
+
+            # Each filter delays audio by 24 samples at 8000Hz.
+            delay = 48 * rate // 8000
+            error = result[delay:] - audio[: len(audio) - delay]
+            snr = 10 * np.log10(np.mean(audio.astype(np.float64) ** 2) / np.mean(error**2))
+            assert snr > 35
+
+    def test_reset(self):
+        audio = generate_tone(0.1, 16000).tobytes()
+        encoder = G711Encoder("ulaw")
+        first = encoder.encode(audio, 16000)
+        encoder.reset()
+        assert encoder.encode(audio, 16000) == first
+
+    def test_other_rates(self):
+        audio = generate_tone(0.1, 44100).tobytes()
+        data = G711Encoder("ulaw").encode(audio, 44100)
+        assert len(data) == 800
+        assert len(G711Decoder("ulaw").decode(data, 44100)) == 4410 * 2
+
+
+class TestTwilioFrameSerializer(unittest.IsolatedAsyncioTestCase):
+    async def test_audio(self):
+        serializer = TwilioFrameSerializer("stream")
+        await serializer.setup(
+            StartFrame(clock=SystemClock(), task_manager=TaskManager(), audio_in_sample_rate=16000)
+        )
+
+        audio = generate_tone(0.02, 24000).tobytes()
+        message = json.loads(await serializer.serialize(AudioRawFrame(audio, 24000, 1)))
+        assert message["event"] == "media"
+
+        frame = await serializer.deserialize(json.dumps(message))
+        assert isinstance(frame, InputAudioRawFrame)
+        assert frame.sample_rate == 16000
+        assert len(frame.audio) == 320 * 2
@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import math
+import unittest
+
+import numpy as np
+import pyloudnorm as pyln
+
+from pipecat.audio.loudness import LoudnessMeter
+from pipecat.audio.utils import calculate_audio_volume
+
+
+def generate_audio(seconds: float, sample_rate: int) -> bytes:
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = 8000 * np.sin(2 * np.pi * 50 * t) + 2000 * rng.standard_normal(t.shape)
+    return samples.astype(np.int16).tobytes()
+
+
+class TestLoudnessMeter(unittest.TestCase):
+    def test_same_as_calculate_audio_volume(self):
+        for sample_rate in [8000, 16000, 24000]:
+            audio = generate_audio(0.032, sample_rate)
+            meter = LoudnessMeter(sample_rate)
+            self.assertAlmostEqual(
+                meter.volume(audio), calculate_audio_volume(audio, sample_rate), places=4
+            )
+
+    def test_streaming(self):
+        sample_rate = 16000
+        window = 512
+        audio = generate_audio(5.0, sample_rate)
+
+        # Filter the whole signal at once and measure every window.
+        meter = pyln.Meter(sample_rate)
+        samples = np.frombuffer(audio, dtype=np.int16).astype(np.float64)
+        for filter_stage in meter._filters.values():
+            samples = filter_stage.apply_filter(samples)
+        num_windows = len(samples) // window
+        mean_squares = np.mean(samples[: num_windows * window].reshape(-1, window) ** 2, axis=1)
+        expected = -0.691 + 10 * np.log10(mean_squares)
+
+        meter = LoudnessMeter(sample_rate)
+        result = [
+            meter.loudness(audio[i * window * 2 : (i + 1) * window * 2]) for i in range(num_windows)
+        ]
+        np.testing.assert_allclose(result, expected, atol=0.01)
+
+    def test_silence(self):
+        meter = LoudnessMeter(16000)
+        assert meter.loudness(bytes(1024)) == -math.inf
+        assert meter.volume(bytes(1024)) == 0.0
+        assert meter.volume(b"") == 0.0
+
+    def test_set_sample_rate(self):
+        audio = generate_audio(0.032, 16000)
+        meter = LoudnessMeter(8000)
+        meter.volume(generate_audio(0.1, 8000))
+        meter.set_sample_rate(16000)
+        # The filter state is reset when the sample rate changes.
+        self.assertAlmostEqual(meter.volume(audio), LoudnessMeter(16000).volume(audio))
@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import soundfile as sf
+
+from pipecat.audio.mixers.multitrack_mixer import MixerTrack, MultiTrackMixer
+from pipecat.audio.mixers.sound_bank import clear_sounds
+from pipecat.frames.frames import MixerEnableFrame, MixerUpdateSettingsFrame
+
+SAMPLE_RATE = 16000
+CHUNK = 320
+
+
+def write_constant(file_name: str, value: int, num_samples: int):
+    sf.write(file_name, np.full(num_samples, value, dtype=np.int16), SAMPLE_RATE)
+
+
+def samples(audio: bytes) -> np.ndarray:
+    return np.frombuffer(audio, dtype=np.int16)
+
+
+class TestMultiTrackMixer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.background = os.path.join(self._dir.name, "background.wav")
+        self.earcon = os.path.join(self._dir.name, "earcon.wav")
+        write_constant(self.background, 1000, 1000)
+        write_constant(self.earcon, 2000, 500)
+        clear_sounds()
+
+    def tearDown(self):
+        clear_sounds()
+        self._dir.cleanup()
+
+    async def create_mixer(self, **kwargs) -> MultiTrackMixer:
+        tracks = {
+            "background": MixerTrack(sound=self.background, volume=0.5, duck=True, playing=True),
+            "earcon": MixerTrack(sound=self.earcon, loop=False),
+        }
+        mixer = MultiTrackMixer(tracks, cache_dir=None, **kwargs)
+        await mixer.start(SAMPLE_RATE)
+        return mixer
+
+    async def test_loop(self):
+        mixer = await self.create_mixer(ramp_secs=0)
+        # The background sound (1000 samples) loops over several chunks.
+        for _ in range(10):
+            assert np.all(samples(await mixer.mix(bytes(CHUNK * 2))) == 500)
+
+    async def test_earcon(self):
+        mixer = await self.create_mixer(ramp_secs=0)
+        await mixer.process_frame(MixerUpdateSettingsFrame(settings={"play": "earcon"}))
+        mixed = np.concatenate([samples(await mixer.mix(bytes(CHUNK * 2))) for _ in range(3)])
+        assert np.all(mixed[:500] == 2500)
+        assert np.all(mixed[500:] == 500)
+
+        # Plays again from the beginning.
+        mixer.play("earcon")
+        assert np.all(samples(await mixer.mix(bytes(CHUNK * 2))) == 2500)
+
+    async def test_ramps(self):
+        mixer = await self.create_mixer(ramp_secs=0.01)
+        mixed = samples(await mixer.mix(bytes(CHUNK * 2)))
+        # The background fades in for 160 samples.
+        assert np.all(np.diff(mixed[:160].astype(np.int32)) >= 0)
+        assert mixed[0] < 10
+        assert np.all(mixed[160:] == 500)
+
+        await mixer.process_frame(
+            MixerUpdateSettingsFrame(settings={"volumes": {"background": 1.0}})
+        )
+        mixed = samples(await mixer.mix(bytes(CHUNK * 2)))
+        assert 500 < mixed[40] < 1000
+        assert np.all(mixed[80:] == 1000)
+
+        await mixer.process_frame(MixerUpdateSettingsFrame(settings={"stop": ["background"]}))
+        mixed = samples(await mixer.mix(bytes(CHUNK * 2)))
+        assert 0 < mixed[80] < 1000
+        assert mixed[80] > mixed[120]
+        assert np.all(mixed[160:] == 0)
+
+    async def test_ducking(self):
+        mixer = await self.create_mixer(ramp_secs=0, duck_volume=0.2, duck_hold_secs=0.04)
+        voice = np.full(CHUNK, 10000, dtype=np.int16).tobytes()
+        assert np.all(samples(await mixer.mix(voice)) == 10100)
+        # Back up after 40ms (two chunks) of silence.
+        assert np.all(samples(await mixer.mix(bytes(CHUNK * 2))) == 100)
+        assert np.all(samples(await mixer.mix(bytes(CHUNK * 2))) == 100)
+        assert np.all(samples(await mixer.mix(bytes(CHUNK * 2))) == 500)
+
+        # Only ducked tracks are lowered.
+        mixer.play("earcon")
+        assert np.all(samples(await mixer.mix(voice))[:CHUNK] == 10000 + 100 + 2000)
+
+    async def test_clipping(self):
+        mixer = await self.create_mixer(ramp_secs=0)
+        voice = np.full(CHUNK, 32767, dtype=np.int16).tobytes()
+        mixer.set_volume("background", 1.0)
+        await mixer.process_frame(MixerUpdateSettingsFrame(settings={"duck_volume": 1.0}))
+        assert np.all(samples(await mixer.mix(voice)) == 32767)
+
+    async def test_enable(self):
+        mixer = await self.create_mixer()
+        audio = bytes(CHUNK * 2)
+        await mixer.process_frame(MixerEnableFrame(enable=False))
+        assert await mixer.mix(audio) is audio
+        await mixer.process_frame(MixerEnableFrame(enable=True))
+        assert await mixer.mix(audio) != audio
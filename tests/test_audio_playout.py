@@ -0,0 +1,166 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+from pipecat.audio.playout import AudioPlayout
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    MetricsFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.metrics.metrics import PlayoutMetricsData
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.tests.virtual_time import run_with_virtual_time
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import TransportParams
+
+SAMPLE_RATE = 16000
+CHUNK_SIZE = 640
+
+
+class TimedOutputTransport(BaseOutputTransport):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.writes = []
+
+    async def write_raw_audio_frames(self, frames: bytes):
+        self.writes.append((asyncio.get_running_loop().time(), len(frames)))
+
+
+class MetricsCollector(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.metrics = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, MetricsFrame):
+            self.metrics.extend(d for d in frame.data if isinstance(d, PlayoutMetricsData))
+        await self.push_frame(frame, direction)
+
+
+class TestAudioPlayout(unittest.TestCase):
+    def test_chunks(self):
+        playout = AudioPlayout(sample_rate=SAMPLE_RATE)
+        assert playout.chunk_size == CHUNK_SIZE
+        assert playout.write(b"\x01" * 1000) == [b"\x01" * CHUNK_SIZE]
+        chunks = playout.write(b"\x02" * 1000)
+        assert chunks == [b"\x01" * 360 + b"\x02" * 280, b"\x02" * CHUNK_SIZE]
+        # The last chunk is padded with silence.
+        assert playout.flush() == [b"\x02" * 80 + b"\x00" * 560]
+        assert playout.flush() == []
+
+    def test_clock(self):
+        async def run():
+            playout = AudioPlayout(sample_rate=SAMPLE_RATE, tick_secs=0.01)
+            loop = asyncio.get_running_loop()
+            chunks = playout.write(bytes(SAMPLE_RATE * 2))
+            start_time = loop.time()
+            for i, _ in enumerate(chunks):
+                await playout.tick()
+                # Something slow happened, but less than a tick.
+                if i % 3 == 1:
+                    await asyncio.sleep(0.007)
+            # Time lost after each chunk doesn't accumulate.
+            assert abs(loop.time() - start_time - 0.99) < 1e-6
+            assert playout.stats.chunks == 100
+            assert playout.stats.underruns == 0
+            assert playout.stats.max_jitter < 1e-6
+
+        run_with_virtual_time(run())
+
+    def test_underruns(self):
+        async def run():
+            playout = AudioPlayout(sample_rate=SAMPLE_RATE)
+            for _ in playout.write(bytes(CHUNK_SIZE * 2)):
+                await playout.tick()
+            # The next chunk arrives too late.
+            await asyncio.sleep(0.1)
+            for _ in playout.write(bytes(CHUNK_SIZE)):
+                await playout.tick()
+            assert playout.stats.underruns == 1
+            # Silence after the end of a stream is not an underrun.
+            playout.end_of_stream()
+            await asyncio.sleep(0.1)
+            for _ in playout.write(bytes(CHUNK_SIZE)):
+                await playout.tick()
+            assert playout.stats.underruns == 1
+
+        run_with_virtual_time(run())
+
+    def test_overruns(self):
+        async def run():
+            playout = AudioPlayout(sample_rate=SAMPLE_RATE, max_buffer_secs=0.1)
+            # No audio is dropped.
+            chunks = playout.write(bytes(CHUNK_SIZE * 10))
+            chunks += playout.write(bytes(CHUNK_SIZE * 10))
+            assert len(chunks) == 20
+            assert playout.stats.overruns == 1
+            for _ in chunks:
+                await playout.tick()
+            playout.write(bytes(CHUNK_SIZE * 10))
+            assert playout.stats.overruns == 2
+
+        run_with_virtual_time(run())
+
+    def test_clear(self):
+        playout = AudioPlayout(sample_rate=SAMPLE_RATE)
+        playout.write(bytes(CHUNK_SIZE * 3 + 10))
+        playout.clear()
+        assert playout.buffered_secs == 0
+        assert playout.flush() == []
+
+
+class TestOutputTransportPlayout(unittest.TestCase):
+    def test_paced_audio(self):
+        transport = TimedOutputTransport(
+            params=TransportParams(
+                audio_out_enabled=True,
+                audio_out_sample_rate=SAMPLE_RATE,
+                audio_out_playout_clock=True,
+            )
+        )
+        collector = MetricsCollector()
+
+        async def run():
+            task = PipelineTask(
+                Pipeline([transport, collector]), params=PipelineParams(enable_metrics=True)
+            )
+            runner = asyncio.create_task(PipelineRunner(handle_sigint=False).run(task))
+            await task.queue_frames(
+                [
+                    TTSStartedFrame(),
+                    # 0.5 seconds at once, plus some extra audio.
+                    TTSAudioRawFrame(bytes(SAMPLE_RATE + 100), SAMPLE_RATE, 1),
+                    TTSStoppedFrame(),
+                ]
+            )
+            # Wait for the bot to stop speaking.
+            await asyncio.sleep(1.0)
+            await task.queue_frame(EndFrame())
+            await runner
+
+        run_with_virtual_time(run())
+
+        # Exactly sized chunks written every 20ms.
+        assert len(transport.writes) == 26
+        assert all(size == CHUNK_SIZE for _, size in transport.writes)
+        times = [t for t, _ in transport.writes]
+        assert all(abs(b - a - 0.02) < 1e-6 for a, b in zip(times, times[1:]))
+
+        assert len(collector.metrics) == 1
+        metrics = collector.metrics[0]
+        assert metrics.underruns == 0
+        assert metrics.overruns == 0
+        assert abs(metrics.audio_duration - 0.52) < 1e-6
@@ -0,0 +1,189 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import soundfile as sf
+
+from pipecat.audio.recorder import AudioRecorder
+from pipecat.frames.frames import Frame, InputAudioRawFrame, OutputAudioRawFrame, StartFrame
+from pipecat.processors.audio.audio_recorder_processor import AudioRecorderProcessor
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.tests.utils import run_test
+
+SAMPLE_RATE = 16000
+
+# 20ms at 16kHz.
+FRAME_SAMPLES = 320
+FRAME_NS = 20_000_000
+
+
+def generate_frame(value: int) -> bytes:
+    return np.full(FRAME_SAMPLES, value, dtype=np.int16).tobytes()
+
+
+class AutoStartRecorderProcessor(AudioRecorderProcessor):
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, StartFrame):
+            await self.start_recording()
+
+
+class TestAudioRecorder(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def file_name(self, name: str) -> str:
+        return os.path.join(self.dir.name, name)
+
+    async def test_stereo_alignment(self):
+        recorder = AudioRecorder(
+            self.file_name("call.wav"), sample_rate=SAMPLE_RATE, num_channels=2
+        )
+        recorder.start(0)
+        # One second of continuous user audio, the bot talks between 0.5s and
+        # 0.7s.
+        for i in range(50):
+            timestamp = (i + 1) * FRAME_NS
+            await recorder.write_user_audio(generate_frame(100), timestamp)
+            if 25 <= i < 35:
+                await recorder.write_bot_audio(generate_frame(200), timestamp)
+        await recorder.stop()
+
+        audio, sample_rate = sf.read(recorder.file_name, dtype="int16")
+        assert sample_rate == SAMPLE_RATE
+        assert audio.shape == (16000, 2)
+        assert np.all(audio[:, 0] == 100)
+        bot = audio[:, 1]
+        assert np.all(bot[:8000] == 0)
+        assert np.all(bot[8000:11200] == 200)
+        assert np.all(bot[11200:] == 0)
+
+    async def test_intermittent_user_audio(self):
+        recorder = AudioRecorder(self.file_name("call.flac"), sample_rate=SAMPLE_RATE)
+        recorder.start(0)
+        # Audio is only received while the user speaks (at 1s and at 3s).
+        for start in (1_000_000_000, 3_000_000_000):
+            for i in range(10):
+                await recorder.write_user_audio(generate_frame(100), start + (i + 1) * FRAME_NS)
+        await recorder.stop()
+
+        audio, sample_rate = sf.read(recorder.file_name, dtype="int16")
+        assert sample_rate == SAMPLE_RATE
+        assert len(audio) == 3 * SAMPLE_RATE + 3200
+        assert np.count_nonzero(audio) == 6400
+        assert np.all(audio[16000:19200] == 100)
+        assert np.all(audio[48000:51200] == 100)
+
+    async def test_mono_mix(self):
+        recorder = AudioRecorder(self.file_name("call.wav"), sample_rate=SAMPLE_RATE)
+        recorder.start(0)
+        for i in range(10):
+            timestamp = (i + 1) * FRAME_NS
+            await recorder.write_user_audio(generate_frame(30000), timestamp)
+            await recorder.write_bot_audio(generate_frame(-1000 if i < 5 else 30000), timestamp)
+        await recorder.stop()
+
+        audio, _ = sf.read(recorder.file_name, dtype="int16")
+        assert len(audio) == 3200
+        assert np.all(audio[:1600] == 29000)
+        # Clipped.
+        assert np.all(audio[1600:] == 32767)
+
+    async def test_bounded_memory(self):
+        recorder = AudioRecorder(self.file_name("call.wav"), sample_rate=SAMPLE_RATE)
+        recorder.start(0)
+        frame = generate_frame(100)
+        # Ten minutes, the bot only talks every other minute.
+        for i in range(30000):
+            timestamp = (i + 1) * FRAME_NS
+            await recorder.write_user_audio(frame, timestamp)
+            if (i // 3000) % 2:
+                await recorder.write_bot_audio(frame, timestamp)
+            # Ten minutes of audio would be ~19MB (per side), we only keep a
+            # few seconds.
+            assert recorder.memory_usage() < 1_000_000
+        await recorder.stop()
+
+        assert recorder.duration_secs == 600
+        assert sf.info(recorder.file_name).frames == 600 * SAMPLE_RATE
+
+    async def test_write_error(self):
+        recorder = AudioRecorder(
+            self.file_name("missing/call.wav"), sample_rate=SAMPLE_RATE, max_queued_secs=1.0
+        )
+        recorder.start(0)
+        # The writer keeps consuming audio after an error, so this doesn't
+        # block.
+        for i in range(500):
+            await recorder.write_user_audio(generate_frame(100), (i + 1) * FRAME_NS)
+        await recorder.stop()
+        assert not recorder.recording
+        assert not os.path.exists(recorder.file_name)
+
+
+class TestAudioRecorderProcessor(unittest.IsolatedAsyncioTestCase):
+    async def test_recording(self):
+        with tempfile.TemporaryDirectory() as dir:
+            processor = AutoStartRecorderProcessor(
+                os.path.join(dir, "call.wav"), sample_rate=SAMPLE_RATE, num_channels=2
+            )
+            stopped = []
+
+            @processor.event_handler("on_recording_stopped")
+            async def on_recording_stopped(processor, file_name):
+                stopped.append(file_name)
+
+            # Bot audio is resampled to the recording sample rate.
+            await run_test(
+                processor,
+                frames_to_send=[
+                    InputAudioRawFrame(
+                        audio=generate_frame(100), sample_rate=16000, num_channels=1
+                    ),
+                    OutputAudioRawFrame(
+                        audio=generate_frame(200), sample_rate=8000, num_channels=1
+                    ),
+                ],
+                expected_down_frames=[InputAudioRawFrame, OutputAudioRawFrame],
+            )
+
+            assert stopped == [processor._file_name]
+            audio, sample_rate = sf.read(stopped[0], dtype="int16")
+            assert sample_rate == SAMPLE_RATE
+            assert audio.shape[1] == 2
+            assert np.all(audio[:FRAME_SAMPLES, 0] == 100)
+            # None of the bot audio is held back by the resampler.
+            bot = audio[:, 1]
+            assert np.count_nonzero(bot) > 2 * FRAME_SAMPLES - 10
+
+    async def test_start_before_pipeline(self):
+        with tempfile.TemporaryDirectory() as dir:
+            processor = AudioRecorderProcessor(
+                os.path.join(dir, "call.wav"), sample_rate=SAMPLE_RATE
+            )
+            # There's no sample rate or clock yet, so it starts with the
+            # pipeline.
+            await processor.start_recording()
+            assert processor.memory_usage() == 0
+
+            await run_test(
+                processor,
+                frames_to_send=[
+                    InputAudioRawFrame(audio=generate_frame(100), sample_rate=16000, num_channels=1)
+                ],
+                expected_down_frames=[InputAudioRawFrame],
+            )
+
+            audio, sample_rate = sf.read(processor._file_name, dtype="int16")
+            assert sample_rate == SAMPLE_RATE
+            assert np.all(audio[:FRAME_SAMPLES] == 100)
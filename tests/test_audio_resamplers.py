@@ -0,0 +1,184 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+import numpy as np
+import soxr
+
+from pipecat.audio.resamplers.soxr_resampler import SOXRAudioResampler
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    EndFrame,
+    Frame,
+    OutputAudioRawFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.tests.virtual_time import run_with_virtual_time
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import TransportParams
+
+
+def generate_audio(seconds: float, sample_rate: int) -> np.ndarray:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (10000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+
+def chunks(audio: np.ndarray, sample_rate: int, chunk_secs: float = 0.02):
+    size = int(sample_rate * chunk_secs)
+    return [audio[i : i + size].tobytes() for i in range(0, len(audio), size)]
+
+
+class RecordingOutputTransport(BaseOutputTransport):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.audio = bytearray()
+
+    async def write_raw_audio_frames(self, frames: bytes):
+        self.audio.extend(frames)
+
+
+class FrameCollector(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        self.frames.append(frame)
+        await self.push_frame(frame, direction)
+
+
+class TestSOXRStreamAudioResampler(unittest.IsolatedAsyncioTestCase):
+    async def test_same_as_whole_signal(self):
+        for in_rate, out_rate in [(24000, 16000), (16000, 8000), (8000, 16000)]:
+            audio = generate_audio(1.0, in_rate)
+            resampler = SOXRStreamAudioResampler()
+            result = bytearray()
+            for chunk in chunks(audio, in_rate):
+                result.extend(await resampler.resample(chunk, in_rate, out_rate))
+            result.extend(await resampler.flush())
+
+            expected = soxr.resample(audio, in_rate, out_rate, quality="VHQ")
+            result = np.frombuffer(result, dtype=np.int16)
+            assert len(result) == len(expected)
+            assert np.abs(result.astype(np.int32) - expected).max() <= 2
+
+    async def test_less_distortion_than_chunks(self):
+        (in_rate, out_rate) = (24000, 16000)
+        audio = generate_audio(1.0, in_rate)
+        expected = soxr.resample(audio, in_rate, out_rate, quality="VHQ").astype(np.float64)
+
+        async def error(resampler):
+            result = bytearray()
+            for chunk in chunks(audio, in_rate):
+                result.extend(await resampler.resample(chunk, in_rate, out_rate))
+            result.extend(await resampler.flush())
+            result = np.frombuffer(result, dtype=np.int16)
+            return np.abs(result - expected).max()
+
+        assert await error(SOXRStreamAudioResampler()) < 0.01 * await error(SOXRAudioResampler())
+
+    async def test_clear(self):
+        audio = generate_audio(0.1, 24000).tobytes()
+        resampler = SOXRStreamAudioResampler()
+        await resampler.resample(audio, 24000, 16000)
+        resampler.clear()
+        assert await resampler.flush() == b""
+
+    async def test_new_input_rate(self):
+        resampler = SOXRStreamAudioResampler()
+        result = await resampler.resample(generate_audio(0.1, 24000).tobytes(), 24000, 16000)
+        # The end of the previous stream comes first.
+        result += await resampler.resample(generate_audio(0.1, 16000).tobytes(), 16000, 16000)
+        assert len(result) == int(0.2 * 16000) * 2
+
+
+class TestOutputTransportResampling(unittest.TestCase):
+    def test_tts_audio(self):
+        in_rate = 24000
+        out_rate = 16000
+        transport = RecordingOutputTransport(
+            params=TransportParams(audio_out_enabled=True, audio_out_sample_rate=out_rate)
+        )
+        audio = generate_audio(0.5, in_rate)
+
+        async def run():
+            task = PipelineTask(Pipeline([transport]))
+            await task.queue_frames(
+                [
+                    TTSStartedFrame(),
+                    *[TTSAudioRawFrame(chunk, in_rate, 1) for chunk in chunks(audio, in_rate)],
+                    TTSStoppedFrame(),
+                ]
+            )
+            await task.queue_frame(EndFrame())
+            await PipelineRunner(handle_sigint=False).run(task)
+
+        run_with_virtual_time(run())
+
+        # All the audio has been played, including the end held by the
+        # resampler.
+        assert len(transport.audio) == int(0.5 * out_rate) * 2
+
+    def run_transport(self, frames):
+        """Sends the given frames, waits for them to be played and returns the
+        size of the audio written until then and the frames pushed by the
+        transport.
+
+        """
+        transport = RecordingOutputTransport(
+            params=TransportParams(audio_out_enabled=True, audio_out_sample_rate=16000)
+        )
+        collector = FrameCollector()
+
+        async def run():
+            task = PipelineTask(Pipeline([transport, collector]))
+            runner = asyncio.create_task(PipelineRunner(handle_sigint=False).run(task))
+            await task.queue_frames(frames)
+            await asyncio.sleep(1.0)
+            written = len(transport.audio)
+            await task.queue_frame(EndFrame())
+            await runner
+            return written
+
+        return (run_with_virtual_time(run()), collector.frames)
+
+    def test_sound_audio(self):
+        sound = generate_audio(0.1, 24000).tobytes()
+        (written, frames) = self.run_transport([OutputAudioRawFrame(sound, 24000, 1)])
+
+        # Audio that is not TTS audio is not held by the resampler, and it's
+        # not taken as bot speech.
+        assert written == int(0.1 * 16000) * 2
+        audio_frames = [f for f in frames if isinstance(f, OutputAudioRawFrame)]
+        assert {type(f) for f in audio_frames} == {OutputAudioRawFrame}
+        assert not any(isinstance(f, BotStartedSpeakingFrame) for f in frames)
+
+    def test_tts_audio_then_sound(self):
+        audio = generate_audio(0.5, 24000)
+        sound = generate_audio(0.1, 24000).tobytes()
+        (written, frames) = self.run_transport(
+            [
+                TTSStartedFrame(),
+                *[TTSAudioRawFrame(chunk, 24000, 1) for chunk in chunks(audio, 24000)],
+                OutputAudioRawFrame(sound, 24000, 1),
+            ]
+        )
+
+        # The end of the bot audio is released before the sound and keeps its
+        # frame class.
+        assert written == int(0.6 * 16000) * 2
+        audio_frames = [type(f) for f in frames if isinstance(f, OutputAudioRawFrame)]
+        assert audio_frames == [TTSAudioRawFrame] * 25 + [OutputAudioRawFrame] * 5
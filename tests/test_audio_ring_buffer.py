@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import random
+import unittest
+
+from pipecat.audio.ring_buffer import AudioRingBuffer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+
+
+class WindowRecorderVADAnalyzer(VADAnalyzer):
+    def __init__(self):
+        super().__init__(sample_rate=16000, params=VADParams())
+        self.windows = []
+
+    def num_frames_required(self) -> int:
+        return 512
+
+    def voice_confidence(self, buffer) -> float:
+        self.windows.append(bytes(buffer))
+        return 0.0
+
+
+class TestAudioRingBuffer(unittest.TestCase):
+    def test_read_write(self):
+        buffer = AudioRingBuffer(8)
+        buffer.write(b"123456")
+        assert bytes(buffer.peek(2)) == b"12"
+        assert bytes(buffer.read(4)) == b"1234"
+        # Doesn't fit at the end, unread bytes are moved to the beginning.
+        buffer.write(b"789")
+        assert buffer.capacity == 8
+        assert bytes(buffer.read(5)) == b"56789"
+        assert len(buffer) == 0
+
+    def test_grow(self):
+        buffer = AudioRingBuffer(4)
+        buffer.write(b"12")
+        buffer.write(b"3456789")
+        assert buffer.capacity >= 9
+        assert bytes(buffer.read(9)) == b"123456789"
+
+    def test_read_too_much(self):
+        buffer = AudioRingBuffer(4)
+        buffer.write(b"12")
+        with self.assertRaises(ValueError):
+            buffer.read(3)
+
+    def test_no_copies(self):
+        buffer = AudioRingBuffer(16)
+        buffer.write(b"12345678")
+        view = buffer.read(4)
+        assert isinstance(view, memoryview)
+        assert view.obj is buffer.peek(4).obj
+
+    def test_random_chunks(self):
+        rng = random.Random(0)
+        data = bytes(rng.getrandbits(8) for _ in range(100_000))
+        buffer = AudioRingBuffer(1024)
+        written = 0
+        output = bytearray()
+        while written < len(data) or len(buffer) > 0:
+            if written < len(data):
+                size = rng.randint(1, 700)
+                buffer.write(data[written : written + size])
+                written += size
+            output += buffer.read(min(len(buffer), rng.randint(1, 900)))
+        assert bytes(output) == data
+
+
+class TestVADAnalyzerBuffer(unittest.TestCase):
+    def test_windows(self):
+        rng = random.Random(0)
+        audio = bytes(rng.getrandbits(8) for _ in range(16000 * 2))
+        vad = WindowRecorderVADAnalyzer()
+        vad.set_sample_rate(16000)
+        # Chunks that don't line up with the analyzer window (1024 bytes).
+        offset = 0
+        while offset < len(audio):
+            size = rng.choice([320, 640, 960, 1100])
+            vad.analyze_audio(audio[offset : offset + size])
+            offset += size
+        num_windows = len(vad.windows)
+        assert num_windows > 0
+        assert b"".join(vad.windows) == audio[: num_windows * 1024]
@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import soundfile as sf
+
+from pipecat.audio.mixers.sound_bank import clear_sounds, load_sound
+from pipecat.audio.mixers.soundfile_mixer import SoundfileMixer
+
+
+def write_sound(file_name: str, seconds: float, sample_rate: int, channels: int = 1):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    tone = (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+    sf.write(file_name, np.stack([tone] * channels, axis=1), sample_rate)
+
+
+class TestSoundBank(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self._dir.name, "cache")
+        self.sound_file = os.path.join(self._dir.name, "sound.wav")
+        write_sound(self.sound_file, 1.0, 44100, channels=2)
+        clear_sounds()
+
+    def tearDown(self):
+        clear_sounds()
+        self._dir.cleanup()
+
+    def test_load(self):
+        sound = load_sound(self.sound_file, 16000, cache_dir=self.cache_dir)
+        assert sound.dtype == np.int16
+        assert len(sound) == 16000
+        assert not sound.flags.writeable
+        assert isinstance(sound, np.memmap)
+        # Loaded only once.
+        assert load_sound(self.sound_file, 16000, cache_dir=self.cache_dir) is sound
+        assert len(os.listdir(self.cache_dir)) == 1
+
+        # Mapped from the cache file.
+        clear_sounds()
+        cached = load_sound(self.sound_file, 16000, cache_dir=self.cache_dir)
+        assert cached is not sound
+        assert np.array_equal(cached, sound)
+
+        # One cache file per sample rate.
+        assert len(load_sound(self.sound_file, 24000, cache_dir=self.cache_dir)) == 24000
+        assert len(os.listdir(self.cache_dir)) == 2
+
+    def test_without_cache(self):
+        # Not cached by default.
+        sound = load_sound(self.sound_file, 44100)
+        assert not isinstance(sound, np.memmap)
+        assert not sound.flags.writeable
+        assert len(sound) == 44100
+        assert load_sound(self.sound_file, 44100, cache_dir=None) is sound
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX only")
+    def test_shared_cache_dir(self):
+        os.makedirs(self.cache_dir)
+        os.chmod(self.cache_dir, 0o777)
+        sound = load_sound(self.sound_file, 16000, cache_dir=self.cache_dir)
+        assert not isinstance(sound, np.memmap)
+        assert len(sound) == 16000
+        assert os.listdir(self.cache_dir) == []
+
+    def test_invalid_cache_file(self):
+        sound = load_sound(self.sound_file, 16000, cache_dir=self.cache_dir)
+        (cache_file,) = [os.path.join(self.cache_dir, f) for f in os.listdir(self.cache_dir)]
+        size = os.path.getsize(cache_file)
+        del sound
+        clear_sounds()
+
+        # Truncated.
+        with open(cache_file, "r+b") as f:
+            f.truncate(size - 2)
+        sound = load_sound(self.sound_file, 16000, cache_dir=self.cache_dir)
+        assert len(sound) == 16000
+        assert os.path.getsize(cache_file) == size
+        del sound
+        clear_sounds()
+
+        # Not a cache file.
+        with open(cache_file, "wb") as f:
+            f.write(bytes(size))
+        sound = load_sound(self.sound_file, 16000, cache_dir=self.cache_dir)
+        assert len(sound) == 16000
+        assert np.count_nonzero(sound) > 0
+
+    def test_file_changed(self):
+        sound = load_sound(self.sound_file, 16000, cache_dir=self.cache_dir)
+        write_sound(self.sound_file, 0.5, 44100)
+        os.utime(self.sound_file, ns=(0, os.stat(self.sound_file).st_mtime_ns + 1))
+        assert len(load_sound(self.sound_file, 16000, cache_dir=self.cache_dir)) == 8000
+        assert len(sound) == 16000
+        # The old cache file is replaced.
+        assert len(os.listdir(self.cache_dir)) == 1
+
+    async def test_mixers(self):
+        mixers = [
+            SoundfileMixer({"sound": self.sound_file}, "sound", cache_dir=self.cache_dir)
+            for _ in range(2)
+        ]
+        for mixer in mixers:
+            await mixer.start(16000)
+        assert mixers[0]._sounds["sound"] is mixers[1]._sounds["sound"]
+
+        mixed = np.frombuffer(await mixers[0].mix(bytes(640)), dtype=np.int16)
+        expected = (mixers[0]._sounds["sound"][:320] * 0.4).astype(np.int16)
+        assert np.array_equal(mixed, expected)
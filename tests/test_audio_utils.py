@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+import numpy as np
+
+from pipecat.audio.utils import interleave_stereo_audio, mix_audio
+from pipecat.frames.frames import InputAudioRawFrame
+
+
+def to_bytes(samples) -> bytes:
+    return np.array(samples, dtype=np.int16).tobytes()
+
+
+class TestAudioUtils(unittest.TestCase):
+    def test_mix_audio(self):
+        mixed = mix_audio(to_bytes([1, 30000, -30000]), to_bytes([2, 30000]))
+        # The shortest audio is padded with silence and the result is clipped.
+        assert mixed == to_bytes([3, 32767, -30000])
+
+    def test_interleave_stereo_audio(self):
+        stereo = interleave_stereo_audio(to_bytes([1, 2, 3]), to_bytes([4, 5]))
+        assert stereo == to_bytes([1, 4, 2, 5])
+
+
+class TestAudioRawFrameSamples(unittest.TestCase):
+    def test_samples(self):
+        audio = to_bytes([1, 2, 3, 4])
+        frame = InputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1)
+        samples = frame.samples
+        np.testing.assert_array_equal(samples, [1, 2, 3, 4])
+        # It's a cached view of the audio.
+        assert frame.samples is samples
+        assert not samples.flags.owndata
+        assert not samples.flags.writeable
+
+        # A new audio gives new samples.
+        frame.audio = to_bytes([5, 6])
+        np.testing.assert_array_equal(frame.samples, [5, 6])
+
+    def test_writable_audio_gives_read_only_samples(self):
+        frame = InputAudioRawFrame(audio=bytearray(4), sample_rate=16000, num_channels=1)
+        with self.assertRaises(ValueError):
+            frame.samples[0] = 1
+
+    def test_stereo_samples(self):
+        audio = to_bytes([1, 2, 3, 4])
+        frame = InputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=2)
+        np.testing.assert_array_equal(frame.samples, [[1, 2], [3, 4]])
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import glob
+import json
+import os
+import tempfile
+import unittest
+
+from pipecat.frames.frames import EndFrame, ErrorFrame, TextFrame
+from pipecat.pipeline.flight_recorder import FlightRecorder
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.processors.frame_processor import FrameDirection
+
+
+class TestFlightRecorder(unittest.IsolatedAsyncioTestCase):
+    def test_ring_buffer(self):
+        recorder = FlightRecorder(size=3)
+        src = IdentityFilter()
+        dst = IdentityFilter()
+        frames = [TextFrame(text=f"{i}") for i in range(5)]
+        for i, frame in enumerate(frames):
+            recorder.record(src, dst, frame, FrameDirection.DOWNSTREAM, i)
+
+        entries = recorder.entries()
+        assert recorder.count == 5
+        assert [e.frame_id for e in entries] == [f.id for f in frames[2:]]
+        assert entries[0].frame_type == "TextFrame"
+        assert entries[0].direction == "downstream"
+        assert entries[0].src == src.name
+        assert entries[0].dst == dst.name
+        assert entries[0].size == 1
+
+    async def test_task_records_and_dumps(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = FlightRecorder(dump_dir=tmpdir)
+            identity = IdentityFilter()
+            task = PipelineTask(
+                Pipeline([identity]), params=PipelineParams(flight_recorder=recorder)
+            )
+            text = TextFrame(text="Hello!")
+            await task.queue_frames([text, EndFrame()])
+
+            await PipelineRunner(handle_sigint=False).run(task)
+
+            entries = recorder.entries()
+            assert any(e.frame_id == text.id and e.src == identity.name for e in entries)
+
+            # Dump on demand.
+            file_name = await task.dump_flight_recorder(os.path.join(tmpdir, "dump.jsonl"))
+            with open(file_name) as f:
+                lines = [json.loads(line) for line in f]
+            assert lines[0]["reason"] == "on_demand"
+            assert len(lines) - 1 == len(entries)
+
+    async def test_dump_on_error(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = FlightRecorder(dump_dir=tmpdir)
+            identity = IdentityFilter()
+            task = PipelineTask(
+                Pipeline([identity]), params=PipelineParams(flight_recorder=recorder)
+            )
+
+            await task.queue_frames([TextFrame(text="Hello!")])
+            runner = PipelineRunner(handle_sigint=False)
+
+            async def send():
+                await asyncio.sleep(0.1)
+                await identity.push_error(ErrorFrame(error="Something went wrong"))
+                await asyncio.sleep(0.1)
+                await task.queue_frame(EndFrame())
+
+            await asyncio.gather(runner.run(task), send())
+
+            dumps = glob.glob(os.path.join(tmpdir, "*-error-*.jsonl"))
+            assert len(dumps) == 1
+            with open(dumps[0]) as f:
+                header = json.loads(f.readline())
+            assert header["reason"] == "error"
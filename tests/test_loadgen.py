@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import socket
+import unittest
+from contextlib import ExitStack
+
+from pipecat.tests.loadgen.report import CallerResult, LoadReport
+from pipecat.tests.loadgen.runner import run_load_test
+from pipecat.tests.loadgen.scenario import CallerTurn, LoadScenario, MockBotParams
+
+
+class TestLoadReport(unittest.TestCase):
+    def test_from_results(self):
+        results = [
+            CallerResult(
+                caller_id=0, connected=True, completed=True, response_latencies=[1.0, 2.0]
+            ),
+            CallerResult(caller_id=1, connected=True, timeouts=1, dropped_audio_secs=0.5),
+            CallerResult(caller_id=2, error="unable to connect"),
+        ]
+        report = LoadReport.from_results(results, max_concurrent_sessions=2)
+        assert report.sessions_connected == 2
+        assert report.sessions_sustained == 1
+        assert report.response_latency["p50"] == 1.5
+        assert report.response_latency["max"] == 2.0
+        assert report.interruption_latency == {}
+        assert report.timeouts == 1
+        assert report.dropped_audio_secs == 0.5
+        assert report.errors == {2: "unable to connect"}
+
+
+def free_ports(count: int) -> int:
+    """Returns the first of `count` consecutive free ports, starting at an
+    ephemeral port chosen by the OS.
+
+    """
+    while True:
+        with ExitStack() as stack:
+            sock = stack.enter_context(socket.socket())
+            sock.bind(("localhost", 0))
+            port = sock.getsockname()[1]
+            try:
+                for i in range(1, count):
+                    stack.enter_context(socket.socket()).bind(("localhost", port + i))
+            except (OSError, OverflowError):
+                continue
+            return port
+
+
+class TestLoadGenerator(unittest.IsolatedAsyncioTestCase):
+    async def test_websocket_server_callers(self):
+        scenario = LoadScenario(
+            callers=2,
+            port=free_ports(2),
+            turns=[
+                CallerTurn(duration=0.5, delay=0.1),
+                CallerTurn(duration=0.5, barge_in_after=0.3),
+            ],
+            bot=MockBotParams(
+                stt_latency=0.05,
+                llm_latency=0.05,
+                llm_response="Hello! How are you doing today?",
+                tts_latency=0.05,
+                vad_stop_secs=0.5,
+            ),
+        )
+        report = await run_load_test(scenario)
+        assert report.errors == {}
+        assert report.sessions_sustained == 2
+        assert report.max_concurrent_sessions == 2
+        # Two responses per caller and one interruption.
+        assert len(report.response_latency) > 0
+        assert report.response_latency["max"] < 2.0
+        assert report.interruption_latency["max"] < 1.0
+        assert report.bot_audio_secs > 0
@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import sys
+import unittest
+
+from loguru import logger
+
+from pipecat.frames.frames import TextFrame
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.tests.utils import run_test
+from pipecat.utils import log
+
+
+class TestLog(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.records = []
+        logger.remove()
+
+    def tearDown(self):
+        logger.remove()
+        logger.add(sys.stderr)
+
+    def sink(self, message):
+        self.records.append(message.record)
+
+    def test_trace_disabled(self):
+        logger.add(self.sink, level="INFO")
+        assert not log.trace_enabled()
+        assert not log.debug_enabled()
+        log.trace("Hello {name}", name="world")
+        log.debug("Hello {name}", name="world")
+        assert self.records == []
+
+    def test_trace_enabled(self):
+        logger.add(self.sink, level="TRACE")
+        assert log.trace_enabled()
+        log.trace("Hello {name}", name="world")
+        (record,) = self.records
+        assert record["message"] == "Hello world"
+        assert record["extra"]["name"] == "world"
+        # The record points to the caller, not to the log module.
+        assert record["function"] == "test_trace_enabled"
+
+    def test_no_handlers(self):
+        assert not log.level_enabled(logger.level("CRITICAL").no)
+        log.debug("Hello {name}", name="world")
+        assert self.records == []
+
+    def test_min_level_of_handlers(self):
+        info_id = logger.add(self.sink, level="INFO")
+        debug_id = logger.add(self.sink, level="DEBUG")
+        assert log.debug_enabled()
+        logger.remove(debug_id)
+        assert not log.debug_enabled()
+        logger.remove(info_id)
+        assert not log.level_enabled(logger.level("CRITICAL").no)
+
+    def test_configure(self):
+        logger.configure(handlers=[{"sink": self.sink, "level": "TRACE"}])
+        log.trace("Hello {name}", name="world")
+        assert len(self.records) == 1
+        logger.configure(handlers=[{"sink": self.sink, "level": "INFO"}])
+        assert not log.debug_enabled()
+
+    async def test_processor_level_change(self):
+        # The level is changed after the processor is created.
+        processor = IdentityFilter()
+        logger.add(self.sink, level="TRACE")
+        await run_test(
+            processor, frames_to_send=[TextFrame("Hello")], expected_down_frames=[TextFrame]
+        )
+        assert any(r["message"].startswith("Pushing") for r in self.records)
@@ -0,0 +1,177 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+import unittest
+from typing import List, Sequence
+
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    TransportMessageUrgentFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.tests.virtual_time import run_with_virtual_time
+from pipecat.transports.local.loopback import (
+    LoopbackNetworkParams,
+    LoopbackParams,
+    LoopbackTransport,
+    create_loopback_transports,
+)
+
+SAMPLE_RATE = 16000
+CHUNK_SIZE = int(SAMPLE_RATE * 0.02) * 2
+
+
+class EchoProcessor(FrameProcessor):
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, InputAudioRawFrame):
+            await self.push_frame(
+                OutputAudioRawFrame(
+                    audio=frame.audio, sample_rate=frame.sample_rate, num_channels=1
+                )
+            )
+        else:
+            await self.push_frame(frame, direction)
+
+
+class AudioReceiver(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.times: List[float] = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, InputAudioRawFrame):
+            self.times.append(time.monotonic())
+        await self.push_frame(frame, direction)
+
+
+def loopback_params(**kwargs) -> LoopbackParams:
+    return LoopbackParams(
+        audio_in_enabled=True,
+        audio_out_enabled=True,
+        network=LoopbackNetworkParams(**kwargs),
+    )
+
+
+def create_task(transport: LoopbackTransport, processors: Sequence[FrameProcessor]):
+    return PipelineTask(
+        Pipeline([transport.input(), *processors, transport.output()]),
+        params=PipelineParams(audio_in_sample_rate=SAMPLE_RATE, audio_out_sample_rate=SAMPLE_RATE),
+    )
+
+
+async def run_pair(bot_task: PipelineTask, client_task: PipelineTask, frames, duration: float):
+    async def client():
+        await asyncio.sleep(0.01)
+        for frame in frames:
+            await client_task.queue_frame(frame)
+        await asyncio.sleep(duration)
+        await client_task.queue_frame(EndFrame())
+        await bot_task.queue_frame(EndFrame())
+
+    runner = PipelineRunner(handle_sigint=False)
+    await asyncio.gather(runner.run(bot_task), runner.run(client_task), client())
+
+
+def audio_frame(secs: float) -> OutputAudioRawFrame:
+    audio = b"\x01\x00" * int(SAMPLE_RATE * secs)
+    return OutputAudioRawFrame(audio=audio, sample_rate=SAMPLE_RATE, num_channels=1)
+
+
+class TestLoopbackTransport(unittest.TestCase):
+    def test_round_trip(self):
+        async def main():
+            (bot, client) = create_loopback_transports(
+                loopback_params(latency=0.1), loopback_params(latency=0.05)
+            )
+            receiver = AudioReceiver()
+            bot_task = create_task(bot, [EchoProcessor()])
+            client_task = create_task(client, [receiver])
+            start_time = time.monotonic() + 0.01
+            await run_pair(bot_task, client_task, [audio_frame(0.02)], duration=1.0)
+            return [t - start_time for t in receiver.times]
+
+        times = run_with_virtual_time(main())
+        assert len(times) == 1
+        self.assertAlmostEqual(times[0], 0.15, delta=0.001)
+
+    def test_real_time_pacing(self):
+        async def main():
+            (bot, client) = create_loopback_transports(loopback_params(), loopback_params())
+            receiver = AudioReceiver()
+            bot_task = create_task(bot, [receiver])
+            client_task = create_task(client, [])
+            await run_pair(bot_task, client_task, [audio_frame(1.0)], duration=2.0)
+            return receiver.times
+
+        times = run_with_virtual_time(main())
+        assert len(times) == 50
+        # 20ms chunks sent in real time.
+        self.assertAlmostEqual(times[-1] - times[0], 0.98, delta=0.001)
+
+    def test_jitter_and_packet_loss(self):
+        async def main():
+            (bot, client) = create_loopback_transports(
+                loopback_params(),
+                loopback_params(latency=0.05, jitter=0.05, packet_loss=0.2, seed=1),
+            )
+            receiver = AudioReceiver()
+            bot_task = create_task(bot, [receiver])
+            client_task = create_task(client, [])
+            await run_pair(bot_task, client_task, [audio_frame(2.0)], duration=3.0)
+            return (client.stats, receiver.times)
+
+        (stats, times) = run_with_virtual_time(main())
+        assert stats.sent == 100
+        assert 10 < stats.lost < 30
+        assert stats.delivered == stats.sent - stats.lost
+        assert len(times) == stats.delivered
+        # Jitter doesn't reorder packets.
+        assert times == sorted(times)
+
+
+class TestLoopbackTransportEvents(unittest.IsolatedAsyncioTestCase):
+    async def test_events(self):
+        (bot, client) = create_loopback_transports(loopback_params(), loopback_params())
+        events = []
+
+        @bot.event_handler("on_peer_connected")
+        async def on_bot_connected(transport, peer):
+            events.append(("bot", "connected"))
+
+        @bot.event_handler("on_peer_disconnected")
+        async def on_bot_disconnected(transport, peer):
+            events.append(("bot", "disconnected"))
+
+        @client.event_handler("on_peer_connected")
+        async def on_client_connected(transport, peer):
+            events.append(("client", "connected"))
+
+        @bot.event_handler("on_message")
+        async def on_message(transport, message):
+            events.append(("bot", message))
+
+        await run_pair(
+            create_task(bot, []),
+            create_task(client, []),
+            [TransportMessageUrgentFrame(message={"hello": "bot"})],
+            duration=0.1,
+        )
+
+        assert ("bot", "connected") in events
+        assert ("client", "connected") in events
+        assert ("bot", {"hello": "bot"}) in events
+        # The client is stopped first.
+        assert events[-1] == ("bot", "disconnected")
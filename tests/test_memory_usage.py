@@ -0,0 +1,196 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import sys
+import unittest
+from unittest.mock import patch
+
+from pipecat.frames.frames import EndFrame, Frame, MetricsFrame, TextFrame
+from pipecat.metrics.metrics import MemoryUsageMetricsData
+from pipecat.pipeline.parallel_pipeline import ParallelPipeline
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.tests.soak import create_mock_voice_pipeline, mock_voice_frames, run_soak_test
+from pipecat.utils.memory import GrowthDetector, current_rss, deep_sizeof
+
+
+class TextHoarder(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.texts = []
+
+    def memory_usage(self) -> int:
+        return deep_sizeof(self.texts)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            self.texts.append(frame.text)
+        await self.push_frame(frame, direction)
+
+
+class MetricsCollector(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.data = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, MetricsFrame):
+            self.data.extend(frame.data)
+        await self.push_frame(frame, direction)
+
+
+class TaskLeaker(FrameProcessor):
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            # Nobody waits for this task, so the task manager keeps it.
+            self.create_task(asyncio.sleep(0))
+        await self.push_frame(frame, direction)
+
+
+class TestGrowthDetector(unittest.TestCase):
+    def test_monotonic_growth(self):
+        detector = GrowthDetector(window=5)
+        results = [detector.add_sample(v) for v in [100, 120, 140, 160, 180]]
+        assert results == [False, False, False, False, True]
+
+    def test_sawtooth(self):
+        detector = GrowthDetector(window=6)
+        for v in [100, 200, 100, 200, 100, 200]:
+            detector.add_sample(v)
+        assert not detector.is_growing()
+
+    def test_within_tolerance(self):
+        detector = GrowthDetector(window=3, tolerance=0.1)
+        for v in [1000, 1010, 1020]:
+            detector.add_sample(v)
+        assert not detector.is_growing()
+
+
+class TestCurrentRSS(unittest.TestCase):
+    def test_current_rss(self):
+        assert current_rss() > 0
+
+    def test_without_proc_and_resource(self):
+        # E.g. on Windows.
+        with (
+            patch("builtins.open", side_effect=OSError),
+            patch.dict(sys.modules, {"resource": None}),
+        ):
+            assert current_rss() == 0
+
+
+class TestMemoryUsage(unittest.IsolatedAsyncioTestCase):
+    async def test_pipeline_memory_usage(self):
+        hoarder = TextHoarder()
+        parallel = ParallelPipeline([IdentityFilter()], [IdentityFilter()])
+        pipeline = Pipeline([hoarder, parallel])
+        usage = pipeline.processors_memory_usage()
+        assert usage[hoarder.name] == deep_sizeof([])
+        assert parallel.name in usage
+
+    async def test_pipeline_queue_sizes(self):
+        hoarder = TextHoarder()
+        parallel = ParallelPipeline([IdentityFilter()], [IdentityFilter()])
+        task = PipelineTask(Pipeline([hoarder, parallel]))
+        sizes = task.queue_sizes()
+        assert sizes[hoarder.name] == 0
+        assert parallel.name in sizes
+        assert all(size == 0 for size in sizes.values())
+
+    async def test_soak_detects_growth(self):
+        hoarder = TextHoarder()
+        result = await run_soak_test(
+            Pipeline([IdentityFilter(), hoarder]),
+            frames_factory=lambda i: [TextFrame(text=f"Hello {i}!")],
+            iterations=20,
+        )
+        assert result.iterations == 20
+        assert result.growing == [hoarder.name]
+
+    async def test_soak_detects_parallel_pipeline_seen_ids(self):
+        parallel = ParallelPipeline([IdentityFilter()], [IdentityFilter()])
+        result = await run_soak_test(
+            parallel,
+            frames_factory=lambda i: [TextFrame(text="Hello!") for _ in range(10)],
+            iterations=20,
+        )
+        assert parallel.name in result.growing
+
+    async def test_soak_detects_task_leak(self):
+        result = await run_soak_test(
+            TaskLeaker(),
+            frames_factory=lambda i: [TextFrame(text="Hello!")],
+            iterations=30,
+            sample_objects=False,
+        )
+        assert result.growing == []
+        assert "tasks" in result.growing_resources
+        assert result.failed
+        with self.assertRaises(AssertionError):
+            result.assert_no_growth()
+
+    async def test_soak_decimates_samples(self):
+        hoarder = TextHoarder()
+        result = await run_soak_test(
+            hoarder,
+            frames_factory=lambda i: [TextFrame(text=f"Hello {i}!")],
+            iterations=25,
+            warmup_iterations=5,
+            max_samples=8,
+            sample_resources=False,
+        )
+        assert result.sample_every == 4
+        assert len(result.samples[hoarder.name]) < 8
+        assert result.growing == [hoarder.name]
+
+    async def test_soak_voice_pipeline(self):
+        result = await run_soak_test(
+            create_mock_voice_pipeline(),
+            frames_factory=lambda i: mock_voice_frames(i, turns_per_conversation=5),
+            iterations=30,
+        )
+        result.assert_no_growth()
+        assert "rss" in result.resources
+        assert any(name.startswith("objects:") for name in result.resources)
+
+    async def test_soak_voice_pipeline_context_growth(self):
+        result = await run_soak_test(
+            create_mock_voice_pipeline(),
+            frames_factory=lambda i: mock_voice_frames(i, turns_per_conversation=None),
+            iterations=20,
+            sample_resources=False,
+        )
+        assert sorted(name.split("#")[0] for name in result.growing) == [
+            "LLMAssistantContextAggregator",
+            "LLMUserContextAggregator",
+        ]
+
+    async def test_memory_usage_metrics(self):
+        hoarder = TextHoarder()
+        collector = MetricsCollector()
+        task = PipelineTask(
+            Pipeline([hoarder, collector]),
+            params=PipelineParams(enable_memory_usage_metrics=True, memory_usage_period_secs=0.05),
+        )
+        await task.queue_frame(TextFrame(text="Hello!"))
+
+        async def end():
+            await asyncio.sleep(0.2)
+            await task.queue_frame(EndFrame())
+
+        await asyncio.gather(PipelineRunner(handle_sigint=False).run(task), end())
+
+        data = [d for d in collector.data if isinstance(d, MemoryUsageMetricsData)]
+        assert data
+        assert all(d.processor == hoarder.name for d in data)
+        assert data[-1].value == deep_sizeof(hoarder.texts)
@@ -0,0 +1,244 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import random
+import unittest
+
+from pipecat.frames.frames import (
+    ErrorFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallResultFrame,
+    InputAudioRawFrame,
+    InterimTranscriptionFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMMessagesFrame,
+    LLMTextFrame,
+    StopInterruptionFrame,
+    TextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.services.mock import (
+    MockFunctionCall,
+    MockLatency,
+    MockLLMService,
+    MockRealtimeLLMService,
+    MockSTTService,
+    MockTTSService,
+    generate_tone,
+    mock_function_result,
+)
+from pipecat.tests.utils import SleepFrame, run_test
+
+SAMPLE_RATE = 16000
+
+
+def audio_frames(audio: bytes):
+    chunk = int(SAMPLE_RATE * 0.02) * 2
+    return [
+        InputAudioRawFrame(audio=audio[i : i + chunk], sample_rate=SAMPLE_RATE, num_channels=1)
+        for i in range(0, len(audio), chunk)
+    ]
+
+
+def utterance_frames(voiced_secs: float, silence_secs: float):
+    return audio_frames(
+        generate_tone(voiced_secs, SAMPLE_RATE) + bytes(int(SAMPLE_RATE * silence_secs) * 2)
+    )
+
+
+class TestMockLatency(unittest.TestCase):
+    def test_fixed(self):
+        rng = random.Random(0)
+        assert MockLatency(mean=0.3).sample(rng) == 0.3
+        assert MockLatency(mean=0.3, jitter=0.1, distribution="fixed").sample(rng) == 0.3
+
+    def test_uniform(self):
+        rng = random.Random(0)
+        latency = MockLatency(mean=0.3, jitter=0.1, distribution="uniform")
+        samples = [latency.sample(rng) for _ in range(1000)]
+        assert all(0.2 <= s <= 0.4 for s in samples)
+
+    def test_lognormal(self):
+        rng = random.Random(0)
+        latency = MockLatency(mean=0.5, jitter=0.2, distribution="lognormal")
+        samples = [latency.sample(rng) for _ in range(10000)]
+        assert all(s > 0 for s in samples)
+        assert abs(sum(samples) / len(samples) - 0.5) < 0.02
+
+    def test_bounds(self):
+        rng = random.Random(0)
+        latency = MockLatency(mean=0.5, jitter=1.0, min=0.1, max=0.9)
+        samples = [latency.sample(rng) for _ in range(1000)]
+        assert min(samples) == 0.1
+        assert max(samples) == 0.9
+
+    def test_seed(self):
+        def samples(seed):
+            rng = random.Random(seed)
+            latency = MockLatency(mean=0.5, jitter=0.2)
+            return [latency.sample(rng) for _ in range(10)]
+
+        assert samples(1) == samples(1)
+        assert samples(1) != samples(2)
+
+
+class TestMockLLMService(unittest.IsolatedAsyncioTestCase):
+    async def test_response(self):
+        llm = MockLLMService(response="Hello there!", latency=0)
+        frames_to_send = [LLMMessagesFrame(messages=[{"role": "user", "content": "Hi"}])]
+        expected_down_frames = [
+            LLMFullResponseStartFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMFullResponseEndFrame,
+        ]
+        (received_down, _) = await run_test(
+            llm, frames_to_send=frames_to_send, expected_down_frames=expected_down_frames
+        )
+        assert "".join(f.text for f in received_down if isinstance(f, TextFrame)) == "Hello there!"
+
+    async def test_failure(self):
+        llm = MockLLMService(latency=0, failure_rate=1.0)
+        frames_to_send = [LLMMessagesFrame(messages=[{"role": "user", "content": "Hi"}])]
+        expected_down_frames = [LLMFullResponseStartFrame, LLMFullResponseEndFrame]
+        expected_up_frames = [ErrorFrame]
+        await run_test(
+            llm,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+            expected_up_frames=expected_up_frames,
+        )
+
+    async def test_function_calls(self):
+        llm = MockLLMService(
+            latency=0,
+            function_calls=[MockFunctionCall("get_weather", {"location": "Barcelona"})],
+        )
+        llm.register_function("get_weather", mock_function_result({"conditions": "sunny"}))
+        frames_to_send = [LLMMessagesFrame(messages=[{"role": "user", "content": "Weather?"}])]
+        # `FunctionCallInProgressFrame` is a system frame so it's pushed first.
+        expected_down_frames = [
+            FunctionCallInProgressFrame,
+            LLMFullResponseStartFrame,
+            FunctionCallResultFrame,
+            LLMFullResponseEndFrame,
+        ]
+        expected_up_frames = [FunctionCallInProgressFrame, FunctionCallResultFrame]
+        (received_down, _) = await run_test(
+            llm,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+            expected_up_frames=expected_up_frames,
+        )
+        result = received_down[2]
+        assert result.function_name == "get_weather"
+        assert result.arguments == {"location": "Barcelona"}
+        assert result.result == {"conditions": "sunny"}
+
+    async def test_function_call_result_in_context(self):
+        llm = MockLLMService(
+            response="It's sunny.", latency=0, function_calls=[MockFunctionCall("get_weather")]
+        )
+        llm.register_function("get_weather", mock_function_result({"conditions": "sunny"}))
+        messages = [
+            {"role": "user", "content": "Weather?"},
+            {"role": "tool", "content": '{"conditions": "sunny"}', "tool_call_id": "1"},
+        ]
+        expected_down_frames = [
+            LLMFullResponseStartFrame,
+            LLMTextFrame,
+            LLMTextFrame,
+            LLMFullResponseEndFrame,
+        ]
+        await run_test(
+            llm,
+            frames_to_send=[LLMMessagesFrame(messages=messages)],
+            expected_down_frames=expected_down_frames,
+        )
+
+
+class TestMockTTSService(unittest.IsolatedAsyncioTestCase):
+    async def test_audio(self):
+        tts = MockTTSService(latency=0, secs_per_char=0.01, chunk_secs=0.05, sample_rate=16000)
+        # 10 characters, 0.1 seconds of audio in 2 chunks.
+        frames_to_send = [TextFrame(text="0123456789")]
+        expected_down_frames = [
+            TTSStartedFrame,
+            TTSAudioRawFrame,
+            TTSAudioRawFrame,
+            TTSStoppedFrame,
+            TTSTextFrame,
+        ]
+        await run_test(
+            tts, frames_to_send=frames_to_send, expected_down_frames=expected_down_frames
+        )
+
+    async def test_failure(self):
+        tts = MockTTSService(latency=0, failure_rate=1.0, sample_rate=16000)
+        expected_down_frames = [TTSStartedFrame, TTSStoppedFrame, TTSTextFrame]
+        await run_test(
+            tts,
+            frames_to_send=[TextFrame(text="Hello")],
+            expected_down_frames=expected_down_frames,
+            expected_up_frames=[ErrorFrame],
+        )
+
+
+class TestMockSTTService(unittest.IsolatedAsyncioTestCase):
+    async def test_transcription(self):
+        stt = MockSTTService(
+            latency=0, endpointing_secs=0.1, interim_interval=0.1, sample_rate=SAMPLE_RATE
+        )
+        frames_to_send = [*utterance_frames(0.2, 0.2), SleepFrame(sleep=0.1)]
+        # Two interim transcriptions (0.2 seconds of voice) and the final one.
+        expected_down_frames = [
+            InterimTranscriptionFrame,
+            InterimTranscriptionFrame,
+            TranscriptionFrame,
+        ]
+        await run_test(
+            stt, frames_to_send=frames_to_send, expected_down_frames=expected_down_frames
+        )
+
+    async def test_failure(self):
+        stt = MockSTTService(latency=0, endpointing_secs=0.1, failure_rate=1.0)
+        await run_test(
+            stt,
+            frames_to_send=[*utterance_frames(0.2, 0.2), SleepFrame(sleep=0.1)],
+            expected_down_frames=[],
+            expected_up_frames=[ErrorFrame],
+        )
+
+
+class TestMockRealtimeLLMService(unittest.IsolatedAsyncioTestCase):
+    async def test_utterance(self):
+        llm = MockRealtimeLLMService(
+            response="Hi!", latency=0, endpointing_secs=0.1, secs_per_char=0.01, speed=0
+        )
+        frames_to_send = [*utterance_frames(0.2, 0.2), SleepFrame(sleep=0.1)]
+        expected_down_frames = [
+            UserStartedSpeakingFrame,
+            StopInterruptionFrame,
+            UserStoppedSpeakingFrame,
+            TranscriptionFrame,
+            LLMFullResponseStartFrame,
+            TTSStartedFrame,
+            LLMTextFrame,
+            TTSTextFrame,
+            TTSAudioRawFrame,
+            TTSStoppedFrame,
+            LLMFullResponseEndFrame,
+        ]
+        await run_test(
+            llm, frames_to_send=frames_to_send, expected_down_frames=expected_down_frames
+        )
@@ -0,0 +1,172 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+from typing import AsyncGenerator, List, Type
+
+import numpy as np
+
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    InputAudioRawFrame,
+    MetricsFrame,
+    TextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.metrics.metrics import MetricsData, RTFMetricsData, STTFinalizationMetricsData
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.ai_services import SegmentedSTTService, STTService, TTSService
+from pipecat.transcriptions.language import Language
+
+
+class FakeTTSService(TTSService):
+    def __init__(self, **kwargs):
+        super().__init__(sample_rate=16000, **kwargs)
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def flush_audio(self):
+        pass
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        yield TTSStartedFrame()
+        await asyncio.sleep(0.1)
+        # One second of audio.
+        yield TTSAudioRawFrame(audio=b"\x00" * 32000, sample_rate=16000, num_channels=1)
+        yield TTSStoppedFrame()
+
+
+class FakeSTTService(STTService):
+    def __init__(self, **kwargs):
+        super().__init__(sample_rate=16000, **kwargs)
+        self._num_chunks = 0
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def set_model(self, model: str):
+        pass
+
+    async def set_language(self, language: Language):
+        pass
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        self._num_chunks += 1
+        if self._num_chunks == 10:
+            # The final transcription takes a while after the user stops.
+            await asyncio.sleep(0.1)
+            yield TranscriptionFrame(text="Hello!", user_id="", timestamp="")
+
+
+class FakeSegmentedSTTService(SegmentedSTTService):
+    def __init__(self, **kwargs):
+        super().__init__(sample_rate=16000, **kwargs)
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def set_model(self, model: str):
+        pass
+
+    async def set_language(self, language: Language):
+        pass
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        await asyncio.sleep(0.1)
+        yield TranscriptionFrame(text="Hello!", user_id="", timestamp="")
+
+
+class MetricsCollector(FrameProcessor):
+    def __init__(self, metrics_type: Type[MetricsData] = RTFMetricsData):
+        super().__init__()
+        self._metrics_type = metrics_type
+        self.data: List[MetricsData] = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, MetricsFrame):
+            self.data.extend(d for d in frame.data if isinstance(d, self._metrics_type))
+        await self.push_frame(frame, direction)
+
+
+async def run_pipeline(processors, frames):
+    task = PipelineTask(
+        Pipeline(processors),
+        params=PipelineParams(enable_metrics=True, send_initial_empty_metrics=False),
+    )
+    await task.queue_frames(list(frames) + [EndFrame()])
+    await PipelineRunner(handle_sigint=False).run(task)
+
+
+class TestRTFMetrics(unittest.IsolatedAsyncioTestCase):
+    async def test_tts_rtf(self):
+        tts = FakeTTSService(aggregate_sentences=False)
+        collector = MetricsCollector()
+        await run_pipeline([tts, collector], [TextFrame("Hello!"), TextFrame("Bye!")])
+        assert len(collector.data) == 2
+        first, second = collector.data
+        assert first.processor == tts.name
+        assert first.audio_duration == 1.0
+        assert 0.1 <= first.value < 0.5
+        window_value = (first.value + second.value) / 2
+        assert abs(second.window_value - window_value) < 1e-9
+
+    async def test_stt_finalization(self):
+        stt = FakeSTTService()
+        rtf_collector = MetricsCollector()
+        collector = MetricsCollector(STTFinalizationMetricsData)
+        # 20ms audio chunks, the user stops speaking before the last one.
+        audio = [
+            InputAudioRawFrame(audio=b"\x00" * 640, sample_rate=16000, num_channels=1)
+            for _ in range(10)
+        ]
+        await run_pipeline(
+            [stt, rtf_collector, collector],
+            [UserStartedSpeakingFrame(), *audio[:9], UserStoppedSpeakingFrame(), audio[9]],
+        )
+        # Audio is streamed in real time, so there's no real-time factor.
+        assert rtf_collector.data == []
+        assert len(collector.data) == 1
+        assert collector.data[0].processor == stt.name
+        assert 0.1 <= collector.data[0].value < 0.5
+
+    async def test_segmented_stt_rtf(self):
+        stt = FakeSegmentedSTTService()
+        collector = MetricsCollector()
+        # Half a second of speech followed by silence, in 20ms chunks.
+        rng = np.random.default_rng(0)
+        speech = rng.integers(-20000, 20000, 8000, dtype=np.int16).tobytes()
+        audio = [
+            InputAudioRawFrame(audio=speech[i : i + 640], sample_rate=16000, num_channels=1)
+            for i in range(0, len(speech), 640)
+        ]
+        audio += [
+            InputAudioRawFrame(audio=b"\x00" * 640, sample_rate=16000, num_channels=1)
+            for _ in range(25)
+        ]
+        await run_pipeline([stt, collector], audio)
+        assert len(collector.data) == 1
+        assert abs(collector.data[0].audio_duration - 0.5) < 0.05
+        assert 0.2 <= collector.data[0].value < 1.0
+
+    async def test_rtf_disabled_without_metrics(self):
+        tts = FakeTTSService(aggregate_sentences=False)
+        collector = MetricsCollector()
+        task = PipelineTask(Pipeline([tts, collector]))
+        await task.queue_frames([TextFrame("Hello!"), EndFrame()])
+        await PipelineRunner(handle_sigint=False).run(task)
+        assert collector.data == []
@@ -0,0 +1,189 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    Frame,
+    InputAudioRawFrame,
+    StartFrame,
+    TextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.session_recorder import RecordedFrame, SessionRecorder, SessionRecording
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.llm_response import (
+    LLMAssistantContextAggregator,
+    LLMUserContextAggregator,
+)
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.mock import MockLLMService, MockSTTService, MockTTSService, generate_tone
+from pipecat.tests.replay import ReplayService, replay_session
+from pipecat.transports.base_input import BaseInputTransport
+from pipecat.transports.base_transport import TransportParams
+
+SAMPLE_RATE = 16000
+
+
+class UserInputTransport(BaseInputTransport):
+    """Emulates a user saying something and waiting for the bot to respond."""
+
+    def __init__(self):
+        super().__init__(TransportParams())
+        self._user_task = None
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        self._user_task = self.create_task(self._user_task_handler())
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        await self.cancel_task(self._user_task)
+
+    async def cancel(self, frame: CancelFrame):
+        await super().cancel(frame)
+        await self.cancel_task(self._user_task)
+
+    async def _user_task_handler(self):
+        chunk = int(SAMPLE_RATE * 0.02) * 2
+        audio = generate_tone(0.2, SAMPLE_RATE) + bytes(int(SAMPLE_RATE * 0.2) * 2)
+        await self.push_frame(UserStartedSpeakingFrame())
+        for i in range(0, len(audio), chunk):
+            frame = InputAudioRawFrame(
+                audio=audio[i : i + chunk], sample_rate=SAMPLE_RATE, num_channels=1
+            )
+            await self.push_frame(frame)
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(0.05)
+        await self.push_frame(UserStoppedSpeakingFrame())
+
+
+class FrameCollector(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        self.frames.append(frame)
+        await self.push_frame(frame, direction)
+
+
+class AudioCollector(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.audio = b""
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TTSAudioRawFrame):
+            self.audio += frame.audio
+        await self.push_frame(frame, direction)
+
+
+def create_processors(stt, llm, tts):
+    context = OpenAILLMContext()
+    collector = AudioCollector()
+    processors = [
+        stt,
+        LLMUserContextAggregator(context),
+        llm,
+        tts,
+        collector,
+        LLMAssistantContextAggregator(context),
+    ]
+    return (processors, context, collector)
+
+
+class TestSessionReplay(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        (processors, self.context, self.collector) = create_processors(
+            MockSTTService(latency=0.02, endpointing_secs=0.1),
+            MockLLMService(latency=0.05, token_interval=0.01),
+            MockTTSService(latency=0.05, secs_per_char=0.01),
+        )
+        self.recorder = SessionRecorder()
+        task = PipelineTask(
+            Pipeline([UserInputTransport(), *processors]),
+            params=PipelineParams(observers=[self.recorder]),
+        )
+
+        async def end():
+            await asyncio.sleep(1.0)
+            await task.queue_frame(EndFrame())
+
+        await asyncio.gather(PipelineRunner(handle_sigint=False).run(task), end())
+
+    async def test_recording(self):
+        recording = self.recorder.recording
+        assert isinstance(recording.inputs[0].frame, UserStartedSpeakingFrame)
+        assert isinstance(recording.inputs[-1].frame, UserStoppedSpeakingFrame)
+        assert set(recording.services.keys()) == {"stt", "llm", "tts"}
+        assert len(recording.services["llm"]) == 1
+        assert recording.duration > recording.inputs[-1].timestamp
+        # Every audio frame is an STT request and one of them is transcribed.
+        audio_frames = [f for f in recording.inputs if isinstance(f.frame, InputAudioRawFrame)]
+        assert len(recording.services["stt"]) == len(audio_frames)
+        transcriptions = [
+            r.frame for req in recording.services["stt"] for r in req.responses if r.frame
+        ]
+        assert [type(t) for t in transcriptions] == [TranscriptionFrame]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_name = os.path.join(tmpdir, "session.pkl")
+            recording.save(file_name)
+            loaded = SessionRecording.load(file_name)
+        assert len(loaded.inputs) == len(recording.inputs)
+        assert loaded.services.keys() == recording.services.keys()
+
+    async def _replay(self, speed: float):
+        recording = self.recorder.recording
+        (processors, context, collector) = create_processors(
+            ReplayService(recording, "stt", speed=speed),
+            ReplayService(recording, "llm", speed=speed),
+            ReplayService(recording, "tts", speed=speed),
+        )
+        await replay_session(recording, processors, speed=speed)
+        assert context.get_messages() == self.context.get_messages()
+        assert collector.audio == self.collector.audio
+
+    async def test_replay(self):
+        await self._replay(speed=1.0)
+
+    async def test_replay_fast(self):
+        await self._replay(speed=0)
+
+    async def test_unknown_service(self):
+        with self.assertRaises(ValueError):
+            ReplayService(self.recorder.recording, "vision")
+
+
+class TestReplayFrames(unittest.IsolatedAsyncioTestCase):
+    async def test_frame_fields(self):
+        frame = TextFrame("Hello")
+        frame.pts = 500_000_000
+        frame.metadata["language"] = "en"
+        recording = SessionRecording(inputs=[RecordedFrame(timestamp=0, frame=frame)])
+        collector = FrameCollector()
+        await replay_session(recording, [collector], speed=0)
+
+        (replayed,) = [f for f in collector.frames if isinstance(f, TextFrame)]
+        assert replayed.id != frame.id
+        assert replayed.text == "Hello"
+        assert replayed.pts == frame.pts
+        assert replayed.metadata == {"language": "en"}
+        assert replayed.metadata is not frame.metadata
@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pipecat.audio.vad.silero import (
+    SileroOnnxModel,
+    SileroVADAnalyzer,
+    SileroVADBatchService,
+    _model_file_path,
+)
+
+
+def generate_speech_like(seconds: float, sample_rate: int, seed: int) -> bytes:
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    # Amplitude modulated harmonics, with pauses.
+    envelope = (np.sin(2 * np.pi * 2 * t) > 0).astype(np.float32)
+    f0 = 120 + 40 * seed
+    samples = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 6))
+    samples = 0.2 * envelope * samples + 0.01 * rng.standard_normal(t.shape)
+    return (samples * 32767).astype(np.int16).tobytes()
+
+
+def confidences(vad: SileroVADAnalyzer, audio: bytes):
+    window = vad.num_frames_required() * 2
+    return [
+        vad.voice_confidence(audio[i : i + window])
+        for i in range(0, len(audio) - window + 1, window)
+    ]
+
+
+class TestSileroVADAnalyzer(unittest.TestCase):
+    def test_shared_session(self):
+        vad1 = SileroVADAnalyzer(sample_rate=16000)
+        vad2 = SileroVADAnalyzer(sample_rate=16000)
+        vad1.set_sample_rate(16000)
+        vad2.set_sample_rate(16000)
+        assert vad1._model.session is vad2._model.session
+
+        # Analyzing different audio at the same time with the shared session
+        # gives the same results as with separate sessions.
+        audio1 = generate_speech_like(1.0, 16000, 0)
+        audio2 = generate_speech_like(1.0, 16000, 1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            (result1, result2) = executor.map(confidences, [vad1, vad2], [audio1, audio2])
+
+        for result, audio in [(result1, audio1), (result2, audio2)]:
+            vad = SileroVADAnalyzer(sample_rate=16000)
+            vad.set_sample_rate(16000)
+            vad._model = SileroOnnxModel(_model_file_path(), shared=False)
+            assert vad._model.session is not vad1._model.session
+            np.testing.assert_allclose(result, confidences(vad, audio), atol=1e-5)
+
+
+class TestSileroVADBatchService(unittest.TestCase):
+    def test_same_results_as_single_analyzers(self):
+        num_sessions = 4
+        for sample_rate in [8000, 16000]:
+            audios = [generate_speech_like(1.0, sample_rate, i) for i in range(num_sessions)]
+
+            expected = []
+            for audio in audios:
+                vad = SileroVADAnalyzer(sample_rate=sample_rate)
+                vad.set_sample_rate(sample_rate)
+                expected.append(confidences(vad, audio))
+
+            service = SileroVADBatchService(max_delay=0.01)
+            vads = [
+                SileroVADAnalyzer(sample_rate=sample_rate, batch_service=service) for _ in audios
+            ]
+            for vad in vads:
+                vad.set_sample_rate(sample_rate)
+
+            with ThreadPoolExecutor(max_workers=num_sessions) as executor:
+                results = list(executor.map(confidences, vads, audios))
+            service.close()
+
+            for result, exp in zip(results, expected):
+                np.testing.assert_allclose(result, exp, atol=1e-5)
+            # Windows from different sessions have been analyzed together.
+            assert service.num_windows == sum(len(r) for r in results)
+            assert service.num_batches < service.num_windows
+
+    def test_mixed_sample_rates(self):
+        service = SileroVADBatchService(max_delay=0.01)
+        vads = []
+        for sample_rate in [8000, 16000]:
+            vad = SileroVADAnalyzer(sample_rate=sample_rate, batch_service=service)
+            vad.set_sample_rate(sample_rate)
+            vads.append(vad)
+        audios = [generate_speech_like(0.5, vad.sample_rate, 0) for vad in vads]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(confidences, vads, audios))
+        service.close()
+
+        for vad, result, audio in zip(vads, results, audios):
+            single = SileroVADAnalyzer(sample_rate=vad.sample_rate)
+            single.set_sample_rate(vad.sample_rate)
+            np.testing.assert_allclose(result, confidences(single, audio), atol=1e-5)
@@ -0,0 +1,150 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from typing import AsyncGenerator, List, Sequence
+
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    EndFrame,
+    Frame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMMessagesFrame,
+    TextFrame,
+    TTSAudioRawFrame,
+    UserStartedSpeakingFrame,
+)
+from pipecat.pipeline.parallel_pipeline import ParallelPipeline
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.ai_services import LLMService, TTSService
+from pipecat.tracing.exporters.file_span_exporter import FileSpanExporter
+from pipecat.tracing.exporters.memory_span_exporter import InMemorySpanExporter
+from pipecat.tracing.span import Span, SpanStatus
+from pipecat.tracing.tracer import Tracer
+
+
+class FakeLLMService(LLMService):
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, LLMMessagesFrame):
+            await self.push_frame(LLMFullResponseStartFrame())
+            await self.push_frame(TextFrame("Hello there."))
+            await self.push_frame(LLMFullResponseEndFrame())
+        else:
+            await self.push_frame(frame, direction)
+
+
+class FakeTTSService(TTSService):
+    async def flush_audio(self):
+        pass
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        yield TTSAudioRawFrame(audio=b"\x00" * 320, sample_rate=16000, num_channels=1)
+
+
+class FrameCollector(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.frames: List[Frame] = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        self.frames.append(frame)
+        await self.push_frame(frame, direction)
+
+
+async def run_pipeline(processors, frames: Sequence[Frame], tracer: Tracer | None = None):
+    task = PipelineTask(Pipeline(processors), params=PipelineParams(tracer=tracer))
+    await task.queue_frames(list(frames) + [EndFrame()])
+    await PipelineRunner(handle_sigint=False).run(task)
+
+
+def spans_named(spans: List[Span], name: str) -> List[Span]:
+    return [s for s in spans if s.name == name]
+
+
+class TestTracing(unittest.IsolatedAsyncioTestCase):
+    async def test_turns(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter=exporter)
+        await run_pipeline(
+            [IdentityFilter()],
+            [
+                UserStartedSpeakingFrame(),
+                BotStartedSpeakingFrame(),
+                BotStoppedSpeakingFrame(),
+                UserStartedSpeakingFrame(),
+            ],
+            tracer,
+        )
+        turns = spans_named(exporter.spans, "turn")
+        (session,) = spans_named(exporter.spans, "session")
+        assert len(turns) == 2
+        assert all(t.parent == session.context for t in turns)
+        assert all(t.context.trace_id == tracer.trace_id for t in turns)
+        assert all(t.end_time is not None for t in exporter.spans)
+
+    async def test_service_spans_nest(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter=exporter)
+        await run_pipeline(
+            [FakeLLMService(), FakeTTSService()],
+            [UserStartedSpeakingFrame(), LLMMessagesFrame(messages=[])],
+            tracer,
+        )
+        (turn,) = spans_named(exporter.spans, "turn")
+        (llm,) = spans_named(exporter.spans, "llm")
+        (tts,) = spans_named(exporter.spans, "tts")
+        assert llm.parent == turn.context
+        assert tts.parent == llm.context
+        assert tts.attributes["text"] == "Hello there."
+        assert llm.status == SpanStatus.OK
+        # The LLM span links to the frame that triggered it.
+        assert len(llm.links) == 1
+
+    async def test_parallel_pipeline_spans_nest(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter=exporter)
+        await run_pipeline(
+            [FakeLLMService(), ParallelPipeline([FakeTTSService()], [FakeTTSService()])],
+            [UserStartedSpeakingFrame(), LLMMessagesFrame(messages=[])],
+            tracer,
+        )
+        (llm,) = spans_named(exporter.spans, "llm")
+        tts = spans_named(exporter.spans, "tts")
+        assert len(tts) == 2
+        assert all(s.parent == llm.context for s in tts)
+        assert tts[0].attributes["processor"] != tts[1].attributes["processor"]
+
+    async def test_tracing_disabled(self):
+        collector = FrameCollector()
+        await run_pipeline(
+            [FakeLLMService(), collector],
+            [UserStartedSpeakingFrame(), LLMMessagesFrame(messages=[])],
+        )
+        assert collector.frames
+        assert all(f.trace_context is None for f in collector.frames)
+
+    async def test_file_exporter(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_name = os.path.join(tmpdir, "spans.jsonl")
+            tracer = Tracer(exporter=FileSpanExporter(file_name))
+            await run_pipeline([IdentityFilter()], [UserStartedSpeakingFrame()], tracer)
+            with open(file_name) as f:
+                spans = [json.loads(line) for line in f]
+        assert {s["name"] for s in spans} == {"turn", "session"}
+        assert all(s["traceId"] == tracer.trace_id for s in spans)
@@ -0,0 +1,78 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import sys
+import unittest
+from unittest.mock import patch
+
+from pipecat.utils.asyncio import TaskManager
+
+
+class TestTaskManager(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.task_manager = TaskManager()
+        self.task_manager.set_event_loop(asyncio.get_running_loop())
+
+    async def test_cancel_task(self):
+        task = self.task_manager.create_task(asyncio.sleep(10), "sleep")
+        # Let the task start, otherwise the coroutine is never awaited.
+        await asyncio.sleep(0)
+        await self.task_manager.cancel_task(task)
+        assert task.cancelled()
+        assert self.task_manager.current_tasks() == set()
+
+    async def test_cancel_task_slow_cleanup(self):
+        cleaned_up = False
+
+        async def slow_cleanup():
+            nonlocal cleaned_up
+            try:
+                await asyncio.sleep(10)
+            finally:
+                # E.g. closing a websocket.
+                await asyncio.sleep(0.3)
+                cleaned_up = True
+
+        task = self.task_manager.create_task(slow_cleanup(), "slow_cleanup")
+        await asyncio.sleep(0)
+        await self.task_manager.cancel_task(task)
+        assert task.cancelled()
+        assert cleaned_up
+
+    async def test_cancel_task_uncancelled(self):
+        if sys.version_info < (3, 11):
+            self.skipTest("Task.uncancel() requires Python 3.11")
+
+        async def stubborn():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                asyncio.current_task().uncancel()
+            await asyncio.sleep(10)
+
+        task = self.task_manager.create_task(stubborn(), "stubborn")
+        await asyncio.sleep(0)
+        # The swallowed cancellation is detected, so we don't wait for the
+        # grace period.
+        await asyncio.wait_for(self.task_manager.cancel_task(task), timeout=1.0)
+        assert task.cancelled()
+
+    async def test_cancel_task_swallowing_cancellation(self):
+        async def stubborn():
+            # This is what `asyncio.wait_for()` does (before Python 3.12) if the
+            # awaited future completes while being cancelled.
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                pass
+            await asyncio.sleep(10)
+
+        task = self.task_manager.create_task(stubborn(), "stubborn")
+        await asyncio.sleep(0)
+        with patch("pipecat.utils.asyncio.CANCEL_GRACE_SECS", 0.3):
+            await asyncio.wait_for(self.task_manager.cancel_task(task), timeout=1.0)
+        assert task.cancelled()
@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+import unittest
+
+from pipecat.frames.frames import UserStartedSpeakingFrame, UserStoppedSpeakingFrame
+from pipecat.processors.user_idle_processor import UserIdleProcessor
+from pipecat.tests.utils import SleepFrame, run_test
+from pipecat.tests.virtual_time import run_with_virtual_time
+
+
+class TestVirtualTimeEventLoop(unittest.TestCase):
+    def test_sleep(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            await asyncio.sleep(3600)
+            return loop.elapsed
+
+        start_time = time.perf_counter()
+        elapsed = run_with_virtual_time(main())
+        assert elapsed == 3600
+        assert time.perf_counter() - start_time < 1.0
+
+    def test_timers_order(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            events = []
+
+            async def sleeper(name: str, secs: float):
+                await asyncio.sleep(secs)
+                events.append((name, loop.elapsed))
+
+            await asyncio.gather(sleeper("c", 30), sleeper("a", 10), sleeper("b", 20))
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.Event().wait(), timeout=5)
+            events.append(("timeout", loop.elapsed))
+            return events
+
+        events = run_with_virtual_time(main())
+        assert events == [("a", 10), ("b", 20), ("c", 30), ("timeout", 35)]
+
+    def test_executor_takes_no_time(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            sleeper = asyncio.create_task(asyncio.sleep(0.01))
+            # The thread takes longer than the sleep in real time.
+            await asyncio.to_thread(time.sleep, 0.05)
+            elapsed = loop.elapsed
+            done = sleeper.done()
+            await sleeper
+            return (elapsed, done)
+
+        (elapsed, done) = run_with_virtual_time(main())
+        assert elapsed == 0
+        assert not done
+
+    def test_patch_time(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            start = (time.time(), time.monotonic())
+            await asyncio.sleep(60)
+            assert time.monotonic() == loop.monotonic()
+            return (time.time() - start[0], time.monotonic() - start[1])
+
+        real_monotonic = time.monotonic()
+        (wall_elapsed, monotonic_elapsed) = run_with_virtual_time(main())
+        assert abs(wall_elapsed - 60) < 0.001
+        assert abs(monotonic_elapsed - 60) < 0.001
+        # Outside the virtual loop we get the real time back.
+        assert time.monotonic() - real_monotonic < 10
+
+    def test_no_patch(self):
+        async def main():
+            start = time.monotonic()
+            await asyncio.sleep(60)
+            return time.monotonic() - start
+
+        assert run_with_virtual_time(main(), patch=False) < 10
+
+
+class TestRunTestVirtualTime(unittest.IsolatedAsyncioTestCase):
+    async def test_user_idle(self):
+        idle_times = []
+
+        async def idle_callback(processor: UserIdleProcessor) -> None:
+            idle_times.append(time.monotonic())
+
+        processor = UserIdleProcessor(callback=idle_callback, timeout=60)
+
+        frames_to_send = [
+            UserStartedSpeakingFrame(),
+            UserStoppedSpeakingFrame(),
+            SleepFrame(sleep=90),
+        ]
+        expected_down_frames = [UserStartedSpeakingFrame, UserStoppedSpeakingFrame]
+
+        start_time = time.perf_counter()
+        await run_test(
+            processor,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+            virtual_time=True,
+        )
+        assert len(idle_times) == 1
+        assert time.perf_counter() - start_time < 5.0